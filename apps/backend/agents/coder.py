@@ -31,6 +31,7 @@ from phase_event import ExecutionPhase, emit_phase
 from progress import (
     count_subtasks,
     count_subtasks_detailed,
+    get_available_subtasks,
     get_current_phase,
     get_next_subtask,
     is_build_complete,
@@ -81,6 +82,15 @@ from .base import (
     sanitize_error_message,
 )
 from .memory_manager import debug_memory_system_status, get_graphiti_context
+from .scheduler import (
+    WaveStats,
+    create_subtask_worktree,
+    get_coder_workers,
+    merge_subtask_worktree,
+    remove_subtask_worktree,
+    select_wave,
+    worktree_spec_dir,
+)
 from .session import post_session_processing, run_agent_session
 from .utils import (
     find_phase_for_subtask,
@@ -391,6 +401,255 @@ def parse_rate_limit_reset_time(error_info: dict | None) -> int | None:
     return None
 
 
+# =============================================================================
+# SUBTASK SESSIONS
+# =============================================================================
+
+
+async def _build_subtask_prompt(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    recovery_manager: RecoveryManager,
+    working_dir: Path | None = None,
+) -> str:
+    """
+    Build a coder prompt: subtask instructions, file context and memory.
+
+    Args:
+        spec_dir: Spec directory
+        project_dir: Project root (spec worktree in worktree mode)
+        subtask: The subtask to implement
+        recovery_manager: Recovery manager, for attempt count and hints
+        working_dir: Where the session runs, if not project_dir (subtask worktree)
+    """
+    working_dir = working_dir or project_dir
+    prompt_spec_dir = (
+        spec_dir
+        if working_dir == project_dir
+        else worktree_spec_dir(project_dir, spec_dir, working_dir)
+    )
+    subtask_id = subtask.get("id")
+
+    # Get attempt count for recovery context
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(subtask_id) if attempt_count > 0 else None
+    )
+
+    # Find the phase for this subtask
+    plan = load_implementation_plan(spec_dir)
+    phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+
+    # Generate focused, minimal prompt for this subtask
+    prompt = generate_subtask_prompt(
+        spec_dir=prompt_spec_dir,
+        project_dir=working_dir,
+        subtask=subtask,
+        phase=phase or {},
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+    )
+
+    # Load and append relevant file context
+    context = load_subtask_context(prompt_spec_dir, working_dir, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        prompt += "\n\n" + format_context_for_prompt(context)
+
+    # Retrieve and append Graphiti memory context (if enabled)
+    graphiti_context = await get_graphiti_context(spec_dir, project_dir, subtask)
+    if graphiti_context:
+        prompt += "\n\n" + graphiti_context
+        print_status("Graphiti memory context loaded", "success")
+
+    return prompt
+
+
+async def _mark_stuck_if_exhausted(
+    spec_dir: Path,
+    subtask_id: str,
+    recovery_manager: RecoveryManager,
+    linear_enabled: bool,
+) -> None:
+    """Mark a subtask stuck once it has failed MAX_SUBTASK_RETRIES times."""
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    if attempt_count < MAX_SUBTASK_RETRIES:
+        return
+
+    # Write exitReason="stuckRetry_loop" for RDR detection
+    # (3+ failed attempts indicates agent is stuck in a loop)
+    _save_exit_reason(spec_dir, "stuckRetry_loop")
+
+    recovery_manager.mark_subtask_stuck(
+        subtask_id, f"Failed after {attempt_count} attempts"
+    )
+    print()
+    print_status(
+        f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
+        "error",
+    )
+    print(muted("Consider: manual intervention or skipping this subtask"))
+
+    # Record stuck subtask in Linear (if enabled)
+    if linear_enabled:
+        await linear_task_stuck(
+            spec_dir=spec_dir,
+            subtask_id=subtask_id,
+            attempt_count=attempt_count,
+        )
+        print_status("Linear notified of stuck subtask", "info")
+
+
+async def _run_subtask_wave(
+    wave: list[dict],
+    *,
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    verbose: bool,
+    first_session: int,
+    recovery_manager: RecoveryManager,
+    status_manager: StatusManager,
+    linear_enabled: bool,
+    source_spec_dir: Path | None,
+    wave_stats: WaveStats,
+) -> dict[str, str]:
+    """
+    Run coder sessions for several subtasks at once, one worktree each.
+
+    Each finished subtask is merged back into project_dir (one at a time)
+    before its worktree is removed. A subtask whose merge fails is set back
+    to pending so it runs again.
+
+    Returns:
+        Session status ("continue", "complete" or "error") by subtask id
+    """
+    phase_model = get_phase_model(spec_dir, "coding", model)
+    phase_betas = get_phase_model_betas(spec_dir, "coding", model)
+    thinking_kwargs = get_phase_client_thinking_kwargs(spec_dir, "coding", phase_model)
+    fast_mode = get_fast_mode(spec_dir)
+
+    merge_lock = asyncio.Lock()
+    active = 0
+    durations: list[float] = []
+
+    def set_active(delta: int) -> None:
+        nonlocal active
+        active += delta
+        status_manager.update_workers(active, len(wave))
+        status_manager.update_subtasks(in_progress=active)
+
+    async def reset_to_pending(subtask_id: str, session_num: int, error: str) -> None:
+        from core.plan_store import PlanStore
+
+        print_status(f"Could not merge subtask {subtask_id}: {error}", "error")
+        await PlanStore.for_spec(spec_dir).mutate(
+            lambda plan: {
+                "op": "update_subtask",
+                "subtask_id": subtask_id,
+                "fields": {"status": "pending"},
+            }
+        )
+        recovery_manager.record_attempt(
+            subtask_id=subtask_id,
+            session=session_num,
+            success=False,
+            approach="Merging the subtask worktree back failed",
+            error=error,
+        )
+
+    async def run_one(subtask: dict, session_num: int) -> str:
+        subtask_id = subtask["id"]
+        try:
+            worktree = await asyncio.to_thread(
+                create_subtask_worktree, project_dir, spec_dir, subtask_id
+            )
+        except Exception as e:
+            print_status(f"Subtask {subtask_id}: {e}", "error")
+            return "error"
+
+        started = asyncio.get_running_loop().time()
+        set_active(1)
+        try:
+            print(f"Working on: {highlight(subtask_id)} (session {session_num})")
+            prompt = await _build_subtask_prompt(
+                spec_dir,
+                project_dir,
+                subtask,
+                recovery_manager,
+                working_dir=worktree.path,
+            )
+            commit_before = get_latest_commit(worktree.path)
+            commit_count_before = get_commit_count(worktree.path)
+
+            client = create_client(
+                worktree.path,
+                spec_dir,
+                phase_model,
+                agent_type="coder",
+                betas=phase_betas,
+                fast_mode=fast_mode,
+                **thinking_kwargs,
+            )
+            async with client:
+                status, _, error_info = await run_agent_session(
+                    client, prompt, spec_dir, verbose, phase=LogPhase.CODING
+                )
+            durations.append(asyncio.get_running_loop().time() - started)
+
+            success = await post_session_processing(
+                spec_dir=spec_dir,
+                project_dir=worktree.path,
+                subtask_id=subtask_id,
+                session_num=session_num,
+                commit_before=commit_before,
+                commit_count_before=commit_count_before,
+                recovery_manager=recovery_manager,
+                linear_enabled=linear_enabled,
+                status_manager=status_manager,
+                source_spec_dir=source_spec_dir,
+                error_info=error_info,
+            )
+
+            async with merge_lock:
+                merge = await asyncio.to_thread(
+                    merge_subtask_worktree, project_dir, worktree
+                )
+            if merge.success:
+                logger.info(f"Subtask {subtask_id} merged ({merge.method})")
+            elif success:
+                await reset_to_pending(subtask_id, session_num, merge.error or "")
+                success = False
+
+            if not success:
+                await _mark_stuck_if_exhausted(
+                    spec_dir, subtask_id, recovery_manager, linear_enabled
+                )
+            return status
+        except Exception as e:
+            logger.exception(f"Concurrent session for subtask {subtask_id} failed")
+            print_status(
+                f"Subtask {subtask_id}: {sanitize_error_message(str(e))}", "error"
+            )
+            return "error"
+        finally:
+            set_active(-1)
+            await asyncio.to_thread(remove_subtask_worktree, project_dir, worktree)
+
+    wave_stats.start_wave()
+    statuses = await asyncio.gather(
+        *(run_one(subtask, first_session + i) for i, subtask in enumerate(wave))
+    )
+    speedup = wave_stats.end_wave(durations)
+    status_manager.update_workers(0, len(wave))
+    print_status(
+        f"{len(wave)} concurrent sessions finished, {speedup:.1f}x faster "
+        "than running them one after another",
+        "info",
+    )
+    return {subtask["id"]: status for subtask, status in zip(wave, statuses)}
+
+
 async def run_autonomous_agent(
     project_dir: Path,
     spec_dir: Path,
@@ -552,6 +811,32 @@ async def run_autonomous_agent(
         current_retry_delay = INITIAL_RETRY_DELAY_SECONDS
         concurrency_error_context = None
 
+    async def _finish_build() -> None:
+        """All subtasks done: report it (QA still has to run)."""
+        # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
+        # QA loop will emit COMPLETE after actual approval
+        print_build_complete_banner(spec_dir)
+        status_manager.update(state=BuildState.COMPLETE)
+
+        if task_logger:
+            task_logger.end_phase(
+                LogPhase.CODING,
+                success=True,
+                message="All subtasks completed successfully",
+            )
+
+        if linear_task and linear_task.task_id:
+            await linear_build_complete(spec_dir)
+            print_status("Linear notified: build complete, ready for QA", "success")
+
+    # Concurrent coding (CODER_WORKERS > 1): subtasks that don't depend on each
+    # other or share files run together, each in its own worktree
+    coder_workers = get_coder_workers()
+    wave_stats = WaveStats()
+    # After a wave with a failed session the next session runs on its own,
+    # so the error handling below (rate limits, auth, retries) applies
+    run_next_sequentially = False
+
     while True:
         iteration += 1
 
@@ -578,6 +863,68 @@ async def run_autonomous_agent(
             print("To continue, run the script again without --max-iterations")
             break
 
+        wave = []
+        if (
+            coder_workers > 1
+            and not first_run
+            and not is_planning_phase
+            and not run_next_sequentially
+        ):
+            wave = select_wave(
+                (
+                    subtask
+                    for subtask in get_available_subtasks(spec_dir)
+                    if validate_subtask_files(subtask, project_dir)["success"]
+                ),
+                coder_workers,
+            )
+            if max_iterations:
+                wave = wave[: max_iterations - iteration + 1]
+        run_next_sequentially = False
+
+        if len(wave) > 1:
+            status_manager.update_session(iteration)
+            content = [
+                bold(
+                    f"{icon(Icons.GEAR)} CONCURRENT SESSIONS {iteration}-{iteration + len(wave) - 1}"
+                ),
+                "",
+                *(f"{s['id']}: {s.get('description', '')}" for s in wave),
+            ]
+            print()
+            print(box(content, width=70, style="heavy"))
+            print()
+
+            statuses = await _run_subtask_wave(
+                wave,
+                project_dir=project_dir,
+                spec_dir=spec_dir,
+                model=model,
+                verbose=verbose,
+                first_session=iteration,
+                recovery_manager=recovery_manager,
+                status_manager=status_manager,
+                linear_enabled=bool(linear_task and linear_task.task_id),
+                source_spec_dir=source_spec_dir,
+                wave_stats=wave_stats,
+            )
+            iteration += len(wave) - 1
+
+            if "error" in statuses.values():
+                print_status("Next session runs on its own after errors", "warning")
+                run_next_sequentially = True
+            else:
+                _reset_concurrency_state()
+
+            if is_build_complete(spec_dir):
+                await _finish_build()
+                break
+
+            print_progress_summary(spec_dir)
+            status_manager.update(state=BuildState.BUILDING)
+            await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+            continue
+
         # Get the next subtask to work on (planner sessions shouldn't bind to a subtask)
         next_subtask = None if first_run else get_next_subtask(spec_dir)
         subtask_id = next_subtask.get("id") if next_subtask else None
@@ -782,40 +1129,10 @@ async def run_autonomous_agent(
                 **thinking_kwargs,
             )
 
-            # Get attempt count for recovery context
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
-            )
-
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
-
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
-            )
-
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
-
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
+            prompt = await _build_subtask_prompt(
+                spec_dir, project_dir, next_subtask, recovery_manager
             )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
+            attempt_count = recovery_manager.get_attempt_count(subtask_id)
 
             # Add concurrency error context if recovering from 400 error
             if concurrency_error_context:
@@ -901,30 +1218,10 @@ async def run_autonomous_agent(
             )
 
             # Check for stuck subtasks
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            if not success and attempt_count >= MAX_SUBTASK_RETRIES:
-                # Write exitReason="stuckRetry_loop" for RDR detection
-                # (3+ failed attempts indicates agent is stuck in a loop)
-                _save_exit_reason(spec_dir, "stuckRetry_loop")
-
-                recovery_manager.mark_subtask_stuck(
-                    subtask_id, f"Failed after {attempt_count} attempts"
+            if not success:
+                await _mark_stuck_if_exhausted(
+                    spec_dir, subtask_id, recovery_manager, linear_is_enabled
                 )
-                print()
-                print_status(
-                    f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
-                    "error",
-                )
-                print(muted("Consider: manual intervention or skipping this subtask"))
-
-                # Record stuck subtask in Linear (if enabled)
-                if linear_is_enabled:
-                    await linear_task_stuck(
-                        spec_dir=spec_dir,
-                        subtask_id=subtask_id,
-                        attempt_count=attempt_count,
-                    )
-                    print_status("Linear notified of stuck subtask", "info")
         elif plan_validated and source_spec_dir:
             # After planning phase, sync the newly created implementation plan back to source
             if sync_spec_to_source(spec_dir, source_spec_dir):
@@ -932,25 +1229,9 @@ async def run_autonomous_agent(
 
         # Handle session status
         if status == "complete":
-            # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
-            # QA loop will emit COMPLETE after actual approval
-            print_build_complete_banner(spec_dir)
-            status_manager.update(state=BuildState.COMPLETE)
-
             # Reset error tracking on success
             _reset_concurrency_state()
-
-            if task_logger:
-                task_logger.end_phase(
-                    LogPhase.CODING,
-                    success=True,
-                    message="All subtasks completed successfully",
-                )
-
-            if linear_task and linear_task.task_id:
-                await linear_build_complete(spec_dir)
-                print_status("Linear notified: build complete, ready for QA", "success")
-
+            await _finish_build()
             break
 
         elif status == "continue":
@@ -1237,6 +1518,11 @@ async def run_autonomous_agent(
         f"Spec: {highlight(spec_dir.name)}",
         f"Sessions completed: {iteration}",
     ]
+    if wave_stats.waves:
+        content.append(
+            f"Concurrent sessions: {wave_stats.sessions} in {wave_stats.waves} "
+            f"wave(s), {wave_stats.speedup:.1f}x speedup"
+        )
     print()
     print(box(content, width=70, style="heavy"))
     print_progress_summary(spec_dir)
@@ -0,0 +1,409 @@
+"""
+Subtask Scheduler
+=================
+
+Picks subtasks that can be coded at the same time and gives each its own
+worktree, for the coder loop's concurrent mode (CODER_WORKERS > 1).
+
+- A wave is drawn from the available subtasks (get_available_subtasks():
+  phases with satisfied dependencies; within a phase only the next subtask
+  unless it is parallel_safe)
+- Subtasks in a wave don't share files_to_modify/files_to_create; a subtask
+  that declares no files is never scheduled next to another one
+- Each subtask gets a branch and worktree created from the spec worktree's
+  HEAD, under .auto-claude/worktrees/subtasks/
+- Finished branches are merged back into the spec worktree one at a time:
+  a plain git merge, or the merge orchestrator when git reports conflicts.
+  Changes the agent didn't commit are committed before merging
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.git_executable import run_git
+from core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+SUBTASK_WORKTREES_DIR = Path(".auto-claude") / "worktrees" / "subtasks"
+SUBTASK_BRANCH_PREFIX = "auto-claude-subtask"
+
+
+def get_coder_workers() -> int:
+    """Max concurrent coder sessions (CODER_WORKERS, default 1: sequential)."""
+    try:
+        return max(1, int(os.environ.get("CODER_WORKERS", "1")))
+    except ValueError:
+        return 1
+
+
+def subtask_files(subtask: dict) -> frozenset[str]:
+    """Normalized paths a subtask declares it will modify or create."""
+    paths = [
+        *(subtask.get("files_to_modify") or []),
+        *(subtask.get("files_to_create") or []),
+    ]
+    return frozenset(
+        Path(p.replace("\\", "/")).as_posix().removeprefix("./")
+        for p in paths
+        if isinstance(p, str) and p.strip()
+    )
+
+
+def select_wave(available: Iterable[dict], limit: int) -> list[dict]:
+    """
+    Choose subtasks to run together, in plan order.
+
+    Args:
+        available: Candidate subtasks (from get_available_subtasks())
+        limit: Maximum wave size
+
+    Returns:
+        Subtasks with pairwise disjoint files; a single subtask if the first
+        candidate declares no files
+    """
+    wave: list[dict] = []
+    claimed: set[str] = set()
+    for subtask in available:
+        if len(wave) >= limit:
+            break
+        files = subtask_files(subtask)
+        if not files:
+            # Unknown footprint: only safe on its own
+            if not wave:
+                return [subtask]
+            continue
+        if files & claimed:
+            continue
+        wave.append(subtask)
+        claimed |= files
+    return wave
+
+
+# =============================================================================
+# Worktrees
+# =============================================================================
+
+
+@dataclass
+class SubtaskWorktree:
+    """A subtask's worktree and branch, created from the spec worktree."""
+
+    subtask_id: str
+    path: Path
+    branch: str
+    base_commit: str
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", value).strip("-.") or "subtask"
+
+
+def _git(args: list[str], cwd: Path, timeout: int = 60):
+    with span("git", command=args[0]):
+        return run_git(args, cwd=cwd, timeout=timeout)
+
+
+def _ignore_auto_claude_dir(worktree_path: Path) -> None:
+    """Keep .auto-claude/ (and the spec link in it) out of the subtask's commits."""
+    if _git(["check-ignore", "-q", ".auto-claude/"], worktree_path).returncode == 0:
+        return
+    result = _git(["rev-parse", "--git-path", "info/exclude"], worktree_path)
+    if result.returncode != 0:
+        return
+    exclude_file = Path(result.stdout.strip())
+    if not exclude_file.is_absolute():
+        exclude_file = worktree_path / exclude_file
+    exclude_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(exclude_file, "a", encoding="utf-8") as f:
+        f.write("\n.auto-claude/\n")
+
+
+def create_subtask_worktree(
+    project_dir: Path, spec_dir: Path, subtask_id: str
+) -> SubtaskWorktree:
+    """
+    Create a worktree for one subtask from the spec worktree's HEAD.
+
+    The spec directory is linked into the worktree at the same relative
+    location, so prompts can refer to it relative to the working directory.
+
+    Raises:
+        RuntimeError: If git can't create the worktree
+    """
+    name = _safe_name(subtask_id)
+    path = project_dir / SUBTASK_WORKTREES_DIR / name
+    branch = f"{SUBTASK_BRANCH_PREFIX}/{_safe_name(spec_dir.name)}/{name}"
+
+    base = _git(["rev-parse", "HEAD"], project_dir)
+    if base.returncode != 0:
+        raise RuntimeError(f"Could not read HEAD: {base.stderr.strip()}")
+
+    # Leftovers of an interrupted run
+    if path.exists():
+        _git(["worktree", "remove", "--force", str(path)], project_dir)
+    _git(["worktree", "prune"], project_dir)
+    _git(["branch", "-D", branch], project_dir)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    result = _git(
+        ["worktree", "add", "-b", branch, str(path), base.stdout.strip()],
+        project_dir,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Could not create worktree for subtask {subtask_id}: "
+            f"{result.stderr.strip()}"
+        )
+
+    _ignore_auto_claude_dir(path)
+    worktree = SubtaskWorktree(
+        subtask_id=subtask_id,
+        path=path,
+        branch=branch,
+        base_commit=base.stdout.strip(),
+    )
+    _prepare_worktree(project_dir, spec_dir, worktree)
+    return worktree
+
+
+def _prepare_worktree(
+    project_dir: Path, spec_dir: Path, worktree: SubtaskWorktree
+) -> None:
+    """Env files, dependencies, .claude config and a link to the spec."""
+    from core.workspace.setup import (
+        copy_env_files_to_worktree,
+        setup_worktree_dependencies,
+        symlink_claude_config_to_worktree,
+    )
+
+    copy_env_files_to_worktree(project_dir, worktree.path)
+    symlink_claude_config_to_worktree(project_dir, worktree.path)
+
+    project_index = None
+    project_index_path = project_dir / ".auto-claude" / "project_index.json"
+    if project_index_path.is_file():
+        try:
+            with open(project_index_path, encoding="utf-8") as f:
+                project_index = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not load project_index.json: {e}")
+    setup_worktree_dependencies(project_dir, worktree.path, project_index=project_index)
+
+    try:
+        relative_spec = spec_dir.resolve().relative_to(project_dir.resolve())
+    except ValueError:
+        return
+    link = worktree.path / relative_spec
+    if not link.exists():
+        try:
+            link.parent.mkdir(parents=True, exist_ok=True)
+            link.symlink_to(spec_dir.resolve(), target_is_directory=True)
+        except OSError as e:
+            logger.warning(f"Could not link spec into subtask worktree: {e}")
+
+
+def worktree_spec_dir(project_dir: Path, spec_dir: Path, worktree_path: Path) -> Path:
+    """The spec directory as seen from a subtask worktree (if linked there)."""
+    try:
+        relative_spec = spec_dir.resolve().relative_to(project_dir.resolve())
+    except ValueError:
+        return spec_dir
+    linked = worktree_path / relative_spec
+    return linked if linked.exists() else spec_dir
+
+
+def remove_subtask_worktree(project_dir: Path, worktree: SubtaskWorktree) -> None:
+    """Remove a subtask's worktree and branch."""
+    result = _git(["worktree", "remove", "--force", str(worktree.path)], project_dir)
+    if result.returncode != 0:
+        logger.warning(
+            f"Could not remove subtask worktree {worktree.path}: "
+            f"{result.stderr.strip()}"
+        )
+    _git(["worktree", "prune"], project_dir)
+    _git(["branch", "-D", worktree.branch], project_dir)
+
+
+# =============================================================================
+# Merging back
+# =============================================================================
+
+
+@dataclass
+class SubtaskMergeResult:
+    """Outcome of merging a subtask branch into the spec worktree."""
+
+    success: bool
+    method: str  # "none" (no commits), "git", "orchestrator" or "failed"
+    error: str | None = None
+
+
+def merge_subtask_worktree(
+    project_dir: Path, worktree: SubtaskWorktree
+) -> SubtaskMergeResult:
+    """
+    Merge a subtask's branch into the spec worktree's current branch.
+
+    Git merges it directly when it can. On conflicts the merge is aborted and
+    the subtask's changes go through the merge orchestrator (semantic merge,
+    AI resolution), whose result is committed. Call it for one subtask at a
+    time.
+
+    Changes the agent left uncommitted in the worktree are committed first,
+    so removing the worktree afterwards can't lose them.
+    """
+    leftover = _commit_leftover_changes(worktree)
+    if leftover is not None:
+        return leftover
+
+    ahead = _git(
+        ["rev-list", "--count", f"{worktree.base_commit}..{worktree.branch}"],
+        project_dir,
+    )
+    if ahead.returncode == 0 and ahead.stdout.strip() == "0":
+        return SubtaskMergeResult(success=True, method="none")
+
+    message = f"auto-claude: merge subtask {worktree.subtask_id}"
+    with span("subtask.merge", subtask_id=worktree.subtask_id):
+        result = _git(
+            ["merge", "--no-ff", "--no-edit", "-m", message, worktree.branch],
+            project_dir,
+            timeout=120,
+        )
+        if result.returncode == 0:
+            return SubtaskMergeResult(success=True, method="git")
+
+        _git(["merge", "--abort"], project_dir)
+        logger.info(
+            f"Git merge of subtask {worktree.subtask_id} conflicted, "
+            "using the merge orchestrator"
+        )
+        return _merge_with_orchestrator(project_dir, worktree, message)
+
+
+def _commit_leftover_changes(worktree: SubtaskWorktree) -> SubtaskMergeResult | None:
+    """Commit uncommitted work in a subtask worktree (None when that worked)."""
+    pathspec = ["--", ".", ":!.auto-claude"]
+    status = _git(["status", "--porcelain", *pathspec], worktree.path)
+    if status.returncode != 0:
+        return SubtaskMergeResult(False, "failed", status.stderr.strip())
+    if not status.stdout.strip():
+        return None
+
+    logger.info(f"Committing uncommitted changes of subtask {worktree.subtask_id}")
+    _git(["add", "-A", *pathspec], worktree.path)
+    commit = _git(
+        [
+            "commit",
+            "--no-verify",
+            "-m",
+            f"auto-claude: uncommitted changes of subtask {worktree.subtask_id}",
+        ],
+        worktree.path,
+    )
+    if commit.returncode != 0:
+        return SubtaskMergeResult(
+            False,
+            "failed",
+            f"Could not commit leftover changes: {commit.stderr.strip()}",
+        )
+    return None
+
+
+def _merge_with_orchestrator(
+    project_dir: Path, worktree: SubtaskWorktree, message: str
+) -> SubtaskMergeResult:
+    from merge import MergeOrchestrator
+
+    branch = _git(["rev-parse", "--abbrev-ref", "HEAD"], project_dir)
+    if branch.returncode != 0:
+        return SubtaskMergeResult(False, "failed", branch.stderr.strip())
+
+    task_id = f"subtask-{_safe_name(worktree.subtask_id)}"
+    try:
+        orchestrator = MergeOrchestrator(project_dir, enable_ai=True)
+        report = orchestrator.merge_task(
+            task_id,
+            worktree_path=worktree.path,
+            target_branch=branch.stdout.strip(),
+        )
+    except Exception as e:
+        logger.exception(f"Merge orchestrator failed for {task_id}")
+        return SubtaskMergeResult(False, "failed", str(e))
+
+    if not report.success or report.stats.files_need_review:
+        return SubtaskMergeResult(
+            False,
+            "failed",
+            report.error
+            or f"{report.stats.files_need_review} file(s) need manual review",
+        )
+    if not orchestrator.apply_to_project(report):
+        return SubtaskMergeResult(False, "failed", "Could not write merged files")
+
+    files = [
+        path for path, result in report.file_results.items() if result.merged_content
+    ]
+    if files:
+        _git(["add", "--", *files], project_dir)
+    # The orchestrator only writes merged content; apply deletions ourselves
+    deleted = _git(
+        [
+            "diff",
+            "--name-only",
+            "--diff-filter=D",
+            f"{worktree.base_commit}..{worktree.branch}",
+        ],
+        project_dir,
+    )
+    removed = deleted.stdout.splitlines() if deleted.returncode == 0 else []
+    if removed:
+        _git(["rm", "-q", "--ignore-unmatch", "--", *removed], project_dir)
+        files += removed
+    commit = _git(["commit", "--no-verify", "-m", message], project_dir)
+    if commit.returncode != 0 and files:
+        return SubtaskMergeResult(False, "failed", commit.stderr.strip())
+    return SubtaskMergeResult(success=True, method="orchestrator")
+
+
+# =============================================================================
+# Speedup
+# =============================================================================
+
+
+@dataclass
+class WaveStats:
+    """Timing of concurrent coder sessions, for reporting the speedup."""
+
+    waves: int = 0
+    sessions: int = 0
+    wall_seconds: float = 0.0
+    session_seconds: float = 0.0
+    _started: float = field(default=0.0, repr=False)
+
+    def start_wave(self) -> None:
+        self._started = time.monotonic()
+
+    def end_wave(self, session_durations: list[float]) -> float:
+        """Record a finished wave and return its speedup."""
+        wall = time.monotonic() - self._started
+        self.waves += 1
+        self.sessions += len(session_durations)
+        self.wall_seconds += wall
+        self.session_seconds += sum(session_durations)
+        return sum(session_durations) / wall if wall > 0 else 1.0
+
+    @property
+    def speedup(self) -> float:
+        """Session time over wall time: how much faster than one at a time."""
+        if self.wall_seconds <= 0:
+            return 1.0
+        return self.session_seconds / self.wall_seconds
@@ -16,6 +16,8 @@ from core.error_utils import (
     is_tool_concurrency_error,
 )
 from core.file_utils import write_json_atomic
+from core.plan_store import flush_plan_store
+from core.tracing import current_span, start_span, traced
 from debug import debug, debug_detailed, debug_error, debug_section, debug_success
 from insight_extractor import extract_session_insights
 from linear_updater import (
@@ -438,6 +440,7 @@ async def post_session_processing(
         return False
 
 
+@traced("agent.session")
 async def run_agent_session(
     client: ClaudeSDKClient,
     message: str,
@@ -474,12 +477,15 @@ async def run_agent_session(
         prompt_preview=message[:200] + "..." if len(message) > 200 else message,
     )
     print("Sending prompt to Claude Agent SDK...\n")
+    current_span().set(spec=spec_dir.name, phase=phase.value)
 
     # Get task logger for this spec
     task_logger = get_task_logger(spec_dir)
     current_tool = None
     message_count = 0
     tool_count = 0
+    # Trace spans of tool calls awaiting their result, by tool use ID
+    tool_spans = {}
 
     try:
         # Send the query
@@ -519,6 +525,9 @@ async def run_agent_session(
                         tool_name = block.name
                         tool_input_display = None
                         tool_count += 1
+                        tool_spans[getattr(block, "id", None)] = start_span(
+                            "agent.tool", tool=tool_name
+                        )
 
                         # Safely extract tool input (handles None, non-dict, etc.)
                         inp = get_safe_tool_input(block)
@@ -574,6 +583,11 @@ async def run_agent_session(
                     if block_type == "ToolResultBlock":
                         result_content = getattr(block, "content", "")
                         is_error = getattr(block, "is_error", False)
+                        tool_span = tool_spans.pop(
+                            getattr(block, "tool_use_id", None), None
+                        )
+                        if tool_span is not None:
+                            tool_span.end(error="tool_error" if is_error else None)
 
                         # Check if this is an error (not just content containing "blocked")
                         if is_error and "blocked" in str(result_content).lower():
@@ -724,3 +738,15 @@ async def run_agent_session(
             "exception_type": type(e).__name__,
         }
         return "error", sanitized_error, error_info
+
+    finally:
+        current_span().set(messages=message_count, tools=tool_count)
+        for tool_span in tool_spans.values():
+            tool_span.end(error="no_result")
+
+        # Write the plan updates this session's tool calls made, so the
+        # orchestrator and the UI see them in implementation_plan.json
+        try:
+            await flush_plan_store(spec_dir)
+        except OSError as e:
+            logger.warning(f"Failed to write implementation plan: {e}")
@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from core.file_utils import write_json_atomic
+from core.plan_store import PlanStore
 from spec.validate_pkg.auto_fix import auto_fix_plan
 
 try:
@@ -23,14 +23,14 @@ except ImportError:
     tool = None
 
 
-def _apply_qa_update(
+def _qa_signoff_mutation(
     plan: dict[str, Any],
     status: str,
     issues: list[Any],
     tests_passed: dict[str, Any],
-) -> int:
+) -> dict[str, Any]:
     """
-    Apply QA update to the plan and return the new QA session number.
+    Build the PlanStore mutation that records a QA sign-off.
 
     Args:
         plan: The implementation plan dict
@@ -39,7 +39,7 @@ def _apply_qa_update(
         tests_passed: Dict of test results
 
     Returns:
-        The new QA session number
+        The mutation; its qa_signoff value carries the new QA session number
     """
     # Get current QA session number
     current_qa = plan.get("qa_signoff", {})
@@ -47,23 +47,26 @@ def _apply_qa_update(
     if status in ["in_review", "rejected"]:
         qa_session += 1
 
-    plan["qa_signoff"] = {
-        "status": status,
-        "qa_session": qa_session,
-        "issues_found": issues,
-        "tests_passed": tests_passed,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "ready_for_qa_revalidation": status == "fixes_applied",
-    }
+    now = datetime.now(timezone.utc).isoformat()
 
     # NOTE: Do NOT write plan["status"] or plan["planStatus"] here.
     # The frontend XState task state machine owns status transitions.
     # Writing status here races with XState's persistPlanStatusAndReasonSync()
     # and can clobber the reviewReason field, causing tasks to appear "incomplete".
-
-    plan["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-    return qa_session
+    return {
+        "op": "set",
+        "values": {
+            "qa_signoff": {
+                "status": status,
+                "qa_session": qa_session,
+                "issues_found": issues,
+                "tests_passed": tests_passed,
+                "timestamp": now,
+                "ready_for_qa_revalidation": status == "fixes_applied",
+            }
+        },
+        "at": now,
+    }
 
 
 def create_qa_tools(spec_dir: Path, project_dir: Path) -> list:
@@ -124,6 +127,11 @@ def create_qa_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
+        store = PlanStore.for_spec(spec_dir)
+
+        def build_mutation(plan: dict[str, Any]) -> dict[str, Any]:
+            return _qa_signoff_mutation(plan, status, issues, tests_passed)
+
         try:
             # Parse issues and tests
             try:
@@ -136,13 +144,8 @@ def create_qa_tools(spec_dir: Path, project_dir: Path) -> list:
             except json.JSONDecodeError:
                 tests_passed = {}
 
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
-
-            qa_session = _apply_qa_update(plan, status, issues, tests_passed)
-
-            # Use atomic write to prevent file corruption
-            write_json_atomic(plan_file, plan, indent=2)
+            mutation = await store.mutate(build_mutation)
+            qa_session = mutation["values"]["qa_signoff"]["qa_session"]
 
             return {
                 "content": [
@@ -158,11 +161,9 @@ def create_qa_tools(spec_dir: Path, project_dir: Path) -> list:
             if auto_fix_plan(spec_dir):
                 # Retry after fix
                 try:
-                    with open(plan_file, encoding="utf-8") as f:
-                        plan = json.load(f)
-
-                    qa_session = _apply_qa_update(plan, status, issues, tests_passed)
-                    write_json_atomic(plan_file, plan, indent=2)
+                    store.invalidate()
+                    mutation = await store.mutate(build_mutation)
+                    qa_session = mutation["values"]["qa_signoff"]["qa_session"]
 
                     return {
                         "content": [
@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from core.file_utils import write_json_atomic
+from core.plan_store import PlanStore
 from spec.validate_pkg.auto_fix import auto_fix_plan
 
 try:
@@ -23,14 +23,14 @@ except ImportError:
     tool = None
 
 
-def _update_subtask_in_plan(
+def _subtask_status_mutation(
     plan: dict[str, Any],
     subtask_id: str,
     status: str,
     notes: str,
-) -> bool:
+) -> dict[str, Any] | None:
     """
-    Update a subtask in the plan.
+    Build the PlanStore mutation that updates a subtask's status.
 
     Args:
         plan: The implementation plan dict
@@ -39,25 +39,26 @@ def _update_subtask_in_plan(
         notes: Optional notes to add
 
     Returns:
-        True if subtask was found and updated, False otherwise
+        The mutation, or None if the subtask is not in the plan
     """
-    subtask_found = False
-    for phase in plan.get("phases", []):
-        for subtask in phase.get("subtasks", []):
-            if subtask.get("id") == subtask_id:
-                subtask["status"] = status
-                if notes:
-                    subtask["notes"] = notes
-                subtask["updated_at"] = datetime.now(timezone.utc).isoformat()
-                subtask_found = True
-                break
-        if subtask_found:
-            break
-
-    if subtask_found:
-        plan["last_updated"] = datetime.now(timezone.utc).isoformat()
+    subtask_found = any(
+        subtask.get("id") == subtask_id
+        for phase in plan.get("phases", [])
+        for subtask in phase.get("subtasks", [])
+    )
+    if not subtask_found:
+        return None
 
-    return subtask_found
+    now = datetime.now(timezone.utc).isoformat()
+    fields = {"status": status, "updated_at": now}
+    if notes:
+        fields["notes"] = notes
+    return {
+        "op": "update_subtask",
+        "subtask_id": subtask_id,
+        "fields": fields,
+        "at": now,
+    }
 
 
 def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
@@ -112,13 +113,17 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
-        try:
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
+        store = PlanStore.for_spec(spec_dir)
+
+        def build_mutation(plan: dict[str, Any]) -> dict[str, Any] | None:
+            return _subtask_status_mutation(plan, subtask_id, status, notes)
 
-            subtask_found = _update_subtask_in_plan(plan, subtask_id, status, notes)
+        try:
+            # Applied in memory and journaled; the plan file is written shortly
+            # after by the store, coalescing bursts of updates
+            mutation = await store.mutate(build_mutation)
 
-            if not subtask_found:
+            if mutation is None:
                 return {
                     "content": [
                         {
@@ -128,9 +133,6 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                     ]
                 }
 
-            # Use atomic write to prevent file corruption
-            write_json_atomic(plan_file, plan, indent=2)
-
             return {
                 "content": [
                     {
@@ -145,15 +147,10 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
             if auto_fix_plan(spec_dir):
                 # Retry after fix
                 try:
-                    with open(plan_file, encoding="utf-8") as f:
-                        plan = json.load(f)
-
-                    subtask_found = _update_subtask_in_plan(
-                        plan, subtask_id, status, notes
-                    )
+                    store.invalidate()
+                    mutation = await store.mutate(build_mutation)
 
-                    if subtask_found:
-                        write_json_atomic(plan_file, plan, indent=2)
+                    if mutation is not None:
                         return {
                             "content": [
                                 {
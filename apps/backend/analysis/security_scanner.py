@@ -7,6 +7,14 @@ Consolidates security scanning including secrets detection and SAST tools.
 This module integrates the existing scan_secrets.py and provides a unified
 interface for all security scanning.
 
+Scanners are independent, so scan() runs them concurrently in a thread pool
+(each one is bound by its subprocess). Dependency audits (npm audit,
+pip-audit) are cached in ``.auto-claude/security-audit-cache/``, keyed by a
+hash of the project's manifests and lockfiles, so QA iterations that don't
+touch dependencies skip them. Bandit only scans the Python files changed in
+the worktree diff unless full_scan=True. Set ``SECURITY_AUDIT_CACHE=false``
+to disable the audit cache.
+
 The security scanner is used by:
 - QA Agent: To verify no secrets are committed
 - Validation Strategy: To run security scans for high-risk changes
@@ -23,12 +31,18 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import subprocess
-from dataclasses import dataclass, field
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+from core.env_flags import env_flag
+
 # Import the existing secrets scanner
 try:
     from security.scan_secrets import SecretMatch, get_all_tracked_files, scan_files
@@ -39,6 +53,39 @@ except ImportError:
     SecretMatch = None
 
 
+AUDIT_CACHE_DIR_NAME = "security-audit-cache"
+
+# Advisory databases change even when the lockfile doesn't
+AUDIT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Files whose content determines each audit's result
+NPM_AUDIT_INPUTS = (
+    "package.json",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+)
+PIP_AUDIT_INPUTS = (
+    "requirements*.txt",
+    "constraints*.txt",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "poetry.lock",
+    "uv.lock",
+    "Pipfile.lock",
+)
+
+# Branches tried (in order) as the base of the worktree diff
+DEFAULT_BASE_BRANCHES = ("main", "master", "develop")
+
+
+def is_audit_cache_enabled() -> bool:
+    """Whether dependency audit results are cached (SECURITY_AUDIT_CACHE)."""
+    return env_flag("SECURITY_AUDIT_CACHE", default=True)
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -79,6 +126,8 @@ class SecurityScanResult:
         scan_errors: List of errors during scanning
         has_critical_issues: Whether any critical issues were found
         should_block_qa: Whether these results should block QA approval
+        scanner_timings: Wall-clock seconds per scanner that ran
+        cached_scanners: Scanners whose results came from the audit cache
     """
 
     secrets: list[dict[str, Any]] = field(default_factory=list)
@@ -86,6 +135,16 @@ class SecurityScanResult:
     scan_errors: list[str] = field(default_factory=list)
     has_critical_issues: bool = False
     should_block_qa: bool = False
+    scanner_timings: dict[str, float] = field(default_factory=dict)
+    cached_scanners: list[str] = field(default_factory=list)
+
+    def merge(self, other: SecurityScanResult) -> None:
+        """Append another (partial) result's findings to this one."""
+        self.secrets.extend(other.secrets)
+        self.vulnerabilities.extend(other.vulnerabilities)
+        self.scan_errors.extend(other.scan_errors)
+        self.scanner_timings.update(other.scanner_timings)
+        self.cached_scanners.extend(other.cached_scanners)
 
 
 # =============================================================================
@@ -103,10 +162,17 @@ class SecurityScanner:
     - npm audit for JavaScript vulnerabilities (if applicable)
     """
 
-    def __init__(self) -> None:
-        """Initialize the security scanner."""
+    def __init__(self, audit_cache_dir: Path | None = None) -> None:
+        """
+        Initialize the security scanner.
+
+        Args:
+            audit_cache_dir: Override for the dependency audit cache
+                (default: <project>/.auto-claude/security-audit-cache)
+        """
         self._bandit_available: bool | None = None
         self._npm_available: bool | None = None
+        self._audit_cache_dir = audit_cache_dir
 
     def scan(
         self,
@@ -116,6 +182,8 @@ class SecurityScanner:
         run_secrets: bool = True,
         run_sast: bool = True,
         run_dependency_audit: bool = True,
+        full_scan: bool = False,
+        base_branch: str | None = None,
     ) -> SecurityScanResult:
         """
         Run all applicable security scans.
@@ -127,6 +195,10 @@ class SecurityScanner:
             run_secrets: Whether to run secrets scanning
             run_sast: Whether to run SAST tools
             run_dependency_audit: Whether to run dependency audits
+            full_scan: Run SAST over the whole project instead of only the
+                changed files, and ignore cached dependency audits
+            base_branch: Branch the worktree diff is taken against when
+                changed_files is None (default: auto-detect)
 
         Returns:
             SecurityScanResult with all findings
@@ -134,17 +206,56 @@ class SecurityScanner:
         project_dir = Path(project_dir)
         result = SecurityScanResult()
 
-        # Run secrets scan
+        # Each scanner fills its own partial result; merging them in this
+        # order keeps the output stable however the threads finish.
+        scanners: list[tuple[str, Any]] = []
         if run_secrets:
-            self._run_secrets_scan(project_dir, changed_files, result)
-
-        # Run SAST based on project type
-        if run_sast:
-            self._run_sast_scans(project_dir, result)
-
-        # Run dependency audits
+            scanners.append(
+                (
+                    "secrets",
+                    lambda r: self._run_secrets_scan(project_dir, changed_files, r),
+                )
+            )
+        if run_sast and self._is_python_project(project_dir):
+            scanners.append(
+                (
+                    "bandit",
+                    lambda r: self._run_sast_scans(
+                        project_dir, r, changed_files, full_scan, base_branch
+                    ),
+                )
+            )
         if run_dependency_audit:
-            self._run_dependency_audits(project_dir, result)
+            if (project_dir / "package.json").exists():
+                scanners.append(
+                    (
+                        "npm_audit",
+                        lambda r: self._run_cached_audit(
+                            "npm_audit", project_dir, r, full_scan
+                        ),
+                    )
+                )
+            if self._is_python_project(project_dir):
+                scanners.append(
+                    (
+                        "pip_audit",
+                        lambda r: self._run_cached_audit(
+                            "pip_audit", project_dir, r, full_scan
+                        ),
+                    )
+                )
+
+        if scanners:
+            partials = [SecurityScanResult() for _ in scanners]
+            with ThreadPoolExecutor(max_workers=len(scanners)) as executor:
+                futures = [
+                    executor.submit(self._timed, name, run, partial)
+                    for (name, run), partial in zip(scanners, partials)
+                ]
+                for future in futures:
+                    future.result()
+            for partial in partials:
+                result.merge(partial)
 
         # Determine if should block QA
         result.has_critical_issues = (
@@ -163,6 +274,16 @@ class SecurityScanner:
 
         return result
 
+    @staticmethod
+    def _timed(name: str, run: Any, result: SecurityScanResult) -> None:
+        """Run one scanner into its partial result, recording its duration."""
+        started = time.perf_counter()
+        try:
+            run(result)
+        except Exception as e:
+            result.scan_errors.append(f"{name} error: {str(e)}")
+        result.scanner_timings[name] = round(time.perf_counter() - started, 3)
+
     def _run_secrets_scan(
         self,
         project_dir: Path,
@@ -210,43 +331,139 @@ class SecurityScanner:
         except Exception as e:
             result.scan_errors.append(f"Secrets scan error: {str(e)}")
 
-    def _run_sast_scans(self, project_dir: Path, result: SecurityScanResult) -> None:
-        """Run SAST tools based on project type."""
+    def _run_sast_scans(
+        self,
+        project_dir: Path,
+        result: SecurityScanResult,
+        changed_files: list[str] | None = None,
+        full_scan: bool = True,
+        base_branch: str | None = None,
+    ) -> None:
+        """
+        Run SAST tools based on project type.
+
+        Unless full_scan is set, Bandit only scans the changed Python files:
+        changed_files if given, otherwise the worktree diff against the base
+        branch. Without a usable diff (not a git repo, no base branch, an
+        empty diff) it falls back to the full scan.
+        """
         # Python SAST with Bandit
         if self._is_python_project(project_dir):
-            self._run_bandit(project_dir, result)
+            files = None
+            if not full_scan:
+                if changed_files is None:
+                    # An empty diff is more likely a bad base than a clean tree
+                    changed_files = (
+                        self._get_worktree_changed_files(project_dir, base_branch)
+                        or None
+                    )
+                if changed_files is not None:
+                    files = [
+                        f
+                        for f in changed_files
+                        if f.endswith(".py") and (project_dir / f).is_file()
+                    ]
+                    if not files:
+                        return  # No Python changes to scan
+            self._run_bandit(project_dir, result, files)
 
         # JavaScript/Node.js - npm audit
         # (handled in dependency audits for Node projects)
 
-    def _run_bandit(self, project_dir: Path, result: SecurityScanResult) -> None:
-        """Run Bandit security scanner for Python projects."""
+    def _get_worktree_changed_files(
+        self, project_dir: Path, base_branch: str | None = None
+    ) -> list[str] | None:
+        """
+        List files changed in the worktree relative to its base branch.
+
+        Includes committed, uncommitted and untracked (non-ignored) files
+        under project_dir (which may be a subdirectory of the repository).
+
+        Returns:
+            Project-relative paths, or None if the diff can't be computed
+        """
+        candidates = [base_branch] if base_branch else DEFAULT_BASE_BRANCHES
+        try:
+            merge_base = None
+            for branch in candidates:
+                proc = subprocess.run(
+                    ["git", "merge-base", branch, "HEAD"],
+                    cwd=project_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                if proc.returncode == 0 and proc.stdout.strip():
+                    merge_base = proc.stdout.strip()
+                    break
+            if merge_base is None:
+                return None
+
+            files: list[str] = []
+            for cmd in (
+                [
+                    "git",
+                    "diff",
+                    "--name-only",
+                    "--relative",
+                    "--diff-filter=ACMR",
+                    merge_base,
+                ],
+                ["git", "ls-files", "--others", "--exclude-standard"],
+            ):
+                proc = subprocess.run(
+                    cmd, cwd=project_dir, capture_output=True, text=True, timeout=30
+                )
+                if proc.returncode != 0:
+                    return None
+                files.extend(f.strip() for f in proc.stdout.splitlines() if f.strip())
+            return list(dict.fromkeys(files))
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+
+    def _run_bandit(
+        self,
+        project_dir: Path,
+        result: SecurityScanResult,
+        files: list[str] | None = None,
+    ) -> None:
+        """
+        Run Bandit security scanner for Python projects.
+
+        Args:
+            project_dir: Path to the project root
+            result: Result to add findings to
+            files: Project-relative files to scan (None scans the source dirs)
+        """
         if not self._check_bandit_available():
             return
 
         try:
-            # Find Python source directories
-            src_dirs = []
-            for candidate in ["src", "app", project_dir.name, "."]:
-                candidate_path = project_dir / candidate
-                if (
-                    candidate_path.exists()
-                    and (candidate_path / "__init__.py").exists()
-                ):
-                    src_dirs.append(str(candidate_path))
-
-            if not src_dirs:
-                # Try to find any Python files
-                py_files = list(project_dir.glob("**/*.py"))
-                if not py_files:
-                    return
-                src_dirs = ["."]
+            if files:
+                targets = files
+            else:
+                # Find Python source directories
+                targets = []
+                for candidate in ["src", "app", project_dir.name, "."]:
+                    candidate_path = project_dir / candidate
+                    if (
+                        candidate_path.exists()
+                        and (candidate_path / "__init__.py").exists()
+                    ):
+                        targets.append(str(candidate_path))
+
+                if not targets:
+                    # Try to find any Python files
+                    py_files = list(project_dir.glob("**/*.py"))
+                    if not py_files:
+                        return
+                    targets = ["."]
 
             # Run bandit
             cmd = [
                 "bandit",
                 "-r",
-                *src_dirs,
+                *targets,
                 "-f",
                 "json",
                 "--exit-zero",  # Don't fail on findings
@@ -293,20 +510,100 @@ class SecurityScanner:
         except Exception as e:
             result.scan_errors.append(f"Bandit error: {str(e)}")
 
-    def _run_dependency_audits(
-        self, project_dir: Path, result: SecurityScanResult
+    def _run_cached_audit(
+        self,
+        source: str,
+        project_dir: Path,
+        result: SecurityScanResult,
+        refresh: bool = False,
     ) -> None:
-        """Run dependency vulnerability audits."""
-        # npm audit for JavaScript projects
-        if (project_dir / "package.json").exists():
-            self._run_npm_audit(project_dir, result)
+        """
+        Run a dependency audit, reusing a cached result for the same lockfiles.
 
-        # pip-audit for Python projects (if available)
-        if self._is_python_project(project_dir):
-            self._run_pip_audit(project_dir, result)
+        Only audits that produced a parseable report are cached, so a missing
+        tool or a failed run is retried next time.
+
+        Args:
+            source: "npm_audit" or "pip_audit"
+            project_dir: Path to the project root
+            result: Result to add findings to
+            refresh: Ignore (and overwrite) any cached result
+        """
+        run, inputs = {
+            "npm_audit": (self._run_npm_audit, NPM_AUDIT_INPUTS),
+            "pip_audit": (self._run_pip_audit, PIP_AUDIT_INPUTS),
+        }[source]
+
+        if not is_audit_cache_enabled():
+            run(project_dir, result)
+            return
+
+        cache_file = self._audit_cache_file(project_dir, source, inputs)
+        if not refresh:
+            cached = self._load_cached_audit(cache_file)
+            if cached is not None:
+                result.vulnerabilities.extend(cached)
+                result.cached_scanners.append(source)
+                return
+
+        audit = SecurityScanResult()
+        if run(project_dir, audit):
+            self._store_cached_audit(cache_file, audit.vulnerabilities)
+        result.merge(audit)
+
+    def _audit_cache_file(
+        self, project_dir: Path, source: str, inputs: tuple[str, ...]
+    ) -> Path:
+        """Cache entry path for an audit, keyed by its input files' content."""
+        digest = hashlib.sha256()
+        for pattern in inputs:
+            for path in sorted(project_dir.glob(pattern)):
+                if path.is_file():
+                    digest.update(path.name.encode())
+                    digest.update(hashlib.sha256(path.read_bytes()).digest())
+        cache_dir = self._audit_cache_dir or (
+            project_dir / ".auto-claude" / AUDIT_CACHE_DIR_NAME
+        )
+        return cache_dir / f"{source}-{digest.hexdigest()[:32]}.json"
 
-    def _run_npm_audit(self, project_dir: Path, result: SecurityScanResult) -> None:
-        """Run npm audit for JavaScript projects."""
+    def _load_cached_audit(
+        self, cache_file: Path
+    ) -> list[SecurityVulnerability] | None:
+        """Load a cached audit result, or None if missing, stale or unreadable."""
+        try:
+            if time.time() - cache_file.stat().st_mtime > AUDIT_CACHE_TTL_SECONDS:
+                return None
+            with open(cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+            return [SecurityVulnerability(**v) for v in data["vulnerabilities"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_cached_audit(
+        self, cache_file: Path, vulnerabilities: list[SecurityVulnerability]
+    ) -> None:
+        """Write an audit result to the cache (atomically; failures are ignored)."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Drop entries for older lockfiles of the same audit
+            source = cache_file.name.rsplit("-", 1)[0]
+            for old in cache_file.parent.glob(f"{source}-*.json"):
+                if old != cache_file:
+                    old.unlink(missing_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"vulnerabilities": [asdict(v) for v in vulnerabilities]}, f)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+
+    def _run_npm_audit(self, project_dir: Path, result: SecurityScanResult) -> bool:
+        """
+        Run npm audit for JavaScript projects.
+
+        Returns:
+            True if npm audit produced a report (the result can be cached)
+        """
         try:
             cmd = ["npm", "audit", "--json"]
 
@@ -349,6 +646,7 @@ class SecurityScanner:
                                 file="package.json",
                             )
                         )
+                    return True
                 except json.JSONDecodeError:
                     pass  # npm audit may return invalid JSON on no findings
 
@@ -358,9 +656,15 @@ class SecurityScanner:
             pass  # npm not available
         except Exception as e:
             result.scan_errors.append(f"npm audit error: {str(e)}")
+        return False
+
+    def _run_pip_audit(self, project_dir: Path, result: SecurityScanResult) -> bool:
+        """
+        Run pip-audit for Python projects (if available).
 
-    def _run_pip_audit(self, project_dir: Path, result: SecurityScanResult) -> None:
-        """Run pip-audit for Python projects (if available)."""
+        Returns:
+            True if pip-audit produced a report (the result can be cached)
+        """
         try:
             cmd = ["pip-audit", "--format", "json"]
 
@@ -389,6 +693,7 @@ class SecurityScanner:
                                 else None,
                             )
                         )
+                    return True
                 except json.JSONDecodeError:
                     pass
 
@@ -398,6 +703,7 @@ class SecurityScanner:
             pass
         except Exception:
             pass
+        return False
 
     def _is_python_project(self, project_dir: Path) -> bool:
         """Check if this is a Python project."""
@@ -459,6 +765,8 @@ class SecurityScanner:
             "scan_errors": result.scan_errors,
             "has_critical_issues": result.has_critical_issues,
             "should_block_qa": result.should_block_qa,
+            "scanner_timings": result.scanner_timings,
+            "cached_scanners": result.cached_scanners,
             "summary": {
                 "total_secrets": len(result.secrets),
                 "total_vulnerabilities": len(result.vulnerabilities),
@@ -487,6 +795,7 @@ def scan_for_security_issues(
     project_dir: Path,
     spec_dir: Path | None = None,
     changed_files: list[str] | None = None,
+    full_scan: bool = False,
 ) -> SecurityScanResult:
     """
     Convenience function to run security scan.
@@ -495,12 +804,13 @@ def scan_for_security_issues(
         project_dir: Path to project root
         spec_dir: Optional spec directory to save results
         changed_files: Optional list of files to scan
+        full_scan: Run SAST on the whole project and refresh cached audits
 
     Returns:
         SecurityScanResult with all findings
     """
     scanner = SecurityScanner()
-    return scanner.scan(project_dir, spec_dir, changed_files)
+    return scanner.scan(project_dir, spec_dir, changed_files, full_scan=full_scan)
 
 
 def has_security_issues(project_dir: Path) -> bool:
@@ -557,6 +867,11 @@ def main() -> None:
     parser.add_argument(
         "--secrets-only", action="store_true", help="Only scan for secrets"
     )
+    parser.add_argument(
+        "--full-scan",
+        action="store_true",
+        help="Run SAST on the whole project and refresh cached dependency audits",
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     args = parser.parse_args()
@@ -567,6 +882,7 @@ def main() -> None:
         spec_dir=args.spec_dir,
         run_sast=not args.secrets_only,
         run_dependency_audit=not args.secrets_only,
+        full_scan=args.full_scan,
     )
 
     if args.json:
@@ -576,6 +892,9 @@ def main() -> None:
         print(f"Vulnerabilities: {len(result.vulnerabilities)}")
         print(f"Has Critical Issues: {result.has_critical_issues}")
         print(f"Should Block QA: {result.should_block_qa}")
+        for name, seconds in result.scanner_timings.items():
+            cached = " (cached)" if name in result.cached_scanners else ""
+            print(f"  {name}: {seconds:.2f}s{cached}")
 
         if result.secrets:
             print("\nSecrets Detected:")
@@ -16,19 +16,9 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 
-from .batch_commands import (
-    handle_batch_cleanup_command,
-    handle_batch_create_command,
-    handle_batch_status_command,
-)
-from .build_commands import handle_build_command
-from .followup_commands import handle_followup_command
-from .qa_commands import (
-    handle_qa_command,
-    handle_qa_status_command,
-    handle_review_status_command,
-)
-from .spec_commands import print_specs_list
+# Command handlers are imported when their command is dispatched: between
+# them they pull in the agent SDK, Graphiti and Linear, which --list, the
+# status checks and the UI's --merge-preview polling don't need.
 from .utils import (
     DEFAULT_MODEL,
     find_spec,
@@ -36,14 +26,6 @@ from .utils import (
     print_banner,
     setup_environment,
 )
-from .workspace_commands import (
-    handle_cleanup_worktrees_command,
-    handle_create_pr_command,
-    handle_discard_command,
-    handle_list_worktrees_command,
-    handle_merge_command,
-    handle_review_command,
-)
 
 
 def parse_args() -> argparse.Namespace:
@@ -329,30 +311,42 @@ def _run_cli() -> None:
 
     # Handle --list command
     if args.list:
+        from .spec_commands import print_specs_list
+
         print_banner()
         print_specs_list(project_dir)
         return
 
     # Handle --list-worktrees command
     if args.list_worktrees:
+        from .workspace_commands import handle_list_worktrees_command
+
         handle_list_worktrees_command(project_dir)
         return
 
     # Handle --cleanup-worktrees command
     if args.cleanup_worktrees:
+        from .workspace_commands import handle_cleanup_worktrees_command
+
         handle_cleanup_worktrees_command(project_dir)
         return
 
     # Handle batch commands
     if args.batch_create:
+        from .batch_commands import handle_batch_create_command
+
         handle_batch_create_command(args.batch_create, str(project_dir))
         return
 
     if args.batch_status:
+        from .batch_commands import handle_batch_status_command
+
         handle_batch_status_command(str(project_dir))
         return
 
     if args.batch_cleanup:
+        from .batch_commands import handle_batch_cleanup_command
+
         handle_batch_cleanup_command(str(project_dir), dry_run=not args.no_dry_run)
         return
 
@@ -371,6 +365,8 @@ def _run_cli() -> None:
     debug("run.py", "Finding spec", spec_identifier=args.spec)
     spec_dir = find_spec(project_dir, args.spec)
     if not spec_dir:
+        from .spec_commands import print_specs_list
+
         debug_error("run.py", "Spec not found", spec=args.spec)
         print_banner()
         print(f"\nError: Spec '{args.spec}' not found")
@@ -403,6 +399,8 @@ def _run_cli() -> None:
         return
 
     if args.merge:
+        from .workspace_commands import handle_merge_command
+
         success = handle_merge_command(
             project_dir,
             spec_dir.name,
@@ -414,16 +412,22 @@ def _run_cli() -> None:
         return
 
     if args.review:
+        from .workspace_commands import handle_review_command
+
         handle_review_command(project_dir, spec_dir.name)
         return
 
     if args.discard:
+        from .workspace_commands import handle_discard_command
+
         handle_discard_command(project_dir, spec_dir.name)
         return
 
     if args.create_pr:
         # Pass args.pr_target directly - WorktreeManager._detect_base_branch
         # handles base branch detection internally when target_branch is None
+        from .workspace_commands import handle_create_pr_command
+
         result = handle_create_pr_command(
             project_dir=project_dir,
             spec_name=spec_dir.name,
@@ -438,14 +442,20 @@ def _run_cli() -> None:
 
     # Handle QA commands
     if args.qa_status:
+        from .qa_commands import handle_qa_status_command
+
         handle_qa_status_command(spec_dir)
         return
 
     if args.review_status:
+        from .qa_commands import handle_review_status_command
+
         handle_review_status_command(spec_dir)
         return
 
     if args.qa:
+        from .qa_commands import handle_qa_command
+
         handle_qa_command(
             project_dir=project_dir,
             spec_dir=spec_dir,
@@ -456,6 +466,8 @@ def _run_cli() -> None:
 
     # Handle --followup command
     if args.followup:
+        from .followup_commands import handle_followup_command
+
         handle_followup_command(
             project_dir=project_dir,
             spec_dir=spec_dir,
@@ -465,6 +477,8 @@ def _run_cli() -> None:
         return
 
     # Normal build flow
+    from .build_commands import handle_build_command
+
     handle_build_command(
         project_dir=project_dir,
         spec_dir=spec_dir,
@@ -5,6 +5,7 @@ CLI Utilities
 Shared utility functions for the Aperant-MCP CLI.
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -15,6 +16,7 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 from core.auth import get_auth_token, get_auth_token_source
+from core.debug import reload_debug_config
 from core.dependency_validator import validate_platform_dependencies
 
 
@@ -26,7 +28,8 @@ def import_dotenv():
     runner scripts when python-dotenv is not available.
 
     Returns:
-        The load_dotenv function
+        The load_dotenv function, wrapped to re-read the debug settings
+        (which are resolved once, at import) after the .env file is loaded
 
     Raises:
         SystemExit: If dotenv cannot be imported, with helpful installation instructions.
@@ -34,7 +37,13 @@ def import_dotenv():
     try:
         from dotenv import load_dotenv as _load_dotenv
 
-        return _load_dotenv
+        @functools.wraps(_load_dotenv)
+        def load_dotenv(*args, **kwargs):
+            loaded = _load_dotenv(*args, **kwargs)
+            reload_debug_config()
+            return loaded
+
+        return load_dotenv
     except ImportError:
         sys.exit(
             "Error: Required Python package 'python-dotenv' is not installed.\n"
@@ -58,9 +67,8 @@ def import_dotenv():
 load_dotenv = import_dotenv()
 # NOTE: graphiti_config is imported lazily in validate_environment() to avoid
 # triggering graphiti_core -> real_ladybug -> pywintypes import chain before
-# platform dependency validation can run. See ACS-253.
-from linear_integration import LinearManager
-from linear_updater import is_linear_enabled
+# platform dependency validation can run. See ACS-253. The Linear modules are
+# imported there too: they load the agent SDK, which most commands never use.
 from spec.pipeline import get_specs_dir
 from ui import (
     Icons,
@@ -188,6 +196,9 @@ def validate_environment(spec_dir: Path) -> bool:
         valid = False
 
     # Check Linear integration (optional but show status)
+    from linear_integration import LinearManager
+    from linear_updater import is_linear_enabled
+
     if is_linear_enabled():
         print("Linear integration: ENABLED")
         # Show Linear project status if initialized
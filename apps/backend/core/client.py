@@ -12,13 +12,14 @@ The client factory now uses AGENT_CONFIGS from agents/tools_pkg/models.py as the
 single source of truth for phase-aware tool and MCP server configuration.
 """
 
-import copy
 import json
 import logging
 import os
 import threading
 import time
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from core.fast_mode import ensure_fast_mode_in_user_settings
@@ -26,6 +27,7 @@ from core.platform import (
     is_windows,
     validate_cli_path,
 )
+from core.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -34,18 +36,47 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # Caches project index and capabilities to avoid reloading on every create_client() call.
 # This significantly reduces the time to create new agent sessions.
+#
+# Cached data is frozen (read-only mappings and tuples) so it can be handed to
+# every caller without copying. An entry is valid while project_index.json has
+# the stat signature it was loaded with; the analyzer rewriting the file
+# invalidates it on the next call.
 
-_PROJECT_INDEX_CACHE: dict[str, tuple[dict[str, Any], dict[str, bool], float]] = {}
-_CACHE_TTL_SECONDS = 300  # 5 minute TTL
+_FileSignature = tuple[int, int, int] | None
+
+_PROJECT_INDEX_CACHE: dict[
+    str, tuple[Mapping[str, Any], Mapping[str, bool], _FileSignature]
+] = {}
 _CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE access
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _project_index_signature(project_dir: Path) -> _FileSignature:
+    """Stat signature of project_index.json, or None if it doesn't exist."""
+    try:
+        st = (project_dir / ".auto-claude" / "project_index.json").stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
 def _get_cached_project_data(
     project_dir: Path,
-) -> tuple[dict[str, Any], dict[str, bool]]:
+) -> tuple[Mapping[str, Any], Mapping[str, bool]]:
     """
     Get project index and capabilities with caching.
 
+    The returned mappings are shared and read-only; use
+    dict(project_capabilities) (or a deep copy of the index) to modify them.
+
     Args:
         project_dir: Path to the project directory
 
@@ -54,32 +85,27 @@ def _get_cached_project_data(
     """
 
     key = str(project_dir.resolve())
-    now = time.time()
+    signature = _project_index_signature(project_dir)
     debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
 
     # Check cache with lock
     with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = now - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                if debug:
-                    print(
-                        f"[ClientCache] Cache HIT for project index (age: {cache_age:.1f}s / TTL: {_CACHE_TTL_SECONDS}s)"
-                    )
-                logger.debug(f"Using cached project index for {project_dir}")
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-            elif debug:
-                print(
-                    f"[ClientCache] Cache EXPIRED for project index (age: {cache_age:.1f}s > TTL: {_CACHE_TTL_SECONDS}s)"
-                )
-
-    # Cache miss or expired - load fresh data (outside lock to avoid blocking)
+        cached = _PROJECT_INDEX_CACHE.get(key)
+    if cached is not None:
+        cached_index, cached_capabilities, cached_signature = cached
+        if cached_signature == signature:
+            logger.debug(f"Using cached project index for {project_dir}")
+            return cached_index, cached_capabilities
+        if debug:
+            print("[ClientCache] project_index.json changed, reloading")
+
+    # Cache miss or stale - load fresh data (outside lock to avoid blocking)
     load_start = time.time()
     logger.debug(f"Loading project index for {project_dir}")
-    project_index = load_project_index(project_dir)
-    project_capabilities = detect_project_capabilities(project_index)
+    with span("project.load_index"):
+        raw_index = load_project_index(project_dir)
+        project_index = _freeze(raw_index)
+        project_capabilities = _freeze(detect_project_capabilities(raw_index))
 
     if debug:
         load_duration = (time.time() - load_start) * 1000
@@ -87,24 +113,11 @@ def _get_cached_project_data(
             f"[ClientCache] Cache MISS - loaded project index in {load_duration:.1f}ms"
         )
 
-    # Store in cache with lock - use double-checked locking pattern
-    # Re-check if another thread populated the cache while we were loading
+    # If the file changed while it was being read, the entry is stored under
+    # the old signature and the next call reloads it
     with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = time.time() - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                # Another thread already cached valid data while we were loading
-                if debug:
-                    print(
-                        "[ClientCache] Cache was populated by another thread, using cached data"
-                    )
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-        # Either no cache entry or it's expired - store our fresh data
-        _PROJECT_INDEX_CACHE[key] = (project_index, project_capabilities, time.time())
+        _PROJECT_INDEX_CACHE[key] = (project_index, project_capabilities, signature)
 
-    # Return the freshly loaded data (no need to copy since it's not from cache)
     return project_index, project_capabilities
 
 
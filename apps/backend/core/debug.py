@@ -9,18 +9,37 @@ Controlled via environment variables:
   - DEBUG_LEVEL=1|2|3   Log verbosity (1=basic, 2=detailed, 3=verbose)
   - DEBUG_LOG_FILE=path Optional file output
 
+The environment is read once, at import. Call reload_debug_config() after
+changing it (e.g. after loading a .env file).
+
+With debug mode off, the debug functions return after a single comparison.
+Arguments are still evaluated by the caller, so expensive messages or values
+can be passed as callables (called only when the line is written), or built
+behind an is_debug_enabled() check.
+
 Usage:
     from debug import debug, debug_detailed, debug_verbose, is_debug_enabled
 
     debug("run.py", "Starting task execution", task_id="001")
     debug_detailed("agent", "Agent response received", response_length=1234)
     debug_verbose("client", "Full request payload", payload=data)
+
+    # Lazy message and values
+    debug("merge", lambda: f"Merging {describe(files)}", files=lambda: sorted(files))
+
+    # Guard for work that isn't a single call
+    if is_debug_enabled(level=3):
+        debug_verbose("merge", "Conflict details", details=summarize(conflicts))
 """
 
+import atexit
 import json
 import os
+import re
 import sys
+import threading
 import time
+from collections.abc import Callable
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
@@ -67,18 +86,118 @@ def _get_log_file() -> Path | None:
     return None
 
 
-def is_debug_enabled() -> bool:
-    """Check if debug mode is enabled."""
-    return _get_debug_enabled()
+# DEBUG_LOG_FILE lines are buffered and written once this many are pending,
+# or when a line arrives this long after the last write
+LOG_FLUSH_EVERY_LINES = 64
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+
+_ANSI_ESCAPE = re.compile(r"\033\[[0-9;]*m")
+
+
+class _LogFileSink:
+    """Keeps DEBUG_LOG_FILE open and appends buffered lines to it."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+        self._buffer: list[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def write(self, message: str, flush: bool = False) -> None:
+        # Strip ANSI codes for file output
+        line = _ANSI_ESCAPE.sub("", message) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if (
+                flush
+                or len(self._buffer) >= LOG_FLUSH_EVERY_LINES
+                or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL_SECONDS
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _flush_locked(self) -> None:
+        lines, self._buffer = self._buffer, []
+        self._last_flush = time.monotonic()
+        if not lines:
+            return
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.writelines(lines)
+            self._file.flush()
+        except Exception:
+            pass  # Silently fail file logging
+
+
+# Resolved configuration, set by reload_debug_config()
+_enabled = False
+_level = 1
+# _level while enabled, 0 while disabled: the whole check on the hot path
+_active_level = 0
+_log_sink: _LogFileSink | None = None
+
+
+def reload_debug_config() -> None:
+    """
+    Re-read DEBUG, DEBUG_LEVEL and DEBUG_LOG_FILE from the environment.
+
+    Prints the debug environment status when this turns debug mode on.
+    """
+    global _enabled, _level, _active_level, _log_sink
+    was_enabled = _enabled
+
+    if _log_sink is not None:
+        _log_sink.close()
+
+    _enabled = _get_debug_enabled()
+    _level = _get_debug_level()
+    _active_level = _level if _enabled else 0
+    log_file = _get_log_file()
+    _log_sink = _LogFileSink(log_file) if log_file else None
+
+    if _enabled and not was_enabled:
+        debug_env_status()
+
+
+def flush_debug_log() -> None:
+    """Write buffered DEBUG_LOG_FILE lines."""
+    if _log_sink is not None:
+        _log_sink.flush()
+
+
+def is_debug_enabled(level: int = 1) -> bool:
+    """Check if debug mode is enabled (at the given verbosity level or above)."""
+    return _active_level >= level
 
 
 def get_debug_level() -> int:
     """Get current debug level."""
-    return _get_debug_level()
+    return _level
+
+
+def _resolve(value: Any) -> Any:
+    """Call a message or value that was passed lazily."""
+    if callable(value) and not isinstance(value, type):
+        return value()
+    return value
 
 
 def _format_value(value: Any, max_length: int = 200) -> str:
     """Format a value for debug output, truncating if necessary."""
+    value = _resolve(value)
     if value is None:
         return "None"
 
@@ -97,40 +216,31 @@ def _format_value(value: Any, max_length: int = 200) -> str:
     return str_value
 
 
-def _write_log(message: str, to_file: bool = True) -> None:
-    """Write log message to stdout and optionally to file."""
+def _write_log(message: str, to_file: bool = True, flush: bool = False) -> None:
+    """Write log message to stderr and optionally to the log file."""
     print(message, file=sys.stderr)
 
-    if to_file:
-        log_file = _get_log_file()
-        if log_file:
-            try:
-                log_file.parent.mkdir(parents=True, exist_ok=True)
-                # Strip ANSI codes for file output
-                import re
-
-                clean_message = re.sub(r"\033\[[0-9;]*m", "", message)
-                with open(log_file, "a", encoding="utf-8") as f:
-                    f.write(clean_message + "\n")
-            except Exception:
-                pass  # Silently fail file logging
+    if to_file and _log_sink is not None:
+        _log_sink.write(message, flush=flush)
 
 
-def debug(module: str, message: str, level: int = 1, **kwargs) -> None:
+def debug(
+    module: str, message: str | Callable[[], str], level: int = 1, **kwargs
+) -> None:
     """
     Log a debug message.
 
     Args:
         module: Source module name (e.g., "run.py", "ideation_runner")
-        message: Debug message
+        message: Debug message, or a callable returning it
         level: Required debug level (1=basic, 2=detailed, 3=verbose)
-        **kwargs: Additional key-value pairs to log
+        **kwargs: Additional key-value pairs to log; callable values are
+            called only when the message is written
     """
-    if not _get_debug_enabled():
+    if _active_level < level:
         return
 
-    if _get_debug_level() < level:
-        return
+    message = _resolve(message)
 
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
 
@@ -159,21 +269,22 @@ def debug(module: str, message: str, level: int = 1, **kwargs) -> None:
     _write_log(log_line)
 
 
-def debug_detailed(module: str, message: str, **kwargs) -> None:
+def debug_detailed(module: str, message: str | Callable[[], str], **kwargs) -> None:
     """Log a detailed debug message (level 2)."""
     debug(module, message, level=2, **kwargs)
 
 
-def debug_verbose(module: str, message: str, **kwargs) -> None:
+def debug_verbose(module: str, message: str | Callable[[], str], **kwargs) -> None:
     """Log a verbose debug message (level 3)."""
     debug(module, message, level=3, **kwargs)
 
 
-def debug_success(module: str, message: str, **kwargs) -> None:
+def debug_success(module: str, message: str | Callable[[], str], **kwargs) -> None:
     """Log a success debug message."""
-    if not _get_debug_enabled():
+    if not _active_level:
         return
 
+    message = _resolve(message)
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
     log_line = f"{Colors.TIMESTAMP}[{timestamp}]{Colors.RESET} {Colors.SUCCESS}[OK]{Colors.RESET} {Colors.MODULE}[{module}]{Colors.RESET} {message}"
 
@@ -184,11 +295,12 @@ def debug_success(module: str, message: str, **kwargs) -> None:
     _write_log(log_line)
 
 
-def debug_info(module: str, message: str, **kwargs) -> None:
+def debug_info(module: str, message: str | Callable[[], str], **kwargs) -> None:
     """Log an info debug message."""
-    if not _get_debug_enabled():
+    if not _active_level:
         return
 
+    message = _resolve(message)
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
     log_line = f"{Colors.TIMESTAMP}[{timestamp}]{Colors.RESET} {Colors.DEBUG}[INFO]{Colors.RESET} {Colors.MODULE}[{module}]{Colors.RESET} {message}"
 
@@ -199,11 +311,12 @@ def debug_info(module: str, message: str, **kwargs) -> None:
     _write_log(log_line)
 
 
-def debug_error(module: str, message: str, **kwargs) -> None:
+def debug_error(module: str, message: str | Callable[[], str], **kwargs) -> None:
     """Log an error debug message (always shown if debug enabled)."""
-    if not _get_debug_enabled():
+    if not _active_level:
         return
 
+    message = _resolve(message)
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
     log_line = f"{Colors.TIMESTAMP}[{timestamp}]{Colors.RESET} {Colors.ERROR}[ERROR]{Colors.RESET} {Colors.MODULE}[{module}]{Colors.RESET} {Colors.ERROR}{message}{Colors.RESET}"
 
@@ -211,14 +324,16 @@ def debug_error(module: str, message: str, **kwargs) -> None:
         for key, value in kwargs.items():
             log_line += f"\n  {Colors.KEY}{key}{Colors.RESET}: {Colors.VALUE}{_format_value(value)}{Colors.RESET}"
 
-    _write_log(log_line)
+    # Errors are written out right away, in case the process is about to die
+    _write_log(log_line, flush=True)
 
 
-def debug_warning(module: str, message: str, **kwargs) -> None:
+def debug_warning(module: str, message: str | Callable[[], str], **kwargs) -> None:
     """Log a warning debug message."""
-    if not _get_debug_enabled():
+    if not _active_level:
         return
 
+    message = _resolve(message)
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
     log_line = f"{Colors.TIMESTAMP}[{timestamp}]{Colors.RESET} {Colors.WARNING}[WARN]{Colors.RESET} {Colors.MODULE}[{module}]{Colors.RESET} {Colors.WARNING}{message}{Colors.RESET}"
 
@@ -231,7 +346,7 @@ def debug_warning(module: str, message: str, **kwargs) -> None:
 
 def debug_section(module: str, title: str) -> None:
     """Log a section header for organizing debug output."""
-    if not _get_debug_enabled():
+    if not _active_level:
         return
 
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -256,7 +371,7 @@ def debug_timer(module: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if not _get_debug_enabled():
+            if not _active_level:
                 return func(*args, **kwargs)
 
             start = time.time()
@@ -299,7 +414,7 @@ def debug_async_timer(module: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            if not _get_debug_enabled():
+            if not _active_level:
                 return await func(*args, **kwargs)
 
             start = time.time()
@@ -331,7 +446,7 @@ def debug_async_timer(module: str):
 
 def debug_env_status() -> None:
     """Print debug environment status on startup."""
-    if not _get_debug_enabled():
+    if not _active_level:
         return
 
     debug_section("debug", "Debug Mode Enabled")
@@ -339,11 +454,11 @@ def debug_env_status() -> None:
         "debug",
         "Environment configuration",
         DEBUG=os.environ.get("DEBUG", "not set"),
-        DEBUG_LEVEL=_get_debug_level(),
+        DEBUG_LEVEL=_level,
         DEBUG_LOG_FILE=os.environ.get("DEBUG_LOG_FILE", "not set"),
     )
 
 
-# Print status on import if debug is enabled
-if _get_debug_enabled():
-    debug_env_status()
+atexit.register(flush_debug_log)
+# Resolve configuration, printing status on import if debug is enabled
+reload_debug_config()
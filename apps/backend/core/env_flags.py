@@ -0,0 +1,38 @@
+"""
+Environment Flags
+=================
+
+Boolean feature switches read from environment variables.
+
+Usage:
+    from core.env_flags import env_flag
+
+    if env_flag("VENV_TEMPLATE_CACHE", default=True):
+        ...
+"""
+
+import os
+
+_FALSE_VALUES = ("false", "0", "no", "off")
+_TRUE_VALUES = ("true", "1", "yes", "on")
+
+
+def env_flag(name: str, default: bool) -> bool:
+    """
+    Read a boolean environment variable.
+
+    Unset, empty or unrecognized values give the default.
+
+    Args:
+        name: Environment variable name
+        default: Value when the variable doesn't say otherwise
+
+    Returns:
+        The flag's value
+    """
+    value = os.environ.get(name, "").strip().lower()
+    if value in _FALSE_VALUES:
+        return False
+    if value in _TRUE_VALUES:
+        return True
+    return default
@@ -0,0 +1,399 @@
+"""
+Implementation Plan Store
+=========================
+
+In-process store for a spec's implementation_plan.json.
+
+The agent tools used to re-read the whole plan, change one subtask and
+rewrite it with blocking I/O inside async handlers, and every progress
+helper re-parsed the file on each call. A PlanStore keeps one parsed copy
+of the plan per spec instead:
+
+- Readers get the in-memory plan. The file is only re-read when its
+  (mtime, size, inode) signature changes, i.e. someone else wrote it.
+- Mutations are serialized by one asyncio lock, applied in memory, and
+  appended to a journal (implementation_plan.journal.jsonl) right away.
+- The plan file itself is written atomically, debounced, so a burst of
+  tool calls costs one write. run_agent_session() and interpreter exit
+  flush whatever is pending.
+- If the process dies before a flush, the next store to load the plan
+  replays the journaled mutations, provided the plan file is still the
+  one they were made against.
+
+Mutations are plain dicts so they can be journaled and replayed:
+    {"op": "update_subtask", "subtask_id": "1.2", "fields": {...}, "at": ts}
+    {"op": "set", "values": {"qa_signoff": {...}}, "at": ts}
+
+Usage:
+    from core.plan_store import PlanStore
+
+    store = PlanStore.for_spec(spec_dir)
+    plan = store.read()  # shared, do not modify
+
+    await store.mutate(
+        lambda plan: {"op": "set", "values": {"qa_signoff": signoff}}
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from core.file_utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+PLAN_FILE_NAME = "implementation_plan.json"
+JOURNAL_FILE_NAME = "implementation_plan.journal.jsonl"
+
+# Delay before pending mutations are written to the plan file
+FLUSH_DEBOUNCE_SECONDS = 0.2
+
+# Files modified this recently may be rewritten without a visible change
+# to their mtime (coarse filesystem timestamps), so their content is
+# compared as well
+RACY_WINDOW_NS = 2_000_000_000
+
+# The journal is truncated at a checkpoint once it grows past this
+MAX_JOURNAL_BYTES = 256 * 1024
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.sha1(raw, usedforsecurity=False).hexdigest()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def apply_plan_mutation(plan: dict[str, Any], mutation: dict[str, Any]) -> bool:
+    """
+    Apply a journaled mutation to a plan dict in place.
+
+    Args:
+        plan: The implementation plan dict
+        mutation: Mutation record (see module docstring)
+
+    Returns:
+        True if the plan changed, False if the mutation's target is missing
+    """
+    op = mutation["op"]
+    if op == "update_subtask":
+        for phase in plan.get("phases", []):
+            for subtask in phase.get("subtasks", []):
+                if subtask.get("id") == mutation["subtask_id"]:
+                    subtask.update(mutation["fields"])
+                    plan["last_updated"] = mutation["at"]
+                    return True
+        return False
+    if op == "set":
+        plan.update(mutation["values"])
+        plan["last_updated"] = mutation["at"]
+        return True
+    raise ValueError(f"Unknown plan mutation: {op!r}")
+
+
+class PlanStore:
+    """
+    The parsed implementation plan of one spec, shared within the process.
+
+    Use PlanStore.for_spec() rather than the constructor so all callers
+    share one instance per spec directory.
+    """
+
+    _instances: dict[Path, PlanStore] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, spec_dir: Path):
+        self.spec_dir = Path(spec_dir)
+        self.plan_file = self.spec_dir / PLAN_FILE_NAME
+        self.journal_file = self.spec_dir / JOURNAL_FILE_NAME
+
+        self._plan: dict[str, Any] | None = None
+        self._signature: tuple[int, int, int] | None = None
+        self._digest: str | None = None
+        self._loaded_ns = 0
+        self._journal_checked = False
+
+        # Mutations applied in memory but not yet in the plan file
+        self._pending: list[dict[str, Any]] = []
+        self._seq = 0
+
+        self._state_lock = threading.RLock()
+        self._mutation_lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._flush_task: asyncio.Task | None = None
+
+    @classmethod
+    def for_spec(cls, spec_dir: Path) -> PlanStore:
+        """The shared store for a spec directory."""
+        key = Path(spec_dir).resolve()
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls._instances[key] = cls(key)
+            return store
+
+    @classmethod
+    def existing(cls, spec_dir: Path) -> PlanStore | None:
+        """The shared store for a spec directory, if one was created."""
+        with cls._instances_lock:
+            return cls._instances.get(Path(spec_dir).resolve())
+
+    @classmethod
+    def reset_instances(cls) -> None:
+        """Drop all stores without flushing (for tests)."""
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    def read(self) -> dict[str, Any]:
+        """
+        The current plan, including mutations not yet written to disk.
+
+        The returned dict is shared; callers must not modify it.
+
+        Raises:
+            FileNotFoundError: If the plan file does not exist
+            json.JSONDecodeError: If the plan file is not valid JSON
+        """
+        with self._state_lock:
+            self._refresh()
+            return self._plan
+
+    def invalidate(self) -> None:
+        """Forget the cached plan so the next read re-parses the file."""
+        with self._state_lock:
+            self._signature = None
+            self._digest = None
+
+    def _refresh(self) -> None:
+        st = os.stat(self.plan_file)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        racy = self._loaded_ns - st.st_mtime_ns < RACY_WINDOW_NS
+        if signature == self._signature and self._plan is not None and not racy:
+            return
+
+        raw = self.plan_file.read_bytes()
+        digest = _digest(raw)
+        loaded_ns = time.time_ns()
+        if digest == self._digest and self._plan is not None:
+            self._signature = signature
+            self._loaded_ns = loaded_ns
+            return
+
+        plan = json.loads(raw.decode("utf-8"))
+        if self._plan is not None:
+            logger.debug(f"{self.plan_file} changed on disk, reloading")
+
+        # Our unwritten mutations go on top of whatever is on disk now
+        for mutation in self._pending:
+            apply_plan_mutation(plan, mutation)
+
+        self._plan = plan
+        self._signature = signature
+        self._digest = digest
+        self._loaded_ns = loaded_ns
+
+        if not self._journal_checked:
+            self._journal_checked = True
+            self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        """Re-apply mutations a previous process journaled but never flushed."""
+        try:
+            lines = self.journal_file.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Could not read plan journal {self.journal_file}: {e}")
+            return
+
+        unflushed: list[dict[str, Any]] = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn final line from a crash
+            self._seq = max(self._seq, entry.get("seq", 0))
+            if entry.get("op") == "checkpoint":
+                unflushed = []
+            else:
+                unflushed.append(entry)
+
+        replay = [e for e in unflushed if e.get("base") == self._digest]
+        if len(replay) < len(unflushed):
+            logger.warning(
+                f"Discarding {len(unflushed) - len(replay)} journaled plan "
+                f"mutations made against an older {PLAN_FILE_NAME}"
+            )
+        for entry in replay:
+            try:
+                apply_plan_mutation(self._plan, entry)
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Skipping unreadable plan journal entry: {e}")
+                continue
+            self._pending.append(entry)
+        if replay:
+            logger.info(f"Replayed {len(replay)} unflushed plan mutations")
+            self.flush_sync()
+
+    # =========================================================================
+    # Mutating
+    # =========================================================================
+
+    async def mutate(
+        self, make_mutation: Callable[[dict[str, Any]], dict[str, Any] | None]
+    ) -> dict[str, Any] | None:
+        """
+        Apply a mutation built from the current plan.
+
+        `make_mutation` is called with the current plan while the store's
+        lock is held. It must not modify the plan; it returns a mutation
+        record (see module docstring, "at" is filled in if missing) or None
+        to leave the plan unchanged.
+
+        Returns:
+            The applied mutation, or None if nothing was applied
+
+        Raises:
+            FileNotFoundError: If the plan file does not exist
+            json.JSONDecodeError: If the plan file is not valid JSON
+        """
+        async with self._get_mutation_lock():
+            with self._state_lock:
+                self._refresh()
+                mutation = make_mutation(self._plan)
+                if mutation is None:
+                    return None
+                mutation.setdefault("at", _now())
+                if not apply_plan_mutation(self._plan, mutation):
+                    return None
+                self._seq += 1
+                entry = {"seq": self._seq, "base": self._digest, **mutation}
+                self._pending.append(entry)
+
+            await asyncio.to_thread(self._append_journal, entry)
+
+        self._schedule_flush()
+        return mutation
+
+    def _get_mutation_lock(self) -> asyncio.Lock:
+        # The store outlives event loops (e.g. one asyncio.run() per CLI
+        # command), and an asyncio.Lock can only be used within one
+        loop = asyncio.get_running_loop()
+        if self._mutation_lock is None or self._lock_loop is not loop:
+            self._mutation_lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._mutation_lock
+
+    def _append_journal(self, entry: dict[str, Any]) -> None:
+        with open(self.journal_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_later()
+            )
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(FLUSH_DEBOUNCE_SECONDS)
+        except asyncio.CancelledError:
+            # The loop is shutting down; don't leave the mutations unwritten
+            self.flush_sync()
+            raise
+        await self.flush()
+
+    # =========================================================================
+    # Persisting
+    # =========================================================================
+
+    @property
+    def dirty(self) -> bool:
+        """True while mutations are waiting to be written to the plan file."""
+        return bool(self._pending)
+
+    async def flush(self) -> None:
+        """Write pending mutations to the plan file now."""
+        if not self._pending:
+            return
+        async with self._get_mutation_lock():
+            await asyncio.to_thread(self.flush_sync)
+
+    def flush_sync(self) -> None:
+        """Blocking flush, for synchronous callers and interpreter exit."""
+        with self._state_lock:
+            if not self._pending:
+                return
+            try:
+                # Pick up external writes so they aren't overwritten
+                self._refresh()
+            except (OSError, ValueError) as e:
+                logger.warning(f"Re-reading {self.plan_file} before flush failed: {e}")
+
+            text = json.dumps(self._plan, indent=2, ensure_ascii=False)
+            with atomic_write(self.plan_file) as f:
+                f.write(text)
+
+            st = os.stat(self.plan_file)
+            self._signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+            self._digest = _digest(text.encode("utf-8"))
+            self._loaded_ns = time.time_ns()
+            seq = self._pending[-1]["seq"]
+            self._pending = []
+            self._checkpoint(seq)
+
+    def _checkpoint(self, seq: int) -> None:
+        try:
+            if (
+                self.journal_file.exists()
+                and self.journal_file.stat().st_size > MAX_JOURNAL_BYTES
+            ):
+                self.journal_file.write_text("", encoding="utf-8")
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"seq": seq, "op": "checkpoint"}) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not checkpoint plan journal: {e}")
+
+
+def load_plan(spec_dir: Path) -> dict[str, Any]:
+    """
+    The spec's implementation plan, served from its shared PlanStore.
+
+    The returned dict is shared; callers must not modify it.
+    """
+    return PlanStore.for_spec(spec_dir).read()
+
+
+async def flush_plan_store(spec_dir: Path) -> None:
+    """Write a spec's pending plan mutations, if it has a store."""
+    store = PlanStore.existing(spec_dir)
+    if store is not None:
+        await store.flush()
+
+
+@atexit.register
+def _flush_all_on_exit() -> None:
+    for store in list(PlanStore._instances.values()):
+        try:
+            store.flush_sync()
+        except Exception as e:
+            logger.warning(f"Could not flush {store.plan_file} at exit: {e}")
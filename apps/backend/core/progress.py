@@ -8,6 +8,7 @@ Uses subtask-based implementation plans (implementation_plan.json).
 Enhanced with colored output, icons, and better visual formatting.
 """
 
+import copy
 import json
 import logging
 from pathlib import Path
@@ -15,6 +16,7 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 from core.plan_normalization import normalize_subtask_aliases
+from core.plan_store import load_plan
 from ui import (
     Icons,
     bold,
@@ -46,8 +48,7 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
         return 0, 0
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = load_plan(spec_dir)
 
         total = 0
         completed = 0
@@ -84,8 +85,7 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
         return result
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = load_plan(spec_dir)
 
         for phase in plan.get("phases", []):
             for subtask in phase.get("subtasks", []):
@@ -185,8 +185,7 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
 
         # Phase summary
         try:
-            with open(spec_dir / "implementation_plan.json", encoding="utf-8") as f:
-                plan = json.load(f)
+            plan = load_plan(spec_dir)
 
             print("\nPhases:")
             for phase in plan.get("phases", []):
@@ -305,8 +304,7 @@ def get_plan_summary(spec_dir: Path) -> dict:
         }
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = load_plan(spec_dir)
 
         summary = {
             "workflow_type": plan.get("workflow_type"),
@@ -379,8 +377,7 @@ def get_current_phase(spec_dir: Path) -> dict | None:
         return None
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = load_plan(spec_dir)
 
         for phase in plan.get("phases", []):
             subtasks = phase.get("subtasks", phase.get("chunks", []))
@@ -403,22 +400,26 @@ def get_current_phase(spec_dir: Path) -> dict | None:
         return None
 
 
-def get_next_subtask(spec_dir: Path) -> dict | None:
+def get_available_subtasks(spec_dir: Path) -> list[dict]:
     """
-    Find the next subtask to work on, respecting phase dependencies.
+    Find the subtasks that could be worked on now, in plan order.
 
-    Skips subtasks that are marked as stuck in the recovery manager's attempt history.
+    These are the pending subtasks of phases whose dependencies are complete.
+    A phase not marked parallel_safe contributes only its next subtask.
+    Skips subtasks that are marked as stuck in the recovery manager's
+    attempt history.
 
     Args:
         spec_dir: Directory containing implementation_plan.json
 
     Returns:
-        The next subtask dict to work on, or None if all complete
+        Subtask dicts (with phase_id, phase_name and phase_num added),
+        empty if all are complete or blocked
     """
     plan_file = spec_dir / "implementation_plan.json"
 
     if not plan_file.exists():
-        return None
+        return []
 
     # Load stuck subtasks from recovery manager's attempt history
     stuck_subtask_ids = set()
@@ -438,8 +439,7 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
             pass
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = load_plan(spec_dir)
 
         phases = plan.get("phases", [])
 
@@ -458,7 +458,8 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
                 s.get("status") == "completed" for s in subtasks
             )
 
-        # Find next available subtask
+        # Find available subtasks
+        available = []
         for phase in phases:
             phase_id_value = phase.get("id")
             phase_id = (
@@ -477,7 +478,7 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
             if not deps_satisfied:
                 continue
 
-            # Find first pending subtask in this phase (skip stuck subtasks)
+            # Pending subtasks in this phase (skip stuck subtasks)
             for subtask in phase.get("subtasks", phase.get("chunks", [])):
                 status = subtask.get("status", "pending")
                 subtask_id = subtask.get("id")
@@ -487,19 +488,42 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
                     continue
 
                 if status in {"pending", "not_started", "not started"}:
-                    subtask_out, _changed = normalize_subtask_aliases(subtask)
+                    # Copy: the plan is shared with the other PlanStore readers
+                    subtask_out, _changed = normalize_subtask_aliases(
+                        copy.deepcopy(subtask)
+                    )
                     subtask_out["status"] = "pending"
-                    return {
-                        **subtask_out,
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                    }
+                    available.append(
+                        {
+                            **subtask_out,
+                            "phase_id": phase_id,
+                            "phase_name": phase.get("name"),
+                            "phase_num": phase.get("phase"),
+                        }
+                    )
+                    if not phase.get("parallel_safe"):
+                        break
 
-        return None
+        return available
 
     except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+        return []
+
+
+def get_next_subtask(spec_dir: Path) -> dict | None:
+    """
+    Find the next subtask to work on, respecting phase dependencies.
+
+    Skips subtasks that are marked as stuck in the recovery manager's attempt history.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+
+    Returns:
+        The next subtask dict to work on, or None if all complete
+    """
+    available = get_available_subtasks(spec_dir)
+    return available[0] if available else None
 
 
 def format_duration(seconds: float) -> str:
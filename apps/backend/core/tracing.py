@@ -0,0 +1,284 @@
+"""
+Span Tracing
+============
+
+Lightweight in-process tracing for finding where a build spends its time.
+
+Spans are nested, timed regions with attributes. A span's parent is the
+span current in the calling context (a contextvar, so nesting follows
+asyncio tasks and threads). Finished spans are buffered and appended to a
+local trace file:
+
+    TRACE_FILE=/tmp/build.jsonl   One JSON object per span
+    TRACE_FILE=/tmp/build.json    Chrome trace event format; open it in
+                                  chrome://tracing or https://ui.perfetto.dev
+
+Tracing is off unless TRACE_FILE is set. When it is off, span() and
+start_span() return a shared no-op span and @traced functions call straight
+through, so instrumentation can stay in hot paths.
+
+Usage:
+    from core.tracing import current_span, span, start_span, traced
+
+    with span("git", command="diff"):
+        ...
+
+    @traced("merge.task")
+    def merge_task(self, task_id):
+        current_span().set(task_id=task_id)
+        ...
+
+    # Spans that don't fit a block, e.g. a tool call seen across messages
+    tool_span = start_span("agent.tool", tool="Read")
+    ...
+    tool_span.end(error="timeout")
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Finished spans are written out once this many are buffered
+FLUSH_EVERY_SPANS = 500
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "current_span", default=None
+)
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """A timed region. Create spans with span() or start_span()."""
+
+    __slots__ = (
+        "name",
+        "span_id",
+        "parent_id",
+        "attrs",
+        "start_ns",
+        "_tracer",
+        "_token",
+    )
+
+    def __init__(self, tracer: Tracer, name: str, attrs: dict[str, Any]):
+        parent = _current_span.get()
+        self._tracer = tracer
+        self._token: contextvars.Token | None = None
+        self.name = name
+        self.span_id = next(_span_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attrs = attrs
+        self.start_ns = time.monotonic_ns()
+
+    def set(self, **attrs: Any) -> None:
+        """Add or replace attributes."""
+        self.attrs.update(attrs)
+
+    def end(self, error: str | None = None) -> None:
+        """Finish the span, marking it failed if an error is given."""
+        if error is not None:
+            self.attrs["error"] = error
+        self._tracer.record(self, time.monotonic_ns())
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self.end(error=exc_type.__name__ if exc_type is not None else None)
+
+
+class _NoopSpan:
+    """Stands in for a span when tracing is disabled."""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def end(self, error: str | None = None) -> None:
+        pass
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Buffers finished spans and appends them to a trace file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.chrome = self.path.suffix == ".json"
+        self._pid = os.getpid()
+        self._epoch_ns = time.monotonic_ns()
+        self._buffer: list[str] = []
+        self._lock = threading.Lock()
+
+    def record(self, span: Span, end_ns: int) -> None:
+        start_us = (span.start_ns - self._epoch_ns) // 1000
+        duration_us = (end_ns - span.start_ns) // 1000
+        if self.chrome:
+            event = {
+                "name": span.name,
+                "ph": "X",
+                "ts": start_us,
+                "dur": duration_us,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": {"span_id": span.span_id, "parent_id": span.parent_id}
+                | span.attrs,
+            }
+            line = json.dumps(event, default=str) + ",\n"
+        else:
+            record = {
+                "name": span.name,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "start_us": start_us,
+                "duration_us": duration_us,
+                "pid": self._pid,
+                "thread": threading.get_ident(),
+                "attrs": span.attrs,
+            }
+            line = json.dumps(record, default=str) + "\n"
+
+        with self._lock:
+            self._buffer.append(line)
+            should_flush = len(self._buffer) >= FLUSH_EVERY_SPANS
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append buffered spans to the trace file."""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+            if not lines:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    # The Chrome trace viewer accepts an unterminated JSON
+                    # array, which lets the file grow by appending
+                    if self.chrome and f.tell() == 0:
+                        f.write("[\n")
+                    f.writelines(lines)
+            except OSError as e:
+                logger.warning(f"Could not write trace file {self.path}: {e}")
+
+
+_tracer: Tracer | None = None
+
+
+def configure_tracing(path: Path | str | None) -> None:
+    """
+    Enable tracing to a file, or disable it with None.
+
+    Spans buffered for a previous file are written out first.
+    """
+    global _tracer
+    if _tracer is not None:
+        _tracer.flush()
+    _tracer = Tracer(Path(path)) if path else None
+
+
+def reload_tracing_config() -> None:
+    """Re-read TRACE_FILE from the environment."""
+    configure_tracing(os.environ.get("TRACE_FILE") or None)
+
+
+def is_tracing_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _tracer is not None
+
+
+def span(name: str, **attrs: Any) -> Span | _NoopSpan:
+    """A span to use as a context manager; it is current inside the block."""
+    if _tracer is None:
+        return NOOP_SPAN
+    return Span(_tracer, name, attrs)
+
+
+def start_span(name: str, **attrs: Any) -> Span | _NoopSpan:
+    """
+    Start a span that is ended explicitly with .end().
+
+    It is a child of the current span but does not become current itself.
+    """
+    if _tracer is None:
+        return NOOP_SPAN
+    return Span(_tracer, name, attrs)
+
+
+def current_span() -> Span | _NoopSpan:
+    """The innermost active span, for adding attributes."""
+    if _tracer is None:
+        return NOOP_SPAN
+    return _current_span.get() or NOOP_SPAN
+
+
+def traced(name: str | None = None) -> Callable[[F], F]:
+    """
+    Decorator running each call of a function (sync or async) in a span.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with Span(_tracer, span_name, {}):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with Span(_tracer, span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def flush_traces() -> None:
+    """Write buffered spans to the trace file."""
+    if _tracer is not None:
+        _tracer.flush()
+
+
+atexit.register(flush_traces)
+reload_tracing_config()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Copy Engine
+===========
+
+Fast file and directory copies for the COPY dependency strategy and the
+venv template cache.
+
+Each file is copied with the cheapest method that works:
+1. Copy-on-write clone (FICLONE ioctl) - instant, no extra disk space,
+   on btrfs / XFS (reflink=1) / bcachefs
+2. Hardlink - only for read-only files (or when the caller allows it),
+   since writes through a hardlink would change the source
+3. copy_file_range() - in-kernel copy (server-side on NFS/SMB, reflink on
+   some filesystems), no userspace buffering
+4. shutil.copyfile() - plain byte copy
+
+Methods that fail with "not supported" are remembered for the rest of the
+tree so a large copy doesn't retry a doomed syscall per file.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import stat
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Import debug utilities
+try:
+    from debug import debug
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.copy_engine"
+
+# _IOW(0x94, 9, int) from linux/fs.h
+FICLONE = 0x40049409
+
+# Errors meaning "this method can't work here" (as opposed to a real I/O error)
+_UNSUPPORTED_ERRNOS = {
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EBADF,
+    errno.EPERM,
+}
+
+METHOD_REFLINK = "reflink"
+METHOD_HARDLINK = "hardlink"
+METHOD_COPY_RANGE = "copy_file_range"
+METHOD_COPY = "copy"
+
+
+@dataclass
+class CopyStats:
+    """How the files of a copy were materialized."""
+
+    files: int = 0
+    bytes: int = 0
+    methods: dict[str, int] = field(default_factory=dict)
+    # Methods found unsupported for this source/target pair
+    unsupported: set[str] = field(default_factory=set)
+
+    def record(self, method: str, size: int) -> None:
+        self.files += 1
+        self.bytes += size
+        self.methods[method] = self.methods.get(method, 0) + 1
+
+    def merge(self, other: CopyStats) -> None:
+        """Add another copy's counters to this one."""
+        self.files += other.files
+        self.bytes += other.bytes
+        for method, count in other.methods.items():
+            self.methods[method] = self.methods.get(method, 0) + count
+
+    def to_dict(self) -> dict:
+        return {"files": self.files, "bytes": self.bytes, "methods": dict(self.methods)}
+
+
+def _is_read_only(st: os.stat_result) -> bool:
+    return not st.st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _try_reflink(src: Path, dst: Path) -> bool:
+    if fcntl is None:
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return True
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+    os.unlink(dst)
+    return False
+
+
+def _try_copy_file_range(src: Path, dst: Path, size: int) -> bool:
+    if not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            if remaining <= 0:
+                return True
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+    os.unlink(dst)
+    return False
+
+
+def copy_file(
+    src: Path,
+    dst: Path,
+    allow_hardlink: bool = False,
+    stats: CopyStats | None = None,
+) -> str:
+    """
+    Copy one file with the cheapest available method.
+
+    Args:
+        src: Source file (symlinks are followed)
+        dst: Destination path (must not exist)
+        allow_hardlink: Hardlink even if src is writable (caller guarantees
+            neither side is modified in place)
+        stats: Optional CopyStats to record into; also remembers methods
+            found unsupported so later files skip them
+
+    Returns:
+        The method used (one of the METHOD_* constants)
+    """
+    stats = stats if stats is not None else CopyStats()
+    st = os.stat(src)
+
+    method = None
+    if METHOD_REFLINK not in stats.unsupported:
+        if _try_reflink(src, dst):
+            method = METHOD_REFLINK
+        else:
+            stats.unsupported.add(METHOD_REFLINK)
+
+    if method is None and (allow_hardlink or _is_read_only(st)):
+        if METHOD_HARDLINK not in stats.unsupported:
+            try:
+                os.link(src, dst)
+                method = METHOD_HARDLINK
+            except OSError as e:
+                if e.errno in _UNSUPPORTED_ERRNOS or e.errno == errno.EMLINK:
+                    stats.unsupported.add(METHOD_HARDLINK)
+                else:
+                    raise
+
+    if method is None and METHOD_COPY_RANGE not in stats.unsupported:
+        if _try_copy_file_range(src, dst, st.st_size):
+            method = METHOD_COPY_RANGE
+        else:
+            stats.unsupported.add(METHOD_COPY_RANGE)
+
+    if method is None:
+        shutil.copyfile(src, dst)
+        method = METHOD_COPY
+
+    if method != METHOD_HARDLINK:
+        shutil.copystat(src, dst)
+    stats.record(method, st.st_size)
+    return method
+
+
+def copy_tree(
+    src: Path,
+    dst: Path,
+    allow_hardlink: bool = False,
+    stats: CopyStats | None = None,
+) -> CopyStats:
+    """
+    Recursively copy a directory, like shutil.copytree(src, dst).
+
+    Symlinks are followed, matching shutil.copytree's default.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+        allow_hardlink: Hardlink writable files too (see copy_file)
+        stats: Optional CopyStats to accumulate into
+
+    Returns:
+        CopyStats for this copy
+
+    Raises:
+        OSError: If a file can't be copied
+    """
+    stats = stats if stats is not None else CopyStats()
+    src = Path(src)
+    dst = Path(dst)
+    dst.mkdir(parents=True)
+
+    for dirpath, dirnames, filenames in os.walk(src, followlinks=True):
+        rel_dir = Path(dirpath).relative_to(src)
+        dest_dir = dst / rel_dir
+        for name in dirnames:
+            (dest_dir / name).mkdir()
+        for name in filenames:
+            copy_file(
+                Path(dirpath) / name,
+                dest_dir / name,
+                allow_hardlink=allow_hardlink,
+                stats=stats,
+            )
+        shutil.copystat(dirpath, dest_dir)
+
+    debug(MODULE, f"Copied {src} -> {dst}", **stats.to_dict())
+    return stats
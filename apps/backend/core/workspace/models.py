@@ -6,7 +6,7 @@ Workspace Models
 Data classes and enums for workspace management.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
@@ -301,3 +301,16 @@ class DependencyShareConfig:
     source_rel_path: str  # Relative path from project root, e.g. "node_modules"
     requirements_file: str | None = None  # e.g. "requirements.txt", "pyproject.toml"
     package_manager: str | None = None  # e.g. "npm", "uv", "pip"
+
+
+@dataclass
+class DependencySetupStats:
+    """Details of a setup_worktree_dependencies() run, for the setup summary."""
+
+    venv_cache_hits: list[str] = field(default_factory=list)  # Cloned from template
+    venv_cache_builds: list[str] = field(default_factory=list)  # Template built now
+    strategy_seconds: dict[str, float] = field(
+        default_factory=dict
+    )  # Summed per strategy
+    total_seconds: float = 0.0  # Wall-clock time of the whole setup
+    copy_methods: dict[str, int] = field(default_factory=dict)  # COPY files per method
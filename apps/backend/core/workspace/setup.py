@@ -11,6 +11,9 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from core.git_executable import run_git
@@ -29,9 +32,16 @@ from ui import (
 )
 from worktree import WorktreeManager
 
+from .copy_engine import CopyStats, copy_file, copy_tree
 from .dependency_strategy import get_dependency_configs
 from .git_utils import has_uncommitted_changes
-from .models import DependencyShareConfig, DependencyStrategy, WorkspaceMode
+from .models import (
+    DependencySetupStats,
+    DependencyShareConfig,
+    DependencyStrategy,
+    WorkspaceMode,
+)
+from .venv_cache import VenvTemplateCache, is_venv_cache_enabled
 
 # Import debug utilities
 try:
@@ -50,6 +60,9 @@ _git_hook_check_done = False
 
 MODULE = "workspace.setup"
 
+# Guards DependencySetupStats updates from parallel dependency setup
+_stats_lock = threading.Lock()
+
 
 def choose_workspace(
     project_dir: Path,
@@ -385,14 +398,20 @@ def setup_workspace(
         except (OSError, json.JSONDecodeError) as e:
             debug_warning(MODULE, f"Could not load project_index.json: {e}")
 
+    dep_stats = DependencySetupStats()
     dep_results = setup_worktree_dependencies(
-        project_dir, worktree_info.path, project_index=project_index
+        project_dir, worktree_info.path, project_index=project_index, stats=dep_stats
     )
     for strategy_name, paths in dep_results.items():
         if paths:
             print_status(
                 f"Dependencies ({strategy_name}): {', '.join(paths)}", "success"
             )
+    if dep_stats.venv_cache_hits:
+        print_status(
+            f"Venv template cache hit: {', '.join(dep_stats.venv_cache_hits)}",
+            "info",
+        )
 
     # Symlink .claude/ config to worktree for Claude Code features (settings, commands, etc.)
     symlinked_claude = symlink_claude_config_to_worktree(
@@ -597,12 +616,15 @@ def setup_worktree_dependencies(
     project_dir: Path,
     worktree_path: Path,
     project_index: dict | None = None,
+    stats: DependencySetupStats | None = None,
+    max_workers: int | None = None,
 ) -> dict[str, list[str]]:
     """
     Set up dependencies in a worktree using strategy-based dispatch.
 
     Reads dependency configs from the project index and applies the correct
-    strategy for each: symlink, recreate, copy, or skip.
+    strategy for each: symlink, recreate, copy, or skip. Configs with
+    unrelated paths are applied concurrently.
 
     All operations are non-blocking — failures produce warnings but do not
     prevent worktree creation.
@@ -611,42 +633,143 @@ def setup_worktree_dependencies(
         project_dir: The main project directory
         worktree_path: Path to the worktree
         project_index: Parsed project_index.json dict, or None
+        stats: Optional DependencySetupStats to fill with setup details
+            (per-strategy timings, venv template cache hits, copy methods)
+        max_workers: Max configs applied at once
+            (default: DEPENDENCY_SETUP_WORKERS env var, or 4)
 
     Returns:
         Dict mapping strategy names to lists of paths that were processed.
     """
     configs = get_dependency_configs(project_index, project_dir=project_dir)
     results: dict[str, list[str]] = {}
-
     for config in configs:
-        strategy_name = config.strategy.value
-        if strategy_name not in results:
-            results[strategy_name] = []
+        results.setdefault(config.strategy.value, [])
+
+    if max_workers is None:
+        max_workers = _dependency_setup_workers()
+    groups = _group_nested_configs(configs)
+    started = time.monotonic()
+
+    def run_group(indices: list[int]) -> list[tuple[int, bool, float]]:
+        return [
+            (
+                i,
+                *_apply_dependency_config(
+                    project_dir, worktree_path, configs[i], stats
+                ),
+            )
+            for i in indices
+        ]
 
-        try:
-            performed = True
-            if config.strategy == DependencyStrategy.SYMLINK:
-                performed = _apply_symlink_strategy(project_dir, worktree_path, config)
-            elif config.strategy == DependencyStrategy.RECREATE:
-                performed = _apply_recreate_strategy(project_dir, worktree_path, config)
-            elif config.strategy == DependencyStrategy.COPY:
-                performed = _apply_copy_strategy(project_dir, worktree_path, config)
-            elif config.strategy == DependencyStrategy.SKIP:
-                _apply_skip_strategy(config)
-                # Don't record skipped entries — only report actual work
-                continue
-            if performed:
-                results[strategy_name].append(config.source_rel_path)
-        except Exception as e:
-            debug_warning(
-                MODULE,
-                f"Failed to apply {strategy_name} strategy for "
-                f"{config.source_rel_path}: {e}",
+    outcomes: list[tuple[int, bool, float]] = []
+    if max_workers <= 1 or len(groups) <= 1:
+        for group in groups:
+            outcomes.extend(run_group(group))
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+            for group_outcomes in pool.map(run_group, groups):
+                outcomes.extend(group_outcomes)
+
+    # Report in config order regardless of completion order
+    for i, performed, elapsed in sorted(outcomes):
+        config = configs[i]
+        strategy_name = config.strategy.value
+        if performed:
+            results[strategy_name].append(config.source_rel_path)
+        if stats is not None and config.strategy != DependencyStrategy.SKIP:
+            stats.strategy_seconds[strategy_name] = (
+                stats.strategy_seconds.get(strategy_name, 0.0) + elapsed
             )
 
+    if stats is not None:
+        stats.total_seconds += time.monotonic() - started
+        debug(
+            MODULE,
+            "Dependency setup timings",
+            total_seconds=round(stats.total_seconds, 3),
+            strategy_seconds={
+                name: round(secs, 3) for name, secs in stats.strategy_seconds.items()
+            },
+            copy_methods=stats.copy_methods,
+        )
+
     return results
 
 
+def _dependency_setup_workers() -> int:
+    """Worker count for parallel dependency setup (DEPENDENCY_SETUP_WORKERS)."""
+    try:
+        return max(1, int(os.environ.get("DEPENDENCY_SETUP_WORKERS", "4")))
+    except ValueError:
+        return 4
+
+
+def _group_nested_configs(configs: list[DependencyShareConfig]) -> list[list[int]]:
+    """Group config indices whose paths nest inside each other.
+
+    Configs in different groups touch disjoint paths and can run
+    concurrently; a group runs in config order.
+    """
+    groups: list[list[int]] = []
+    group_parts: list[list[tuple[str, ...]]] = []
+
+    for i, config in enumerate(configs):
+        parts = Path(config.source_rel_path).parts
+        matching = [
+            g
+            for g, members in enumerate(group_parts)
+            if any(m[: len(parts)] == parts or parts[: len(m)] == m for m in members)
+        ]
+        if not matching:
+            groups.append([i])
+            group_parts.append([parts])
+            continue
+        # Merge every group this config links together into the first one
+        first = matching[0]
+        for g in reversed(matching[1:]):
+            groups[first].extend(groups.pop(g))
+            group_parts[first].extend(group_parts.pop(g))
+        groups[first].append(i)
+        groups[first].sort()
+        group_parts[first].append(parts)
+
+    return groups
+
+
+def _apply_dependency_config(
+    project_dir: Path,
+    worktree_path: Path,
+    config: DependencyShareConfig,
+    stats: DependencySetupStats | None,
+) -> tuple[bool, float]:
+    """Apply one config's strategy.
+
+    Returns (performed, elapsed seconds). Failures are logged, not raised.
+    """
+    started = time.monotonic()
+    performed = False
+    try:
+        if config.strategy == DependencyStrategy.SYMLINK:
+            performed = _apply_symlink_strategy(project_dir, worktree_path, config)
+        elif config.strategy == DependencyStrategy.RECREATE:
+            performed = _apply_recreate_strategy(
+                project_dir, worktree_path, config, stats
+            )
+        elif config.strategy == DependencyStrategy.COPY:
+            performed = _apply_copy_strategy(project_dir, worktree_path, config, stats)
+        elif config.strategy == DependencyStrategy.SKIP:
+            # Don't record skipped entries — only report actual work
+            _apply_skip_strategy(config)
+    except Exception as e:
+        debug_warning(
+            MODULE,
+            f"Failed to apply {config.strategy.value} strategy for "
+            f"{config.source_rel_path}: {e}",
+        )
+    return performed, time.monotonic() - started
+
+
 def _apply_symlink_strategy(
     project_dir: Path,
     worktree_path: Path,
@@ -711,9 +834,14 @@ def _apply_recreate_strategy(
     project_dir: Path,
     worktree_path: Path,
     config: DependencyShareConfig,
+    stats: DependencySetupStats | None = None,
 ) -> bool:
     """Create a fresh virtual environment in the worktree and install deps.
 
+    With the venv template cache enabled, the venv is cloned from a template
+    built once per (interpreter, requirements) combination instead of being
+    created and pip-installed from scratch.
+
     Returns True if the venv was successfully created, False if skipped or failed.
     """
     venv_path = worktree_path / config.source_rel_path
@@ -734,6 +862,149 @@ def _apply_recreate_strategy(
                 python_exec = str(candidate_path.resolve())
                 break
 
+    # Windows console-script launchers (Scripts/*.exe) embed the interpreter
+    # path in binary form and can't be relocated, so clones would be broken
+    req_file = config.requirements_file
+    if (
+        is_venv_cache_enabled()
+        and not is_windows()
+        and not (req_file and Path(req_file).name == "Pipfile")
+    ):
+        cached = _recreate_from_template(
+            project_dir, worktree_path, config, python_exec, stats
+        )
+        if cached is not None:
+            return cached
+
+    if not _create_venv(project_dir, worktree_path, config, python_exec, venv_path):
+        return False
+
+    debug(MODULE, f"Recreated venv at {config.source_rel_path}")
+    return True
+
+
+def _recreate_from_template(
+    project_dir: Path,
+    worktree_path: Path,
+    config: DependencyShareConfig,
+    python_exec: str,
+    stats: DependencySetupStats | None,
+) -> bool | None:
+    """Clone the worktree venv from the venv template cache.
+
+    Returns True/False like _apply_recreate_strategy, or None if the cache
+    could not be used and the caller should create the venv directly.
+    """
+    venv_path = worktree_path / config.source_rel_path
+    cache = VenvTemplateCache(project_dir)
+    req_path = (
+        project_dir / config.requirements_file if config.requirements_file else None
+    )
+
+    try:
+        key = cache.compute_key(python_exec, config.source_rel_path, req_path)
+    except OSError as e:
+        debug_warning(MODULE, f"Could not compute venv template key: {e}")
+        return None
+
+    template = cache.get(key)
+    built = template is None
+    if built:
+        install_results: list[bool] = []
+
+        def _build(path: Path) -> bool:
+            ok = _create_venv(project_dir, worktree_path, config, python_exec, path)
+            install_results.append(ok)
+            return ok
+
+        template = cache.build(key, config.source_rel_path, _build)
+        if template is None:
+            # A failed install fails the same way uncached - don't retry it
+            return False if install_results == [False] else None
+
+    if not cache.clone(template, venv_path):
+        return None
+
+    # pyproject.toml installs the project itself; refresh it from this worktree
+    if not built and req_path is not None and req_path.name == "pyproject.toml":
+        if not _reinstall_project_package(worktree_path, config, venv_path):
+            shutil.rmtree(venv_path, ignore_errors=True)
+            return False
+
+    if stats is not None:
+        with _stats_lock:
+            if built:
+                stats.venv_cache_builds.append(config.source_rel_path)
+            else:
+                stats.venv_cache_hits.append(config.source_rel_path)
+    debug(
+        MODULE,
+        f"{'Built and cloned' if built else 'Cloned'} venv template for "
+        f"{config.source_rel_path}",
+        key=key,
+    )
+    return True
+
+
+def _venv_pip(venv_path: Path) -> list[str]:
+    """Command running pip inside a venv (via its interpreter, not a launcher)."""
+    if is_windows():
+        python = venv_path / "Scripts" / "python.exe"
+    else:
+        python = venv_path / "bin" / "python"
+    return [str(python), "-m", "pip"]
+
+
+def _reinstall_project_package(
+    worktree_path: Path,
+    config: DependencyShareConfig,
+    venv_path: Path,
+) -> bool:
+    """Reinstall the worktree's own package (no deps) into a cloned venv."""
+    install_dir = (worktree_path / config.requirements_file).parent
+    try:
+        result = subprocess.run(
+            [
+                *_venv_pip(venv_path),
+                "install",
+                "--no-deps",
+                "--force-reinstall",
+                str(install_dir),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        debug_warning(
+            MODULE, f"Project reinstall failed for {config.source_rel_path}: {e}"
+        )
+        return False
+    if result.returncode != 0:
+        debug_warning(
+            MODULE,
+            f"Project reinstall failed (exit {result.returncode}): {result.stderr}",
+        )
+        print_status(
+            f"Warning: Dependency install failed for {config.requirements_file}",
+            "warning",
+        )
+        return False
+    return True
+
+
+def _create_venv(
+    project_dir: Path,
+    worktree_path: Path,
+    config: DependencyShareConfig,
+    python_exec: str,
+    venv_path: Path,
+) -> bool:
+    """Create a venv at venv_path and install the config's requirements into it.
+
+    Returns True on success. On failure, the partial venv is removed so
+    retries aren't blocked.
+    """
     # Create the venv
     try:
         debug(MODULE, f"Creating venv at {venv_path}")
@@ -769,11 +1040,8 @@ def _apply_recreate_strategy(
     if req_file:
         req_path = project_dir / req_file
         if req_path.is_file():
-            # Determine pip executable inside the new venv
-            if is_windows():
-                pip_exec = str(venv_path / "Scripts" / "pip.exe")
-            else:
-                pip_exec = str(venv_path / "bin" / "pip")
+            # Determine the pip command inside the new venv
+            pip_cmd = _venv_pip(venv_path)
 
             # Build install command based on file type
             req_basename = Path(req_file).name
@@ -784,7 +1052,7 @@ def _apply_recreate_strategy(
                 install_dir = str(
                     worktree_req.parent if worktree_req.is_file() else req_path.parent
                 )
-                install_cmd = [pip_exec, "install", install_dir]
+                install_cmd = [*pip_cmd, "install", install_dir]
             elif req_basename == "Pipfile":
                 # Pipfile: not directly installable via pip, skip
                 debug(
@@ -795,7 +1063,7 @@ def _apply_recreate_strategy(
                 install_cmd = None
             else:
                 # requirements.txt or similar: pip install -r
-                install_cmd = [pip_exec, "install", "-r", str(req_path)]
+                install_cmd = [*pip_cmd, "install", "-r", str(req_path)]
 
             if install_cmd:
                 try:
@@ -840,7 +1108,6 @@ def _apply_recreate_strategy(
                         shutil.rmtree(venv_path, ignore_errors=True)
                     return False
 
-    debug(MODULE, f"Recreated venv at {config.source_rel_path}")
     return True
 
 
@@ -848,9 +1115,13 @@ def _apply_copy_strategy(
     project_dir: Path,
     worktree_path: Path,
     config: DependencyShareConfig,
+    stats: DependencySetupStats | None = None,
 ) -> bool:
     """Deep-copy a dependency directory from project to worktree.
 
+    Uses the copy engine (reflink, hardlink for read-only files, in-kernel
+    copy) instead of byte-copying every file.
+
     Returns True if the copy was performed, False if skipped.
     """
     source_path = project_dir / config.source_rel_path
@@ -866,18 +1137,27 @@ def _apply_copy_strategy(
 
     target_path.parent.mkdir(parents=True, exist_ok=True)
 
+    copy_stats = CopyStats()
     try:
         if source_path.is_file():
-            shutil.copy2(source_path, target_path)
+            copy_file(source_path, target_path, stats=copy_stats)
         else:
-            shutil.copytree(source_path, target_path)
-        debug(MODULE, f"Copied {config.source_rel_path} to worktree")
-        return True
+            copy_tree(source_path, target_path, stats=copy_stats)
     except (OSError, shutil.Error) as e:
         debug_warning(MODULE, f"Could not copy {config.source_rel_path}: {e}")
         print_status(f"Warning: Could not copy {config.source_rel_path}", "warning")
+        # Clean up partial copy so retries aren't blocked
+        if target_path.is_dir():
+            shutil.rmtree(target_path, ignore_errors=True)
         return False
 
+    if stats is not None:
+        with _stats_lock:
+            for method, count in copy_stats.methods.items():
+                stats.copy_methods[method] = stats.copy_methods.get(method, 0) + count
+    debug(MODULE, f"Copied {config.source_rel_path} to worktree")
+    return True
+
 
 def _apply_skip_strategy(config: DependencyShareConfig) -> None:
     """Skip — nothing to do for this dependency type."""
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Virtualenv Template Cache
+=========================
+
+Speeds up the RECREATE dependency strategy by building each Python venv
+once and cloning it into new worktrees.
+
+A template is keyed by:
+- the interpreter (resolved path, size and mtime of the binary)
+- the venv's project-relative path
+- the content of the requirements input (requirements.txt / pyproject.toml)
+  and any lock files next to it (uv.lock, poetry.lock, requirements*.txt, ...)
+
+Changing any of these produces a new key; the stale template for the same
+venv path is removed when the new one is built.
+
+Templates live in ``.auto-claude/venv-cache/<key>/venv`` (same filesystem as
+the worktrees, so hardlinks work). Cloning reflinks or hardlinks library
+files (see copy_engine) and rewrites the few files that embed the venv's
+absolute path (console-script shebangs, activate scripts), so the clone
+behaves like a venv created in place. Set ``VENV_TEMPLATE_CACHE=false`` to disable.
+
+Not used on Windows: the ``Scripts/*.exe`` launchers embed the interpreter
+path in binary form and can't be relocated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from core.env_flags import env_flag
+
+from .copy_engine import CopyStats, copy_file
+
+# Import debug utilities
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.venv_cache"
+
+CACHE_DIR_NAME = "venv-cache"
+MANIFEST_FILENAME = "manifest.json"
+
+# Files next to the requirements input that pin the resolved dependency set
+LOCK_FILE_PATTERNS = (
+    "requirements*.txt",
+    "constraints*.txt",
+    "uv.lock",
+    "poetry.lock",
+    "pdm.lock",
+    "Pipfile.lock",
+)
+
+# Venv subdirectories holding scripts with the venv path baked in
+SCRIPT_DIRS = ("bin", "Scripts")
+
+# Script files larger than this are binaries - never rewritten
+MAX_SCRIPT_REWRITE_BYTES = 1024 * 1024
+
+
+def is_venv_cache_enabled() -> bool:
+    """Whether worktree venvs are cloned from templates (VENV_TEMPLATE_CACHE)."""
+    return env_flag("VENV_TEMPLATE_CACHE", default=True)
+
+
+class VenvTemplateCache:
+    """
+    Content-addressed store of pre-built virtualenvs for one project.
+
+    Example:
+        cache = VenvTemplateCache(project_dir)
+        key = cache.compute_key(python_exec, ".venv", project_dir / "requirements.txt")
+        template = cache.get(key) or cache.build(key, ".venv", create_venv)
+        if template:
+            cache.clone(template, worktree_path / ".venv")
+    """
+
+    def __init__(self, project_dir: Path, cache_root: Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            project_dir: The main project directory
+            cache_root: Override for the cache directory
+                (default: <project>/.auto-claude/venv-cache)
+        """
+        self.project_dir = Path(project_dir)
+        self.cache_root = cache_root or (
+            self.project_dir / ".auto-claude" / CACHE_DIR_NAME
+        )
+
+    def compute_key(
+        self,
+        python_exec: str,
+        venv_rel_path: str,
+        requirements_path: Path | None,
+    ) -> str:
+        """
+        Compute the template key for a venv.
+
+        Args:
+            python_exec: Interpreter used to create the venv
+            venv_rel_path: Project-relative path of the venv
+            requirements_path: Requirements input, or None for a bare venv
+
+        Returns:
+            Hex digest identifying the template
+        """
+        digest = hashlib.sha256()
+
+        interpreter = Path(python_exec).resolve()
+        digest.update(str(interpreter).encode())
+        try:
+            stat = interpreter.stat()
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        except OSError:
+            pass
+
+        digest.update(venv_rel_path.encode())
+
+        for path in _requirement_inputs(requirements_path):
+            digest.update(path.name.encode())
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+
+        return digest.hexdigest()[:32]
+
+    def template_path(self, key: str) -> Path:
+        """Path of the venv inside a template entry."""
+        return self.cache_root / key / "venv"
+
+    def get(self, key: str) -> Path | None:
+        """
+        Look up a usable template.
+
+        Args:
+            key: Key from compute_key()
+
+        Returns:
+            Path to the template venv, or None if missing or incomplete
+        """
+        venv = self.template_path(key)
+        manifest = self.cache_root / key / MANIFEST_FILENAME
+        if manifest.is_file() and (venv / "pyvenv.cfg").is_file():
+            return venv
+        return None
+
+    def build(
+        self,
+        key: str,
+        venv_rel_path: str,
+        create_venv: Callable[[Path], bool],
+    ) -> Path | None:
+        """
+        Build a template by running create_venv into a staging directory.
+
+        The staged venv is moved into place atomically, so concurrent builds
+        of the same key are safe (the first one wins). Older templates for
+        the same venv path are pruned afterwards.
+
+        Args:
+            key: Key from compute_key()
+            venv_rel_path: Project-relative path of the venv (for pruning)
+            create_venv: Callable that creates and populates a venv at the
+                given path, returning True on success
+
+        Returns:
+            Path to the template venv, or None if the build failed
+        """
+        entry = self.cache_root / key
+        staging = self.cache_root / f".{key}.building-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True, exist_ok=True)
+
+        started = time.monotonic()
+        try:
+            if not create_venv(staging / "venv"):
+                return None
+
+            manifest = {
+                "key": key,
+                "venv_rel_path": venv_rel_path,
+                "template_root": str(staging / "venv"),
+                "created_at": datetime.now().isoformat(),
+                "build_seconds": round(time.monotonic() - started, 2),
+            }
+            with open(staging / MANIFEST_FILENAME, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                # Another process finished the same template first
+                if self.get(key) is None:
+                    raise
+                debug(MODULE, f"Template {key} already built by another process")
+        except OSError as e:
+            debug_warning(MODULE, f"Could not store venv template {key}: {e}")
+            return None
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self._prune_stale(venv_rel_path, keep=key)
+        debug(MODULE, f"Built venv template {key} for {venv_rel_path}")
+        return self.get(key)
+
+    def clone(self, template: Path, target: Path) -> bool:
+        """
+        Clone a template venv to a new location.
+
+        Library files are reflinked or hardlinked (falling back to copies
+        across filesystems); scripts that embed the template's absolute path are
+        rewritten for the target.
+
+        Args:
+            template: Template venv from get()/build()
+            target: Destination venv path (must not exist)
+
+        Returns:
+            True if the clone succeeded
+        """
+        template_root = self._recorded_root(template)
+        try:
+            _clone_tree(template, target, template_root)
+        except OSError as e:
+            debug_warning(MODULE, f"Could not clone venv template to {target}: {e}")
+            shutil.rmtree(target, ignore_errors=True)
+            return False
+        return True
+
+    def _recorded_root(self, template: Path) -> str:
+        """Absolute path the template venv was created at."""
+        manifest = template.parent / MANIFEST_FILENAME
+        try:
+            with open(manifest, encoding="utf-8") as f:
+                return json.load(f)["template_root"]
+        except (OSError, KeyError, json.JSONDecodeError):
+            return str(template)
+
+    def _prune_stale(self, venv_rel_path: str, keep: str) -> None:
+        """Remove older templates for the same venv path (invalidated inputs)."""
+        if not self.cache_root.is_dir():
+            return
+        for entry in self.cache_root.iterdir():
+            if entry.name == keep or entry.name.startswith("."):
+                continue
+            try:
+                with open(entry / MANIFEST_FILENAME, encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if manifest.get("venv_rel_path") == venv_rel_path:
+                debug(MODULE, f"Pruning stale venv template {entry.name}")
+                shutil.rmtree(entry, ignore_errors=True)
+
+
+def _requirement_inputs(requirements_path: Path | None) -> list[Path]:
+    """The requirements file plus sibling lock files, in a stable order."""
+    if requirements_path is None or not requirements_path.is_file():
+        return []
+    inputs = {requirements_path}
+    for pattern in LOCK_FILE_PATTERNS:
+        inputs.update(p for p in requirements_path.parent.glob(pattern) if p.is_file())
+    return sorted(inputs)
+
+
+def _clone_tree(source: Path, target: Path, source_root: str) -> None:
+    """Recreate source at target: link files, relocate scripts and symlinks."""
+    target_root = str(target)
+    copy_stats = CopyStats()
+    target.mkdir(parents=True)
+
+    for dirpath, dirnames, filenames in os.walk(source):
+        rel_dir = Path(dirpath).relative_to(source)
+        dest_dir = target / rel_dir
+        is_script_dir = bool(rel_dir.parts) and rel_dir.parts[0] in SCRIPT_DIRS
+
+        for name in list(dirnames):
+            src = Path(dirpath) / name
+            if src.is_symlink():
+                # os.walk doesn't descend into symlinked dirs; recreate the link
+                _copy_symlink(src, dest_dir / name, source_root, target_root)
+                dirnames.remove(name)
+            else:
+                (dest_dir / name).mkdir()
+
+        for name in filenames:
+            src = Path(dirpath) / name
+            dest = dest_dir / name
+            if src.is_symlink():
+                _copy_symlink(src, dest, source_root, target_root)
+            elif is_script_dir or name == "pyvenv.cfg":
+                _copy_relocated(src, dest, source_root, target_root)
+            else:
+                # Templates are never modified in place, so hardlinks are safe
+                copy_file(src, dest, allow_hardlink=True, stats=copy_stats)
+
+
+def _copy_symlink(src: Path, dest: Path, source_root: str, target_root: str) -> None:
+    link = os.readlink(src)
+    if link.startswith(source_root):
+        link = target_root + link[len(source_root) :]
+    os.symlink(link, dest)
+
+
+def _copy_relocated(src: Path, dest: Path, source_root: str, target_root: str) -> None:
+    """Copy a file, rewriting the template path if it appears in a text file."""
+    if src.stat().st_size <= MAX_SCRIPT_REWRITE_BYTES:
+        data = src.read_bytes()
+        old = source_root.encode()
+        if old in data and b"\0" not in data:
+            dest.write_bytes(data.replace(old, target_root.encode()))
+            shutil.copymode(src, dest)
+            return
+    shutil.copy2(src, dest)
@@ -33,6 +33,7 @@ from core.git_executable import get_git_executable, get_isolated_git_env, run_gi
 from core.git_provider import detect_git_provider
 from core.glab_executable import get_glab_executable, invalidate_glab_cache
 from core.model_config import get_utility_model_config
+from core.tracing import span
 from debug import debug_warning
 
 logger = logging.getLogger(__name__)
@@ -265,7 +266,8 @@ class WorktreeManager:
             CompletedProcess with command results. On timeout, returns a
             CompletedProcess with returncode=-1 and timeout error in stderr.
         """
-        return run_git(args, cwd=cwd or self.project_dir, timeout=timeout)
+        with span("git", command=args[0] if args else ""):
+            return run_git(args, cwd=cwd or self.project_dir, timeout=timeout)
 
     def _unstage_gitignored_files(self) -> None:
         """
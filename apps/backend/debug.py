@@ -18,8 +18,10 @@ from core.debug import (
     debug_timer,
     debug_verbose,
     debug_warning,
+    flush_debug_log,
     get_debug_level,
     is_debug_enabled,
+    reload_debug_config,
 )
 
 __all__ = [
@@ -35,6 +37,8 @@ __all__ = [
     "debug_timer",
     "debug_verbose",
     "debug_warning",
+    "flush_debug_log",
     "get_debug_level",
     "is_debug_enabled",
+    "reload_debug_config",
 ]
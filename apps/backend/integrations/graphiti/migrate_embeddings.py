@@ -29,13 +29,14 @@ import argparse
 import asyncio
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add auto-claude to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from integrations.graphiti.config import GraphitiConfig
+from integrations.graphiti.queries_pkg.ingest import Episode, EpisodeIngestor
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -148,6 +149,27 @@ class EmbeddingMigrator:
             logger.error(f"Failed to fetch episodes: {e}")
             return []
 
+    def _target_episode(self, episode: dict) -> Episode:
+        """Convert a source episode row to an episode for the target database."""
+        # Determine episode type
+        source = episode.get("source", "text")
+        if source not in ("message", "json"):
+            source = "text"
+
+        # Parse timestamps
+        valid_at = episode.get("valid_at")
+        if isinstance(valid_at, str):
+            valid_at = datetime.fromisoformat(valid_at.replace("Z", "+00:00"))
+
+        return Episode(
+            name=episode["name"],
+            body=episode["content"] or "",
+            source=source,
+            source_description=episode.get("source_description", "Migrated episode"),
+            group_id=episode.get("group_id", "default"),
+            reference_time=valid_at or datetime.now(timezone.utc),
+        )
+
     async def migrate_episode(self, episode: dict) -> bool:
         """
         Migrate a single episode to the target database.
@@ -165,30 +187,16 @@ class EmbeddingMigrator:
         try:
             from graphiti_core.nodes import EpisodeType
 
-            # Determine episode type
-            source = episode.get("source", "text")
-            if source == "message":
-                episode_type = EpisodeType.message
-            elif source == "json":
-                episode_type = EpisodeType.json
-            else:
-                episode_type = EpisodeType.text
-
-            # Parse timestamps
-            valid_at = episode.get("valid_at")
-            if isinstance(valid_at, str):
-                valid_at = datetime.fromisoformat(valid_at.replace("Z", "+00:00"))
+            target = self._target_episode(episode)
 
             # Re-embed and save with new provider
             await self.target_client.graphiti.add_episode(
-                name=episode["name"],
-                episode_body=episode["content"] or "",
-                source=episode_type,
-                source_description=episode.get(
-                    "source_description", "Migrated episode"
-                ),
-                reference_time=valid_at,
-                group_id=episode.get("group_id", "default"),
+                name=target.name,
+                episode_body=target.body,
+                source=getattr(EpisodeType, target.source),
+                source_description=target.source_description,
+                reference_time=target.reference_time,
+                group_id=target.group_id,
             )
 
             logger.info(f"Migrated: {episode['name']}")
@@ -213,14 +221,35 @@ class EmbeddingMigrator:
             "failed": 0,
             "dry_run": self.dry_run,
         }
+        if not episodes:
+            return stats
 
-        for i, episode in enumerate(episodes, 1):
-            logger.info(f"Processing episode {i}/{len(episodes)}")
-            if await self.migrate_episode(episode):
-                stats["succeeded"] += 1
-            else:
+        if self.dry_run:
+            for i, episode in enumerate(episodes, 1):
+                logger.info(f"Processing episode {i}/{len(episodes)}")
+                await self.migrate_episode(episode)
+            stats["succeeded"] = len(episodes)
+            return stats
+
+        # Re-embed in batches per group instead of one episode at a time
+        ingestor = EpisodeIngestor(
+            self.target_client.graphiti,
+            progress_callback=lambda done, total: logger.info(
+                f"Migrated {done}/{total} episodes"
+            ),
+        )
+        targets = []
+        for episode in episodes:
+            try:
+                targets.append(self._target_episode(episode))
+            except Exception as e:
+                logger.error(f"Failed to migrate episode {episode['name']}: {e}")
                 stats["failed"] += 1
 
+        result = await ingestor.ingest(targets)
+        stats["succeeded"] = result.saved
+        stats["failed"] += result.failed
+
         return stats
 
     async def close(self):
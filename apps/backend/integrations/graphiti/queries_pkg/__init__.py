@@ -5,6 +5,7 @@ This package provides a clean separation of concerns for Graphiti memory:
 - graphiti.py: Main facade and coordination
 - client.py: Database connection management
 - queries.py: Episode storage operations
+- ingest.py: Batched episode ingestion
 - search.py: Semantic search and retrieval
 - schema.py: Data structures and constants
 
@@ -0,0 +1,216 @@
+"""
+Batched episode ingestion for Graphiti memory.
+
+Saving a session's structured insights or migrating a database adds many
+episodes at once. Each add_episode() call runs its own LLM extraction and
+embedding round trips, so adding them one after another made session
+teardown take minutes. EpisodeIngestor instead:
+
+- Groups episodes by group_id into batches (GRAPHITI_INGEST_BATCH_SIZE,
+  default 10) and adds each batch with graphiti.add_episode_bulk(): one
+  extraction pass, bulk embedding and one bulk save per batch
+- Falls back to add_episode() per episode, at most GRAPHITI_INGEST_WORKERS
+  (default 4) at a time, when bulk ingestion is unavailable (the rest of
+  the run then skips bulk ingestion). A bulk call that fails for any other
+  reason may have saved part of its batch, so the batch is counted as
+  failed rather than added again
+- Reports progress after every batch or episode
+
+Bulk ingestion skips Graphiti's edge invalidation; set
+GRAPHITI_INGEST_BATCH_SIZE=1 to add every episode on its own.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+# Called with (episodes done, total episodes)
+IngestProgressCallback = Callable[[int, int], None]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, str(default))))
+    except ValueError:
+        return default
+
+
+def get_ingest_batch_size() -> int:
+    """Episodes per add_episode_bulk() call (GRAPHITI_INGEST_BATCH_SIZE)."""
+    return _env_int("GRAPHITI_INGEST_BATCH_SIZE", 10)
+
+
+def get_ingest_workers() -> int:
+    """Concurrent add_episode() calls when not bulk adding (GRAPHITI_INGEST_WORKERS)."""
+    return _env_int("GRAPHITI_INGEST_WORKERS", 4)
+
+
+@dataclass
+class Episode:
+    """An episode to add to the knowledge graph."""
+
+    name: str
+    body: str
+    source_description: str
+    group_id: str
+    reference_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    source: str = "text"  # EpisodeType name: "text", "message" or "json"
+
+
+@dataclass
+class IngestResult:
+    """Outcome of ingesting a list of episodes."""
+
+    total: int = 0
+    saved: int = 0
+    failed: int = 0
+    bulk_batches: int = 0
+
+
+# Errors raised before add_episode_bulk() writes anything: graphiti_core
+# without bulk support, or a driver that doesn't implement it
+_BULK_UNSUPPORTED_ERRORS = (ImportError, AttributeError, NotImplementedError, TypeError)
+
+
+def _is_duplicate_facts_error(error: Exception) -> bool:
+    # Graphiti deduplication can fail with "invalid duplicate_facts idx"
+    # This is a known issue in graphiti-core - episode is still saved
+    return "duplicate_facts" in str(error)
+
+
+class EpisodeIngestor:
+    """Adds episodes to a Graphiti instance in batches."""
+
+    def __init__(
+        self,
+        graphiti,
+        batch_size: int | None = None,
+        max_workers: int | None = None,
+        progress_callback: IngestProgressCallback | None = None,
+    ):
+        """
+        Initialize the ingestor.
+
+        Args:
+            graphiti: graphiti_core Graphiti instance
+            batch_size: Episodes per bulk call (default: get_ingest_batch_size())
+            max_workers: Concurrent single adds (default: get_ingest_workers())
+            progress_callback: Called with (done, total) as episodes are added
+        """
+        self.graphiti = graphiti
+        self.batch_size = batch_size or get_ingest_batch_size()
+        self.max_workers = max_workers or get_ingest_workers()
+        self.progress_callback = progress_callback
+        self._use_bulk = self.batch_size > 1 and hasattr(graphiti, "add_episode_bulk")
+
+    async def ingest(self, episodes: list[Episode]) -> IngestResult:
+        """
+        Add episodes, in batches where possible.
+
+        Returns:
+            Counts of saved and failed episodes
+        """
+        result = IngestResult(total=len(episodes))
+        if not episodes:
+            return result
+
+        from graphiti_core.nodes import EpisodeType
+
+        self._episode_type = EpisodeType
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        by_group: dict[str, list[Episode]] = {}
+        for episode in episodes:
+            by_group.setdefault(episode.group_id, []).append(episode)
+
+        for group_id, group in by_group.items():
+            for start in range(0, len(group), self.batch_size):
+                batch = group[start : start + self.batch_size]
+                if self._use_bulk and len(batch) > 1:
+                    saved = await self._add_bulk(group_id, batch)
+                    if saved is not None:
+                        if saved:
+                            result.saved += len(batch)
+                            result.bulk_batches += 1
+                        else:
+                            result.failed += len(batch)
+                        self._report(result)
+                        continue
+                await self._add_each(batch, result)
+
+        return result
+
+    def _report(self, result: IngestResult) -> None:
+        done = result.saved + result.failed
+        logger.debug(f"Ingested {done}/{result.total} episodes")
+        if self.progress_callback:
+            self.progress_callback(done, result.total)
+
+    def _episode_source(self, episode: Episode):
+        return getattr(self._episode_type, episode.source, self._episode_type.text)
+
+    async def _add_bulk(self, group_id: str, batch: list[Episode]) -> bool | None:
+        """Add a batch in one call; None when bulk ingestion is unsupported."""
+        try:
+            from graphiti_core.utils.bulk_utils import RawEpisode
+
+            await self.graphiti.add_episode_bulk(
+                [
+                    RawEpisode(
+                        name=episode.name,
+                        content=episode.body,
+                        source=self._episode_source(episode),
+                        source_description=episode.source_description,
+                        reference_time=episode.reference_time,
+                    )
+                    for episode in batch
+                ],
+                group_id=group_id,
+            )
+            return True
+        except Exception as e:
+            if _is_duplicate_facts_error(e):
+                logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
+                return True
+            if isinstance(e, _BULK_UNSUPPORTED_ERRORS):
+                logger.info(
+                    f"Bulk episode ingestion unavailable, adding one by one: {e}"
+                )
+                self._use_bulk = False
+                return None
+            # Part of the batch may already be saved; adding it again one by
+            # one would duplicate those episodes
+            logger.warning(
+                f"Bulk ingestion of {len(batch)} episodes failed, "
+                f"not retrying them: {e}"
+            )
+            return False
+
+    async def _add_each(self, batch: list[Episode], result: IngestResult) -> None:
+        async def add(episode: Episode) -> None:
+            async with self._semaphore:
+                try:
+                    await self.graphiti.add_episode(
+                        name=episode.name,
+                        episode_body=episode.body,
+                        source=self._episode_source(episode),
+                        source_description=episode.source_description,
+                        reference_time=episode.reference_time,
+                        group_id=episode.group_id,
+                    )
+                    result.saved += 1
+                except Exception as e:
+                    if _is_duplicate_facts_error(e):
+                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
+                        result.saved += 1
+                    else:
+                        logger.debug(f"Failed to add episode {episode.name}: {e}")
+                        result.failed += 1
+            self._report(result)
+
+        await asyncio.gather(*(add(episode) for episode in batch))
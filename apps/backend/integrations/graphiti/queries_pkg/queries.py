@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 
 from core.sentry import capture_exception
 
+from .ingest import Episode, EpisodeIngestor
 from .schema import (
     EPISODE_TYPE_CODEBASE_DISCOVERY,
     EPISODE_TYPE_GOTCHA,
@@ -286,6 +287,114 @@ class GraphitiQueries:
             )
             return False
 
+    def _structured_insight_episodes(self, insights: dict) -> list[Episode]:
+        """Build the episodes for add_structured_insights()."""
+        episodes = []
+
+        def add(name: str, content: dict, source_description: str) -> None:
+            episodes.append(
+                Episode(
+                    name=name,
+                    body=json.dumps(content),
+                    source_description=source_description,
+                    group_id=self.group_id,
+                )
+            )
+
+        # 1. File insights
+        for file_insight in insights.get("file_insights", []):
+            path = file_insight.get("path", "unknown")
+            add(
+                f"file_insight_{path.replace('/', '_')}",
+                {
+                    "type": EPISODE_TYPE_CODEBASE_DISCOVERY,
+                    "spec_id": self.spec_context_id,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "file_path": path,
+                    "purpose": file_insight.get("purpose", ""),
+                    "changes_made": file_insight.get("changes_made", ""),
+                    "patterns_used": file_insight.get("patterns_used", []),
+                    "gotchas": file_insight.get("gotchas", []),
+                },
+                f"File insight: {path}",
+            )
+
+        # 2. Patterns
+        for i, pattern in enumerate(insights.get("patterns_discovered", [])):
+            is_dict = isinstance(pattern, dict)
+            pattern_text = pattern.get("pattern", "") if is_dict else str(pattern)
+            add(
+                f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}_{i}",
+                {
+                    "type": EPISODE_TYPE_PATTERN,
+                    "spec_id": self.spec_context_id,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "pattern": pattern_text,
+                    "applies_to": pattern.get("applies_to", "") if is_dict else "",
+                    "example": pattern.get("example", "") if is_dict else "",
+                },
+                f"Pattern: {pattern_text[:50]}...",
+            )
+
+        # 3. Gotchas
+        for i, gotcha in enumerate(insights.get("gotchas_discovered", [])):
+            is_dict = isinstance(gotcha, dict)
+            gotcha_text = gotcha.get("gotcha", "") if is_dict else str(gotcha)
+            add(
+                f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}_{i}",
+                {
+                    "type": EPISODE_TYPE_GOTCHA,
+                    "spec_id": self.spec_context_id,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "gotcha": gotcha_text,
+                    "trigger": gotcha.get("trigger", "") if is_dict else "",
+                    "solution": gotcha.get("solution", "") if is_dict else "",
+                },
+                f"Gotcha: {gotcha_text[:50]}...",
+            )
+
+        subtask_id = insights.get("subtask_id", "unknown")
+
+        # 4. Approach outcome
+        outcome = insights.get("approach_outcome", {})
+        if outcome:
+            success = outcome.get("success", insights.get("success", False))
+            add(
+                f"task_outcome_{subtask_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
+                {
+                    "type": EPISODE_TYPE_TASK_OUTCOME,
+                    "spec_id": self.spec_context_id,
+                    "task_id": subtask_id,
+                    "success": success,
+                    "outcome": outcome.get("approach_used", ""),
+                    "why_worked": outcome.get("why_it_worked"),
+                    "why_failed": outcome.get("why_it_failed"),
+                    "alternatives_tried": outcome.get("alternatives_tried", []),
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "changed_files": insights.get("changed_files", []),
+                },
+                f"Task outcome: {subtask_id} {'succeeded' if success else 'failed'}",
+            )
+
+        # 5. Recommendations
+        recommendations = insights.get("recommendations", [])
+        if recommendations:
+            add(
+                f"recommendations_{subtask_id}",
+                {
+                    "type": EPISODE_TYPE_SESSION_INSIGHT,
+                    "spec_id": self.spec_context_id,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "subtask_id": subtask_id,
+                    "session_number": insights.get("session_num", 0),
+                    "recommendations": recommendations,
+                    "success": insights.get("success", False),
+                },
+                f"Recommendations for {subtask_id}",
+            )
+
+        return episodes
+
     async def add_structured_insights(self, insights: dict) -> bool:
         """
         Save extracted insights as multiple focused episodes.
@@ -299,202 +408,15 @@ class GraphitiQueries:
         if not insights:
             return True
 
-        saved_count = 0
-        total_count = 0
-
         try:
-            from graphiti_core.nodes import EpisodeType
-
-            # 1. Save file insights
-            for file_insight in insights.get("file_insights", []):
-                total_count += 1
-                try:
-                    episode_content = {
-                        "type": EPISODE_TYPE_CODEBASE_DISCOVERY,
-                        "spec_id": self.spec_context_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "file_path": file_insight.get("path", "unknown"),
-                        "purpose": file_insight.get("purpose", ""),
-                        "changes_made": file_insight.get("changes_made", ""),
-                        "patterns_used": file_insight.get("patterns_used", []),
-                        "gotchas": file_insight.get("gotchas", []),
-                    }
-
-                    await self.client.graphiti.add_episode(
-                        name=f"file_insight_{file_insight.get('path', 'unknown').replace('/', '_')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"File insight: {file_insight.get('path', 'unknown')}",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1
-                    else:
-                        logger.debug(f"Failed to save file insight: {e}")
-
-            # 2. Save patterns
-            for pattern in insights.get("patterns_discovered", []):
-                total_count += 1
-                try:
-                    pattern_text = (
-                        pattern.get("pattern", "")
-                        if isinstance(pattern, dict)
-                        else str(pattern)
-                    )
-                    applies_to = (
-                        pattern.get("applies_to", "")
-                        if isinstance(pattern, dict)
-                        else ""
-                    )
-                    example = (
-                        pattern.get("example", "") if isinstance(pattern, dict) else ""
-                    )
-
-                    episode_content = {
-                        "type": EPISODE_TYPE_PATTERN,
-                        "spec_id": self.spec_context_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "pattern": pattern_text,
-                        "applies_to": applies_to,
-                        "example": example,
-                    }
-
-                    await self.client.graphiti.add_episode(
-                        name=f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"Pattern: {pattern_text[:50]}...",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1
-                    else:
-                        logger.debug(f"Failed to save pattern: {e}")
-
-            # 3. Save gotchas
-            for gotcha in insights.get("gotchas_discovered", []):
-                total_count += 1
-                try:
-                    gotcha_text = (
-                        gotcha.get("gotcha", "")
-                        if isinstance(gotcha, dict)
-                        else str(gotcha)
-                    )
-                    trigger = (
-                        gotcha.get("trigger", "") if isinstance(gotcha, dict) else ""
-                    )
-                    solution = (
-                        gotcha.get("solution", "") if isinstance(gotcha, dict) else ""
-                    )
-
-                    episode_content = {
-                        "type": EPISODE_TYPE_GOTCHA,
-                        "spec_id": self.spec_context_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "gotcha": gotcha_text,
-                        "trigger": trigger,
-                        "solution": solution,
-                    }
-
-                    await self.client.graphiti.add_episode(
-                        name=f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"Gotcha: {gotcha_text[:50]}...",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1
-                    else:
-                        logger.debug(f"Failed to save gotcha: {e}")
-
-            # 4. Save approach outcome
-            outcome = insights.get("approach_outcome", {})
-            if outcome:
-                total_count += 1
-                try:
-                    subtask_id = insights.get("subtask_id", "unknown")
-                    success = outcome.get("success", insights.get("success", False))
-
-                    episode_content = {
-                        "type": EPISODE_TYPE_TASK_OUTCOME,
-                        "spec_id": self.spec_context_id,
-                        "task_id": subtask_id,
-                        "success": success,
-                        "outcome": outcome.get("approach_used", ""),
-                        "why_worked": outcome.get("why_it_worked"),
-                        "why_failed": outcome.get("why_it_failed"),
-                        "alternatives_tried": outcome.get("alternatives_tried", []),
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "changed_files": insights.get("changed_files", []),
-                    }
-
-                    await self.client.graphiti.add_episode(
-                        name=f"task_outcome_{subtask_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"Task outcome: {subtask_id} {'succeeded' if success else 'failed'}",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    # Graphiti deduplication can fail with "invalid duplicate_facts idx"
-                    # This is a known issue in graphiti-core - episode is still partially saved
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1  # Episode likely saved, just dedup failed
-                    else:
-                        logger.debug(f"Failed to save task outcome: {e}")
-
-            # 5. Save recommendations
-            recommendations = insights.get("recommendations", [])
-            if recommendations:
-                total_count += 1
-                try:
-                    episode_content = {
-                        "type": EPISODE_TYPE_SESSION_INSIGHT,
-                        "spec_id": self.spec_context_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "subtask_id": insights.get("subtask_id", "unknown"),
-                        "session_number": insights.get("session_num", 0),
-                        "recommendations": recommendations,
-                        "success": insights.get("success", False),
-                    }
-
-                    await self.client.graphiti.add_episode(
-                        name=f"recommendations_{insights.get('subtask_id', 'unknown')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"Recommendations for {insights.get('subtask_id', 'unknown')}",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1
-                    else:
-                        logger.debug(f"Failed to save recommendations: {e}")
+            episodes = self._structured_insight_episodes(insights)
+            result = await EpisodeIngestor(self.client.graphiti).ingest(episodes)
 
             logger.info(
-                f"Saved {saved_count}/{total_count} structured insights to Graphiti "
+                f"Saved {result.saved}/{result.total} structured insights to Graphiti "
                 f"(group: {self.group_id})"
             )
-            return saved_count > 0
+            return result.saved > 0
 
         except Exception as e:
             logger.warning(f"Failed to save structured insights: {e}")
@@ -98,6 +98,24 @@ def sample_episodes():
     ]
 
 
+@pytest.fixture
+def mock_graphiti_core_modules():
+    """Mock graphiti_core for the batched ingestion path of migrate_all()."""
+    import sys
+
+    nodes = MagicMock()
+    with patch.dict(
+        sys.modules,
+        {
+            "graphiti_core": MagicMock(),
+            "graphiti_core.nodes": nodes,
+            "graphiti_core.utils": MagicMock(),
+            "graphiti_core.utils.bulk_utils": MagicMock(),
+        },
+    ):
+        yield nodes.EpisodeType
+
+
 # =============================================================================
 # Tests for EmbeddingMigrator.__init__
 # =============================================================================
@@ -987,8 +1005,10 @@ class TestMigrateAll:
     """Tests for EmbeddingMigrator.migrate_all method."""
 
     @pytest.mark.asyncio
-    async def test_migrate_all_success(self, sample_episodes):
-        """Test successful migration of all episodes (lines 208-224)."""
+    async def test_migrate_all_success(
+        self, sample_episodes, mock_target_client, mock_graphiti_core_modules
+    ):
+        """Test successful migration of all episodes in one bulk batch."""
         from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
 
         migrator = EmbeddingMigrator(
@@ -996,10 +1016,10 @@ class TestMigrateAll:
             target_config=MagicMock(),
             dry_run=False,
         )
+        migrator.target_client = mock_target_client
+        mock_target_client.graphiti.add_episode_bulk = AsyncMock()
 
-        # Mock get_source_episodes and migrate_episode
         migrator.get_source_episodes = AsyncMock(return_value=sample_episodes)
-        migrator.migrate_episode = AsyncMock(return_value=True)
 
         stats = await migrator.migrate_all()
 
@@ -1007,22 +1027,32 @@ class TestMigrateAll:
         assert stats["succeeded"] == 2
         assert stats["failed"] == 0
         assert stats["dry_run"] is False
+        bulk = mock_target_client.graphiti.add_episode_bulk
+        bulk.assert_awaited_once()
+        assert bulk.call_args.kwargs["group_id"] == "test_group"
+        assert len(bulk.call_args.args[0]) == 2
+        mock_target_client.graphiti.add_episode.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_migrate_all_success_slow(self, sample_episodes):
-        """Test successful migration of all episodes (slow variant)."""
+    async def test_migrate_all_success_slow(
+        self,
+        sample_episodes,
+        mock_target_client,
+        mock_graphiti_core_modules,
+        monkeypatch,
+    ):
+        """Test successful migration one episode at a time (batch size 1)."""
         from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
 
+        monkeypatch.setenv("GRAPHITI_INGEST_BATCH_SIZE", "1")
         migrator = EmbeddingMigrator(
             source_config=MagicMock(),
             target_config=MagicMock(),
             dry_run=False,
         )
-
-        # Mock get_source_episodes and migrate_episode
+        migrator.target_client = mock_target_client
         migrator.get_source_episodes = AsyncMock(return_value=sample_episodes)
-        migrator.migrate_episode = AsyncMock(return_value=True)
 
         stats = await migrator.migrate_all()
 
@@ -1030,11 +1060,14 @@ class TestMigrateAll:
         assert stats["succeeded"] == 2
         assert stats["failed"] == 0
         assert stats["dry_run"] is False
+        assert mock_target_client.graphiti.add_episode.await_count == 2
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_migrate_all_with_failures(self, sample_episodes):
-        """Test migration with some failures."""
+    async def test_migrate_all_with_failures(
+        self, sample_episodes, mock_target_client, mock_graphiti_core_modules
+    ):
+        """Test migration with some failures when bulk ingestion is unsupported."""
         from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
 
         migrator = EmbeddingMigrator(
@@ -1042,9 +1075,17 @@ class TestMigrateAll:
             target_config=MagicMock(),
             dry_run=False,
         )
+        migrator.target_client = mock_target_client
+        mock_target_client.graphiti.add_episode_bulk = AsyncMock(
+            side_effect=NotImplementedError("no bulk support")
+        )
 
+        async def add_episode(**kwargs):
+            if kwargs["name"] == "episode_2":
+                raise RuntimeError("Embedding failed")
+
+        mock_target_client.graphiti.add_episode.side_effect = add_episode
         migrator.get_source_episodes = AsyncMock(return_value=sample_episodes)
-        migrator.migrate_episode = AsyncMock(side_effect=[True, False])
 
         stats = await migrator.migrate_all()
 
@@ -1075,8 +1116,10 @@ class TestMigrateAll:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_migrate_all_increments_failed_count(self, sample_episodes):
-        """Test migrate_all increments failed count (line 222)."""
+    async def test_migrate_all_increments_failed_count(
+        self, sample_episodes, mock_target_client, mock_graphiti_core_modules
+    ):
+        """Test a failed bulk batch counts all its episodes as failed."""
         from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
 
         migrator = EmbeddingMigrator(
@@ -1084,31 +1127,41 @@ class TestMigrateAll:
             target_config=MagicMock(),
             dry_run=False,
         )
-
+        migrator.target_client = mock_target_client
+        mock_target_client.graphiti.add_episode_bulk = AsyncMock(
+            side_effect=RuntimeError("Connection lost")
+        )
         migrator.get_source_episodes = AsyncMock(return_value=sample_episodes)
-        # First succeeds, second fails
-        migrator.migrate_episode = AsyncMock(side_effect=[True, False])
 
         stats = await migrator.migrate_all()
 
         assert stats["total"] == 2
-        assert stats["succeeded"] == 1
-        assert stats["failed"] == 1
+        assert stats["succeeded"] == 0
+        assert stats["failed"] == 2
+        # The batch may be partly saved, so it isn't added again one by one
+        mock_target_client.graphiti.add_episode.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_migrate_all_all_fail(self, sample_episodes):
+    async def test_migrate_all_all_fail(
+        self,
+        sample_episodes,
+        mock_target_client,
+        mock_graphiti_core_modules,
+        monkeypatch,
+    ):
         """Test migrate_all when all episodes fail."""
         from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
 
+        monkeypatch.setenv("GRAPHITI_INGEST_BATCH_SIZE", "1")
         migrator = EmbeddingMigrator(
             source_config=MagicMock(),
             target_config=MagicMock(),
             dry_run=False,
         )
-
+        migrator.target_client = mock_target_client
+        mock_target_client.graphiti.add_episode.side_effect = RuntimeError("down")
         migrator.get_source_episodes = AsyncMock(return_value=sample_episodes)
-        migrator.migrate_episode = AsyncMock(return_value=False)
 
         stats = await migrator.migrate_all()
 
@@ -1131,6 +1184,7 @@ class TestMigrateAll:
         migrator.get_source_episodes = AsyncMock(return_value=[])
         migrator.migrate_episode = AsyncMock(return_value=True)
 
+        # No target client: nothing may be ingested
         stats = await migrator.migrate_all()
 
         assert stats["total"] == 0
@@ -2302,7 +2356,9 @@ class TestMigrateAllEdgeCases:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_migrate_all_logs_progress(self, mock_source_client, caplog):
+    async def test_migrate_all_logs_progress(
+        self, mock_target_client, mock_graphiti_core_modules, caplog
+    ):
         """Test migrate_all logs progress for each episode."""
         from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
 
@@ -2325,20 +2381,23 @@ class TestMigrateAllEdgeCases:
             target_config=MagicMock(),
             dry_run=False,
         )
+        migrator.target_client = mock_target_client
+        mock_target_client.graphiti.add_episode_bulk = AsyncMock()
         migrator.get_source_episodes = AsyncMock(return_value=episodes)
-        migrator.migrate_episode = AsyncMock(return_value=True)
 
         with caplog.at_level("INFO"):
             stats = await migrator.migrate_all()
 
         assert stats["total"] == 5
         assert stats["succeeded"] == 5
-        # Should log progress for each episode
-        assert "Processing episode" in caplog.text
+        # Should log progress after each batch
+        assert "Migrated 5/5 episodes" in caplog.text
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_migrate_all_handles_partial_failures(self):
+    async def test_migrate_all_handles_partial_failures(
+        self, mock_target_client, mock_graphiti_core_modules, monkeypatch
+    ):
         """Test migrate_all continues after failures."""
         from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
 
@@ -2356,16 +2415,21 @@ class TestMigrateAllEdgeCases:
             for i in range(1, 6)
         ]
 
+        monkeypatch.setenv("GRAPHITI_INGEST_BATCH_SIZE", "1")
         migrator = EmbeddingMigrator(
             source_config=MagicMock(),
             target_config=MagicMock(),
             dry_run=False,
         )
+        migrator.target_client = mock_target_client
         migrator.get_source_episodes = AsyncMock(return_value=episodes)
+
         # Fail episodes 2 and 4
-        migrator.migrate_episode = AsyncMock(
-            side_effect=[True, False, True, False, True]
-        )
+        async def add_episode(**kwargs):
+            if kwargs["name"] in ("episode_2", "episode_4"):
+                raise RuntimeError("Embedding failed")
+
+        mock_target_client.graphiti.add_episode.side_effect = add_episode
 
         stats = await migrator.migrate_all()
 
@@ -28,6 +28,9 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Conflict severities handed to the AI resolver when auto-merge fails
+AI_RESOLVABLE_SEVERITIES = frozenset({ConflictSeverity.MEDIUM, ConflictSeverity.HIGH})
+
 
 class ConflictResolver:
     """
@@ -119,11 +122,7 @@ class ConflictResolver:
             if (
                 self.enable_ai
                 and self.ai_resolver
-                and conflict.severity
-                in {
-                    ConflictSeverity.MEDIUM,
-                    ConflictSeverity.HIGH,
-                }
+                and conflict.severity in AI_RESOLVABLE_SEVERITIES
             ):
                 # Extract baseline for conflict location
                 conflict_baseline = extract_location_content(
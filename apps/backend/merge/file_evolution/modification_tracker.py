@@ -116,7 +116,9 @@ class ModificationTracker:
             semantic_changes = []
             debug(
                 MODULE,
-                f"Skipping semantic analysis for {rel_path} (lightweight tracking)",
+                lambda: (
+                    f"Skipping semantic analysis for {rel_path} (lightweight tracking)"
+                ),
             )
         else:
             # Full analysis (only for conflict files)
@@ -174,9 +176,9 @@ class ModificationTracker:
             task_id=task_id,
             worktree_path=str(worktree_path),
             target_branch=target_branch,
-            analyze_only_files=list(analyze_only_files)[:10]
-            if analyze_only_files
-            else "all",
+            analyze_only_files=lambda: (
+                list(analyze_only_files)[:10] if analyze_only_files else "all"
+            ),
         )
 
         try:
@@ -205,9 +207,7 @@ class ModificationTracker:
             debug(
                 MODULE,
                 f"Found {len(changed_files)} changed files",
-                changed_files=changed_files[:10]
-                if len(changed_files) > 10
-                else changed_files,
+                changed_files=lambda: changed_files[:10],
             )
 
             processed_count = 0
@@ -14,6 +14,8 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from core.tracing import traced
+
 from ..semantic_analyzer import SemanticAnalyzer
 from ..types import FileEvolution, TaskSnapshot
 from .baseline_capture import DEFAULT_EXTENSIONS, BaselineCapture
@@ -322,6 +324,7 @@ class FileEvolutionTracker:
             task_ids=task_ids,
         )
 
+    @traced("merge.refresh_from_git")
     def refresh_from_git(
         self,
         task_id: str,
@@ -9,14 +9,16 @@ This module handles the pipeline for merging a single file:
 - Detecting conflicts
 - Determining merge strategy (single task vs. multi-task)
 - Coordinating conflict resolution
+- Deterministic (AI-free) file merges that can run in thread/process pools
 """
 
 from __future__ import annotations
 
 import logging
 
+from .auto_merger import AutoMerger
 from .conflict_detector import ConflictDetector
-from .conflict_resolver import ConflictResolver
+from .conflict_resolver import AI_RESOLVABLE_SEVERITIES, ConflictResolver
 from .file_merger import apply_single_task_changes, combine_non_conflicting_changes
 from .progress import MergeProgressCallback, MergeProgressStage
 from .types import (
@@ -171,3 +173,97 @@ class MergePipeline:
             analyses[snapshot.task_id] = analysis
 
         return analyses
+
+
+# =============================================================================
+# Deterministic merge stages (parallel execution support)
+# =============================================================================
+
+# Per-process pipeline installed by init_deterministic_worker()
+_worker_pipeline: MergePipeline | None = None
+
+
+def build_deterministic_pipeline(
+    conflict_detector: ConflictDetector,
+    auto_merger: AutoMerger,
+) -> MergePipeline:
+    """
+    Build a merge pipeline that never calls the AI resolver.
+
+    Conflict detection and AutoMerger strategies are pure functions of
+    their inputs, so this pipeline is safe to run concurrently for
+    different files.
+
+    Args:
+        conflict_detector: ConflictDetector instance (rules are read-only)
+        auto_merger: AutoMerger instance (strategies are stateless)
+
+    Returns:
+        MergePipeline with AI resolution disabled
+    """
+    return MergePipeline(
+        conflict_detector=conflict_detector,
+        conflict_resolver=ConflictResolver(
+            auto_merger=auto_merger,
+            ai_resolver=None,
+            enable_ai=False,
+        ),
+    )
+
+
+def init_deterministic_worker(
+    conflict_detector: ConflictDetector,
+    auto_merger: AutoMerger,
+) -> None:
+    """
+    Process-pool initializer: install the deterministic pipeline once per worker.
+
+    Passing the detector and merger here (instead of with every file) means
+    custom compatibility rules survive the trip to the worker process and
+    are only pickled once per worker.
+    """
+    global _worker_pipeline
+    _worker_pipeline = build_deterministic_pipeline(conflict_detector, auto_merger)
+
+
+def merge_file_deterministic(
+    file_path: str,
+    baseline_content: str,
+    task_snapshots: list[TaskSnapshot],
+) -> MergeResult:
+    """
+    Merge one file using only the deterministic stages.
+
+    Module-level so it can be submitted to a ProcessPoolExecutor.
+
+    Args:
+        file_path: Path to the file
+        baseline_content: Original baseline content
+        task_snapshots: Snapshots from tasks that modified this file
+
+    Returns:
+        MergeResult; conflicts that would need AI are left in conflicts_remaining
+    """
+    if _worker_pipeline is None:
+        init_deterministic_worker(ConflictDetector(), AutoMerger())
+    return _worker_pipeline.merge_file(
+        file_path=file_path,
+        baseline_content=baseline_content,
+        task_snapshots=task_snapshots,
+    )
+
+
+def requires_ai_resolution(result: MergeResult) -> bool:
+    """
+    Check whether a deterministic result left conflicts the AI resolver would try.
+
+    Args:
+        result: MergeResult produced by a deterministic pipeline
+
+    Returns:
+        True if any remaining conflict has a severity the AI resolver handles
+    """
+    return any(
+        conflict.severity in AI_RESOLVABLE_SEVERITIES
+        for conflict in result.conflicts_remaining
+    )
@@ -19,26 +19,44 @@ with maximum automation and minimum AI token usage.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from core.tracing import current_span, traced
+
 from .ai_resolver import AIResolver, create_claude_resolver
 from .auto_merger import AutoMerger
 from .conflict_detector import ConflictDetector
 from .conflict_resolver import ConflictResolver
 from .file_evolution import FileEvolutionTracker
 from .git_utils import find_worktree, get_file_from_branch
-from .merge_pipeline import MergePipeline
+from .merge_pipeline import (
+    MergePipeline,
+    build_deterministic_pipeline,
+    init_deterministic_worker,
+    merge_file_deterministic,
+    requires_ai_resolution,
+)
 
 # Re-export models for backwards compatibility
 from .models import MergeReport, MergeStats, TaskMergeRequest
 from .progress import MergeProgressCallback, MergeProgressStage
+from .semantic_analysis.cache import AnalysisCacheStats
 from .semantic_analyzer import SemanticAnalyzer
 from .types import (
     ConflictRegion,
     FileAnalysis,
     MergeDecision,
+    MergeResult,
+    TaskSnapshot,
 )
 
 # Import debug utilities
@@ -76,7 +94,7 @@ except ImportError:
     def debug_section(*args, **kwargs):
         pass
 
-    def is_debug_enabled():
+    def is_debug_enabled(level=1):
         return False
 
 
@@ -120,6 +138,8 @@ class MergeOrchestrator:
         enable_ai: bool = True,
         ai_resolver: AIResolver | None = None,
         dry_run: bool = False,
+        max_workers: int = 1,
+        use_processes: bool = False,
     ):
         """
         Initialize the merge orchestrator.
@@ -130,6 +150,10 @@ class MergeOrchestrator:
             enable_ai: Whether to use AI for ambiguous conflicts
             ai_resolver: Optional pre-configured AI resolver
             dry_run: If True, don't write any files
+            max_workers: Number of files merge_tasks() processes concurrently.
+                1 keeps the sequential pipeline.
+            use_processes: Run the deterministic stages in a process pool
+                instead of a thread pool (sidesteps the GIL for large merges)
         """
         debug_section(MODULE, "Initializing MergeOrchestrator")
         debug(
@@ -138,12 +162,16 @@ class MergeOrchestrator:
             project_dir=str(project_dir),
             enable_ai=enable_ai,
             dry_run=dry_run,
+            max_workers=max_workers,
+            use_processes=use_processes,
         )
 
         self.project_dir = Path(project_dir).resolve()
         self.storage_dir = storage_dir or (self.project_dir / ".auto-claude")
         self.enable_ai = enable_ai
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
 
         # Initialize components
         debug_detailed(MODULE, "Initializing sub-components...")
@@ -256,6 +284,7 @@ class MergeOrchestrator:
             )
             return content, True
 
+    @traced("merge.task")
     def merge_task(
         self,
         task_id: str,
@@ -276,6 +305,7 @@ class MergeOrchestrator:
         Returns:
             MergeReport with results
         """
+        current_span().set(task_id=task_id)
         debug_section(MODULE, f"Merging Task: {task_id}")
         debug(
             MODULE,
@@ -287,6 +317,7 @@ class MergeOrchestrator:
 
         report = MergeReport(started_at=datetime.now(), tasks_merged=[task_id])
         start_time = datetime.now()
+        cache_stats_before = self._analysis_cache_stats()
 
         def _emit(
             stage: MergeProgressStage,
@@ -348,6 +379,7 @@ class MergeOrchestrator:
                 MergeProgressStage.ANALYZING,
                 25,
                 f"Found {len(modifications)} modified files",
+                self._analysis_cache_details(cache_stats_before),
             )
 
             # --- DETECTING_CONFLICTS stage (25-50%) ---
@@ -369,11 +401,12 @@ class MergeOrchestrator:
                     {"current_file": file_path},
                 )
 
-                debug_detailed(
-                    MODULE,
-                    f"Processing file: {file_path}",
-                    changes=len(snapshot.semantic_changes),
-                )
+                if is_debug_enabled(level=2):
+                    debug_detailed(
+                        MODULE,
+                        f"Processing file: {file_path}",
+                        changes=len(snapshot.semantic_changes),
+                    )
                 result = self._merge_file(
                     file_path=file_path,
                     task_snapshots=[snapshot],
@@ -395,11 +428,12 @@ class MergeOrchestrator:
 
                 report.file_results[file_path] = result
                 self._update_stats(report.stats, result)
-                debug_verbose(
-                    MODULE,
-                    f"File merge result: {result.decision.value}",
-                    file=file_path,
-                )
+                if is_debug_enabled(level=3):
+                    debug_verbose(
+                        MODULE,
+                        f"File merge result: {result.decision.value}",
+                        file=file_path,
+                    )
 
             # --- VALIDATING stage (75-100%) ---
             _emit(
@@ -460,6 +494,7 @@ class MergeOrchestrator:
 
         return report
 
+    @traced("merge.tasks")
     def merge_tasks(
         self,
         requests: list[TaskMergeRequest],
@@ -486,6 +521,7 @@ class MergeOrchestrator:
             tasks_merged=[r.task_id for r in requests],
         )
         start_time = datetime.now()
+        cache_stats_before = self._analysis_cache_stats()
 
         def _emit(
             stage: MergeProgressStage,
@@ -535,6 +571,7 @@ class MergeOrchestrator:
                 MergeProgressStage.ANALYZING,
                 25,
                 f"Found {len(file_tasks)} files to merge",
+                self._analysis_cache_details(cache_stats_before),
             )
 
             # --- DETECTING_CONFLICTS stage (25-50%) ---
@@ -544,18 +581,10 @@ class MergeOrchestrator:
                 "Detecting conflicts across tasks",
             )
 
-            # --- RESOLVING stage (50-75%) ---
-            total_files = len(file_tasks)
-            for idx, (file_path, modifying_tasks) in enumerate(file_tasks.items()):
-                file_percent = 50 + int((idx / max(total_files, 1)) * 25)
-                _emit(
-                    MergeProgressStage.RESOLVING,
-                    file_percent,
-                    f"Merging file {idx + 1}/{total_files}",
-                    {"current_file": file_path},
-                )
-
-                # Get snapshots from all tasks that modified this file
+            # Collect the snapshots for every file up front (evolution data
+            # is only touched from this thread)
+            work: list[tuple[str, list[TaskSnapshot], list[str]]] = []
+            for file_path, modifying_tasks in file_tasks.items():
                 evolution = self.evolution_tracker.get_file_evolution(file_path)
                 if not evolution:
                     continue
@@ -569,12 +598,29 @@ class MergeOrchestrator:
                 if not snapshots:
                     continue
 
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=snapshots,
-                    target_branch=target_branch,
+                work.append((file_path, snapshots, modifying_tasks))
+
+            # --- RESOLVING stage (50-75%) ---
+            total_files = len(work)
+
+            def _on_file(idx: int, file_path: str) -> None:
+                file_percent = 50 + int((idx / max(total_files, 1)) * 25)
+                _emit(
+                    MergeProgressStage.RESOLVING,
+                    file_percent,
+                    f"Merging file {idx + 1}/{total_files}",
+                    {"current_file": file_path},
                 )
 
+            results = self._merge_files(
+                [(file_path, snapshots) for file_path, snapshots, _ in work],
+                target_branch=target_branch,
+                on_file=_on_file,
+            )
+
+            # Fold results into the report in file order so the report is
+            # identical regardless of which worker finished first
+            for (file_path, _, modifying_tasks), result in zip(work, results):
                 # Handle DIRECT_COPY: read file directly from worktree
                 # For multi-task merges, use the first task's worktree that modified this file
                 if result.decision == MergeDecision.DIRECT_COPY:
@@ -655,6 +701,7 @@ class MergeOrchestrator:
 
         return report
 
+    @traced("merge.file")
     def _merge_file(
         self,
         file_path: str,
@@ -673,6 +720,7 @@ class MergeOrchestrator:
             MergeResult with merged content or conflict info
         """
         task_ids = [s.task_id for s in task_snapshots]
+        current_span().set(file=file_path, tasks=len(task_ids))
         debug(
             MODULE,
             f"_merge_file: {file_path}",
@@ -680,7 +728,26 @@ class MergeOrchestrator:
             target_branch=target_branch,
         )
 
-        # Get baseline content
+        baseline_content = self._get_baseline_content(file_path, target_branch)
+
+        # Delegate to merge pipeline
+        return self.merge_pipeline.merge_file(
+            file_path=file_path,
+            baseline_content=baseline_content,
+            task_snapshots=task_snapshots,
+        )
+
+    def _get_baseline_content(self, file_path: str, target_branch: str) -> str:
+        """
+        Get the baseline content a file's task changes are applied to.
+
+        Args:
+            file_path: Path to the file
+            target_branch: Branch to fall back to when no baseline was captured
+
+        Returns:
+            Baseline content ("" for files created by the task(s))
+        """
         baseline_content = self.evolution_tracker.get_baseline_content(file_path)
         if baseline_content is None:
             # Try to get from target branch
@@ -692,13 +759,108 @@ class MergeOrchestrator:
             # File is new - created by task(s)
             baseline_content = ""
 
-        # Delegate to merge pipeline
-        return self.merge_pipeline.merge_file(
-            file_path=file_path,
-            baseline_content=baseline_content,
-            task_snapshots=task_snapshots,
+        return baseline_content
+
+    @traced("merge.files")
+    def _merge_files(
+        self,
+        work: list[tuple[str, list[TaskSnapshot]]],
+        target_branch: str,
+        on_file: Callable[[int, str], None] | None = None,
+    ) -> list[MergeResult]:
+        """
+        Merge a batch of files, concurrently when max_workers > 1.
+
+        In parallel mode the deterministic stages (conflict detection and
+        AutoMerger strategies) run in a thread or process pool. Files whose
+        deterministic result still has conflicts the AI resolver would try
+        are then re-merged through the full pipeline one at a time, in file
+        order, so AI calls stay sequential and results match the sequential
+        pipeline exactly.
+
+        Args:
+            work: (file_path, task_snapshots) pairs in report order
+            target_branch: Branch to merge into
+            on_file: Optional callback(index, file_path) for progress reporting
+
+        Returns:
+            MergeResults in the same order as work
+        """
+        if self.max_workers <= 1 or len(work) <= 1:
+            results = []
+            for idx, (file_path, snapshots) in enumerate(work):
+                if on_file:
+                    on_file(idx, file_path)
+                results.append(
+                    self._merge_file(
+                        file_path=file_path,
+                        task_snapshots=snapshots,
+                        target_branch=target_branch,
+                    )
+                )
+            return results
+
+        debug(
+            MODULE,
+            f"Merging {len(work)} files in parallel",
+            max_workers=self.max_workers,
+            executor="process" if self.use_processes else "thread",
         )
 
+        # Baselines may come from `git show`, which is I/O bound - threads suffice
+        with ThreadPoolExecutor(max_workers=self.max_workers) as io_pool:
+            baselines = list(
+                io_pool.map(
+                    lambda item: self._get_baseline_content(item[0], target_branch),
+                    work,
+                )
+            )
+
+        pool: Executor
+        if self.use_processes:
+            pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=init_deterministic_worker,
+                initargs=(self.conflict_detector, self.auto_merger),
+            )
+            merge_fn = merge_file_deterministic
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            merge_fn = build_deterministic_pipeline(
+                self.conflict_detector, self.auto_merger
+            ).merge_file
+
+        results: list[MergeResult | None] = [None] * len(work)
+        with pool:
+            futures = {
+                pool.submit(merge_fn, file_path, baseline, snapshots): idx
+                for idx, ((file_path, snapshots), baseline) in enumerate(
+                    zip(work, baselines)
+                )
+            }
+            for completed, future in enumerate(as_completed(futures)):
+                idx = futures[future]
+                results[idx] = future.result()
+                if on_file:
+                    on_file(completed, work[idx][0])
+
+        if self.enable_ai:
+            for idx, result in enumerate(results):
+                if result is not None and requires_ai_resolution(result):
+                    file_path, snapshots = work[idx]
+                    debug_detailed(
+                        MODULE,
+                        f"Re-merging {file_path} with AI resolution",
+                        remaining=len(result.conflicts_remaining),
+                    )
+                    results[idx] = self.merge_pipeline.merge_file(
+                        file_path=file_path,
+                        baseline_content=baselines[idx],
+                        task_snapshots=snapshots,
+                    )
+
+        return results
+
     def get_pending_conflicts(self) -> list[tuple[str, list[ConflictRegion]]]:
         """
         Get files with pending conflicts that need human review.
@@ -738,6 +900,7 @@ class MergeOrchestrator:
 
         return pending
 
+    @traced("merge.preview")
     def preview_merge(
         self,
         task_ids: list[str],
@@ -773,7 +936,8 @@ class MergeOrchestrator:
 
         # Analyze conflicts
         for file_path in conflicting:
-            debug_detailed(MODULE, f"Analyzing conflicts for: {file_path}")
+            if is_debug_enabled(level=2):
+                debug_detailed(MODULE, f"Analyzing conflicts for: {file_path}")
             evolution = self.evolution_tracker.get_file_evolution(file_path)
             if not evolution:
                 debug_warning(MODULE, f"No evolution data for {file_path}")
@@ -788,15 +952,19 @@ class MergeOrchestrator:
                     )
 
             conflicts = self.conflict_detector.detect_conflicts(analyses)
-            debug_detailed(MODULE, f"Found {len(conflicts)} conflicts in {file_path}")
+            if is_debug_enabled(level=2):
+                debug_detailed(
+                    MODULE, f"Found {len(conflicts)} conflicts in {file_path}"
+                )
 
             for c in conflicts:
-                debug_verbose(
-                    MODULE,
-                    f"Conflict: {c.location}",
-                    severity=c.severity.value,
-                    can_auto_merge=c.can_auto_merge,
-                )
+                if is_debug_enabled(level=3):
+                    debug_verbose(
+                        MODULE,
+                        f"Conflict: {c.location}",
+                        severity=c.severity.value,
+                        can_auto_merge=c.can_auto_merge,
+                    )
                 preview["conflicts"].append(
                     {
                         "file": c.file_path,
@@ -889,6 +1057,23 @@ class MergeOrchestrator:
 
         return success
 
+    def _analysis_cache_stats(self) -> AnalysisCacheStats | None:
+        """Snapshot the semantic analysis cache counters (None if caching is off)."""
+        if self.analyzer.cache is None:
+            return None
+        return self.analyzer.cache.stats()
+
+    def _analysis_cache_details(
+        self, since: AnalysisCacheStats | None
+    ) -> dict[str, Any] | None:
+        """Progress details with analysis cache counters accumulated since a snapshot."""
+        current = self._analysis_cache_stats()
+        if current is None or since is None:
+            return None
+        delta = current.since(since)
+        debug(MODULE, "Semantic analysis cache", **delta.to_dict())
+        return {"analysis_cache": delta.to_dict()}
+
     def _update_stats(self, stats: MergeStats, result) -> None:
         """Update stats from a merge result."""
         stats.files_processed += 1
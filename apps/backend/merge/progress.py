@@ -89,6 +89,8 @@ def emit_progress(
             - conflicts_found (int): Number of conflicts detected
             - conflicts_resolved (int): Number of conflicts resolved so far
             - current_file (str): File currently being processed
+            - analysis_cache (dict): Semantic analysis cache hits/disk_hits/
+              misses/entries for this merge
     """
     percent = max(0, min(100, percent))
 
@@ -5,8 +5,21 @@ This package provides modular semantic analysis capabilities:
 - models.py: Data structures for extracted elements
 - comparison.py: Element comparison and change classification
 - regex_analyzer.py: Regex-based analysis for code changes
+- cache.py: Content-hash keyed cache of analysis results
 """
 
+from .cache import (
+    AnalysisCache,
+    AnalysisCacheStats,
+    configure_analysis_cache,
+    get_analysis_cache,
+)
 from .models import ExtractedElement
 
-__all__ = ["ExtractedElement"]
+__all__ = [
+    "AnalysisCache",
+    "AnalysisCacheStats",
+    "ExtractedElement",
+    "configure_analysis_cache",
+    "get_analysis_cache",
+]
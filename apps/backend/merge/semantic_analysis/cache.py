@@ -0,0 +1,254 @@
+"""
+Semantic analysis result cache.
+
+analyze_with_regex() is a pure function of (file extension, before, after),
+yet the merge subsystem re-runs it for the same file versions several times
+per session (refresh_from_git for each merge/preview, retries, multi-task
+merges). This module memoizes FileAnalysis results keyed by content hash:
+
+- A bounded in-memory LRU shared by every SemanticAnalyzer in the process
+- An optional on-disk layer (one JSON file per key) that survives restarts
+- Hit/miss counters surfaced in merge progress output
+
+Bump ANALYZER_VERSION whenever regex_analyzer output changes so stale
+on-disk entries are never served.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.file_utils import write_json_atomic
+
+from ..types import FileAnalysis
+
+logger = logging.getLogger(__name__)
+
+# Version of the analyzer output format - part of every cache key
+ANALYZER_VERSION = "regex-2"
+
+DEFAULT_MAX_ENTRIES = 2048
+
+
+@dataclass
+class AnalysisCacheStats:
+    """Counters for cache effectiveness."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    entries: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary for progress output."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": self.entries,
+        }
+
+    def since(self, earlier: AnalysisCacheStats) -> AnalysisCacheStats:
+        """Counters accumulated since an earlier snapshot."""
+        return AnalysisCacheStats(
+            hits=self.hits - earlier.hits,
+            disk_hits=self.disk_hits - earlier.disk_hits,
+            misses=self.misses - earlier.misses,
+            entries=self.entries,
+        )
+
+
+def make_cache_key(ext: str, before: str, after: str) -> str:
+    """
+    Build the cache key for an analysis.
+
+    The file path itself is not part of the key: two files with the same
+    extension and contents produce the same changes.
+
+    Args:
+        ext: Lowercased file extension (e.g. ".py")
+        before: Content before changes
+        after: Content after changes
+
+    Returns:
+        Hex digest identifying (ext, before, after, analyzer version)
+    """
+    digest = hashlib.sha256()
+    for part in (ANALYZER_VERSION, ext, before, after):
+        encoded = part.encode("utf-8", errors="surrogatepass")
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Bounded LRU of FileAnalysis results with an optional on-disk layer.
+
+    Entries are stored in serialized (dict) form and materialized into a
+    fresh FileAnalysis on every hit, so callers can mutate results freely.
+    Thread-safe: the parallel merge pipeline may share one instance.
+
+    Example:
+        cache = AnalysisCache(max_entries=1024, disk_dir=storage_dir / "analysis_cache")
+        analysis = cache.get(key, file_path)
+        if analysis is None:
+            analysis = analyze_with_regex(file_path, before, after, ext)
+            cache.put(key, analysis)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_dir: Path | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum in-memory entries before evicting the LRU one
+            disk_dir: Optional directory for persistent entries
+        """
+        self.max_entries = max(1, max_entries)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = AnalysisCacheStats()
+
+    def get(self, key: str, file_path: str) -> FileAnalysis | None:
+        """
+        Look up a cached analysis.
+
+        Args:
+            key: Key from make_cache_key()
+            file_path: Path to stamp on the returned FileAnalysis
+
+        Returns:
+            A new FileAnalysis, or None on a miss
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return self._materialize(data, file_path)
+
+        data = self._read_disk(key)
+
+        with self._lock:
+            if data is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            self._stats.disk_hits += 1
+            self._store(key, data)
+        return self._materialize(data, file_path)
+
+    def put(self, key: str, analysis: FileAnalysis) -> None:
+        """
+        Store an analysis result.
+
+        Args:
+            key: Key from make_cache_key()
+            analysis: Result to cache (serialized immediately)
+        """
+        data = analysis.to_dict()
+        with self._lock:
+            self._store(key, data)
+        self._write_disk(key, data)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset counters (disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = AnalysisCacheStats()
+
+    def stats(self) -> AnalysisCacheStats:
+        """Snapshot of the current counters."""
+        with self._lock:
+            return AnalysisCacheStats(
+                hits=self._stats.hits,
+                disk_hits=self._stats.disk_hits,
+                misses=self._stats.misses,
+                entries=len(self._entries),
+            )
+
+    def _store(self, key: str, data: dict[str, Any]) -> None:
+        """Insert into the LRU (caller holds the lock)."""
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _materialize(data: dict[str, Any], file_path: str) -> FileAnalysis:
+        """Create an independent FileAnalysis for the requested path."""
+        analysis = FileAnalysis.from_dict(data)
+        analysis.file_path = file_path
+        return analysis
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> dict[str, Any] | None:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable analysis cache entry {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, data: dict[str, Any]) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            write_json_atomic(path, data, indent=None)
+        except OSError as e:
+            logger.debug(f"Failed to persist analysis cache entry {path}: {e}")
+
+
+# Process-wide cache shared by the merge subsystem
+_shared_cache: AnalysisCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Get the process-wide analysis cache, creating it on first use."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = AnalysisCache()
+        return _shared_cache
+
+
+def configure_analysis_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    disk_dir: Path | None = None,
+) -> AnalysisCache:
+    """
+    Replace the process-wide analysis cache.
+
+    Args:
+        max_entries: Maximum in-memory entries
+        disk_dir: Optional directory for persistent entries
+
+    Returns:
+        The new shared cache
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = AnalysisCache(max_entries=max_entries, disk_dir=disk_dir)
+        return _shared_cache
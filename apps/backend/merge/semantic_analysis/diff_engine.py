@@ -0,0 +1,265 @@
+"""
+Line diff engine for semantic analysis.
+
+Produces the added/removed lines (with line numbers) that the regex
+analyzer scans, without rendering and re-parsing unified diff text.
+
+Backends:
+- difflib: SequenceMatcher opcodes, read directly instead of rendering and
+  re-parsing unified diff text. Identical to the previous unified_diff-based
+  behaviour for ordinary source files; large inputs are first trimmed to
+  the region between the common prefix and suffix.
+- git: ``git diff --no-index --diff-algorithm=histogram`` on temp files.
+  Near-linear on large generated files (lockfiles, snapshots, bundles)
+  where SequenceMatcher degrades badly, and bounded by a subprocess timeout.
+- auto (default): difflib for small inputs, git for large ones.
+
+Size/time guard: when the changed region is larger than MAX_DIFF_LINES, or
+the git backend times out, compute_line_changes() returns a result with
+``degraded=True`` and no line lists. Callers fall back to lightweight
+tracking (hash-based change detection only).
+"""
+
+from __future__ import annotations
+
+import difflib
+import logging
+import re
+import subprocess
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Changed-region size (before + after lines) above which we stop diffing
+MAX_DIFF_LINES = 200_000
+
+# SequenceMatcher work estimate (len(a) * len(b)) above which "auto" uses git
+DIFFLIB_WORK_LIMIT = 4_000_000
+
+# Upper bound on a single git diff
+GIT_DIFF_TIMEOUT_SECONDS = 30.0
+
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+@dataclass
+class LineChanges:
+    """
+    Added and removed lines between two versions of a file.
+
+    Line numbers refer to the *after* version: added lines carry their own
+    line number, removed lines carry the position where they were removed.
+
+    Attributes:
+        added: (line_number, text) for each added line (text keeps its newline)
+        removed: (line_number, text) for each removed line
+        degraded: True if the size/time guard tripped and no lines were computed
+        backend: Name of the backend that produced the result
+        estimated_lines_changed: Size of the changed region when degraded
+    """
+
+    added: list[tuple[int, str]] = field(default_factory=list)
+    removed: list[tuple[int, str]] = field(default_factory=list)
+    degraded: bool = False
+    backend: str = ""
+    estimated_lines_changed: int = 0
+
+    @property
+    def lines_changed(self) -> int:
+        """Number of changed lines (estimated when degraded)."""
+        if self.degraded:
+            return self.estimated_lines_changed
+        return len(self.added) + len(self.removed)
+
+
+DiffBackend = Callable[[list[str], list[str], int, bool], LineChanges | None]
+
+
+def _trim_common(before: list[str], after: list[str]) -> tuple[int, int]:
+    """Return (common prefix length, common suffix length)."""
+    limit = min(len(before), len(after))
+    prefix = 0
+    while prefix < limit and before[prefix] == after[prefix]:
+        prefix += 1
+
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and before[-1 - suffix] == after[-1 - suffix]:
+        suffix += 1
+
+    return prefix, suffix
+
+
+def _difflib_backend(
+    before: list[str], after: list[str], offset: int, after_empty: bool
+) -> LineChanges:
+    """Diff with SequenceMatcher opcodes."""
+    changes = LineChanges(backend="difflib")
+    matcher = difflib.SequenceMatcher(None, before, after)
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        # unified_diff reported removals at the current after-line position
+        # ("+0,0" hunks when the after version is empty)
+        position = 0 if after_empty else offset + j1 + 1
+        changes.removed.extend((position, line) for line in before[i1:i2])
+        changes.added.extend((offset + j + 1, after[j]) for j in range(j1, j2))
+
+    return changes
+
+
+def _git_backend(
+    before: list[str], after: list[str], offset: int, after_empty: bool
+) -> LineChanges | None:
+    """Diff with git's histogram algorithm."""
+    from core.git_executable import get_git_executable, get_isolated_git_env
+
+    with tempfile.TemporaryDirectory(prefix="auto-claude-diff-") as tmp:
+        before_path = Path(tmp) / "before"
+        after_path = Path(tmp) / "after"
+        before_path.write_text("".join(before), encoding="utf-8", newline="")
+        after_path.write_text("".join(after), encoding="utf-8", newline="")
+
+        try:
+            result = subprocess.run(
+                [
+                    get_git_executable(),
+                    "diff",
+                    "--no-index",
+                    "--no-color",
+                    "--no-ext-diff",
+                    "--unified=0",
+                    "--diff-algorithm=histogram",
+                    str(before_path),
+                    str(after_path),
+                ],
+                capture_output=True,
+                timeout=GIT_DIFF_TIMEOUT_SECONDS,
+                env=get_isolated_git_env(),
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(
+                f"git diff timed out after {GIT_DIFF_TIMEOUT_SECONDS}s "
+                f"({len(before)} -> {len(after)} lines)"
+            )
+            return None
+        except OSError as e:
+            logger.debug(f"git diff backend unavailable: {e}")
+            return None
+
+    # Exit code 1 means "differences found"
+    if result.returncode not in (0, 1):
+        logger.debug(f"git diff failed: {result.stderr.decode(errors='replace')}")
+        return None
+
+    changes = LineChanges(backend="git")
+    current_line = 0
+    removal_position = 0
+    for raw in result.stdout.decode("utf-8", errors="replace").splitlines(
+        keepends=True
+    ):
+        if raw.startswith("@@"):
+            match = _HUNK_HEADER.match(raw)
+            if match:
+                start = int(match.group(1))
+                count = int(match.group(2)) if match.group(2) is not None else 1
+                # For pure deletions git reports the line *before* the gap
+                current_line = offset + (start if count else start + 1)
+                removal_position = 0 if after_empty else current_line
+        elif raw.startswith("+") and not raw.startswith("+++"):
+            changes.added.append((current_line, raw[1:]))
+            current_line += 1
+        elif raw.startswith("-") and not raw.startswith("---"):
+            changes.removed.append((removal_position, raw[1:]))
+
+    return changes
+
+
+_BACKENDS: dict[str, DiffBackend] = {
+    "difflib": _difflib_backend,
+    "git": _git_backend,
+}
+
+
+def register_diff_backend(name: str, backend: DiffBackend) -> None:
+    """
+    Register an additional diff backend.
+
+    Args:
+        name: Backend name used with compute_line_changes(backend=...)
+        backend: Callable(before, after, line_offset, after_empty) returning
+            LineChanges, or None if it could not produce a diff
+    """
+    _BACKENDS[name] = backend
+
+
+def available_diff_backends() -> list[str]:
+    """Names of registered diff backends (plus "auto")."""
+    return ["auto", *_BACKENDS]
+
+
+def compute_line_changes(
+    before: list[str],
+    after: list[str],
+    backend: str = "auto",
+    max_lines: int = MAX_DIFF_LINES,
+) -> LineChanges:
+    """
+    Compute added/removed lines between two versions of a file.
+
+    Args:
+        before: Lines of the before version (with line endings)
+        after: Lines of the after version (with line endings)
+        backend: "auto", "difflib", "git", or a registered backend name
+        max_lines: Changed-region size above which the diff is skipped
+
+    Returns:
+        LineChanges; check ``degraded`` before relying on the line lists
+    """
+    if backend != "auto" and backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown diff backend: {backend} (available: {available_diff_backends()})"
+        )
+
+    # Small inputs are diffed whole so results match the historical
+    # unified_diff output exactly; large ones are first reduced to the
+    # changed region (lockfiles and snapshots usually change in one place)
+    if len(before) * len(after) <= DIFFLIB_WORK_LIMIT:
+        prefix = suffix = 0
+    else:
+        prefix, suffix = _trim_common(before, after)
+    before_mid = before[prefix : len(before) - suffix]
+    after_mid = after[prefix : len(after) - suffix]
+    after_empty = not after
+
+    if not before_mid and not after_mid:
+        return LineChanges(backend="trim")
+
+    if len(before_mid) + len(after_mid) > max_lines:
+        logger.info(
+            f"Diff region too large ({len(before_mid)} -> {len(after_mid)} lines), "
+            "using lightweight tracking"
+        )
+        return _degraded(before_mid, after_mid)
+
+    if backend == "auto":
+        work = len(before_mid) * len(after_mid)
+        backend = "git" if work > DIFFLIB_WORK_LIMIT else "difflib"
+
+    changes = _BACKENDS[backend](before_mid, after_mid, prefix, after_empty)
+    if changes is None:
+        return _degraded(before_mid, after_mid)
+    return changes
+
+
+def _degraded(before_mid: list[str], after_mid: list[str]) -> LineChanges:
+    """Result for inputs the guard refused to diff."""
+    return LineChanges(
+        degraded=True,
+        backend="none",
+        estimated_lines_changed=max(len(before_mid), len(after_mid)),
+    )
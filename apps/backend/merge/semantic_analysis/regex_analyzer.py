@@ -4,10 +4,10 @@ Regex-based semantic analysis for code changes.
 
 from __future__ import annotations
 
-import difflib
 import re
 
 from ..types import ChangeType, FileAnalysis, SemanticChange
+from .diff_engine import compute_line_changes
 
 
 def analyze_with_regex(
@@ -15,6 +15,7 @@ def analyze_with_regex(
     before: str,
     after: str,
     ext: str,
+    diff_backend: str = "auto",
 ) -> FileAnalysis:
     """
     Analyze code changes using regex patterns.
@@ -24,6 +25,7 @@ def analyze_with_regex(
         before: Content before changes
         after: Content after changes
         ext: File extension
+        diff_backend: Line diff backend (see diff_engine.compute_line_changes)
 
     Returns:
         FileAnalysis with changes detected via regex patterns
@@ -35,33 +37,23 @@ def analyze_with_regex(
     before_normalized = before.replace("\r\n", "\n").replace("\r", "\n")
     after_normalized = after.replace("\r\n", "\n").replace("\r", "\n")
 
-    # Get a unified diff
-    diff = list(
-        difflib.unified_diff(
-            before_normalized.splitlines(keepends=True),
-            after_normalized.splitlines(keepends=True),
-            lineterm="",
-        )
+    # Get added/removed lines with their line numbers
+    line_changes = compute_line_changes(
+        before_normalized.splitlines(keepends=True),
+        after_normalized.splitlines(keepends=True),
+        backend=diff_backend,
     )
 
-    # Analyze the diff for patterns
-    added_lines: list[tuple[int, str]] = []
-    removed_lines: list[tuple[int, str]] = []
-    current_line = 0
-
-    for line in diff:
-        if line.startswith("@@"):
-            # Parse the line numbers
-            match = re.match(r"@@ -\d+(?:,\d+)? \+(\d+)", line)
-            if match:
-                current_line = int(match.group(1))
-        elif line.startswith("+") and not line.startswith("+++"):
-            added_lines.append((current_line, line[1:]))
-            current_line += 1
-        elif line.startswith("-") and not line.startswith("---"):
-            removed_lines.append((current_line, line[1:]))
-        elif not line.startswith("-"):
-            current_line += 1
+    if line_changes.degraded:
+        # Too large to diff - lightweight tracking only (no semantic changes),
+        # callers detect the modification via content hashes
+        return FileAnalysis(
+            file_path=file_path,
+            total_lines_changed=line_changes.lines_changed,
+        )
+
+    added_lines = line_changes.added
+    removed_lines = line_changes.removed
 
     # Detect imports
     import_pattern = get_import_pattern(ext)
@@ -7,6 +7,10 @@ Analyzes code changes at a semantic level using regex-based heuristics.
 This module provides analysis of code changes, extracting meaningful
 semantic changes like "added import", "modified function", "wrapped JSX element"
 rather than line-level diffs.
+
+Results are memoized by content hash in a process-wide AnalysisCache
+(see semantic_analysis/cache.py), so re-analyzing the same file versions
+during refresh/preview/merge is a dictionary lookup.
 """
 
 from __future__ import annotations
@@ -43,6 +47,7 @@ logger = logging.getLogger(__name__)
 MODULE = "merge.semantic_analyzer"
 
 # Import regex-based analyzer
+from .semantic_analysis.cache import AnalysisCache, get_analysis_cache, make_cache_key
 from .semantic_analysis.models import ExtractedElement
 from .semantic_analysis.regex_analyzer import analyze_with_regex
 
@@ -58,9 +63,20 @@ class SemanticAnalyzer:
             print(f"{change.change_type.value}: {change.target}")
     """
 
-    def __init__(self):
-        """Initialize the analyzer."""
+    def __init__(
+        self,
+        cache: AnalysisCache | None = None,
+        use_cache: bool = True,
+    ):
+        """
+        Initialize the analyzer.
+
+        Args:
+            cache: Analysis cache to use (default: the process-wide shared cache)
+            use_cache: Set False to always recompute
+        """
         debug(MODULE, "Initializing SemanticAnalyzer (regex-based)")
+        self.cache = (cache or get_analysis_cache()) if use_cache else None
 
     def analyze_diff(
         self,
@@ -93,8 +109,18 @@ class SemanticAnalyzer:
             task_id=task_id,
         )
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(ext, before, after)
+            cached = self.cache.get(cache_key, file_path)
+            if cached is not None:
+                debug_verbose(MODULE, f"Analysis cache hit for {file_path}")
+                return cached
+
         # Use regex-based analysis
         analysis = analyze_with_regex(file_path, before, after, ext)
+        if self.cache is not None:
+            self.cache.put(cache_key, analysis)
 
         debug_success(
             MODULE,
@@ -9,6 +9,7 @@ from core.progress import (
     count_subtasks,
     count_subtasks_detailed,
     format_duration,
+    get_available_subtasks,
     get_current_phase,
     get_next_subtask,
     get_plan_summary,
@@ -24,6 +25,7 @@ __all__ = [
     "count_subtasks",
     "count_subtasks_detailed",
     "format_duration",
+    "get_available_subtasks",
     "get_current_phase",
     "get_next_subtask",
     "get_plan_summary",
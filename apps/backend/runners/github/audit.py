@@ -11,12 +11,14 @@ Features:
 - Actor tracking (user/bot/automation)
 - Duration and token usage tracking
 - Log rotation with configurable retention
+- SQLite index over the JSONL logs for fast queries (see audit_index.py)
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import sqlite3
 import time
 import uuid
 from contextlib import contextmanager
@@ -26,6 +28,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .audit_index import AuditIndex, is_audit_index_enabled
+except (ImportError, ValueError, SystemError):
+    from audit_index import AuditIndex, is_audit_index_enabled
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -199,6 +206,7 @@ class AuditLogger:
         retention_days: int = 30,
         max_file_size_mb: int = 100,
         enabled: bool = True,
+        use_index: bool | None = None,
     ):
         """
         Initialize audit logger.
@@ -208,11 +216,16 @@ class AuditLogger:
             retention_days: Days to retain logs (default: 30)
             max_file_size_mb: Max size per log file before rotation (default: 100MB)
             enabled: Whether audit logging is enabled (default: True)
+            use_index: Answer queries from the SQLite index (default: on,
+                unless AUDIT_INDEX=false)
         """
         self.log_dir = log_dir or Path(".auto-claude/github/audit")
         self.retention_days = retention_days
         self.max_file_size_mb = max_file_size_mb
         self.enabled = enabled
+        if use_index is None:
+            use_index = is_audit_index_enabled()
+        self.index: AuditIndex | None = AuditIndex(self.log_dir) if use_index else None
 
         if enabled:
             self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -271,6 +284,14 @@ class AuditLogger:
             if log_file.stat().st_mtime < cutoff:
                 log_file.unlink()
                 logger.info(f"Deleted old audit log: {log_file}")
+                if self.index:
+                    try:
+                        self.index.forget_file(log_file.name)
+                    except sqlite3.Error as e:
+                        # The next sync notices the file is gone anyway
+                        logger.warning(
+                            f"Failed to drop {log_file.name} from index: {e}"
+                        )
 
     def generate_correlation_id(self) -> str:
         """Generate a unique correlation ID for an operation."""
@@ -581,6 +602,48 @@ class AuditLogger:
         if not self.enabled or not self.log_dir.exists():
             return []
 
+        if self.index:
+            try:
+                rows = self.index.query(
+                    limit=limit,
+                    correlation_id=correlation_id,
+                    action=action.value if action else None,
+                    repo=repo,
+                    pr_number=pr_number,
+                    issue_number=issue_number,
+                    since=since,
+                )
+                entries = []
+                for data in rows:
+                    try:
+                        entries.append(self._entry_from_dict(data))
+                    except (KeyError, ValueError) as e:
+                        logger.debug(f"Skipping invalid audit entry: {e}")
+                return entries
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.warning(f"Audit index unavailable, scanning logs: {e}")
+
+        return self._scan_logs(
+            correlation_id=correlation_id,
+            action=action,
+            repo=repo,
+            pr_number=pr_number,
+            issue_number=issue_number,
+            since=since,
+            limit=limit,
+        )
+
+    def _scan_logs(
+        self,
+        correlation_id: str | None,
+        action: AuditAction | None,
+        repo: str | None,
+        pr_number: int | None,
+        issue_number: int | None,
+        since: datetime | None,
+        limit: int,
+    ) -> list[AuditEntry]:
+        """Query by reading every JSONL file (used without the index)."""
         results = []
 
         for log_file in sorted(self.log_dir.glob("audit_*.jsonl"), reverse=True):
@@ -614,23 +677,7 @@ class AuditLogger:
                             if entry_time < since:
                                 continue
 
-                        # Reconstruct entry
-                        entry = AuditEntry(
-                            timestamp=datetime.fromisoformat(data["timestamp"]),
-                            correlation_id=data["correlation_id"],
-                            action=AuditAction(data["action"]),
-                            actor_type=ActorType(data["actor_type"]),
-                            actor_id=data.get("actor_id"),
-                            repo=data.get("repo"),
-                            pr_number=data.get("pr_number"),
-                            issue_number=data.get("issue_number"),
-                            result=data["result"],
-                            duration_ms=data.get("duration_ms"),
-                            error=data.get("error"),
-                            details=data.get("details", {}),
-                            token_usage=data.get("token_usage"),
-                        )
-                        results.append(entry)
+                        results.append(self._entry_from_dict(data))
 
                         if len(results) >= limit:
                             return results
@@ -640,6 +687,39 @@ class AuditLogger:
 
         return results
 
+    @staticmethod
+    def _entry_from_dict(data: dict[str, Any]) -> AuditEntry:
+        """Reconstruct an entry from its logged JSON."""
+        return AuditEntry(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            correlation_id=data["correlation_id"],
+            action=AuditAction(data["action"]),
+            actor_type=ActorType(data["actor_type"]),
+            actor_id=data.get("actor_id"),
+            repo=data.get("repo"),
+            pr_number=data.get("pr_number"),
+            issue_number=data.get("issue_number"),
+            result=data["result"],
+            duration_ms=data.get("duration_ms"),
+            error=data.get("error"),
+            details=data.get("details", {}),
+            token_usage=data.get("token_usage"),
+        )
+
+    def rebuild_index(self) -> int:
+        """
+        Re-import all JSONL logs into the SQLite index.
+
+        Existing logs are imported automatically by the first query; this
+        rebuilds from scratch (e.g. after editing or restoring log files).
+
+        Returns:
+            Number of entries indexed
+        """
+        if not self.enabled or not self.index or not self.log_dir.exists():
+            return 0
+        return self.index.rebuild()
+
     def get_operation_history(self, correlation_id: str) -> list[AuditEntry]:
         """Get all entries for a specific operation by correlation ID."""
         return self.query_logs(correlation_id=correlation_id, limit=1000)
@@ -655,6 +735,12 @@ class AuditLogger:
         Returns:
             Dictionary with counts by action, result, and actor type
         """
+        if self.enabled and self.index and self.log_dir.exists():
+            try:
+                return self.index.statistics(limit=10000, repo=repo, since=since)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.warning(f"Audit index unavailable, scanning logs: {e}")
+
         entries = self.query_logs(repo=repo, since=since, limit=10000)
 
         stats = {
@@ -0,0 +1,381 @@
+"""
+Audit Log Index
+===============
+
+SQLite index over the JSONL audit logs written by AuditLogger.
+
+The JSONL files stay the source of truth (append-only, greppable, shipped
+to log collectors). The index is derived from them so queries don't have to
+json-decode every line of every file:
+
+- Incremental sync: each file's indexed byte offset is recorded, and a sync
+  only reads lines appended since. Any process can write JSONL; whichever
+  queries next catches the index up.
+- Rotation aware: a rotated file (renamed, same inode) keeps its rows
+- Retention mirrors the files: rows of deleted log files are dropped, so
+  _cleanup_old_logs() retention applies to the index too
+- Importer: the first sync indexes any pre-existing JSONL files;
+  rebuild() re-imports everything from scratch
+
+Queries return entries in the same order as the original file scan: files
+newest first (by name), lines within a file in write order.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from core.env_flags import env_flag
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "audit_index.db"
+LOG_GLOB = "audit_*.jsonl"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    head BLOB NOT NULL,
+    indexed_bytes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    source_file TEXT NOT NULL,
+    line_offset INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    correlation_id TEXT,
+    action TEXT,
+    actor_type TEXT,
+    repo TEXT,
+    pr_number INTEGER,
+    issue_number INTEGER,
+    result TEXT,
+    duration_ms INTEGER,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (source_file, line_offset)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_entries_correlation ON entries (correlation_id);
+CREATE INDEX IF NOT EXISTS idx_entries_repo ON entries (repo);
+CREATE INDEX IF NOT EXISTS idx_entries_pr ON entries (pr_number);
+CREATE INDEX IF NOT EXISTS idx_entries_issue ON entries (issue_number);
+CREATE INDEX IF NOT EXISTS idx_entries_action ON entries (action);
+CREATE INDEX IF NOT EXISTS idx_entries_ts ON entries (ts);
+"""
+
+# Leading bytes remembered per file, to tell a rotated file from a new one
+_HEAD_BYTES = 256
+
+# Scan order of the original query_logs(): newest file first, lines in order
+_ORDER = "ORDER BY source_file DESC, line_offset ASC"
+
+
+class AuditIndex:
+    """
+    SQLite index of an audit log directory.
+
+    Usage:
+        index = AuditIndex(Path(".auto-claude/github/audit"))
+        rows = index.query(repo="owner/repo", limit=50)  # syncs first
+    """
+
+    def __init__(self, log_dir: Path):
+        self.log_dir = Path(log_dir)
+        self.db_path = self.log_dir / INDEX_FILENAME
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            yield conn
+        finally:
+            conn.close()
+
+    # =========================================================================
+    # Sync / import
+    # =========================================================================
+
+    def sync(self) -> int:
+        """
+        Bring the index up to date with the JSONL files.
+
+        Returns:
+            Number of entries added
+        """
+        if not self.log_dir.exists():
+            return 0
+
+        with self._connect() as conn:
+            # One writer at a time, so concurrent syncs don't index a line twice
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                added = self._sync_locked(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return added
+
+    def _sync_locked(self, conn: sqlite3.Connection) -> int:
+        known = {
+            name: (inode, head, indexed)
+            for name, inode, head, indexed in conn.execute(
+                "SELECT name, inode, head, indexed_bytes FROM files"
+            )
+        }
+        on_disk = {}
+        for path in self.log_dir.glob(LOG_GLOB):
+            try:
+                on_disk[path.name] = path.stat()
+            except FileNotFoundError:
+                continue  # Deleted mid-scan
+
+        # Rotated files were renamed: move their rows instead of re-reading.
+        # Same inode and same first bytes, so a reused inode isn't mistaken
+        # for a rename.
+        by_inode = {st.st_ino: name for name, st in on_disk.items()}
+        for old_name, (inode, head, indexed) in list(known.items()):
+            new_name = by_inode.get(inode)
+            if new_name is None or new_name == old_name or new_name in known:
+                continue
+            if self._same_file(new_name, on_disk[new_name], inode, head, indexed):
+                conn.execute(
+                    "UPDATE entries SET source_file = ? WHERE source_file = ?",
+                    (new_name, old_name),
+                )
+                conn.execute(
+                    "UPDATE files SET name = ? WHERE name = ?", (new_name, old_name)
+                )
+                known[new_name] = known.pop(old_name)
+
+        # Deleted (retention cleanup) or replaced files: drop their rows
+        for name, (inode, head, indexed) in list(known.items()):
+            st = on_disk.get(name)
+            if st is None or not self._same_file(name, st, inode, head, indexed):
+                self._drop_file(conn, name)
+                del known[name]
+
+        added = 0
+        for name, st in on_disk.items():
+            _, head, indexed = known.get(name, (st.st_ino, b"", 0))
+            if st.st_size > indexed:
+                count, indexed = self._index_file(conn, name, indexed)
+                added += count
+                if not head:
+                    head = self._read_head(name)
+            conn.execute(
+                "INSERT OR REPLACE INTO files (name, inode, head, indexed_bytes) "
+                "VALUES (?, ?, ?, ?)",
+                (name, st.st_ino, head, indexed),
+            )
+        return added
+
+    def _read_head(self, name: str) -> bytes:
+        with open(self.log_dir / name, "rb") as f:
+            return f.read(_HEAD_BYTES)
+
+    def _same_file(
+        self, name: str, st: os.stat_result, inode: int, head: bytes, indexed: int
+    ) -> bool:
+        """Whether `name` is the file indexed as (inode, head, indexed)."""
+        if st.st_ino != inode or st.st_size < indexed:
+            return False
+        try:
+            return self._read_head(name)[: len(head)] == head
+        except OSError:
+            return False
+
+    def _index_file(
+        self, conn: sqlite3.Connection, name: str, start: int
+    ) -> tuple[int, int]:
+        """Index complete lines from byte `start`; returns (count, new offset)."""
+        rows = []
+        offset = start
+        with open(self.log_dir / name, "rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Line still being written; pick it up next sync
+                line_offset = offset
+                offset += len(raw)
+                row = _entry_row(name, line_offset, raw)
+                if row is not None:
+                    rows.append(row)
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO entries (source_file, line_offset, ts, "
+            "correlation_id, action, actor_type, repo, pr_number, issue_number, "
+            "result, duration_ms, input_tokens, output_tokens, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        return len(rows), offset
+
+    @staticmethod
+    def _drop_file(conn: sqlite3.Connection, name: str) -> None:
+        conn.execute("DELETE FROM entries WHERE source_file = ?", (name,))
+        conn.execute("DELETE FROM files WHERE name = ?", (name,))
+
+    def forget_file(self, name: str) -> None:
+        """Drop a log file's entries (called when retention deletes it)."""
+        if not self.db_path.exists():
+            return
+        with self._connect() as conn:
+            self._drop_file(conn, name)
+
+    def rebuild(self) -> int:
+        """
+        Re-import every JSONL file from scratch.
+
+        Returns:
+            Number of entries indexed
+        """
+        if self.db_path.exists():
+            with self._connect() as conn:
+                conn.execute("DELETE FROM entries")
+                conn.execute("DELETE FROM files")
+        return self.sync()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def _where(
+        self,
+        correlation_id: str | None = None,
+        action: str | None = None,
+        repo: str | None = None,
+        pr_number: int | None = None,
+        issue_number: int | None = None,
+        since: datetime | None = None,
+    ) -> tuple[str, list[Any]]:
+        # Falsy filters are "no filter", like the original scan
+        clauses = []
+        params: list[Any] = []
+        for column, value in (
+            ("correlation_id", correlation_id),
+            ("action", action),
+            ("repo", repo),
+            ("pr_number", pr_number),
+            ("issue_number", issue_number),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("ts >= ?")
+            params.append(since.timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(self, limit: int = 100, **filters: Any) -> list[dict[str, Any]]:
+        """
+        Find entries matching the filters (after syncing).
+
+        Args:
+            limit: Maximum entries to return
+            **filters: correlation_id, action (value string), repo,
+                pr_number, issue_number, since
+
+        Returns:
+            Entry dicts as written to the JSONL logs
+        """
+        self.sync()
+        where, params = self._where(**filters)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT data FROM entries {where} {_ORDER} LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def statistics(self, limit: int = 10000, **filters: Any) -> dict[str, Any]:
+        """
+        Aggregate counts over the first `limit` matching entries (after syncing).
+
+        Returns:
+            Same shape as AuditLogger.get_statistics()
+        """
+        self.sync()
+        where, params = self._where(**filters)
+        matched = (
+            "SELECT action, result, actor_type, duration_ms, input_tokens, "
+            f"output_tokens FROM entries {where} {_ORDER} LIMIT ?"
+        )
+        params = [*params, limit]
+
+        stats: dict[str, Any] = {
+            "total_entries": 0,
+            "by_action": {},
+            "by_result": {},
+            "by_actor_type": {},
+            "total_duration_ms": 0,
+            "total_input_tokens": 0,
+            "total_output_tokens": 0,
+        }
+        with self._connect() as conn:
+            total, duration, input_tokens, output_tokens = conn.execute(
+                "SELECT COUNT(*), SUM(duration_ms), SUM(input_tokens), "
+                f"SUM(output_tokens) FROM ({matched})",
+                params,
+            ).fetchone()
+            stats["total_entries"] = total
+            stats["total_duration_ms"] = duration or 0
+            stats["total_input_tokens"] = input_tokens or 0
+            stats["total_output_tokens"] = output_tokens or 0
+            for column, key in (
+                ("action", "by_action"),
+                ("result", "by_result"),
+                ("actor_type", "by_actor_type"),
+            ):
+                stats[key] = dict(
+                    conn.execute(
+                        f"SELECT {column}, COUNT(*) FROM ({matched}) GROUP BY {column}",
+                        params,
+                    ).fetchall()
+                )
+        return stats
+
+
+def _entry_row(name: str, line_offset: int, raw: bytes) -> tuple | None:
+    """Column values for one JSONL line, or None if it isn't a valid entry."""
+    try:
+        data = json.loads(raw)
+        ts = datetime.fromisoformat(data["timestamp"]).timestamp()
+        token_usage = data.get("token_usage") or {}
+        return (
+            name,
+            line_offset,
+            ts,
+            data["correlation_id"],
+            data["action"],
+            data["actor_type"],
+            data.get("repo"),
+            data.get("pr_number"),
+            data.get("issue_number"),
+            data["result"],
+            data.get("duration_ms"),
+            token_usage.get("input_tokens", 0),
+            token_usage.get("output_tokens", 0),
+            raw.decode("utf-8").strip(),
+        )
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.debug(f"Skipping invalid audit line in {name}@{line_offset}: {e}")
+        return None
+
+
+def is_audit_index_enabled() -> bool:
+    """Whether audit queries go through the SQLite index (AUDIT_INDEX)."""
+    return env_flag("AUDIT_INDEX", default=True)
@@ -7,7 +7,7 @@ Manages data retention, archival, and cleanup for the GitHub automation system.
 Features:
 - Configurable retention periods by state
 - Automatic archival of old records
-- Index pruning on startup
+- Pruning of state index rows whose files were removed
 - GDPR-compliant deletion (full purge)
 - Storage usage metrics
 
@@ -32,6 +32,7 @@ CLI:
 from __future__ import annotations
 
 import json
+import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -39,6 +40,7 @@ from pathlib import Path
 from typing import Any
 
 from .purge_strategy import PurgeResult, PurgeStrategy
+from .state_index import INDEX_FILENAME, StateIndex
 from .storage_metrics import StorageMetrics, StorageMetricsCalculator
 
 
@@ -229,7 +231,7 @@ class DataCleaner:
                 except Exception as e:
                     result.errors.append(f"Error processing {file_path}: {e}")
 
-        # Prune indexes
+        # Prune the state index
         await self._prune_indexes(dry_run, result)
 
         # Clean up audit logs
@@ -338,50 +340,14 @@ class DataCleaner:
         dry_run: bool,
         result: CleanupResult,
     ) -> None:
-        """Prune stale entries from index files."""
-        index_files = [
-            self.state_dir / "pr" / "index.json",
-            self.state_dir / "issues" / "index.json",
-            self.state_dir / "autofix" / "index.json",
-        ]
-
-        for index_path in index_files:
-            if not index_path.exists():
-                continue
-
-            try:
-                with open(index_path, encoding="utf-8") as f:
-                    index_data = json.load(f)
-
-                if not isinstance(index_data, dict):
-                    continue
-
-                items = index_data.get("items", {})
-                if not isinstance(items, dict):
-                    continue
-
-                pruned = 0
-                to_remove = []
-
-                for key, entry in items.items():
-                    # Check if referenced file exists
-                    file_path = entry.get("file_path") or entry.get("path")
-                    if file_path:
-                        if not Path(file_path).exists():
-                            to_remove.append(key)
-                            pruned += 1
-
-                if to_remove and not dry_run:
-                    for key in to_remove:
-                        del items[key]
-
-                    with open(index_path, "w", encoding="utf-8") as f:
-                        json.dump(index_data, f, indent=2)
-
-                result.pruned_index_entries += pruned
+        """Prune state index rows whose state files no longer exist."""
+        if not (self.state_dir / INDEX_FILENAME).exists():
+            return
 
-            except (OSError, json.JSONDecodeError, UnicodeDecodeError, KeyError):
-                result.errors.append(f"Error pruning index: {index_path}")
+        try:
+            result.pruned_index_entries += StateIndex(self.state_dir).prune(dry_run)
+        except sqlite3.Error as e:
+            result.errors.append(f"Error pruning state index: {e}")
 
     async def _clean_audit_logs(
         self,
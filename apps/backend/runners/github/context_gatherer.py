@@ -18,26 +18,44 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import difflib
 import json
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from core.tracing import current_span, traced
+
 try:
-    from .gh_client import GHClient, PRTooLargeError
+    from .context_snapshot import (
+        ContextSnapshot,
+        ContextSnapshotStore,
+        is_context_snapshot_enabled,
+    )
+    from .gh_client import GHClient, GHCommandError, GHTimeoutError, PRTooLargeError
+    from .rate_limiter import RateLimitExceeded
     from .services.io_utils import safe_print
 except (ImportError, ValueError, SystemError):
     # Import from core.io_utils directly to avoid circular import with services package
     # (services/__init__.py imports pr_review_engine which imports context_gatherer)
+    from context_snapshot import (
+        ContextSnapshot,
+        ContextSnapshotStore,
+        is_context_snapshot_enabled,
+    )
     from core.io_utils import safe_print
-    from gh_client import GHClient, PRTooLargeError
+    from gh_client import GHClient, GHCommandError, GHTimeoutError, PRTooLargeError
+    from rate_limiter import RateLimitExceeded
 
 # Validation patterns for git refs and paths (defense-in-depth)
 # These patterns allow common valid characters while rejecting potentially dangerous ones
 SAFE_REF_PATTERN = re.compile(r"^[a-zA-Z0-9._/\-]+$")
 SAFE_PATH_PATTERN = re.compile(r"^[a-zA-Z0-9._/\-@]+$")
 
+# Changed files whose content and patch are read from git at once
+MAX_CONCURRENT_FILE_READS = 8
+
 # Common config file names to search for in project directories
 # Used by both _find_config_files() and find_related_files_for_root()
 CONFIG_FILE_NAMES = [
@@ -230,20 +248,142 @@ class PRContext:
     )
 
 
-class PRContextGatherer:
+class _GitBlobMixin:
+    """
+    Reads PR file blobs from local git into the context snapshot store.
+
+    Shared by both gatherers so snapshot blob SHAs always come from git
+    (`git ls-tree`), never from decoded file content.
+    """
+
+    project_dir: Path
+    snapshots: ContextSnapshotStore
+
+    async def _store_blobs(
+        self, head_sha: str, paths: list[str]
+    ) -> dict[str, str] | None:
+        """
+        Blob SHAs of `paths` at `head_sha`, storing any blobs not yet stored.
+
+        Returns:
+            Mapping of path to blob SHA (paths that aren't files are left
+            out), or None on git errors
+        """
+        shas: dict[str, str] = {}
+        for start in range(0, len(paths), 200):
+            returncode, out = await self._git(
+                "ls-tree", "-z", head_sha, "--", *paths[start : start + 200]
+            )
+            if returncode != 0:
+                return None
+            for entry in out.decode("utf-8", errors="replace").split("\0"):
+                meta, _, path = entry.partition("\t")
+                parts = meta.split()
+                if len(parts) == 3 and parts[1] == "blob":
+                    shas[path] = parts[2]
+
+        missing = sorted(
+            {sha for sha in shas.values() if not self.snapshots.has_blob(sha)}
+        )
+        if missing:
+            blobs = await self._read_blobs(missing)
+            if blobs is None:
+                return None
+            for sha, content in blobs.items():
+                self.snapshots.put_blob(content, sha)
+        return shas
+
+    async def _read_blobs(self, shas: list[str]) -> dict[str, bytes] | None:
+        """Read blob contents with one `git cat-file --batch`."""
+        returncode, out = await self._git(
+            "cat-file", "--batch", stdin="".join(f"{sha}\n" for sha in shas).encode()
+        )
+        if returncode != 0:
+            return None
+
+        blobs = {}
+        pos = 0
+        try:
+            for sha in shas:
+                end = out.index(b"\n", pos)
+                header = out[pos:end].split()
+                if len(header) != 3:  # "<sha> missing"
+                    return None
+                size = int(header[2])
+                blobs[sha] = out[end + 1 : end + 1 + size]
+                pos = end + 1 + size + 1  # Content is followed by a newline
+        except ValueError:
+            safe_print("[Context] Unexpected git cat-file output")
+            return None
+        return blobs
+
+    async def _git(
+        self, *args: str, stdin: bytes | None = None, timeout: float = 60.0
+    ) -> tuple[int, bytes]:
+        """Run a git command in the project; returns (returncode, stdout)."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                *args,
+                cwd=self.project_dir,
+                stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await asyncio.wait_for(proc.communicate(stdin), timeout=timeout)
+            return proc.returncode or 0, stdout
+        except (OSError, TimeoutError) as e:
+            safe_print(f"[Context] git {args[0]} failed: {e}")
+            return 1, b""
+
+
+class PRContextGatherer(_GitBlobMixin):
     """Gathers all context needed for PR review BEFORE the AI starts."""
 
-    def __init__(self, project_dir: Path, pr_number: int, repo: str | None = None):
+    def __init__(
+        self,
+        project_dir: Path,
+        pr_number: int,
+        repo: str | None = None,
+        bundle: dict | None = None,
+    ):
         self.project_dir = Path(project_dir)
         self.pr_number = pr_number
         self.repo = repo
+        # Pre-fetched GraphQL bundle (see prefetch_bundles())
+        self.bundle = bundle
         self.gh_client = GHClient(
             project_dir=self.project_dir,
             default_timeout=30.0,
             max_retries=3,
             repo=repo,
         )
+        self.snapshots = ContextSnapshotStore(
+            self.project_dir / ".auto-claude" / "github"
+        )
+
+    @staticmethod
+    async def prefetch_bundles(
+        project_dir: Path, pr_numbers: list[int], repo: str
+    ) -> dict[int, dict]:
+        """
+        Fetch GraphQL bundles for a queue of PRs in batched requests.
+
+        Pass each bundle to PRContextGatherer(..., bundle=...) so gather()
+        doesn't query GitHub for it again.
 
+        Args:
+            project_dir: Project directory for gh commands
+            pr_numbers: PRs about to be reviewed
+            repo: Repository in 'owner/repo' format
+
+        Returns:
+            Mapping of PR number to bundle
+        """
+        client = GHClient(project_dir=Path(project_dir), repo=repo)
+        return await client.pr_get_bundle_many(pr_numbers)
+
+    @traced("github.context.gather")
     async def gather(self) -> PRContext:
         """
         Gather all context for review.
@@ -251,10 +391,13 @@ class PRContextGatherer:
         Returns:
             PRContext with all necessary information for review
         """
+        current_span().set(pr=self.pr_number)
         safe_print(f"[Context] Gathering context for PR #{self.pr_number}...")
 
-        # Fetch basic PR metadata
-        pr_data = await self._fetch_pr_metadata()
+        # Fetch metadata, files, commits and comments in one GraphQL query,
+        # falling back to separate gh calls
+        bundle = self.bundle or await self._fetch_pr_bundle()
+        pr_data = bundle or await self._fetch_pr_metadata()
         safe_print(
             f"[Context] PR metadata: {pr_data['title']} by {pr_data['author']['login']}",
             flush=True,
@@ -274,7 +417,7 @@ class PRContextGatherer:
                 )
 
         # Fetch changed files with content
-        changed_files = await self._fetch_changed_files(pr_data)
+        changed_files = await self._fetch_changed_files(pr_data, refs_available)
         safe_print(f"[Context] Fetched {len(changed_files)} changed files")
 
         # Fetch full diff
@@ -289,12 +432,16 @@ class PRContextGatherer:
         related_files = self._find_related_files(changed_files)
         safe_print(f"[Context] Found {len(related_files)} related files")
 
-        # Fetch commits
-        commits = await self._fetch_commits()
+        # Fetch commits and AI bot comments for triage
+        if bundle:
+            commits = bundle.get("commits", [])
+            ai_bot_comments = self._parse_ai_comments(
+                bundle.get("reviewComments", []), bundle.get("comments", [])
+            )
+        else:
+            commits = await self._fetch_commits()
+            ai_bot_comments = await self._fetch_ai_bot_comments()
         safe_print(f"[Context] Fetched {len(commits)} commits")
-
-        # Fetch AI bot comments for triage
-        ai_bot_comments = await self._fetch_ai_bot_comments()
         safe_print(f"[Context] Fetched {len(ai_bot_comments)} AI bot comments")
 
         # Check if diff was truncated (empty diff but files were changed)
@@ -311,7 +458,7 @@ class PRContextGatherer:
                 flush=True,
             )
 
-        return PRContext(
+        context = PRContext(
             pr_number=self.pr_number,
             title=pr_data["title"],
             description=pr_data.get("body", ""),
@@ -335,6 +482,64 @@ class PRContextGatherer:
             merge_state_status=merge_state_status,
         )
 
+        # File contents are only accurate when read from the fetched refs
+        if refs_available and is_context_snapshot_enabled():
+            await self._save_snapshot(context, bundle)
+        return context
+
+    async def _save_snapshot(self, context: PRContext, bundle: dict | None) -> None:
+        """Snapshot what this review saw, for incremental follow-ups."""
+        try:
+            # Blob SHAs from git: file content may be missing or lossy
+            # (binary, non-UTF-8, read timeouts) and wouldn't match git
+            present = [f.path for f in context.changed_files if f.status != "deleted"]
+            blob_shas = await self._store_blobs(context.head_sha, present)
+            if blob_shas is None:
+                safe_print("[Context] Could not read PR files for context snapshot")
+                return
+            files = {f.path: "" for f in context.changed_files if f.status == "deleted"}
+            files.update(blob_shas)
+            if bundle:
+                comments = bundle.get("comments", []) + bundle.get("reviewComments", [])
+                reviews = bundle.get("reviews", [])
+            else:
+                comments, reviews = [], []
+            self.snapshots.save(
+                ContextSnapshot(
+                    pr_number=self.pr_number,
+                    head_sha=context.head_sha,
+                    base_sha=context.base_sha,
+                    files=files,
+                    comments={
+                        str(c["id"]): c.get("updatedAt") or c.get("createdAt") or ""
+                        for c in comments
+                        if c.get("id")
+                    },
+                    reviews={
+                        str(r["id"]): r.get("submittedAt") or ""
+                        for r in reviews
+                        if r.get("id")
+                    },
+                )
+            )
+        except (OSError, ValueError) as e:
+            safe_print(f"[Context] Could not save context snapshot: {e}")
+
+    async def _fetch_pr_bundle(self) -> dict | None:
+        """
+        Fetch the PR with files, commits, reviews and comments via GraphQL.
+
+        Returns None when no repo is configured or the query fails, so
+        gather() uses the separate gh calls instead.
+        """
+        if not self.repo:
+            return None
+        try:
+            return await self.gh_client.pr_get_bundle(self.pr_number)
+        except (GHCommandError, GHTimeoutError, RateLimitExceeded) as e:
+            safe_print(f"[Context] GraphQL fetch failed, using gh pr view: {e}")
+            return None
+
     async def _fetch_pr_metadata(self) -> dict:
         """Fetch PR metadata from GitHub API via gh CLI."""
         return await self.gh_client.pr_get(
@@ -436,52 +641,71 @@ class PRContextGatherer:
             safe_print(f"[Context] Error fetching PR refs: {e}")
             return False
 
-    async def _fetch_changed_files(self, pr_data: dict) -> list[ChangedFile]:
+    async def _fetch_changed_files(
+        self, pr_data: dict, refs_available: bool = True
+    ) -> list[ChangedFile]:
         """
         Fetch all changed files with their full content.
 
         For each file, we need:
         - Current content (HEAD of PR branch)
         - Base content (before changes)
-        - Diff patch
+        - Diff patch: from local git when the PR refs were fetched, otherwise
+          streamed per file from the PR files API (which also works for PRs
+          over GitHub's full-diff limit)
         """
-        changed_files = []
         files = pr_data.get("files", [])
 
-        for file_info in files:
-            path = file_info["path"]
-            status = self._normalize_status(file_info.get("status", "modified"))
-            additions = file_info.get("additions", 0)
-            deletions = file_info.get("deletions", 0)
-
-            safe_print(f"[Context]   Processing {path} ({status})...")
+        api_patches: dict[str, str] = {}
+        if files and not refs_available:
+            api_patches = await self._fetch_api_patches()
 
-            # Use commit SHAs if available (works for fork PRs), fallback to branch names
-            head_ref = pr_data.get("headRefOid") or pr_data["headRefName"]
-            base_ref = pr_data.get("baseRefOid") or pr_data["baseRefName"]
+        # Use commit SHAs if available (works for fork PRs), fallback to branch names
+        head_ref = pr_data.get("headRefOid") or pr_data["headRefName"]
+        base_ref = pr_data.get("baseRefOid") or pr_data["baseRefName"]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_READS)
 
-            # Get current content (from PR head commit)
-            content = await self._read_file_content(path, head_ref)
-
-            # Get base content (from base commit)
-            base_content = await self._read_file_content(path, base_ref)
-
-            # Get the patch for this specific file
-            patch = await self._get_file_patch(path, base_ref, head_ref)
+        async def fetch(file_info: dict) -> ChangedFile:
+            path = file_info["path"]
+            status = self._normalize_status(file_info.get("status", "modified"))
 
-            changed_files.append(
-                ChangedFile(
-                    path=path,
-                    status=status,
-                    additions=additions,
-                    deletions=deletions,
-                    content=content,
-                    base_content=base_content,
-                    patch=patch,
-                )
+            async with semaphore:
+                safe_print(f"[Context]   Processing {path} ({status})...")
+
+                # Get current content (from PR head commit)
+                content = await self._read_file_content(path, head_ref)
+
+                # Get base content (from base commit)
+                base_content = await self._read_file_content(path, base_ref)
+
+                # Get the patch for this specific file
+                if refs_available:
+                    patch = await self._get_file_patch(path, base_ref, head_ref)
+                else:
+                    patch = api_patches.get(path, "")
+
+            return ChangedFile(
+                path=path,
+                status=status,
+                additions=file_info.get("additions", 0),
+                deletions=file_info.get("deletions", 0),
+                content=content,
+                base_content=base_content,
+                patch=patch,
             )
 
-        return changed_files
+        return list(await asyncio.gather(*(fetch(f) for f in files)))
+
+    async def _fetch_api_patches(self) -> dict[str, str]:
+        """Per-file patches from the PR files API, by path ({} on failure)."""
+        patches: dict[str, str] = {}
+        try:
+            async for file in self.gh_client.iter_pr_files(self.pr_number):
+                if file.get("patch"):
+                    patches[file["filename"]] = file["patch"]
+        except (GHCommandError, GHTimeoutError, json.JSONDecodeError) as e:
+            safe_print(f"[Context] Could not fetch file patches from the API: {e}")
+        return patches
 
     def _normalize_status(self, status: str) -> str:
         """Normalize file status to standard values."""
@@ -631,26 +855,31 @@ class PRContextGatherer:
 
         Returns comments from known AI tools like CodeRabbit, Cursor, Greptile, etc.
         """
-        ai_comments: list[AIBotComment] = []
-
         try:
             # Fetch review comments (inline comments on files)
             review_comments = await self._fetch_pr_review_comments()
-            for comment in review_comments:
-                ai_comment = self._parse_ai_comment(comment, is_review_comment=True)
-                if ai_comment:
-                    ai_comments.append(ai_comment)
 
             # Fetch issue comments (general PR comments)
             issue_comments = await self._fetch_pr_issue_comments()
-            for comment in issue_comments:
-                ai_comment = self._parse_ai_comment(comment, is_review_comment=False)
-                if ai_comment:
-                    ai_comments.append(ai_comment)
 
+            return self._parse_ai_comments(review_comments, issue_comments)
         except Exception as e:
             safe_print(f"[Context] Error fetching AI bot comments: {e}")
+            return []
 
+    def _parse_ai_comments(
+        self, review_comments: list[dict], issue_comments: list[dict]
+    ) -> list[AIBotComment]:
+        """Keep the review and issue comments written by known AI tools."""
+        ai_comments: list[AIBotComment] = []
+        for comment in review_comments:
+            ai_comment = self._parse_ai_comment(comment, is_review_comment=True)
+            if ai_comment:
+                ai_comments.append(ai_comment)
+        for comment in issue_comments:
+            ai_comment = self._parse_ai_comment(comment, is_review_comment=False)
+            if ai_comment:
+                ai_comments.append(ai_comment)
         return ai_comments
 
     def _parse_ai_comment(
@@ -1310,7 +1539,7 @@ class PRContextGatherer:
         return []
 
 
-class FollowupContextGatherer:
+class FollowupContextGatherer(_GitBlobMixin):
     """
     Gathers context specifically for follow-up reviews.
 
@@ -1318,6 +1547,10 @@ class FollowupContextGatherer:
     - New commits since last review
     - Changed files since last review
     - New comments since last review
+
+    When a context snapshot of the reviewed commit exists, changed files
+    and commits come from local git (blob SHAs compared with the snapshot),
+    so the cost is proportional to what changed rather than the PR's size.
     """
 
     def __init__(
@@ -1337,7 +1570,11 @@ class FollowupContextGatherer:
             max_retries=3,
             repo=repo,
         )
+        self.snapshots = ContextSnapshotStore(
+            self.project_dir / ".auto-claude" / "github"
+        )
 
+    @traced("github.context.gather_followup")
     async def gather(self) -> FollowupReviewContext:
         """
         Gather context for a follow-up review.
@@ -1345,6 +1582,8 @@ class FollowupContextGatherer:
         Returns:
             FollowupReviewContext with changes since last review
         """
+        current_span().set(pr=self.pr_number)
+
         # Import here to avoid circular imports
         try:
             from .models import FollowupReviewContext
@@ -1365,6 +1604,18 @@ class FollowupContextGatherer:
                 current_commit_sha="",
             )
 
+        # Diff locally against the snapshot of the reviewed commit if we have one
+        if is_context_snapshot_enabled():
+            snapshot = self.snapshots.load(self.pr_number, previous_sha)
+            if snapshot:
+                context = await self._gather_incremental(snapshot)
+                if context:
+                    return context
+                safe_print(
+                    "[Followup] Snapshot comparison failed, gathering full context",
+                    flush=True,
+                )
+
         safe_print(
             f"[Followup] Gathering context since commit {previous_sha[:8]}...",
             flush=True,
@@ -1474,43 +1725,12 @@ class FollowupContextGatherer:
             safe_print(f"[Followup] Error fetching PR reviews: {e}")
             pr_reviews = []
 
-        # Separate AI bot comments from contributor comments
-        ai_comments = []
-        contributor_comments = []
-
+        # Separate AI bot feedback from contributor feedback
         all_comments = comments.get("review_comments", []) + comments.get(
             "issue_comments", []
         )
-
-        for comment in all_comments:
-            author = ""
-            if isinstance(comment.get("user"), dict):
-                author = comment["user"].get("login", "").lower()
-            elif isinstance(comment.get("author"), dict):
-                author = comment["author"].get("login", "").lower()
-
-            is_ai_bot = any(pattern in author for pattern in AI_BOT_PATTERNS.keys())
-
-            if is_ai_bot:
-                ai_comments.append(comment)
-            else:
-                contributor_comments.append(comment)
-
-        # Separate AI bot reviews from contributor reviews
-        ai_reviews = []
-        contributor_reviews = []
-
-        for review in pr_reviews:
-            author = ""
-            if isinstance(review.get("user"), dict):
-                author = review["user"].get("login", "").lower()
-
-            is_ai_bot = any(pattern in author for pattern in AI_BOT_PATTERNS.keys())
-
-            if is_ai_bot:
-                ai_reviews.append(review)
-            else:
-                contributor_reviews.append(review)
+        ai_comments, contributor_comments = self._split_by_author(all_comments)
+        ai_reviews, contributor_reviews = self._split_by_author(pr_reviews)
 
         # Combine AI comments and reviews for reporting
         total_ai_feedback = len(ai_comments) + len(ai_reviews)
@@ -1529,11 +1749,13 @@ class FollowupContextGatherer:
         # Fetch current merge conflict status
         has_merge_conflicts = False
         merge_state_status = "UNKNOWN"
+        base_sha = ""
         try:
             pr_status = await self.gh_client.pr_get(
                 self.pr_number,
-                json_fields=["mergeable", "mergeStateStatus"],
+                json_fields=["mergeable", "mergeStateStatus", "baseRefOid"],
             )
+            base_sha = pr_status.get("baseRefOid", "")
             mergeable = pr_status.get("mergeable", "UNKNOWN")
             merge_state_status = pr_status.get("mergeStateStatus", "UNKNOWN")
             has_merge_conflicts = mergeable == "CONFLICTING"
@@ -1546,6 +1768,12 @@ class FollowupContextGatherer:
         except Exception as e:
             safe_print(f"[Followup] Could not fetch merge status: {e}")
 
+        # Snapshot this head so the next follow-up can be incremental
+        if base_sha and is_context_snapshot_enabled():
+            snapshot = await self._snapshot_from_git(current_sha, base_sha)
+            if snapshot:
+                self._save_followup_snapshot(snapshot)
+
         return FollowupReviewContext(
             pr_number=self.pr_number,
             previous_review=self.previous_review,
@@ -1561,3 +1789,301 @@ class FollowupContextGatherer:
             has_merge_conflicts=has_merge_conflicts,
             merge_state_status=merge_state_status,
         )
+
+    async def _gather_incremental(
+        self, snapshot: ContextSnapshot
+    ) -> FollowupReviewContext | None:
+        """
+        Gather follow-up context by diffing against a context snapshot.
+
+        Makes one gh call for the head/base SHAs and merge status plus the
+        comment and review calls; files, patches and commits come from local
+        git and the snapshot's blob store.
+
+        Returns:
+            FollowupReviewContext, or None if the snapshot can't be used
+        """
+        try:
+            from .models import FollowupReviewContext
+        except (ImportError, ValueError, SystemError):
+            from models import FollowupReviewContext
+
+        previous_sha = snapshot.head_sha
+        try:
+            pr_status = await self.gh_client.pr_get(
+                self.pr_number,
+                json_fields=[
+                    "headRefOid",
+                    "baseRefOid",
+                    "mergeable",
+                    "mergeStateStatus",
+                ],
+            )
+        except Exception as e:
+            safe_print(f"[Followup] Could not fetch PR status: {e}")
+            return None
+
+        current_sha = pr_status.get("headRefOid", "")
+        base_sha = pr_status.get("baseRefOid", "")
+        if not current_sha or not base_sha:
+            return None
+        merge_state_status = pr_status.get("mergeStateStatus", "UNKNOWN")
+        has_merge_conflicts = pr_status.get("mergeable") == "CONFLICTING"
+        if has_merge_conflicts:
+            safe_print(
+                f"[Followup] ⚠️  PR has merge conflicts (mergeStateStatus: {merge_state_status})",
+                flush=True,
+            )
+
+        if current_sha == previous_sha:
+            safe_print("[Followup] No new commits since last review")
+            return FollowupReviewContext(
+                pr_number=self.pr_number,
+                previous_review=self.previous_review,
+                previous_commit_sha=previous_sha,
+                current_commit_sha=current_sha,
+                has_merge_conflicts=has_merge_conflicts,
+                merge_state_status=merge_state_status,
+            )
+
+        safe_print(
+            f"[Followup] Comparing snapshot {previous_sha[:8]} with {current_sha[:8]}",
+            flush=True,
+        )
+        current = await self._snapshot_from_git(current_sha, base_sha)
+        if current is None:
+            return None
+        commits = await self._commits_since(base_sha, previous_sha, current_sha)
+        if commits is None:
+            return None
+
+        files_changed = snapshot.changed_files(current.files)
+
+        # Files that dropped out of the PR (e.g. reverted) still exist at the
+        # head with the base's content, so diff against that
+        dropped = [path for path in files_changed if path not in current.files]
+        head_blobs = await self._store_blobs(current_sha, dropped) if dropped else {}
+        if head_blobs is None:
+            return None
+        head_blobs.update(current.files)
+
+        diff_parts = []
+        for path in files_changed:
+            patch = self._blob_patch(
+                snapshot.files.get(path, ""), head_blobs.get(path, "")
+            )
+            if patch:
+                diff_parts.append(f"--- a/{path}\n+++ b/{path}\n{patch}")
+        safe_print(
+            f"[Followup] Found {len(commits)} new commits, {len(files_changed)} "
+            f"changed files (of {len(current.files)} in PR)",
+            flush=True,
+        )
+
+        # Comments and reviews since last review, minus those already seen
+        try:
+            comments = await self.gh_client.get_comments_since(
+                self.pr_number, self.previous_review.reviewed_at
+            )
+        except Exception as e:
+            safe_print(f"[Followup] Error fetching comments: {e}")
+            comments = {"review_comments": [], "issue_comments": []}
+        try:
+            pr_reviews = await self.gh_client.get_reviews_since(
+                self.pr_number, self.previous_review.reviewed_at
+            )
+        except Exception as e:
+            safe_print(f"[Followup] Error fetching PR reviews: {e}")
+            pr_reviews = []
+
+        all_comments = [
+            c
+            for c in comments.get("review_comments", [])
+            + comments.get("issue_comments", [])
+            if snapshot.comments.get(str(c.get("id")))
+            != (c.get("updated_at") or c.get("created_at"))
+        ]
+        pr_reviews = [r for r in pr_reviews if str(r.get("id")) not in snapshot.reviews]
+        ai_comments, contributor_comments = self._split_by_author(all_comments)
+        ai_reviews, contributor_reviews = self._split_by_author(pr_reviews)
+        safe_print(
+            f"[Followup] Found {len(contributor_comments) + len(contributor_reviews)} "
+            f"contributor feedback, {len(ai_comments) + len(ai_reviews)} AI feedback",
+            flush=True,
+        )
+
+        current.comments = {
+            **snapshot.comments,
+            **{
+                str(c["id"]): c.get("updated_at") or c.get("created_at") or ""
+                for c in all_comments
+                if c.get("id")
+            },
+        }
+        current.reviews = {
+            **snapshot.reviews,
+            **{
+                str(r["id"]): r.get("submitted_at") or ""
+                for r in pr_reviews
+                if r.get("id")
+            },
+        }
+        self._save_followup_snapshot(current)
+
+        return FollowupReviewContext(
+            pr_number=self.pr_number,
+            previous_review=self.previous_review,
+            previous_commit_sha=previous_sha,
+            current_commit_sha=current_sha,
+            commits_since_review=commits,
+            files_changed_since_review=files_changed,
+            diff_since_review="\n\n".join(diff_parts),
+            contributor_comments_since_review=contributor_comments
+            + contributor_reviews,
+            ai_bot_comments_since_review=ai_comments + ai_reviews,
+            pr_reviews_since_review=pr_reviews,
+            has_merge_conflicts=has_merge_conflicts,
+            merge_state_status=merge_state_status,
+        )
+
+    def _save_followup_snapshot(self, snapshot: ContextSnapshot) -> None:
+        """Save a snapshot; a cache write failure mustn't fail the review."""
+        try:
+            self.snapshots.save(snapshot)
+        except (OSError, ValueError) as e:
+            safe_print(f"[Followup] Could not save context snapshot: {e}")
+
+    @staticmethod
+    def _split_by_author(items: list[dict]) -> tuple[list[dict], list[dict]]:
+        """Split comments or reviews into (AI bot, contributor) lists."""
+        ai_items = []
+        contributor_items = []
+        for item in items:
+            author = ""
+            if isinstance(item.get("user"), dict):
+                author = item["user"].get("login", "").lower()
+            elif isinstance(item.get("author"), dict):
+                author = item["author"].get("login", "").lower()
+
+            if any(pattern in author for pattern in AI_BOT_PATTERNS.keys()):
+                ai_items.append(item)
+            else:
+                contributor_items.append(item)
+        return ai_items, contributor_items
+
+    async def _snapshot_from_git(
+        self, head_sha: str, base_sha: str
+    ) -> ContextSnapshot | None:
+        """
+        Snapshot the PR's files at `head_sha` from local git.
+
+        The PR's files are those changed since the merge base with `base_sha`
+        (like GitHub's PR files, so merges from the base branch don't count).
+        Only blobs missing from the store are read.
+        """
+        if not await self._ensure_commits_available(head_sha, base_sha):
+            return None
+
+        returncode, out = await self._git(
+            "diff", "--name-status", "-z", "--no-renames", f"{base_sha}...{head_sha}"
+        )
+        if returncode != 0:
+            return None
+        fields = out.decode("utf-8", errors="replace").split("\0")
+        status_by_path = dict(zip(fields[1::2], fields[0::2]))
+        files = {path: "" for path, status in status_by_path.items() if status == "D"}
+
+        present = [path for path, status in status_by_path.items() if status != "D"]
+        blob_shas = await self._store_blobs(head_sha, present)
+        if blob_shas is None:
+            return None
+        files.update(blob_shas)
+
+        return ContextSnapshot(
+            pr_number=self.pr_number,
+            head_sha=head_sha,
+            base_sha=base_sha,
+            files=files,
+        )
+
+    async def _commits_since(
+        self, base_sha: str, previous_sha: str, head_sha: str
+    ) -> list[dict] | None:
+        """
+        PR commits after `previous_sha`, in the REST commit shape.
+
+        Like get_pr_files_changed_since(), returns no commits when
+        `previous_sha` isn't one of the PR's commits (rebase/force-push).
+        """
+        returncode, out = await self._git(
+            "log",
+            "--reverse",
+            "--format=%H%x1f%an%x1f%aI%x1f%B%x1e",
+            f"{base_sha}..{head_sha}",
+        )
+        if returncode != 0:
+            return None
+
+        commits = []
+        for record in out.decode("utf-8", errors="replace").split("\x1e"):
+            parts = record.strip("\n").split("\x1f")
+            if len(parts) != 4:
+                continue
+            sha, name, date, message = parts
+            commits.append(
+                {
+                    "sha": sha,
+                    "commit": {
+                        "message": message.strip(),
+                        "author": {"name": name, "date": date},
+                    },
+                }
+            )
+
+        for i, commit in enumerate(commits):
+            if commit["sha"].startswith(previous_sha[:7]):
+                return commits[i + 1 :]
+        return []
+
+    def _blob_patch(self, old_sha: str, new_sha: str) -> str:
+        """Unified diff hunks between two stored blobs ("" = no file)."""
+        old = (self.snapshots.get_blob(old_sha) or b"") if old_sha else b""
+        new = (self.snapshots.get_blob(new_sha) or b"") if new_sha else b""
+        if b"\0" in old or b"\0" in new:
+            return ""  # Binary - GitHub doesn't return patches for these either
+
+        def lines(content: bytes) -> list[str]:
+            return [
+                line if line.endswith("\n") else line + "\n"
+                for line in content.decode("utf-8", errors="replace").splitlines(
+                    keepends=True
+                )
+            ]
+
+        diff = difflib.unified_diff(lines(old), lines(new))
+        return "".join(list(diff)[2:])  # Drop the ---/+++ header
+
+    async def _ensure_commits_available(self, *shas: str) -> bool:
+        """Make sure the commits exist locally, fetching them if needed."""
+        if not all(_validate_git_ref(sha) for sha in shas):
+            return False
+        missing = [
+            sha
+            for sha in shas
+            if (await self._git("cat-file", "-e", f"{sha}^{{commit}}"))[0] != 0
+        ]
+        if not missing:
+            return True
+
+        returncode, _ = await self._git("fetch", "origin", *missing)
+        if returncode != 0:
+            await self._git(
+                "fetch",
+                "origin",
+                f"pull/{self.pr_number}/head:refs/pr/{self.pr_number}",
+            )
+        for sha in missing:
+            if (await self._git("cat-file", "-e", f"{sha}^{{commit}}"))[0] != 0:
+                safe_print(f"[Followup] Commit {sha[:8]} not available locally")
+                return False
+        return True
@@ -0,0 +1,232 @@
+"""
+PR Context Snapshots
+====================
+
+Content-addressed snapshots of the PR context a review saw, so follow-up
+reviews only fetch and diff what changed since.
+
+A snapshot is a small manifest per (PR, head SHA):
+- files: path -> git blob SHA of the file at the head ("" if the PR
+  deletes it)
+- comments / reviews: ID -> last-updated timestamp
+
+File contents live once per blob SHA in a shared object store (the same
+SHA git uses, so `git ls-tree` tells which files changed without reading
+them). A follow-up compares the current head's blob SHAs with the
+snapshot of the reviewed commit, diffs only the files whose blob changed
+against the stored content, and skips comments it has already seen.
+
+Layout (under .auto-claude/github/context/):
+    blobs/ab/abcdef...        file contents by blob SHA
+    pr/<number>/<head_sha>.json  manifests (newest few kept per PR)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from core.env_flags import env_flag
+
+try:
+    from .file_lock import atomic_write
+except (ImportError, ValueError, SystemError):
+    from file_lock import atomic_write
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR_NAME = "context"
+
+# Manifests kept per PR. Older ones (and blobs only they referenced) are
+# pruned; a follow-up needs the one for its previous review's commit.
+MAX_SNAPSHOTS_PER_PR = 5
+
+# Unreferenced blobs younger than this are kept: a concurrent gather may
+# have stored them for a manifest it hasn't written yet
+BLOB_PRUNE_GRACE_SECONDS = 60 * 60
+
+
+def git_blob_sha(content: bytes) -> str:
+    """The SHA git assigns to a blob with this content."""
+    header = f"blob {len(content)}\0".encode()
+    return hashlib.sha1(header + content, usedforsecurity=False).hexdigest()
+
+
+@dataclass
+class ContextSnapshot:
+    """What a review saw of a PR at one head commit."""
+
+    pr_number: int
+    head_sha: str
+    base_sha: str
+    files: dict[str, str] = field(default_factory=dict)
+    comments: dict[str, str] = field(default_factory=dict)
+    reviews: dict[str, str] = field(default_factory=dict)
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "pr_number": self.pr_number,
+            "head_sha": self.head_sha,
+            "base_sha": self.base_sha,
+            "files": self.files,
+            "comments": self.comments,
+            "reviews": self.reviews,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ContextSnapshot:
+        return cls(
+            pr_number=data["pr_number"],
+            head_sha=data["head_sha"],
+            base_sha=data.get("base_sha", ""),
+            files=data.get("files", {}),
+            comments=data.get("comments", {}),
+            reviews=data.get("reviews", {}),
+            created_at=data.get("created_at", ""),
+        )
+
+    def changed_files(self, files: dict[str, str]) -> list[str]:
+        """
+        Paths whose content differs between this snapshot and `files`.
+
+        Includes files new to the PR and files that dropped out of it
+        (e.g. a change that was reverted).
+        """
+        paths = set(files) | set(self.files)
+        return sorted(p for p in paths if files.get(p, "") != self.files.get(p, ""))
+
+
+class ContextSnapshotStore:
+    """
+    Snapshot manifests and the blob store for one repository.
+
+    Usage:
+        store = ContextSnapshotStore(project_dir / ".auto-claude" / "github")
+        store.put_blob(content)
+        store.save(ContextSnapshot(pr_number=1, head_sha=sha, base_sha=base, files=...))
+        previous = store.load(1, previous_review.reviewed_commit_sha)
+    """
+
+    def __init__(self, github_dir: Path):
+        self.root = Path(github_dir) / SNAPSHOT_DIR_NAME
+        self.blob_dir = self.root / "blobs"
+        self.manifest_dir = self.root / "pr"
+
+    # =========================================================================
+    # Blobs
+    # =========================================================================
+
+    def _blob_path(self, sha: str) -> Path:
+        return self.blob_dir / sha[:2] / sha
+
+    def has_blob(self, sha: str) -> bool:
+        return self._blob_path(sha).exists()
+
+    def put_blob(self, content: bytes, sha: str | None = None) -> str:
+        """
+        Store file content under its blob SHA (no-op if already stored).
+
+        Returns:
+            The blob SHA
+        """
+        sha = sha or git_blob_sha(content)
+        path = self._blob_path(sha)
+        if not path.exists():
+            with atomic_write(path, "wb") as f:
+                f.write(content)
+        return sha
+
+    def get_blob(self, sha: str) -> bytes | None:
+        """Stored content for a blob SHA, or None if not stored."""
+        try:
+            return self._blob_path(sha).read_bytes()
+        except OSError:
+            return None
+
+    # =========================================================================
+    # Manifests
+    # =========================================================================
+
+    def _manifest_path(self, pr_number: int, head_sha: str) -> Path:
+        return self.manifest_dir / str(pr_number) / f"{head_sha}.json"
+
+    def load(self, pr_number: int, head_sha: str) -> ContextSnapshot | None:
+        """The snapshot taken at `head_sha`, if there is a usable one."""
+        if not head_sha:
+            return None
+        path = self._manifest_path(pr_number, head_sha)
+        try:
+            snapshot = ContextSnapshot.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable context snapshot {path}: {e}")
+            return None
+
+        # Diffs need the content of every file the snapshot references
+        missing = [
+            sha for sha in snapshot.files.values() if sha and not self.has_blob(sha)
+        ]
+        if missing:
+            logger.warning(
+                f"Context snapshot for PR #{pr_number} at {head_sha[:8]} is missing "
+                f"{len(missing)} blobs, ignoring it"
+            )
+            return None
+        return snapshot
+
+    def save(self, snapshot: ContextSnapshot) -> None:
+        """Write a snapshot and prune the PR's oldest ones."""
+        path = self._manifest_path(snapshot.pr_number, snapshot.head_sha)
+        with atomic_write(path) as f:
+            json.dump(snapshot.to_dict(), f)
+
+        manifests = sorted(
+            path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+        stale = manifests[MAX_SNAPSHOTS_PER_PR:]
+        for old in stale:
+            old.unlink(missing_ok=True)
+        if stale:
+            self.prune_blobs()
+
+    def prune_blobs(self) -> int:
+        """
+        Delete blobs no snapshot references.
+
+        Returns:
+            Number of blobs deleted
+        """
+        referenced: set[str] = set()
+        for manifest in self.manifest_dir.glob("*/*.json"):
+            try:
+                referenced.update(json.loads(manifest.read_text())["files"].values())
+            except (OSError, ValueError, KeyError):
+                continue
+
+        cutoff = time.time() - BLOB_PRUNE_GRACE_SECONDS
+        removed = 0
+        for blob in self.blob_dir.glob("*/*"):
+            if blob.name in referenced or blob.name.startswith("."):
+                continue
+            try:
+                if blob.stat().st_mtime < cutoff:
+                    os.unlink(blob)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def is_context_snapshot_enabled() -> bool:
+    """Whether follow-ups use context snapshots (FOLLOWUP_CONTEXT_SNAPSHOTS)."""
+    return env_flag("FOLLOWUP_CONTEXT_SNAPSHOTS", default=True)
@@ -6,6 +6,12 @@ Thread-safe and process-safe file locking utilities for GitHub automation.
 Uses fcntl.flock() on Unix systems and msvcrt.locking() on Windows for proper
 cross-process locking.
 
+Exclusive locks are taken in two stages. Threads and coroutines of this
+process first queue on an in-process lock for the file, which hands the lock
+to the next waiter on release; only the holder then takes the OS lock. A wait
+for another process blocks in flock() on a daemon thread rather than polling.
+get_lock_stats() reports wait times and current holders per lock file.
+
 Example Usage:
     # Simple file locking
     async with FileLock("path/to/file.json", timeout=5.0):
@@ -16,24 +22,35 @@ Example Usage:
     async with locked_write("path/to/file.json", timeout=5.0) as f:
         json.dump(data, f)
 
+    # Contention per lock file
+    for path, stats in get_lock_stats().items():
+        print(path, stats.contended, stats.max_wait_seconds)
+
 """
 
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import json
 import os
 import tempfile
+import threading
 import time
 import warnings
+from collections import deque
 from collections.abc import Callable
 from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 _IS_WINDOWS = os.name == "nt"
 _WINDOWS_LOCK_SIZE = 1024 * 1024
 
+# Retry interval while waiting for a lock the OS can't block on (Windows)
+_POLL_INTERVAL = 0.01
+
 try:
     import fcntl  # type: ignore
 except ImportError:  # pragma: no cover
@@ -67,6 +84,21 @@ def _try_lock(fd: int, exclusive: bool) -> None:
     fcntl.flock(fd, lock_mode | fcntl.LOCK_NB)
 
 
+def _lock_blocking(fd: int, exclusive: bool, abandoned: threading.Event) -> None:
+    """Block until fd is locked, or until the wait is abandoned (Windows)."""
+    if not _IS_WINDOWS and fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return
+
+    while not abandoned.is_set():
+        try:
+            _try_lock(fd, exclusive)
+            return
+        except (BlockingIOError, OSError):
+            time.sleep(_POLL_INTERVAL)
+    raise BlockingIOError("lock wait abandoned")
+
+
 def _unlock(fd: int) -> None:
     if _IS_WINDOWS:
         if msvcrt is None:
@@ -101,12 +133,310 @@ class FileLockTimeout(FileLockError):
     pass
 
 
+@dataclass
+class LockStats:
+    """Contention metrics for one lock file, from this process's view."""
+
+    path: str
+    acquisitions: int = 0
+    # Waits behind a holder in this process, and on another process
+    contended: int = 0
+    os_waits: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    # Current exclusive holder ("task <name>" or "thread <name>") and queue
+    holder: str | None = None
+    waiting: int = 0
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+
+class _Waiter:
+    """A thread (Event) or coroutine (Future) queued for a _ProcessLock."""
+
+    __slots__ = ("event", "future", "loop", "granted")
+
+    def __init__(
+        self,
+        event: threading.Event | None = None,
+        future: asyncio.Future | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        self.event = event
+        self.future = future
+        self.loop = loop
+        self.granted = False
+
+    def wake(self) -> bool:
+        """Tell the waiter it holds the lock; False if it can't be reached."""
+        if self.event is not None:
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(_set_future_done, self.future)
+        except RuntimeError:
+            # Event loop closed while waiting
+            return False
+        return True
+
+
+def _set_future_done(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _ProcessLock:
+    """
+    FIFO lock shared by all threads and event loops of this process.
+
+    Release hands the lock straight to the next waiter, so waiters sleep on
+    an Event or Future instead of polling.
+    """
+
+    def __init__(self, path: str):
+        self.stats = LockStats(path=path)
+        self._mutex = threading.Lock()
+        self._held = False
+        self._waiters: deque[_Waiter] = deque()
+
+    def acquire(self, timeout: float) -> bool:
+        with self._mutex:
+            if not self._held:
+                self._held = True
+                return True
+            waiter = _Waiter(event=threading.Event())
+            self._enqueue(waiter)
+
+        if waiter.event.wait(max(timeout, 0)):
+            return True
+        return self._abandon(waiter)
+
+    async def acquire_async(self, timeout: float) -> bool:
+        loop = asyncio.get_running_loop()
+        with self._mutex:
+            if not self._held:
+                self._held = True
+                return True
+            waiter = _Waiter(future=loop.create_future(), loop=loop)
+            self._enqueue(waiter)
+
+        try:
+            async with asyncio.timeout(max(timeout, 0)):
+                await waiter.future
+            return True
+        except TimeoutError:
+            return self._abandon(waiter)
+        except asyncio.CancelledError:
+            if self._abandon(waiter):
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._mutex:
+            self.stats.holder = None
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                self.stats.waiting -= 1
+                waiter.granted = True
+                if waiter.wake():
+                    return
+                waiter.granted = False
+            self._held = False
+
+    def record_acquired(self, wait: float, os_wait: bool, holder: str | None) -> None:
+        with self._mutex:
+            stats = self.stats
+            stats.acquisitions += 1
+            if os_wait:
+                stats.os_waits += 1
+            stats.total_wait_seconds += wait
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait)
+            if holder is not None:
+                stats.holder = holder
+
+    def record_timeout(self) -> None:
+        with self._mutex:
+            self.stats.timeouts += 1
+
+    def snapshot(self) -> LockStats:
+        with self._mutex:
+            return dataclasses.replace(self.stats)
+
+    def reset_stats(self) -> None:
+        with self._mutex:
+            self.stats = LockStats(
+                path=self.stats.path,
+                holder=self.stats.holder,
+                waiting=self.stats.waiting,
+            )
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        self._waiters.append(waiter)
+        self.stats.waiting += 1
+        self.stats.contended += 1
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Leave the queue after a timeout; True if the lock was granted anyway."""
+        with self._mutex:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            self.stats.waiting -= 1
+            return False
+
+
+_process_locks: dict[str, _ProcessLock] = {}
+_process_locks_mutex = threading.Lock()
+
+
+def _get_process_lock(lock_file: Path) -> _ProcessLock:
+    key = os.path.abspath(lock_file)
+    with _process_locks_mutex:
+        process_lock = _process_locks.get(key)
+        if process_lock is None:
+            process_lock = _process_locks[key] = _ProcessLock(key)
+        return process_lock
+
+
+def get_lock_stats() -> dict[str, LockStats]:
+    """
+    Contention metrics for every file locked by this process.
+
+    Returns:
+        LockStats copies keyed by lock file path
+    """
+    with _process_locks_mutex:
+        process_locks = list(_process_locks.values())
+    return {lock.stats.path: lock.snapshot() for lock in process_locks}
+
+
+def reset_lock_stats() -> None:
+    """Zero the contention counters (current holders are kept)."""
+    with _process_locks_mutex:
+        process_locks = list(_process_locks.values())
+    for process_lock in process_locks:
+        process_lock.reset_stats()
+
+
+def _describe_holder() -> str:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return f"task {task.get_name()}"
+    return f"thread {threading.current_thread().name}"
+
+
+def _lock_is_current(fd: int, lock_file: Path) -> bool:
+    """
+    Check that the locked fd is still the file at lock_file.
+
+    Holders remove the lock file on release, so a waiter may end up locking
+    a file that no longer has a name while a newcomer locks its replacement.
+    """
+    if _IS_WINDOWS:
+        # Open files can't be removed on Windows
+        return True
+    try:
+        return os.fstat(fd).st_ino == os.stat(lock_file).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _open_lock_file(lock_file: Path) -> int:
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    return os.open(str(lock_file), os.O_CREAT | os.O_RDWR)
+
+
+def _try_acquire_os_lock(lock_file: Path, exclusive: bool) -> int | None:
+    """Lock the lock file without waiting; returns the fd, or None if busy."""
+    while True:
+        fd = _open_lock_file(lock_file)
+        try:
+            _try_lock(fd, exclusive)
+        except (BlockingIOError, OSError):
+            os.close(fd)
+            return None
+        except BaseException:
+            os.close(fd)
+            raise
+        if _lock_is_current(fd, lock_file):
+            return fd
+        _unlock(fd)
+        os.close(fd)
+
+
+def _wait_for_os_lock(fd: int, exclusive: bool, timeout: float) -> bool:
+    """
+    Block until fd is locked, for up to timeout seconds.
+
+    The blocking call runs on a daemon thread. If the wait times out, that
+    thread takes over fd and closes it (releasing the lock should it still
+    get it), so a lock that is never released can't hold up interpreter exit.
+    Either way fd is closed unless this returns True.
+    """
+    done = threading.Event()
+    abandoned = threading.Event()
+    guard = threading.Lock()
+    result = [False]
+
+    def wait() -> None:
+        try:
+            _lock_blocking(fd, exclusive, abandoned)
+            locked = True
+        except OSError:
+            locked = False
+        with guard:
+            if abandoned.is_set():
+                if locked:
+                    _unlock(fd)
+                os.close(fd)
+                return
+            result[0] = locked
+            done.set()
+
+    threading.Thread(target=wait, name="file-lock-wait", daemon=True).start()
+    done.wait(max(timeout, 0))
+    with guard:
+        if not done.is_set():
+            abandoned.set()
+            return False
+    if not result[0]:
+        os.close(fd)
+    return result[0]
+
+
+def _acquire_os_lock(lock_file: Path, exclusive: bool, timeout: float) -> int | None:
+    """
+    Wait up to timeout for the lock file's lock; returns the fd, or None.
+
+    For use once _try_acquire_os_lock() has found the lock busy.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        fd = _open_lock_file(lock_file)
+        if not _wait_for_os_lock(fd, exclusive, remaining):
+            return None
+        if _lock_is_current(fd, lock_file):
+            return fd
+        _unlock(fd)
+        os.close(fd)
+
+
 class FileLock:
     """
     Cross-process file lock using platform-specific locking (fcntl.flock on Unix,
     msvcrt.locking on Windows).
 
     Supports both sync and async context managers for flexible usage.
+    Exclusive locks on the same file from one process queue in-process first
+    (see module docstring).
 
     Args:
         filepath: Path to file to lock (will be created if needed)
@@ -136,44 +466,95 @@ class FileLock:
         self.exclusive = exclusive
         self._lock_file: Path | None = None
         self._fd: int | None = None
+        self._process_lock: _ProcessLock | None = None
 
     def _get_lock_file(self) -> Path:
         """Get lock file path (separate .lock file)."""
         return self.filepath.parent / f"{self.filepath.name}.lock"
 
+    def _timeout_error(self, process_lock: _ProcessLock) -> FileLockTimeout:
+        process_lock.record_timeout()
+        return FileLockTimeout(
+            f"Failed to acquire lock on {self.filepath} within {self.timeout}s"
+        )
+
     def _acquire_lock(self) -> None:
         """Acquire the file lock (blocking with timeout)."""
         self._lock_file = self._get_lock_file()
-        self._lock_file.parent.mkdir(parents=True, exist_ok=True)
+        process_lock = _get_process_lock(self._lock_file)
+        start = time.monotonic()
 
-        # Open lock file
-        self._fd = os.open(str(self._lock_file), os.O_CREAT | os.O_RDWR)
+        if self.exclusive and not process_lock.acquire(self.timeout):
+            raise self._timeout_error(process_lock)
 
-        # Try to acquire lock with timeout
-        start_time = time.time()
+        os_wait = False
+        try:
+            fd = _try_acquire_os_lock(self._lock_file, self.exclusive)
+            if fd is None:
+                os_wait = True
+                remaining = self.timeout - (time.monotonic() - start)
+                fd = _acquire_os_lock(self._lock_file, self.exclusive, remaining)
+                if fd is None:
+                    raise self._timeout_error(process_lock)
+        except BaseException:
+            if self.exclusive:
+                process_lock.release()
+            raise
 
-        while True:
-            try:
-                # Non-blocking lock attempt
-                _try_lock(self._fd, self.exclusive)
-                return  # Lock acquired
-            except (BlockingIOError, OSError):
-                # Lock held by another process
-                elapsed = time.time() - start_time
-                if elapsed >= self.timeout:
-                    os.close(self._fd)
-                    self._fd = None
-                    raise FileLockTimeout(
-                        f"Failed to acquire lock on {self.filepath} within "
-                        f"{self.timeout}s"
-                    )
-
-                # Wait a bit before retrying
-                time.sleep(0.01)
+        self._on_acquired(fd, process_lock, time.monotonic() - start, os_wait)
+
+    async def _acquire_lock_async(self) -> None:
+        """Acquire the file lock without blocking the event loop."""
+        self._lock_file = self._get_lock_file()
+        process_lock = _get_process_lock(self._lock_file)
+        start = time.monotonic()
+
+        if self.exclusive and not await process_lock.acquire_async(self.timeout):
+            raise self._timeout_error(process_lock)
+
+        os_wait = False
+        try:
+            fd = _try_acquire_os_lock(self._lock_file, self.exclusive)
+            if fd is None:
+                os_wait = True
+                remaining = self.timeout - (time.monotonic() - start)
+                waiting = asyncio.get_running_loop().run_in_executor(
+                    None, _acquire_os_lock, self._lock_file, self.exclusive, remaining
+                )
+                try:
+                    fd = await asyncio.shield(waiting)
+                except asyncio.CancelledError:
+                    waiting.add_done_callback(_close_abandoned_fd)
+                    raise
+                if fd is None:
+                    raise self._timeout_error(process_lock)
+        except BaseException:
+            if self.exclusive:
+                process_lock.release()
+            raise
+
+        self._on_acquired(fd, process_lock, time.monotonic() - start, os_wait)
+
+    def _on_acquired(
+        self, fd: int, process_lock: _ProcessLock, wait: float, os_wait: bool
+    ) -> None:
+        self._fd = fd
+        self._process_lock = process_lock
+        process_lock.record_acquired(
+            wait, os_wait, _describe_holder() if self.exclusive else None
+        )
 
     def _release_lock(self) -> None:
         """Release the file lock."""
         if self._fd is not None:
+            # An exclusive holder removes the lock file before unlocking it,
+            # so a process already waiting on it sees it's stale
+            # (_lock_is_current) and locks the new file instead
+            if self.exclusive and not _IS_WINDOWS and self._lock_file:
+                try:
+                    self._lock_file.unlink()
+                except Exception:
+                    pass  # Best effort cleanup
             try:
                 _unlock(self._fd)
                 os.close(self._fd)
@@ -182,12 +563,16 @@ class FileLock:
             finally:
                 self._fd = None
 
-        # Clean up lock file
-        if self._lock_file and self._lock_file.exists():
-            try:
-                self._lock_file.unlink()
-            except Exception:
-                pass  # Best effort cleanup
+            if _IS_WINDOWS and self._lock_file:
+                try:
+                    self._lock_file.unlink()
+                except Exception:
+                    pass  # Best effort cleanup
+
+        if self._process_lock is not None:
+            if self.exclusive:
+                self._process_lock.release()
+            self._process_lock = None
 
     def __enter__(self):
         """Synchronous context manager entry."""
@@ -201,16 +586,25 @@ class FileLock:
 
     async def __aenter__(self):
         """Async context manager entry."""
-        # Run blocking lock acquisition in thread pool
-        await asyncio.get_running_loop().run_in_executor(None, self._acquire_lock)
+        await self._acquire_lock_async()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await asyncio.get_running_loop().run_in_executor(None, self._release_lock)
+        self._release_lock()
         return False
 
 
+def _close_abandoned_fd(future: asyncio.Future) -> None:
+    """Release an OS lock acquired for a waiter that was cancelled."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    fd = future.result()
+    if fd is not None:
+        _unlock(fd)
+        os.close(fd)
+
+
 @contextmanager
 def atomic_write(filepath: str | Path, mode: str = "w", encoding: str = "utf-8"):
     """
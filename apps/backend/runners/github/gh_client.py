@@ -16,11 +16,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from core.gh_executable import get_gh_executable
+from core.tracing import current_span, traced
 
 try:
     from .rate_limiter import RateLimiter, RateLimitExceeded
@@ -30,6 +32,198 @@ except (ImportError, ValueError, SystemError):
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Most files the PR files endpoint lists for one PR
+GITHUB_MAX_PR_FILES = 3000
+
+
+# Issue fields matching `gh issue view --json` defaults used by issue_get()
+_ISSUE_FIELDS_FRAGMENT = """
+fragment IssueFields on Issue {
+  number
+  title
+  body
+  state
+  createdAt
+  updatedAt
+  author { login }
+  labels(first: 100) { nodes { name } }
+  comments(first: 100) { nodes { author { login } body createdAt } }
+}
+"""
+
+
+def _normalize_graphql_issue(node: dict[str, Any]) -> dict[str, Any]:
+    """Flatten GraphQL connections into the `gh issue view --json` shape."""
+    issue = dict(node)
+    issue["author"] = node.get("author") or {"login": "ghost"}
+    issue["labels"] = (node.get("labels") or {}).get("nodes", [])
+    issue["comments"] = [
+        {**comment, "author": comment.get("author") or {"login": "ghost"}}
+        for comment in (node.get("comments") or {}).get("nodes", [])
+    ]
+    return issue
+
+
+_PAGE_INFO = "pageInfo { hasNextPage endCursor }"
+
+# Inline comments of a review thread, paged like the PR connections
+_THREAD_COMMENT_FIELDS = (
+    "databaseId author { login } body path line originalLine createdAt updatedAt url"
+)
+
+# Selections for the PR connections a review needs. Each is fetched 100
+# entries at a time; longer connections are paged by pr_get_bundle_many().
+_PR_CONNECTIONS = {
+    "files": "path additions deletions changeType",
+    "commits": (
+        "commit { oid messageHeadline messageBody authoredDate committedDate "
+        "authors(first: 10) { nodes { name email user { login } } } }"
+    ),
+    "reviews": (
+        "databaseId author { login } authorAssociation body state submittedAt "
+        "commit { oid }"
+    ),
+    "comments": (
+        "databaseId author { login } authorAssociation body createdAt updatedAt url"
+    ),
+    "reviewThreads": (
+        "id isResolved comments(first: 100) "
+        f"{{ {_PAGE_INFO} nodes {{ {_THREAD_COMMENT_FIELDS} }} }}"
+    ),
+}
+
+_RATE_LIMIT_FIELDS = "rateLimit { cost remaining resetAt }"
+
+# PR fields matching the `gh pr view --json` fields PRContextGatherer uses
+_PR_BUNDLE_FRAGMENT = (
+    """
+fragment PRBundle on PullRequest {
+  number
+  title
+  body
+  state
+  isDraft
+  url
+  createdAt
+  updatedAt
+  headRefName
+  baseRefName
+  headRefOid
+  baseRefOid
+  author { login }
+  additions
+  deletions
+  changedFiles
+  mergeable
+  mergeStateStatus
+  labels(first: 100) { nodes { name } }
+"""
+    + "".join(
+        f"  {connection}(first: 100) {{ {_PAGE_INFO} nodes {{ {selection} }} }}\n"
+        for connection, selection in _PR_CONNECTIONS.items()
+    )
+    + "}\n"
+)
+
+# Requests GitHub counts per connection page (the page itself plus nested
+# connections: commit authors, thread comments), used to estimate cost
+_PR_CONNECTION_REQUESTS = {
+    "files": 1,
+    "commits": 101,
+    "reviews": 1,
+    "comments": 1,
+    "reviewThreads": 101,
+}
+_PR_BUNDLE_REQUESTS = 2 + sum(_PR_CONNECTION_REQUESTS.values())  # + PR, labels
+
+
+def _graphql_cost(requests: int) -> int:
+    """GitHub's GraphQL point cost: requests / 100, at least 1."""
+    return max(1, round(requests / 100))
+
+
+def _normalize_graphql_pr(node: dict[str, Any]) -> dict[str, Any]:
+    """Flatten GraphQL connections into the `gh pr view --json` shape."""
+    ghost = {"login": "ghost"}
+
+    def nodes(connection: str) -> list[dict[str, Any]]:
+        return (node.get(connection) or {}).get("nodes") or []
+
+    pr = {
+        key: value
+        for key, value in node.items()
+        if key not in _PR_CONNECTIONS and key != "labels"
+    }
+    pr["author"] = node.get("author") or ghost
+    pr["labels"] = nodes("labels")
+    pr["files"] = [
+        {
+            "path": f["path"],
+            "additions": f.get("additions", 0),
+            "deletions": f.get("deletions", 0),
+            "status": (f.get("changeType") or "MODIFIED").lower(),
+        }
+        for f in nodes("files")
+    ]
+    pr["commits"] = [
+        {
+            "oid": c["commit"]["oid"],
+            "messageHeadline": c["commit"].get("messageHeadline", ""),
+            "messageBody": c["commit"].get("messageBody", ""),
+            "authoredDate": c["commit"].get("authoredDate"),
+            "committedDate": c["commit"].get("committedDate"),
+            "authors": [
+                {
+                    "name": a.get("name"),
+                    "email": a.get("email"),
+                    "login": (a.get("user") or {}).get("login", ""),
+                }
+                for a in (c["commit"].get("authors") or {}).get("nodes") or []
+            ],
+        }
+        for c in nodes("commits")
+    ]
+    pr["reviews"] = [
+        {
+            "id": r.get("databaseId"),
+            "author": r.get("author") or ghost,
+            "authorAssociation": r.get("authorAssociation"),
+            "body": r.get("body", ""),
+            "state": r.get("state"),
+            "submittedAt": r.get("submittedAt"),
+            "commit": r.get("commit") or {},
+        }
+        for r in nodes("reviews")
+    ]
+    pr["comments"] = [
+        {
+            "id": c.get("databaseId"),
+            "author": c.get("author") or ghost,
+            "authorAssociation": c.get("authorAssociation"),
+            "body": c.get("body", ""),
+            "createdAt": c.get("createdAt"),
+            "updatedAt": c.get("updatedAt"),
+            "url": c.get("url"),
+        }
+        for c in nodes("comments")
+    ]
+    pr["reviewComments"] = [
+        {
+            "id": c.get("databaseId"),
+            "author": c.get("author") or ghost,
+            "body": c.get("body", ""),
+            "path": c.get("path"),
+            "line": c.get("line"),
+            "original_line": c.get("originalLine"),
+            "createdAt": c.get("createdAt"),
+            "updatedAt": c.get("updatedAt"),
+            "url": c.get("url"),
+        }
+        for thread in nodes("reviewThreads")
+        for c in (thread.get("comments") or {}).get("nodes") or []
+    ]
+    return pr
+
 
 class GHTimeoutError(Exception):
     """Raised when gh CLI command times out after all retry attempts."""
@@ -109,6 +303,7 @@ class GHClient:
         if enable_rate_limiting:
             self._rate_limiter = RateLimiter.get_instance()
 
+    @traced("gh")
     async def run(
         self,
         args: list[str],
@@ -130,6 +325,7 @@ class GHClient:
             GHTimeoutError: If command times out after all retries
             GHCommandError: If command fails and raise_on_error is True
         """
+        current_span().set(command=" ".join(args[:2]))
         timeout = timeout or self.default_timeout
         gh_exec = get_gh_executable()
         if not gh_exec:
@@ -517,6 +713,236 @@ class GHClient:
         result = await self.run(args)
         return json.loads(result.stdout)
 
+    async def issue_get_many(
+        self, issue_numbers: list[int], batch_size: int = 50
+    ) -> list[dict[str, Any]]:
+        """
+        Get several issues with one GraphQL request per batch.
+
+        Returns the same fields as issue_get(), in the requested order.
+        Issues that don't exist are skipped. Falls back to one issue_get()
+        call per issue when no repo is configured.
+
+        Args:
+            issue_numbers: Issue numbers to fetch
+            batch_size: Issues per GraphQL request
+
+        Returns:
+            List of issue data dictionaries
+        """
+        if not self.repo or "/" not in self.repo:
+            return [await self.issue_get(number) for number in issue_numbers]
+
+        owner, name = self.repo.split("/", 1)
+        issues: list[dict[str, Any]] = []
+        for start in range(0, len(issue_numbers), batch_size):
+            batch = issue_numbers[start : start + batch_size]
+            fields = "\n".join(
+                f"i{number}: issue(number: {int(number)}) {{ ...IssueFields }}"
+                for number in batch
+            )
+            query = (
+                "query($owner: String!, $name: String!) {\n"
+                f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n"
+                "}\n" + _ISSUE_FIELDS_FRAGMENT
+            )
+            data = await self.graphql(query, {"owner": owner, "name": name})
+            repository = data.get("repository") or {}
+            for number in batch:
+                node = repository.get(f"i{number}")
+                if node is None:
+                    logger.warning(f"Issue #{number} not found in {self.repo}")
+                    continue
+                issues.append(_normalize_graphql_issue(node))
+        return issues
+
+    async def pr_get_bundle(self, pr_number: int) -> dict[str, Any] | None:
+        """
+        Get a PR with its files, commits, reviews and comments in one query.
+
+        See pr_get_bundle_many() for the returned shape.
+
+        Args:
+            pr_number: PR number
+
+        Returns:
+            PR bundle, or None if the PR doesn't exist
+        """
+        bundles = await self.pr_get_bundle_many([pr_number])
+        return bundles.get(pr_number)
+
+    async def pr_get_bundle_many(
+        self, pr_numbers: list[int], batch_size: int = 10
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Get several PRs with their files, commits, reviews and comments.
+
+        One GraphQL request fetches a whole batch of PRs; connections with
+        more than 100 entries are paged in follow-up requests. Each bundle
+        has the `gh pr view --json` fields used by PRContextGatherer
+        (metadata, files, commits, reviews, comments, labels) plus
+        "reviewComments": inline review comments in the REST comment shape
+        (id, author, body, path, line, original_line, createdAt).
+
+        Args:
+            pr_numbers: PR numbers to fetch
+            batch_size: PRs per GraphQL request
+
+        Returns:
+            Mapping of PR number to bundle. PRs that don't exist are skipped.
+
+        Raises:
+            GHCommandError: If no repo is configured or a query fails
+        """
+        if not self.repo or "/" not in self.repo:
+            raise GHCommandError("pr_get_bundle_many() needs an owner/repo")
+
+        owner, name = self.repo.split("/", 1)
+        variables = {"owner": owner, "name": name}
+        bundles: dict[int, dict[str, Any]] = {}
+        for start in range(0, len(pr_numbers), batch_size):
+            batch = pr_numbers[start : start + batch_size]
+            fields = "\n".join(
+                f"p{number}: pullRequest(number: {int(number)}) {{ ...PRBundle }}"
+                for number in batch
+            )
+            query = (
+                "query($owner: String!, $name: String!) {\n"
+                f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n"
+                f"  {_RATE_LIMIT_FIELDS}\n"
+                "}\n" + _PR_BUNDLE_FRAGMENT
+            )
+            data = await self.graphql(
+                query, variables, cost=_graphql_cost(len(batch) * _PR_BUNDLE_REQUESTS)
+            )
+            repository = data.get("repository") or {}
+            for number in batch:
+                node = repository.get(f"p{number}")
+                if node is None:
+                    logger.warning(f"PR #{number} not found in {self.repo}")
+                    continue
+                await self._page_pr_connections(number, node, variables)
+                bundles[number] = _normalize_graphql_pr(node)
+        return bundles
+
+    async def _page_pr_connections(
+        self, pr_number: int, node: dict[str, Any], variables: dict[str, Any]
+    ) -> None:
+        """Fetch the remaining pages of any PR connection (or thread) cut off at 100."""
+        for connection, selection in _PR_CONNECTIONS.items():
+            page = node.get(connection) or {}
+            while (page.get("pageInfo") or {}).get("hasNextPage"):
+                query = (
+                    "query($owner: String!, $name: String!, $after: String!) {\n"
+                    "  repository(owner: $owner, name: $name) {\n"
+                    f"    pullRequest(number: {int(pr_number)}) {{\n"
+                    f"      {connection}(first: 100, after: $after) "
+                    f"{{ {_PAGE_INFO} nodes {{ {selection} }} }}\n"
+                    "    }\n  }\n"
+                    f"  {_RATE_LIMIT_FIELDS}\n"
+                    "}\n"
+                )
+                data = await self.graphql(
+                    query,
+                    {**variables, "after": page["pageInfo"]["endCursor"]},
+                    cost=_graphql_cost(_PR_CONNECTION_REQUESTS[connection]),
+                )
+                pr = (data.get("repository") or {}).get("pullRequest") or {}
+                next_page = pr.get(connection) or {}
+                node[connection]["nodes"].extend(next_page.get("nodes") or [])
+                page = next_page
+
+        for thread in (node.get("reviewThreads") or {}).get("nodes") or []:
+            await self._page_thread_comments(thread)
+
+    async def _page_thread_comments(self, thread: dict[str, Any]) -> None:
+        """Fetch the remaining comments of a review thread cut off at 100."""
+        page = thread.get("comments") or {}
+        while (page.get("pageInfo") or {}).get("hasNextPage"):
+            query = (
+                "query($thread: ID!, $after: String!) {\n"
+                "  node(id: $thread) {\n"
+                "    ... on PullRequestReviewThread {\n"
+                "      comments(first: 100, after: $after) "
+                f"{{ {_PAGE_INFO} nodes {{ {_THREAD_COMMENT_FIELDS} }} }}\n"
+                "    }\n  }\n"
+                f"  {_RATE_LIMIT_FIELDS}\n"
+                "}\n"
+            )
+            data = await self.graphql(
+                query,
+                {"thread": thread["id"], "after": page["pageInfo"]["endCursor"]},
+                cost=_graphql_cost(1),
+            )
+            next_page = (data.get("node") or {}).get("comments") or {}
+            thread["comments"]["nodes"].extend(next_page.get("nodes") or [])
+            page = next_page
+
+    async def graphql(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+        cost: int = 1,
+    ) -> dict[str, Any]:
+        """
+        Run a GraphQL query via `gh api graphql`.
+
+        GraphQL has its own points budget. When rate limiting is enabled the
+        estimated cost is reserved up front, and if the query selects
+        `rateLimit { cost remaining resetAt }` the actual figures are
+        recorded with the rate limiter.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables (ints/bools are sent typed)
+            cost: Estimated points the query costs
+
+        Returns:
+            The response's "data" object
+
+        Raises:
+            GHCommandError: If the query fails without returning data
+            RateLimitExceeded: If the GraphQL budget is exhausted
+        """
+        if self.enable_rate_limiting:
+            if not await self._rate_limiter.acquire_graphql(
+                cost, timeout=self._rate_limiter.max_retry_delay
+            ):
+                _, msg = self._rate_limiter.check_graphql_available(cost)
+                raise RateLimitExceeded(f"GitHub GraphQL rate limit exceeded: {msg}")
+
+        args = ["api", "graphql", "-f", f"query={query}"]
+        for key, value in (variables or {}).items():
+            flag = "-F" if isinstance(value, (bool, int)) else "-f"
+            if isinstance(value, bool):
+                value = str(value).lower()
+            args.extend([flag, f"{key}={value}"])
+
+        # gh exits non-zero when the response has errors, even alongside
+        # partial data, so inspect the payload instead of the exit code
+        result = await self.run(args, raise_on_error=False)
+        try:
+            payload = json.loads(result.stdout)
+        except json.JSONDecodeError:
+            raise GHCommandError(
+                f"GraphQL query failed (exit {result.returncode}): {result.stderr}"
+            )
+        if payload.get("errors"):
+            if not payload.get("data"):
+                raise GHCommandError(f"GraphQL query failed: {payload['errors']}")
+            # Partial results (e.g. a missing issue) - keep what we got
+            logger.debug(f"GraphQL query returned errors: {payload['errors']}")
+        data = payload.get("data") or {}
+
+        rate_limit = data.get("rateLimit")
+        if self.enable_rate_limiting and rate_limit:
+            self._rate_limiter.record_graphql_cost(
+                cost=rate_limit.get("cost", cost),
+                remaining=rate_limit.get("remaining"),
+                reset_at=rate_limit.get("resetAt"),
+            )
+        return data
+
     async def issue_comment(self, issue_number: int, body: str) -> None:
         """
         Post a comment to an issue.
@@ -1004,31 +1430,28 @@ class GHClient:
 
         return checks
 
-    async def get_pr_files(self, pr_number: int) -> list[dict[str, Any]]:
+    async def iter_pr_files(
+        self, pr_number: int, per_page: int = 100
+    ) -> AsyncIterator[dict[str, Any]]:
         """
-        Get files changed by a PR using the PR files endpoint.
+        Stream the files changed by a PR, one page of the PR files endpoint
+        at a time.
 
-        IMPORTANT: This returns only files that are part of the PR's actual changes,
-        NOT files that came in from merging another branch (e.g., develop).
-        This is crucial for follow-up reviews to avoid reviewing code from other PRs.
+        Unlike pr_diff(), this works for PRs over GitHub's 20,000 line diff
+        limit: each file carries its own patch. GitHub lists at most
+        GITHUB_MAX_PR_FILES files per PR.
 
         Uses: GET /repos/{owner}/{repo}/pulls/{pr_number}/files
 
         Args:
             pr_number: PR number
+            per_page: Files per request (max 100)
 
-        Returns:
-            List of file objects with:
-            - filename: Path to the file
-            - status: added, removed, modified, renamed, copied, changed
-            - additions: Number of lines added
-            - deletions: Number of lines deleted
-            - changes: Total number of line changes
-            - patch: The unified diff patch for this file (may be absent for large files)
+        Yields:
+            File objects as described in get_pr_files()
         """
-        files = []
         page = 1
-        per_page = 100
+        count = 0
 
         while True:
             endpoint = f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/files?page={page}&per_page={per_page}"
@@ -1037,25 +1460,45 @@ class GHClient:
             result = await self.run(args, timeout=60.0)
             page_files = json.loads(result.stdout) if result.stdout.strip() else []
 
-            if not page_files:
-                break
-
-            files.extend(page_files)
+            for file in page_files:
+                yield file
+            count += len(page_files)
 
-            # Check if we got a full page (more pages might exist)
+            # A short page is the last one
             if len(page_files) < per_page:
                 break
-
-            page += 1
-
-            # Safety limit to prevent infinite loops
-            if page > 50:
+            if count >= GITHUB_MAX_PR_FILES:
                 logger.warning(
-                    f"PR #{pr_number} has more than 5000 files, stopping pagination"
+                    f"PR #{pr_number} lists {count} files, GitHub's maximum; "
+                    "any further files are only available from a local git diff"
                 )
                 break
 
-        return files
+            page += 1
+
+    async def get_pr_files(self, pr_number: int) -> list[dict[str, Any]]:
+        """
+        Get files changed by a PR using the PR files endpoint.
+
+        IMPORTANT: This returns only files that are part of the PR's actual changes,
+        NOT files that came in from merging another branch (e.g., develop).
+        This is crucial for follow-up reviews to avoid reviewing code from other PRs.
+
+        Uses: GET /repos/{owner}/{repo}/pulls/{pr_number}/files
+
+        Args:
+            pr_number: PR number
+
+        Returns:
+            List of file objects with:
+            - filename: Path to the file
+            - status: added, removed, modified, renamed, copied, changed
+            - additions: Number of lines added
+            - deletions: Number of lines deleted
+            - changes: Total number of line changes
+            - patch: The unified diff patch for this file (may be absent for large files)
+        """
+        return [file async for file in self.iter_pr_files(pr_number)]
 
     async def get_pr_commits(self, pr_number: int) -> list[dict[str, Any]]:
         """
@@ -1109,6 +1552,75 @@ class GHClient:
 
         return commits
 
+    def _repo_endpoint(self) -> str:
+        """REST path prefix for the repository (gh fills in the placeholders)."""
+        return f"repos/{self.repo}" if self.repo else "repos/{owner}/{repo}"
+
+    async def issues_updated_since(
+        self, since: str | None = None, max_pages: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        List issues and PRs (open or closed) updated at or after `since`.
+
+        Uses: GET /repos/{owner}/{repo}/issues?since=...&sort=updated
+
+        Args:
+            since: ISO 8601 timestamp (None lists everything, newest last)
+            max_pages: Pagination safety limit (100 per page)
+
+        Returns:
+            REST issue objects, oldest update first. Pull requests are
+            included and carry a "pull_request" key.
+        """
+        items: list[dict[str, Any]] = []
+        per_page = 100
+        for page in range(1, max_pages + 1):
+            query = (
+                f"state=all&sort=updated&direction=asc&per_page={per_page}&page={page}"
+            )
+            if since:
+                query += f"&since={since}"
+            args = ["api", "--method", "GET", f"{self._repo_endpoint()}/issues?{query}"]
+            result = await self.run(args, timeout=60.0)
+            page_items = json.loads(result.stdout) if result.stdout.strip() else []
+            items.extend(page_items)
+            if len(page_items) < per_page:
+                break
+        return items
+
+    async def prs_updated_since(
+        self, since: str | None = None, max_pages: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        List pull requests (open or closed) updated at or after `since`.
+
+        The pulls endpoint has no `since` filter, so pages are read newest
+        first until an older update is reached.
+
+        Uses: GET /repos/{owner}/{repo}/pulls?sort=updated&direction=desc
+
+        Args:
+            since: ISO 8601 timestamp (None returns the first page only)
+            max_pages: Pagination safety limit (100 per page)
+
+        Returns:
+            REST pull request objects (with head.sha), oldest update first
+        """
+        prs: list[dict[str, Any]] = []
+        per_page = 100
+        for page in range(1, max_pages + 1):
+            endpoint = (
+                f"{self._repo_endpoint()}/pulls?state=all&sort=updated"
+                f"&direction=desc&per_page={per_page}&page={page}"
+            )
+            result = await self.run(["api", "--method", "GET", endpoint], timeout=60.0)
+            page_prs = json.loads(result.stdout) if result.stdout.strip() else []
+            fresh = [pr for pr in page_prs if not since or pr["updated_at"] >= since]
+            prs.extend(fresh)
+            if not since or len(fresh) < len(page_prs) or len(page_prs) < per_page:
+                break
+        return prs[::-1]
+
     async def get_pr_files_changed_since(
         self,
         pr_number: int,
@@ -9,6 +9,8 @@ Features:
 - Accuracy metrics per-repo and aggregate
 - Pattern detection for cross-project learning
 - Feedback loop for prompt optimization
+- SQLite outcome store with per-record upserts and incrementally
+  maintained aggregates (no full rescans for accuracy/dashboard queries)
 
 Usage:
     tracker = LearningTracker(state_dir=Path(".auto-claude/github"))
@@ -26,6 +28,10 @@ Usage:
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -255,6 +261,346 @@ class LearningPattern:
         }
 
 
+class OutcomeStore:
+    """
+    SQLite store of ReviewOutcomes (learning/outcomes.db).
+
+    Each record_prediction()/record_outcome() is one upsert in a short
+    transaction, so concurrent review workers don't serialize on rewriting
+    a whole JSON file. The same transaction updates aggregate tables:
+    counts per (repo, prediction type) for get_accuracy() and per
+    file type / category / change size for detect_patterns().
+
+    Legacy <repo>_outcomes.json files are imported when first seen (and
+    again if they change, e.g. written by an older version).
+    """
+
+    DB_FILENAME = "outcomes.db"
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS outcomes (
+        review_id TEXT PRIMARY KEY,
+        repo TEXT NOT NULL,
+        prediction TEXT NOT NULL,
+        created_ts REAL NOT NULL,
+        complete INTEGER NOT NULL,
+        was_correct INTEGER,
+        merge_seconds REAL,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_outcomes_repo_created
+        ON outcomes (repo, created_ts);
+    CREATE INDEX IF NOT EXISTS idx_outcomes_created ON outcomes (created_ts);
+    CREATE INDEX IF NOT EXISTS idx_outcomes_pending
+        ON outcomes (complete, repo);
+    CREATE TABLE IF NOT EXISTS accuracy_counts (
+        repo TEXT NOT NULL,
+        prediction TEXT NOT NULL,
+        total INTEGER NOT NULL,
+        correct INTEGER NOT NULL,
+        incorrect INTEGER NOT NULL,
+        pending INTEGER NOT NULL,
+        merge_count INTEGER NOT NULL,
+        merge_seconds REAL NOT NULL,
+        PRIMARY KEY (repo, prediction)
+    );
+    CREATE TABLE IF NOT EXISTS pattern_counts (
+        pattern_type TEXT NOT NULL,
+        key TEXT NOT NULL,
+        correct INTEGER NOT NULL,
+        incorrect INTEGER NOT NULL,
+        PRIMARY KEY (pattern_type, key)
+    );
+    CREATE TABLE IF NOT EXISTS imported_files (
+        name TEXT PRIMARY KEY,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL
+    );
+    """
+
+    # detect_patterns() reports pattern types in this order
+    PATTERN_TYPES = ("file_type_accuracy", "category_accuracy", "change_size_accuracy")
+
+    def __init__(self, learning_dir: Path):
+        self.learning_dir = learning_dir
+        self.db_path = learning_dir / self.DB_FILENAME
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._import_legacy_files()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """The store's connection, opened on first use (one user at a time)."""
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(
+                    self.db_path,
+                    timeout=30.0,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(self._SCHEMA)
+                self._conn = conn
+            yield self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def upsert(self, outcome: ReviewOutcome) -> None:
+        """Insert or replace one outcome and update the aggregates."""
+        with self._transaction() as conn:
+            self._upsert(conn, outcome)
+
+    def _upsert(self, conn: sqlite3.Connection, outcome: ReviewOutcome) -> None:
+        row = conn.execute(
+            "SELECT data FROM outcomes WHERE review_id = ?", (outcome.review_id,)
+        ).fetchone()
+        if row is not None:
+            self._apply_aggregates(
+                conn, ReviewOutcome.from_dict(json.loads(row[0])), -1
+            )
+
+        was_correct = outcome.was_correct
+        conn.execute(
+            "INSERT INTO outcomes (review_id, repo, prediction, created_ts, "
+            "complete, was_correct, merge_seconds, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (review_id) DO UPDATE SET repo = excluded.repo, "
+            "prediction = excluded.prediction, created_ts = excluded.created_ts, "
+            "complete = excluded.complete, was_correct = excluded.was_correct, "
+            "merge_seconds = excluded.merge_seconds, data = excluded.data",
+            (
+                outcome.review_id,
+                outcome.repo,
+                outcome.prediction.value,
+                outcome.created_at.timestamp(),
+                int(outcome.is_complete),
+                None if was_correct is None else int(was_correct),
+                self._merge_seconds(outcome),
+                json.dumps(outcome.to_dict()),
+            ),
+        )
+        self._apply_aggregates(conn, outcome, 1)
+
+    @staticmethod
+    def _merge_seconds(outcome: ReviewOutcome) -> float | None:
+        """Time to merge, if this outcome counts toward avg_time_to_merge."""
+        if (
+            outcome.is_complete
+            and outcome.actual_outcome == OutcomeType.MERGED
+            and outcome.time_to_outcome
+        ):
+            return outcome.time_to_outcome.total_seconds()
+        return None
+
+    def _apply_aggregates(
+        self, conn: sqlite3.Connection, outcome: ReviewOutcome, sign: int
+    ) -> None:
+        """Add (sign=1) or remove (sign=-1) an outcome's aggregate contribution."""
+        complete = outcome.is_complete
+        was_correct = outcome.was_correct if complete else None
+        merge_seconds = self._merge_seconds(outcome)
+        conn.execute(
+            "INSERT INTO accuracy_counts (repo, prediction, total, correct, "
+            "incorrect, pending, merge_count, merge_seconds) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (repo, prediction) DO UPDATE SET "
+            "total = total + excluded.total, correct = correct + excluded.correct, "
+            "incorrect = incorrect + excluded.incorrect, "
+            "pending = pending + excluded.pending, "
+            "merge_count = merge_count + excluded.merge_count, "
+            "merge_seconds = merge_seconds + excluded.merge_seconds",
+            (
+                outcome.repo,
+                outcome.prediction.value,
+                sign,
+                sign * (was_correct is True),
+                sign * (was_correct is False),
+                sign * (not complete),
+                sign * (merge_seconds is not None),
+                sign * (merge_seconds or 0.0),
+            ),
+        )
+
+        if was_correct is None:
+            return
+        keys = [("file_type_accuracy", t) for t in outcome.file_types]
+        keys += [("category_accuracy", c) for c in outcome.categories]
+        keys.append(("change_size_accuracy", outcome.change_size))
+        conn.executemany(
+            "INSERT INTO pattern_counts (pattern_type, key, correct, incorrect) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (pattern_type, key) DO UPDATE SET "
+            "correct = correct + excluded.correct, "
+            "incorrect = incorrect + excluded.incorrect",
+            [
+                (pattern_type, key, sign * was_correct, sign * (not was_correct))
+                for pattern_type, key in keys
+            ],
+        )
+
+    def _import_legacy_files(self) -> None:
+        """Import <repo>_outcomes.json files that are new or changed."""
+        legacy = []
+        for file in self.learning_dir.glob("*_outcomes.json"):
+            try:
+                st = file.stat()
+            except FileNotFoundError:
+                continue
+            legacy.append((file, st.st_mtime_ns, st.st_size))
+        if not legacy and self.db_path.exists():
+            return
+
+        with self._transaction() as conn:
+            imported = {
+                name: (mtime_ns, size)
+                for name, mtime_ns, size in conn.execute(
+                    "SELECT name, mtime_ns, size FROM imported_files"
+                )
+            }
+            for file, mtime_ns, size in legacy:
+                if imported.get(file.name) == (mtime_ns, size):
+                    continue
+                try:
+                    with open(file, encoding="utf-8") as f:
+                        items = json.load(f).get("outcomes", [])
+                    outcomes = [ReviewOutcome.from_dict(item) for item in items]
+                except (json.JSONDecodeError, KeyError, ValueError, OSError):
+                    continue
+                for outcome in outcomes:
+                    self._upsert(conn, outcome)
+                conn.execute(
+                    "INSERT OR REPLACE INTO imported_files (name, mtime_ns, size) "
+                    "VALUES (?, ?, ?)",
+                    (file.name, mtime_ns, size),
+                )
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def get(self, review_id: str) -> ReviewOutcome | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM outcomes WHERE review_id = ?", (review_id,)
+            ).fetchone()
+        return ReviewOutcome.from_dict(json.loads(row[0])) if row else None
+
+    def _select(self, sql: str, params: list[Any]) -> list[ReviewOutcome]:
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [ReviewOutcome.from_dict(json.loads(data)) for (data,) in rows]
+
+    def pending(self, repo: str | None = None) -> list[ReviewOutcome]:
+        if repo is None:
+            return self._select(
+                "SELECT data FROM outcomes WHERE complete = 0 ORDER BY rowid", []
+            )
+        return self._select(
+            "SELECT data FROM outcomes WHERE complete = 0 AND repo = ? ORDER BY rowid",
+            [repo],
+        )
+
+    def pending_count(self, repo: str | None = None) -> int:
+        with self._connect() as conn:
+            if repo is None:
+                row = conn.execute(
+                    "SELECT SUM(pending) FROM accuracy_counts"
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT SUM(pending) FROM accuracy_counts WHERE repo = ?", (repo,)
+                ).fetchone()
+        return row[0] or 0
+
+    def recent(self, repo: str | None, limit: int) -> list[ReviewOutcome]:
+        # rowid keeps insertion order among equal timestamps (stable sort)
+        if repo:
+            return self._select(
+                "SELECT data FROM outcomes WHERE repo = ? "
+                "ORDER BY created_ts DESC, rowid LIMIT ?",
+                [repo, limit],
+            )
+        return self._select(
+            "SELECT data FROM outcomes ORDER BY created_ts DESC, rowid LIMIT ?",
+            [limit],
+        )
+
+    def accuracy_rows(
+        self,
+        repo: str | None,
+        since: datetime | None,
+        prediction_type: PredictionType | None,
+    ) -> list[tuple]:
+        """
+        Per-prediction-type counts.
+
+        Returns:
+            Rows of (prediction, total, correct, incorrect, pending,
+            merge_count, merge_seconds)
+        """
+        clauses = []
+        params: list[Any] = []
+        if repo:
+            clauses.append("repo = ?")
+            params.append(repo)
+        if prediction_type:
+            clauses.append("prediction = ?")
+            params.append(prediction_type.value)
+
+        if since is None:
+            # Maintained incrementally; no scan of the outcomes
+            sql = (
+                "SELECT prediction, SUM(total), SUM(correct), SUM(incorrect), "
+                "SUM(pending), SUM(merge_count), SUM(merge_seconds) "
+                "FROM accuracy_counts"
+            )
+        else:
+            clauses.append("created_ts >= ?")
+            params.append(since.timestamp())
+            sql = (
+                "SELECT prediction, COUNT(*), "
+                "SUM(was_correct IS 1), SUM(was_correct IS 0), SUM(complete = 0), "
+                "COUNT(merge_seconds), TOTAL(merge_seconds) FROM outcomes"
+            )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " GROUP BY prediction ORDER BY MIN(rowid)"
+
+        with self._connect() as conn:
+            return [row for row in conn.execute(sql, params).fetchall() if row[1]]
+
+    def pattern_rows(self) -> list[tuple[str, str, int, int]]:
+        """(pattern_type, key, correct, incorrect), in first-seen order per type."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT pattern_type, key, correct, incorrect FROM pattern_counts "
+                "ORDER BY rowid"
+            ).fetchall()
+        order = {t: i for i, t in enumerate(self.PATTERN_TYPES)}
+        return sorted(rows, key=lambda row: order.get(row[0], len(order)))
+
+
 class LearningTracker:
     """
     Tracks predictions and outcomes to enable learning.
@@ -288,42 +634,8 @@ class LearningTracker:
         self.learning_dir = state_dir / "learning"
         self.learning_dir.mkdir(parents=True, exist_ok=True)
 
-        self._outcomes: dict[str, ReviewOutcome] = {}
-        self._load_outcomes()
-
-    def _get_outcomes_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
-        return self.learning_dir / f"{safe_name}_outcomes.json"
-
-    def _load_outcomes(self) -> None:
-        """Load all outcomes from disk."""
-        for file in self.learning_dir.glob("*_outcomes.json"):
-            try:
-                with open(file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    for item in data.get("outcomes", []):
-                        outcome = ReviewOutcome.from_dict(item)
-                        self._outcomes[outcome.review_id] = outcome
-            except (json.JSONDecodeError, KeyError):
-                continue
-
-    def _save_outcomes(self, repo: str) -> None:
-        """Save outcomes for a repo to disk with file locking for concurrency safety."""
-        from .file_lock import FileLock, atomic_write
-
-        file = self._get_outcomes_file(repo)
-        repo_outcomes = [o for o in self._outcomes.values() if o.repo == repo]
-
-        data = {
-            "repo": repo,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "outcomes": [o.to_dict() for o in repo_outcomes],
-        }
-
-        # Use file locking and atomic write for safe concurrent access
-        with FileLock(file, timeout=5.0):
-            with atomic_write(file) as f:
-                json.dump(data, f, indent=2)
+        # Outcomes are read from the store on demand, not loaded up front
+        self._store = OutcomeStore(self.learning_dir)
 
     def record_prediction(
         self,
@@ -366,8 +678,7 @@ class LearningTracker:
             categories=categories or [],
         )
 
-        self._outcomes[review_id] = outcome
-        self._save_outcomes(repo)
+        self._store.upsert(outcome)
 
         return outcome
 
@@ -392,27 +703,22 @@ class LearningTracker:
         Returns:
             Updated ReviewOutcome or None if not found
         """
-        if review_id not in self._outcomes:
+        review_outcome = self._store.get(review_id)
+        if review_outcome is None:
             return None
 
-        review_outcome = self._outcomes[review_id]
         review_outcome.actual_outcome = outcome
         review_outcome.time_to_outcome = time_to_outcome
         review_outcome.author_response = author_response
         review_outcome.outcome_recorded_at = datetime.now(timezone.utc)
 
-        self._save_outcomes(repo)
+        self._store.upsert(review_outcome)
 
         return review_outcome
 
     def get_pending_outcomes(self, repo: str | None = None) -> list[ReviewOutcome]:
         """Get predictions that don't have outcomes yet."""
-        pending = []
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete:
-                if repo is None or outcome.repo == repo:
-                    pending.append(outcome)
-        return pending
+        return self._store.pending(repo)
 
     def get_accuracy(
         self,
@@ -432,47 +738,33 @@ class LearningTracker:
             AccuracyStats with aggregated metrics
         """
         stats = AccuracyStats()
-        merge_times = []
-
-        for outcome in self._outcomes.values():
-            # Apply filters
-            if repo and outcome.repo != repo:
-                continue
-            if since and outcome.created_at < since:
-                continue
-            if prediction_type and outcome.prediction != prediction_type:
-                continue
-
-            stats.total_predictions += 1
-
-            # Track by type
-            type_key = outcome.prediction.value
-            if type_key not in stats.by_type:
-                stats.by_type[type_key] = {"total": 0, "correct": 0, "incorrect": 0}
-            stats.by_type[type_key]["total"] += 1
-
-            if outcome.is_complete:
-                was_correct = outcome.was_correct
-                if was_correct is True:
-                    stats.correct_predictions += 1
-                    stats.by_type[type_key]["correct"] += 1
-                elif was_correct is False:
-                    stats.incorrect_predictions += 1
-                    stats.by_type[type_key]["incorrect"] += 1
-
-                # Track merge times
-                if (
-                    outcome.actual_outcome == OutcomeType.MERGED
-                    and outcome.time_to_outcome
-                ):
-                    merge_times.append(outcome.time_to_outcome)
-            else:
-                stats.pending_outcomes += 1
+        merge_count = 0
+        merge_seconds = 0.0
+
+        for (
+            type_key,
+            total,
+            correct,
+            incorrect,
+            pending,
+            type_merge_count,
+            type_merge_seconds,
+        ) in self._store.accuracy_rows(repo, since, prediction_type):
+            stats.total_predictions += total
+            stats.correct_predictions += correct
+            stats.incorrect_predictions += incorrect
+            stats.pending_outcomes += pending
+            stats.by_type[type_key] = {
+                "total": total,
+                "correct": correct,
+                "incorrect": incorrect,
+            }
+            merge_count += type_merge_count
+            merge_seconds += type_merge_seconds
 
         # Calculate average merge time
-        if merge_times:
-            avg_seconds = sum(t.total_seconds() for t in merge_times) / len(merge_times)
-            stats.avg_time_to_merge = timedelta(seconds=avg_seconds)
+        if merge_count:
+            stats.avg_time_to_merge = timedelta(seconds=merge_seconds / merge_count)
 
         return stats
 
@@ -482,13 +774,7 @@ class LearningTracker:
         limit: int = 50,
     ) -> list[ReviewOutcome]:
         """Get recent outcomes, most recent first."""
-        outcomes = list(self._outcomes.values())
-
-        if repo:
-            outcomes = [o for o in outcomes if o.repo == repo]
-
-        outcomes.sort(key=lambda o: o.created_at, reverse=True)
-        return outcomes[:limit]
+        return self._store.recent(repo, limit)
 
     def detect_patterns(self, min_sample_size: int = 20) -> list[LearningPattern]:
         """
@@ -503,97 +789,23 @@ class LearningTracker:
             List of detected patterns
         """
         patterns = []
+        # Pattern type -> context key, e.g. "file_type_accuracy" -> "file_type"
+        context_keys = {
+            t: t.removesuffix("_accuracy") for t in OutcomeStore.PATTERN_TYPES
+        }
 
-        # Pattern: Accuracy by file type
-        by_file_type: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            for file_type in outcome.file_types:
-                if file_type not in by_file_type:
-                    by_file_type[file_type] = {"correct": 0, "incorrect": 0}
-
-                if outcome.was_correct:
-                    by_file_type[file_type]["correct"] += 1
-                else:
-                    by_file_type[file_type]["incorrect"] += 1
-
-        for file_type, counts in by_file_type.items():
-            total = counts["correct"] + counts["incorrect"]
+        for pattern_type, key, correct, incorrect in self._store.pattern_rows():
+            total = correct + incorrect
             if total >= min_sample_size:
-                accuracy = counts["correct"] / total
+                context_key = context_keys[pattern_type]
+                accuracy = correct / total
                 confidence = min(1.0, total / 100)  # More samples = higher confidence
 
                 patterns.append(
                     LearningPattern(
-                        pattern_id=f"file_type_{file_type}",
-                        pattern_type="file_type_accuracy",
-                        context={"file_type": file_type},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
-                    )
-                )
-
-        # Pattern: Accuracy by category
-        by_category: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            for category in outcome.categories:
-                if category not in by_category:
-                    by_category[category] = {"correct": 0, "incorrect": 0}
-
-                if outcome.was_correct:
-                    by_category[category]["correct"] += 1
-                else:
-                    by_category[category]["incorrect"] += 1
-
-        for category, counts in by_category.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"category_{category}",
-                        pattern_type="category_accuracy",
-                        context={"category": category},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
-                    )
-                )
-
-        # Pattern: Accuracy by change size
-        by_size: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            size = outcome.change_size
-            if size not in by_size:
-                by_size[size] = {"correct": 0, "incorrect": 0}
-
-            if outcome.was_correct:
-                by_size[size]["correct"] += 1
-            else:
-                by_size[size]["incorrect"] += 1
-
-        for size, counts in by_size.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"change_size_{size}",
-                        pattern_type="change_size_accuracy",
-                        context={"change_size": size},
+                        pattern_id=f"{context_key}_{key}",
+                        pattern_type=pattern_type,
+                        context={context_key: key},
                         sample_size=total,
                         accuracy=accuracy,
                         confidence=confidence,
@@ -620,7 +832,7 @@ class LearningTracker:
             "recent_outcomes": [
                 o.to_dict() for o in self.get_recent_outcomes(repo, limit=10)
             ],
-            "pending_count": len(self.get_pending_outcomes(repo)),
+            "pending_count": self._store.pending_count(repo),
         }
 
     def check_pr_status(
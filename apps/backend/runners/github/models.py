@@ -6,20 +6,27 @@ Data structures for GitHub automation features.
 Stored in .auto-claude/github/pr/ and .auto-claude/github/issues/
 
 All save() operations use file locking to prevent corruption in concurrent scenarios.
+Review results and auto-fix states are also listed in the state index
+(state_index.py), which the queue/list commands query.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 
 try:
-    from .file_lock import locked_json_update, locked_json_write
+    from .file_lock import FileLock, atomic_write, locked_json_write
 except (ImportError, ValueError, SystemError):
-    from file_lock import locked_json_update, locked_json_write
+    from file_lock import FileLock, atomic_write, locked_json_write
+
+logger = logging.getLogger(__name__)
 
 
 def _utc_now_iso() -> str:
@@ -27,6 +34,31 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+async def _save_indexed(
+    github_dir: Path, path: Path, data: dict, kind: str, number: int
+) -> None:
+    """
+    Write a state file and upsert its state index row, both under the file's
+    lock, so concurrent saves of the same item leave the row matching the file.
+    """
+    try:
+        from .state_index import StateIndex
+    except (ImportError, ValueError, SystemError):
+        from state_index import StateIndex
+
+    def write_and_record() -> None:
+        with atomic_write(path) as f:
+            json.dump(data, f, indent=2)
+        try:
+            StateIndex(github_dir).record(kind, number, data)
+        except (sqlite3.Error, OSError) as e:
+            # The file is saved; the next index query re-reads it
+            logger.warning(f"Could not update state index for {path.name}: {e}")
+
+    async with FileLock(path, timeout=5.0):
+        await asyncio.to_thread(write_and_record)
+
+
 class ReviewSeverity(str, Enum):
     """Severity levels for PR review findings."""
 
@@ -666,49 +698,10 @@ class PRReviewResult:
 
         review_file = pr_dir / f"review_{self.pr_number}.json"
 
-        # Atomic locked write
-        await locked_json_write(review_file, self.to_dict(), timeout=5.0)
-
-        # Update index with locking
-        await self._update_index(pr_dir)
-
-    async def _update_index(self, pr_dir: Path) -> None:
-        """Update the PR review index with file locking."""
-        index_file = pr_dir / "index.json"
-
-        def update_index(current_data):
-            """Update function for atomic index update."""
-            if current_data is None:
-                current_data = {"reviews": [], "last_updated": None}
-
-            # Update or add entry
-            reviews = current_data.get("reviews", [])
-            existing = next(
-                (r for r in reviews if r["pr_number"] == self.pr_number), None
-            )
-
-            entry = {
-                "pr_number": self.pr_number,
-                "repo": self.repo,
-                "overall_status": self.overall_status,
-                "findings_count": len(self.findings),
-                "reviewed_at": self.reviewed_at,
-            }
-
-            if existing:
-                reviews = [
-                    entry if r["pr_number"] == self.pr_number else r for r in reviews
-                ]
-            else:
-                reviews.append(entry)
-
-            current_data["reviews"] = reviews
-            current_data["last_updated"] = _utc_now_iso()
-
-            return current_data
-
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        # Atomic locked write, indexed under the same lock
+        await _save_indexed(
+            github_dir, review_file, self.to_dict(), "review", self.pr_number
+        )
 
     @classmethod
     def load(cls, github_dir: Path, pr_number: int) -> PRReviewResult | None:
@@ -834,6 +827,71 @@ class TriageResult:
             return cls.from_dict(json.load(f))
 
 
+@dataclass
+class TriageCheckpoint:
+    """
+    Progress of a triage run, so an interrupted run can resume.
+
+    Results themselves are saved per issue by TriageResult.save(); the
+    checkpoint only records which issues the run covers and which are done.
+    """
+
+    issue_numbers: list[int]
+    completed: list[int] = field(default_factory=list)
+    started_at: str = field(default_factory=lambda: _utc_now_iso())
+    updated_at: str = field(default_factory=lambda: _utc_now_iso())
+
+    @property
+    def pending(self) -> list[int]:
+        done = set(self.completed)
+        return [n for n in self.issue_numbers if n not in done]
+
+    def to_dict(self) -> dict:
+        return {
+            "issue_numbers": self.issue_numbers,
+            "completed": self.completed,
+            "started_at": self.started_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TriageCheckpoint:
+        return cls(
+            issue_numbers=data.get("issue_numbers", []),
+            completed=data.get("completed", []),
+            started_at=data.get("started_at", _utc_now_iso()),
+            updated_at=data.get("updated_at", _utc_now_iso()),
+        )
+
+    @staticmethod
+    def _path(github_dir: Path) -> Path:
+        return github_dir / "issues" / "triage_checkpoint.json"
+
+    async def save(self, github_dir: Path) -> None:
+        """Save checkpoint to .auto-claude/github/issues/ with file locking."""
+        path = self._path(github_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.updated_at = _utc_now_iso()
+        await locked_json_write(path, self.to_dict(), timeout=5.0)
+
+    @classmethod
+    def load(cls, github_dir: Path) -> TriageCheckpoint | None:
+        """Load the checkpoint of an unfinished run, if any."""
+        path = cls._path(github_dir)
+        if not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        except (json.JSONDecodeError, OSError):
+            return None
+
+    @classmethod
+    def clear(cls, github_dir: Path) -> None:
+        """Remove the checkpoint once a run has finished."""
+        cls._path(github_dir).unlink(missing_ok=True)
+
+
 @dataclass
 class AutoFixState:
     """State tracking for auto-fix operations."""
@@ -907,55 +965,10 @@ class AutoFixState:
 
         autofix_file = issues_dir / f"autofix_{self.issue_number}.json"
 
-        # Atomic locked write
-        await locked_json_write(autofix_file, self.to_dict(), timeout=5.0)
-
-        # Update index with locking
-        await self._update_index(issues_dir)
-
-    async def _update_index(self, issues_dir: Path) -> None:
-        """Update the issues index with auto-fix queue using file locking."""
-        index_file = issues_dir / "index.json"
-
-        def update_index(current_data):
-            """Update function for atomic index update."""
-            if current_data is None:
-                current_data = {
-                    "triaged": [],
-                    "auto_fix_queue": [],
-                    "last_updated": None,
-                }
-
-            # Update auto-fix queue
-            queue = current_data.get("auto_fix_queue", [])
-            existing = next(
-                (q for q in queue if q["issue_number"] == self.issue_number), None
-            )
-
-            entry = {
-                "issue_number": self.issue_number,
-                "repo": self.repo,
-                "status": self.status.value,
-                "spec_id": self.spec_id,
-                "pr_number": self.pr_number,
-                "updated_at": self.updated_at,
-            }
-
-            if existing:
-                queue = [
-                    entry if q["issue_number"] == self.issue_number else q
-                    for q in queue
-                ]
-            else:
-                queue.append(entry)
-
-            current_data["auto_fix_queue"] = queue
-            current_data["last_updated"] = _utc_now_iso()
-
-            return current_data
-
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        # Atomic locked write, indexed under the same lock
+        await _save_indexed(
+            github_dir, autofix_file, self.to_dict(), "autofix", self.issue_number
+        )
 
     @classmethod
     def load(cls, github_dir: Path, issue_number: int) -> AutoFixState | None:
@@ -994,6 +1007,16 @@ class GitHubRunnerConfig:
     spam_threshold: float = 0.75
     feature_creep_threshold: float = 0.70
     enable_triage_comments: bool = False
+    # Candidate-duplicate lookup: "indexed" (IDF + MinHash/LSH) or
+    # "overlap" (title word overlap > 0.3, the original behaviour)
+    triage_candidate_mode: str = "indexed"
+    # Issues triaged concurrently (each is one AI session)
+    triage_max_concurrency: int = 3
+
+    # Watch daemon settings (runner.py watch)
+    watch_max_concurrency: int = 2  # Jobs (reviews, triage, auto-fix) at once
+    watch_queue_size: int = 100  # Pending jobs before event intake waits
+    watch_poll_interval: float = 60.0  # Seconds between polls (0: webhooks only)
 
     # PR review settings
     pr_review_enabled: bool = False
@@ -1026,6 +1049,11 @@ class GitHubRunnerConfig:
             "spam_threshold": self.spam_threshold,
             "feature_creep_threshold": self.feature_creep_threshold,
             "enable_triage_comments": self.enable_triage_comments,
+            "triage_candidate_mode": self.triage_candidate_mode,
+            "triage_max_concurrency": self.triage_max_concurrency,
+            "watch_max_concurrency": self.watch_max_concurrency,
+            "watch_queue_size": self.watch_queue_size,
+            "watch_poll_interval": self.watch_poll_interval,
             "pr_review_enabled": self.pr_review_enabled,
             "review_own_prs": self.review_own_prs,
             "auto_post_reviews": self.auto_post_reviews,
@@ -1079,6 +1107,11 @@ class GitHubRunnerConfig:
             spam_threshold=settings.get("spam_threshold", 0.75),
             feature_creep_threshold=settings.get("feature_creep_threshold", 0.70),
             enable_triage_comments=settings.get("enable_triage_comments", False),
+            triage_candidate_mode=settings.get("triage_candidate_mode", "indexed"),
+            triage_max_concurrency=settings.get("triage_max_concurrency", 3),
+            watch_max_concurrency=settings.get("watch_max_concurrency", 2),
+            watch_queue_size=settings.get("watch_queue_size", 100),
+            watch_poll_interval=settings.get("watch_poll_interval", 60.0),
             pr_review_enabled=settings.get("pr_review_enabled", False),
             review_own_prs=settings.get("review_own_prs", False),
             auto_post_reviews=settings.get("auto_post_reviews", False),
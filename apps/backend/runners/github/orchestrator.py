@@ -14,6 +14,7 @@ REFACTORED: Service layer architecture - orchestrator delegates to specialized s
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -22,7 +23,7 @@ try:
     # When imported as part of package
     from .bot_detection import BotDetector
     from .context_gatherer import PRContext, PRContextGatherer
-    from .gh_client import GHClient
+    from .gh_client import GHClient, GHCommandError, GHTimeoutError
     from .models import (
         BRANCH_BEHIND_BLOCKER_MSG,
         BRANCH_BEHIND_REASONING,
@@ -36,10 +37,11 @@ try:
         ReviewCategory,
         ReviewSeverity,
         StructuralIssue,
+        TriageCheckpoint,
         TriageResult,
     )
     from .permissions import GitHubPermissionChecker
-    from .rate_limiter import RateLimiter
+    from .rate_limiter import RateLimiter, RateLimitExceeded
     from .services import (
         AutoFixProcessor,
         BatchProcessor,
@@ -51,7 +53,7 @@ except (ImportError, ValueError, SystemError):
     # When imported directly (runner.py adds github dir to path)
     from bot_detection import BotDetector
     from context_gatherer import PRContext, PRContextGatherer
-    from gh_client import GHClient
+    from gh_client import GHClient, GHCommandError, GHTimeoutError
     from models import (
         BRANCH_BEHIND_BLOCKER_MSG,
         BRANCH_BEHIND_REASONING,
@@ -65,10 +67,11 @@ except (ImportError, ValueError, SystemError):
         ReviewCategory,
         ReviewSeverity,
         StructuralIssue,
+        TriageCheckpoint,
         TriageResult,
     )
     from permissions import GitHubPermissionChecker
-    from rate_limiter import RateLimiter
+    from rate_limiter import RateLimiter, RateLimitExceeded
     from services import (
         AutoFixProcessor,
         BatchProcessor,
@@ -221,6 +224,10 @@ class GitHubOrchestrator:
         """Fetch issue data from GitHub API via gh CLI."""
         return await self.gh_client.issue_get(issue_number)
 
+    async def _fetch_issues_bulk(self, issue_numbers: list[int]) -> list[dict]:
+        """Fetch several issues in batched GraphQL requests."""
+        return await self.gh_client.issue_get_many(issue_numbers)
+
     async def _fetch_open_issues(self, limit: int = 200) -> list[dict]:
         """Fetch all open issues from the repository (up to 200)."""
         return await self.gh_client.issue_list(state="open", limit=limit)
@@ -310,8 +317,35 @@ class GitHubOrchestrator:
     # PR REVIEW WORKFLOW
     # =========================================================================
 
+    async def prefetch_pr_bundles(self, pr_numbers: list[int]) -> dict[int, dict]:
+        """
+        Fetch review context bundles for a queue of PRs in batched GraphQL requests.
+
+        Pass each bundle to review_pr(..., bundle=...) to skip that PR's own
+        fetch. Returns an empty mapping if the batched fetch fails; the
+        reviews then fetch their PRs individually.
+
+        Args:
+            pr_numbers: PRs about to be reviewed
+
+        Returns:
+            Mapping of PR number to bundle
+        """
+        if not pr_numbers or not self.config.repo:
+            return {}
+        try:
+            return await PRContextGatherer.prefetch_bundles(
+                self.project_dir, pr_numbers, self.config.repo
+            )
+        except (GHCommandError, GHTimeoutError, RateLimitExceeded) as e:
+            safe_print(f"[Context] Batched PR fetch failed: {e}")
+            return {}
+
     async def review_pr(
-        self, pr_number: int, force_review: bool = False
+        self,
+        pr_number: int,
+        force_review: bool = False,
+        bundle: dict | None = None,
     ) -> PRReviewResult:
         """
         Perform AI-powered review of a pull request.
@@ -320,6 +354,7 @@ class GitHubOrchestrator:
             pr_number: The PR number to review
             force_review: If True, bypass the "already reviewed" check and force a new review.
                          Useful for re-validating a PR or testing the review system.
+            bundle: PR bundle from prefetch_pr_bundles(), if already fetched
 
         Returns:
             PRReviewResult with findings and overall assessment
@@ -339,7 +374,7 @@ class GitHubOrchestrator:
             # Gather PR context
             safe_print("[DEBUG orchestrator] Creating context gatherer...")
             gatherer = PRContextGatherer(
-                self.project_dir, pr_number, repo=self.config.repo
+                self.project_dir, pr_number, repo=self.config.repo, bundle=bundle
             )
 
             safe_print("[DEBUG orchestrator] Gathering PR context...")
@@ -1433,45 +1468,99 @@ class GitHubOrchestrator:
         self,
         issue_numbers: list[int] | None = None,
         apply_labels: bool = False,
+        max_concurrency: int | None = None,
+        resume: bool = False,
+        use_checkpoint: bool = True,
     ) -> list[TriageResult]:
         """
         Triage issues to detect duplicates, spam, and feature creep.
 
+        Issues are fetched in bulk and triaged by a bounded pool of concurrent
+        AI sessions. Each result is saved as soon as it completes, and a
+        checkpoint records progress so an interrupted run can be resumed.
+        Scheduling stops early (leaving the checkpoint) if the AI cost budget
+        runs out.
+
         Args:
             issue_numbers: Specific issues to triage, or None for all open issues
+                (or the interrupted run's issues when resuming)
             apply_labels: Whether to apply suggested labels to GitHub
+            max_concurrency: Concurrent triage sessions (default from config)
+            resume: Skip issues an interrupted run already triaged
+            use_checkpoint: Record progress in the triage checkpoint; callers
+                triaging single issues alongside a CLI run (the watch daemon)
+                pass False so they leave its checkpoint alone
 
         Returns:
-            List of TriageResult for each issue
+            List of TriageResult for each triaged issue, in issue order
         """
         self._report_progress("fetching", 10, "Fetching issues...")
 
+        checkpoint = (
+            TriageCheckpoint.load(self.github_dir)
+            if resume and use_checkpoint
+            else None
+        )
+        if checkpoint and not issue_numbers:
+            issue_numbers = checkpoint.issue_numbers
+
         # Fetch issues
         if issue_numbers:
-            issues = []
-            for num in issue_numbers:
-                issues.append(await self._fetch_issue_data(num))
+            issues = await self._fetch_issues_bulk(issue_numbers)
         else:
             issues = await self._fetch_open_issues()
 
         if not issues:
+            if use_checkpoint:
+                TriageCheckpoint.clear(self.github_dir)
             return []
 
-        results = []
+        numbers = [issue["number"] for issue in issues]
+        results: dict[int, TriageResult] = {}
+        if checkpoint:
+            for num in set(checkpoint.completed) & set(numbers):
+                previous = TriageResult.load(self.github_dir, num)
+                if previous is not None:
+                    results[num] = previous
+            if results:
+                safe_print(f"Resuming triage: {len(results)} issues already done")
+
+        checkpoint = TriageCheckpoint(issue_numbers=numbers, completed=list(results))
+        if use_checkpoint:
+            await checkpoint.save(self.github_dir)
+
         total = len(issues)
+        concurrency = max(1, max_concurrency or self.config.triage_max_concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        checkpoint_lock = asyncio.Lock()
+        # Set when the budget runs out or a session fails: sessions already
+        # running finish and save, no new ones start
+        stopped = False
+
+        async def triage_one(issue: dict) -> None:
+            nonlocal stopped
+            async with semaphore:
+                if stopped:
+                    return
+                available, message = self.rate_limiter.check_cost_available()
+                if not available:
+                    stopped = True
+                    safe_print(f"Stopping triage: {message}")
+                    return
 
-        for i, issue in enumerate(issues):
-            progress = 20 + int(60 * (i / total))
-            self._report_progress(
-                "analyzing",
-                progress,
-                f"Analyzing issue #{issue['number']}...",
-                issue_number=issue["number"],
-            )
+                self._report_progress(
+                    "analyzing",
+                    20 + int(60 * (len(results) / total)),
+                    f"Analyzing issue #{issue['number']}...",
+                    issue_number=issue["number"],
+                )
 
-            # Delegate to triage engine
-            result = await self.triage_engine.triage_single_issue(issue, issues)
-            results.append(result)
+                # Delegate to triage engine
+                try:
+                    result = await self.triage_engine.triage_single_issue(issue, issues)
+                except Exception:
+                    stopped = True
+                    raise
 
             # Apply labels if requested
             if apply_labels and (result.labels_to_add or result.labels_to_remove):
@@ -1483,11 +1572,36 @@ class GitHubOrchestrator:
                 except Exception as e:
                     safe_print(f"Failed to apply labels to #{issue['number']}: {e}")
 
-            # Save result
+            # Save result, then mark it done
             await result.save(self.github_dir)
-
-        self._report_progress("complete", 100, f"Triaged {len(results)} issues")
-        return results
+            async with checkpoint_lock:
+                results[issue["number"]] = result
+                checkpoint.completed.append(issue["number"])
+                if use_checkpoint:
+                    await checkpoint.save(self.github_dir)
+
+        outcomes = await asyncio.gather(
+            *(triage_one(issue) for issue in issues if issue["number"] not in results),
+            return_exceptions=True,
+        )
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+        if errors:
+            # The checkpoint keeps completed issues for --resume
+            raise errors[0]
+
+        ordered = [results[num] for num in numbers if num in results]
+        if len(ordered) == total:
+            if use_checkpoint:
+                TriageCheckpoint.clear(self.github_dir)
+            self._report_progress("complete", 100, f"Triaged {total} issues")
+        else:
+            self._report_progress(
+                "complete",
+                100,
+                f"Triaged {len(ordered)} of {total} issues "
+                "(stopped early, rerun with --resume)",
+            )
+        return ordered
 
     # =========================================================================
     # AUTO-FIX WORKFLOW
@@ -4,6 +4,8 @@ Rate Limiting Protection for GitHub Automation
 
 Comprehensive rate limiting system that protects against:
 1. GitHub API rate limits (5000 req/hour for authenticated users)
+   - REST calls consume tokens from a local bucket
+   - GraphQL queries are charged in points, as reported by GitHub
 2. AI API cost overruns (configurable budget per run)
 3. Thundering herd problems (exponential backoff)
 
@@ -324,6 +326,14 @@ class RateLimiter:
         self.github_errors = 0
         self.start_time = datetime.now()
 
+        # GraphQL API: a separate points budget. GitHub reports the real
+        # cost and remaining points with each query that asks for rateLimit.
+        self.graphql_remaining: int | None = None
+        self.graphql_reset_at: float | None = None  # Epoch seconds
+        self.graphql_queries = 0
+        self.graphql_points = 0
+        self.graphql_rate_limited = 0
+
         RateLimiter._initialized = True
 
     @classmethod
@@ -392,6 +402,93 @@ class RateLimiter:
         wait_time = self.github_bucket.time_until_available()
         return False, f"Rate limited. Wait {wait_time:.1f}s for next request"
 
+    def check_graphql_available(self, cost: int = 1) -> tuple[bool, str]:
+        """
+        Check if the GraphQL points budget covers a query.
+
+        Args:
+            cost: Estimated points the query will cost
+
+        Returns:
+            (available, message) tuple
+        """
+        remaining = self._graphql_remaining()
+        if remaining is None:
+            return True, "GraphQL budget unknown"
+        if remaining >= cost:
+            return True, f"{remaining} GraphQL points available"
+
+        wait_time = max(0.0, (self.graphql_reset_at or 0) - time.time())
+        return False, (
+            f"GraphQL rate limited ({remaining} points left, need {cost}). "
+            f"Resets in {wait_time:.0f}s"
+        )
+
+    async def acquire_graphql(
+        self, cost: int = 1, timeout: float | None = None
+    ) -> bool:
+        """
+        Reserve GraphQL points for a query, waiting for the reset if needed.
+
+        The reservation is corrected by record_graphql_cost() once GitHub
+        reports the actual cost, so concurrent queries don't overshoot.
+
+        Args:
+            cost: Estimated points the query will cost
+            timeout: Maximum time to wait for the reset (None = wait forever)
+
+        Returns:
+            True if permission granted, False if timeout
+        """
+        available, msg = self.check_graphql_available(cost)
+        if not available:
+            wait_time = max(0.0, (self.graphql_reset_at or 0) - time.time())
+            if timeout is not None and wait_time > timeout:
+                self.graphql_rate_limited += 1
+                return False
+            await asyncio.sleep(wait_time)
+
+        remaining = self._graphql_remaining()
+        if remaining is not None:
+            self.graphql_remaining = max(0, remaining - cost)
+        return True
+
+    def record_graphql_cost(
+        self,
+        cost: int,
+        remaining: int | None = None,
+        reset_at: str | None = None,
+    ) -> None:
+        """
+        Record the rateLimit block GitHub returned for a GraphQL query.
+
+        Args:
+            cost: Points the query cost
+            remaining: Points left in the current window
+            reset_at: ISO timestamp when the window resets
+        """
+        self.graphql_queries += 1
+        self.graphql_points += cost
+        if remaining is not None:
+            self.graphql_remaining = remaining
+        if reset_at:
+            try:
+                self.graphql_reset_at = datetime.fromisoformat(
+                    reset_at.replace("Z", "+00:00")
+                ).timestamp()
+            except ValueError:
+                pass
+
+    def _graphql_remaining(self) -> int | None:
+        """Remaining GraphQL points, or None if unknown or the window reset."""
+        if self.graphql_remaining is None:
+            return None
+        if self.graphql_reset_at is not None and time.time() >= self.graphql_reset_at:
+            self.graphql_remaining = None
+            self.graphql_reset_at = None
+            return None
+        return self.graphql_remaining
+
     def track_ai_cost(
         self,
         input_tokens: int,
@@ -457,6 +554,12 @@ class RateLimiter:
                 "available_tokens": self.github_bucket.available(),
                 "requests_per_second": self.github_requests / max(runtime, 1),
             },
+            "graphql": {
+                "queries": self.graphql_queries,
+                "points_used": self.graphql_points,
+                "points_remaining": self._graphql_remaining(),
+                "rate_limited": self.graphql_rate_limited,
+            },
             "cost": {
                 "total_cost": self.cost_tracker.total_cost,
                 "budget": self.cost_tracker.cost_limit,
@@ -481,6 +584,8 @@ class RateLimiter:
             f"  Errors: {stats['github']['errors']}",
             f"  Available Tokens: {stats['github']['available_tokens']}",
             f"  Rate: {stats['github']['requests_per_second']:.2f} req/s",
+            f"  GraphQL Queries: {stats['graphql']['queries']} "
+            f"({stats['graphql']['points_used']} points)",
             "",
             "AI Cost:",
             f"  Total: ${stats['cost']['total_cost']:.4f}",
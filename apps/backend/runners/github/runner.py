@@ -19,6 +19,9 @@ Usage:
     # Triage specific issues
     python runner.py triage 1 2 3
 
+    # Resume an interrupted triage run
+    python runner.py triage --resume
+
     # Start auto-fix for an issue
     python runner.py auto-fix 456
 
@@ -36,6 +39,9 @@ Usage:
 
     # Show batch status
     python runner.py batch-status
+
+    # Watch for issue/PR events (incremental polling, plus webhooks on a port)
+    python runner.py watch --webhook-port 8787
 """
 
 from __future__ import annotations
@@ -356,6 +362,8 @@ async def cmd_triage(args) -> int:
     results = await orchestrator.triage_issues(
         issue_numbers=issue_numbers,
         apply_labels=args.apply_labels,
+        max_concurrency=args.concurrency,
+        resume=args.resume,
     )
 
     safe_print(f"\n{'=' * 60}")
@@ -487,6 +495,62 @@ async def cmd_queue(args) -> int:
     return 0
 
 
+async def cmd_watch(args) -> int:
+    """Run the watch daemon until interrupted."""
+    from watch import WatchDaemon
+
+    config = get_config(args)
+    if args.review:
+        config.pr_review_enabled = True
+    if args.triage:
+        config.triage_enabled = True
+    if args.auto_fix:
+        config.auto_fix_enabled = True
+    orchestrator = GitHubOrchestrator(
+        project_dir=args.project,
+        config=config,
+        progress_callback=print_progress,
+    )
+
+    daemon = WatchDaemon(
+        orchestrator,
+        max_concurrency=args.concurrency,
+        queue_size=args.queue_size,
+        poll_interval=args.poll_interval,
+        apply_triage_labels=args.apply_labels,
+    )
+    enabled = [
+        name
+        for name, on in (
+            ("review", config.pr_review_enabled),
+            ("triage", config.triage_enabled),
+            ("auto-fix", config.auto_fix_enabled),
+        )
+        if on
+    ]
+    safe_print(
+        f"Watching {config.repo or 'repository'} "
+        f"(jobs: {', '.join(enabled) or 'none'}, "
+        f"concurrency: {daemon.max_concurrency}, queue: {daemon.queue.maxsize})"
+    )
+    if args.webhook_port is not None:
+        safe_print(f"Webhook receiver on {args.webhook_host}:{args.webhook_port}")
+    if daemon.poll_interval > 0:
+        safe_print(f"Polling every {daemon.poll_interval:g}s since {daemon.since}")
+
+    try:
+        await daemon.run(
+            webhook_host=args.webhook_host,
+            webhook_port=args.webhook_port,
+            webhook_secret=args.webhook_secret
+            or os.environ.get("GITHUB_WEBHOOK_SECRET"),
+        )
+    finally:
+        safe_print(f"Watch stopped. Jobs: {json.dumps(daemon.queue.stats.to_dict())}")
+
+    return 0
+
+
 async def cmd_batch_issues(args) -> int:
     """Batch similar issues and create combined specs."""
     config = get_config(args)
@@ -740,6 +804,17 @@ def main():
         action="store_true",
         help="Apply suggested labels to GitHub",
     )
+    triage_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Issues to triage concurrently (default: triage_max_concurrency)",
+    )
+    triage_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted triage run, skipping issues already triaged",
+    )
 
     # auto-fix command
     autofix_parser = subparsers.add_parser("auto-fix", help="Start auto-fix for issue")
@@ -795,6 +870,66 @@ def main():
         help="Output JSON for programmatic use",
     )
 
+    # watch command
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Watch for issue/PR events and dispatch review, triage and auto-fix",
+    )
+    watch_parser.add_argument(
+        "--webhook-port",
+        type=int,
+        default=None,
+        help="Receive GitHub webhooks on this port (default: polling only)",
+    )
+    watch_parser.add_argument(
+        "--webhook-host",
+        type=str,
+        default="127.0.0.1",
+        help="Interface for the webhook receiver (default: 127.0.0.1)",
+    )
+    watch_parser.add_argument(
+        "--webhook-secret",
+        type=str,
+        default=None,
+        help=(
+            "Webhook secret for signature checks (or set GITHUB_WEBHOOK_SECRET); "
+            "deliveries are rejected without one"
+        ),
+    )
+    watch_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Seconds between incremental polls, 0 to disable "
+        "(default: watch_poll_interval)",
+    )
+    watch_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Jobs to run concurrently (default: watch_max_concurrency)",
+    )
+    watch_parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=None,
+        help="Pending job limit (default: watch_queue_size)",
+    )
+    watch_parser.add_argument(
+        "--review", action="store_true", help="Review PRs on new commits"
+    )
+    watch_parser.add_argument(
+        "--triage", action="store_true", help="Triage newly opened issues"
+    )
+    watch_parser.add_argument(
+        "--auto-fix", action="store_true", help="Auto-fix issues with auto-fix labels"
+    )
+    watch_parser.add_argument(
+        "--apply-labels",
+        action="store_true",
+        help="Apply suggested triage labels to GitHub",
+    )
+
     # approve-batches command
     approve_parser = subparsers.add_parser(
         "approve-batches",
@@ -828,6 +963,7 @@ def main():
         "batch-status": cmd_batch_status,
         "analyze-preview": cmd_analyze_preview,
         "approve-batches": cmd_approve_batches,
+        "watch": cmd_watch,
     }
 
     handler = commands.get(args.command)
@@ -7,15 +7,16 @@ Handles automatic issue fixing workflow including permissions and state manageme
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 try:
     from ..models import AutoFixState, AutoFixStatus, GitHubRunnerConfig
     from ..permissions import GitHubPermissionChecker
+    from ..state_index import StateIndex
 except (ImportError, ValueError, SystemError):
     from models import AutoFixState, AutoFixStatus, GitHubRunnerConfig
     from permissions import GitHubPermissionChecker
+    from state_index import StateIndex
 
 
 class AutoFixProcessor:
@@ -151,22 +152,14 @@ class AutoFixProcessor:
             raise
 
     async def get_queue(self) -> list[AutoFixState]:
-        """Get all issues in the auto-fix queue."""
-        issues_dir = self.github_dir / "issues"
-        if not issues_dir.exists():
-            return []
-
+        """Get all issues in the auto-fix queue, newest first."""
         queue = []
-        for f in issues_dir.glob("autofix_*.json"):
+        for data in StateIndex(self.github_dir).autofix_queue():
             try:
-                issue_number = int(f.stem.replace("autofix_", ""))
-                state = AutoFixState.load(self.github_dir, issue_number)
-                if state:
-                    queue.append(state)
-            except (ValueError, json.JSONDecodeError):
+                queue.append(AutoFixState.from_dict(data))
+            except (KeyError, ValueError):
                 continue
-
-        return sorted(queue, key=lambda s: s.created_at, reverse=True)
+        return queue
 
     async def check_labeled_issues(
         self, all_issues: list[dict], verify_permissions: bool = True
@@ -7,15 +7,16 @@ Handles batch processing of similar issues.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 try:
     from ..models import AutoFixState, AutoFixStatus, GitHubRunnerConfig
+    from ..state_index import StateIndex
     from .io_utils import safe_print
 except (ImportError, ValueError, SystemError):
     from models import AutoFixState, AutoFixStatus, GitHubRunnerConfig
     from services.io_utils import safe_print
+    from state_index import StateIndex
 
 
 class BatchProcessor:
@@ -101,22 +102,13 @@ class BatchProcessor:
             self._report_progress("batching", 20, "Computing similarity matrix...")
 
             # Get already-processed issue numbers
-            existing_states = []
-            issues_dir = self.github_dir / "issues"
-            if issues_dir.exists():
-                for f in issues_dir.glob("autofix_*.json"):
-                    try:
-                        issue_num = int(f.stem.replace("autofix_", ""))
-                        state = AutoFixState.load(self.github_dir, issue_num)
-                        if state and state.status not in [
-                            AutoFixStatus.FAILED,
-                            AutoFixStatus.COMPLETED,
-                        ]:
-                            existing_states.append(issue_num)
-                    except (ValueError, json.JSONDecodeError):
-                        continue
-
-            exclude_issues = set(existing_states)
+            in_progress = StateIndex(self.github_dir).autofix_queue(
+                exclude_statuses=[
+                    AutoFixStatus.FAILED.value,
+                    AutoFixStatus.COMPLETED.value,
+                ]
+            )
+            exclude_issues = {data["issue_number"] for data in in_progress}
 
             self._report_progress(
                 "batching", 40, "Clustering and validating batches with AI..."
@@ -0,0 +1,213 @@
+"""
+Review Shards
+=============
+
+Splits an oversized PR into review shards that each fit a specialist's
+context, so large PRs are reviewed in full instead of from a truncated
+diff.
+
+A shard is a run of changed files (in path order, so neighbouring files
+are reviewed together) whose patches fit within a character budget. A
+single file whose patch exceeds the budget is split at hunk boundaries
+into several parts, each repeating the file header.
+
+Specialists run once per shard; `merge_shard_findings` then collapses
+what one specialist reported more than once across shards before the
+usual cross-agent validation.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Patch characters per shard. Below the specialist prompt's own 150K diff
+# limit to leave room for the file list and instructions.
+DEFAULT_SHARD_CHARS = 120_000
+
+# Upper bound on shards per review (each shard runs every specialist)
+MAX_REVIEW_SHARDS = 20
+
+# Characters a file costs in a shard besides its patch (list entry, header)
+_FILE_OVERHEAD_CHARS = 100
+
+_HUNK_RE = re.compile(r"^@@ ", re.MULTILINE)
+
+_SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+@dataclass
+class ReviewShard:
+    """A slice of a PR's changed files reviewed in one specialist pass."""
+
+    index: int
+    files: list[Any] = field(default_factory=list)
+    chars: int = 0
+
+    @property
+    def paths(self) -> list[str]:
+        """Distinct file paths in this shard, in order."""
+        return list(dict.fromkeys(f.path for f in self.files))
+
+
+@dataclass
+class ShardPlan:
+    """How a PR's changed files were divided into review shards."""
+
+    shards: list[ReviewShard]
+    skipped_paths: list[str] = field(default_factory=list)
+
+    @property
+    def is_sharded(self) -> bool:
+        return len(self.shards) > 1
+
+
+def _file_cost(changed_file: Any) -> int:
+    return len(changed_file.patch or "") + len(changed_file.path) + _FILE_OVERHEAD_CHARS
+
+
+def split_patch(patch: str, max_chars: int) -> list[str]:
+    """
+    Split a unified diff patch into parts of at most `max_chars`.
+
+    Splits at hunk boundaries, repeating the file header (the lines before
+    the first hunk) in every part. A single hunk larger than the budget is
+    cut and marked as truncated.
+
+    Args:
+        patch: Unified diff for one file
+        max_chars: Character budget per part
+
+    Returns:
+        The patch parts (the patch itself if it already fits)
+    """
+    if len(patch) <= max_chars:
+        return [patch]
+
+    starts = [m.start() for m in _HUNK_RE.finditer(patch)]
+    if not starts:
+        return [patch[:max_chars] + "\n... (patch truncated)"]
+
+    header = patch[: starts[0]]
+    hunks = [patch[start:end] for start, end in zip(starts, starts[1:] + [len(patch)])]
+    room = max(max_chars - len(header), 1)
+
+    parts: list[str] = []
+    current = ""
+    for hunk in hunks:
+        if len(hunk) > room:
+            hunk = hunk[:room] + "\n... (hunk truncated)\n"
+        if current and len(current) + len(hunk) > room:
+            parts.append(header + current)
+            current = ""
+        current += hunk
+    if current:
+        parts.append(header + current)
+    return parts
+
+
+def build_review_shards(
+    changed_files: list[Any],
+    max_chars: int = DEFAULT_SHARD_CHARS,
+    max_shards: int = MAX_REVIEW_SHARDS,
+) -> ShardPlan:
+    """
+    Pack changed files into review shards.
+
+    Args:
+        changed_files: ChangedFile objects (path, patch, additions, ...)
+        max_chars: Patch character budget per shard
+        max_shards: Files that don't fit into this many shards are skipped
+
+    Returns:
+        ShardPlan; a single shard with every file when the PR fits at once
+    """
+    if sum(_file_cost(f) for f in changed_files) <= max_chars:
+        return ShardPlan(shards=[ReviewShard(0, list(changed_files))])
+
+    pieces: list[Any] = []
+    for changed_file in sorted(changed_files, key=lambda f: f.path):
+        if _file_cost(changed_file) <= max_chars:
+            pieces.append(changed_file)
+            continue
+        budget = max_chars - len(changed_file.path) - _FILE_OVERHEAD_CHARS
+        for part in split_patch(changed_file.patch, budget):
+            pieces.append(replace(changed_file, patch=part))
+
+    shards: list[ReviewShard] = []
+    skipped: list[str] = []
+    current = ReviewShard(0)
+    for piece in pieces:
+        cost = _file_cost(piece)
+        if current.files and current.chars + cost > max_chars:
+            shards.append(current)
+            current = ReviewShard(len(shards))
+        if len(shards) >= max_shards:
+            skipped.append(piece.path)
+            continue
+        current.files.append(piece)
+        current.chars += cost
+    if current.files and len(shards) < max_shards:
+        shards.append(current)
+
+    skipped = list(dict.fromkeys(skipped))
+    if skipped:
+        logger.warning(
+            f"PR diff needs more than {max_shards} review shards; "
+            f"{len(skipped)} files will not be reviewed"
+        )
+    return ShardPlan(shards=shards, skipped_paths=skipped)
+
+
+def shard_context(context: Any, shard: ReviewShard) -> Any:
+    """A copy of a PRContext limited to one shard's files."""
+    return replace(
+        context,
+        changed_files=shard.files,
+        diff="",
+        total_additions=sum(f.additions for f in shard.files),
+        total_deletions=sum(f.deletions for f in shard.files),
+    )
+
+
+def merge_shard_findings(findings: list[Any]) -> list[Any]:
+    """
+    Collapse findings one specialist reported in more than one shard.
+
+    A file split across shards, or one a specialist read while reviewing
+    another shard, can produce the same finding twice from the same agent.
+    Left in, cross-validation would count the repeat as agreement between
+    agents. Keeps the most severe (then most confident) of each
+    (agents, file, line, category) group, in first-seen order.
+
+    Args:
+        findings: PRReviewFinding objects from every shard
+
+    Returns:
+        Findings with per-agent repeats removed
+    """
+    best: dict[tuple, Any] = {}
+    for finding in findings:
+        key = (
+            tuple(sorted(finding.source_agents or [])),
+            finding.file,
+            finding.line,
+            finding.category.value,
+        )
+        kept = best.get(key)
+        if kept is None or _finding_rank(finding) < _finding_rank(kept):
+            best[key] = finding
+
+    kept_ids = {id(f) for f in best.values()}
+    return [f for f in findings if id(f) in kept_ids]
+
+
+def _finding_rank(finding: Any) -> tuple[int, float]:
+    return (
+        _SEVERITY_RANK.get(finding.severity.value, 99),
+        -(finding.confidence or 0.0),
+    )
@@ -0,0 +1,323 @@
+"""
+Issue Token Index
+=================
+
+Candidate-duplicate lookup for issue triage.
+
+Triage used to compare each issue's title against every other open issue,
+which is O(N²) string work over a full triage run. IssueTokenIndex is built
+once per run and queried per issue:
+
+- Inverted index: token -> issues containing it, with IDF weights so rare
+  tokens ("segfault", "oauth") count more than common ones ("error")
+- MinHash/LSH: one-permutation MinHash signatures of title+body tokens,
+  banded into LSH buckets, surfacing issues with similar bodies even when
+  their titles share little
+
+Two query modes:
+- "indexed" (default): candidates from the inverted index and LSH buckets,
+  ranked by IDF-weighted title overlap blended with estimated body Jaccard
+- "overlap": the original semantics - issues whose lowercased title words
+  cover more than 30% of the query title's words, in issue order - answered
+  from the index with prefix filtering instead of a full scan
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import math
+import operator
+import re
+from collections import Counter
+from dataclasses import dataclass
+from fractions import Fraction
+
+MODE_INDEXED = "indexed"
+MODE_OVERLAP = "overlap"
+CANDIDATE_MODES = (MODE_INDEXED, MODE_OVERLAP)
+
+# Title word overlap above which "overlap" mode reports a candidate
+OVERLAP_THRESHOLD = 0.3
+# Exact value, so the prefix-filter bound has no float rounding
+_OVERLAP_FRACTION = Fraction(str(OVERLAP_THRESHOLD))
+
+# "indexed" mode reports an issue if its IDF-weighted title overlap exceeds
+# MIN_TITLE_SCORE or its estimated title+body Jaccard reaches MIN_BODY_SCORE
+MIN_TITLE_SCORE = 0.3
+MIN_BODY_SCORE = 0.5
+
+# Weight of title overlap vs. body similarity when ranking candidates
+TITLE_WEIGHT = 0.7
+
+# MinHash signature size and LSH banding (BANDS * ROWS == NUM_BINS)
+NUM_BINS = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_BINS // LSH_BANDS
+
+# Tokens in more than this fraction of issues (and more than MIN_MAX_DF
+# issues) are not used to find candidates: title tokens still count when
+# scoring, body tokens are left out of MinHash signatures
+MAX_DF_FRACTION = 0.02
+MIN_MAX_DF = 200
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be but by can do does for from has have how i if in is "
+    "it its not of on or so that the this to was we what when where which while "
+    "with would you".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords or single characters."""
+    return [
+        t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS
+    ]
+
+
+# Larger than any bin value (64-bit hash // NUM_BINS)
+_DENSIFY_OFFSET = 1 << 64
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+    )
+
+
+def minhash_signature(tokens: set[str]) -> tuple[int, ...]:
+    """
+    One-permutation MinHash: hash each token once, keep the minimum per bin.
+
+    Empty bins are densified by borrowing the next filled bin's value (with
+    an offset per hop), so short texts still produce full signatures. An
+    empty token set yields all -1, which never matches anything.
+    """
+    bins = [-1] * NUM_BINS
+    for token in tokens:
+        h = _token_hash(token)
+        b = h % NUM_BINS
+        value = h // NUM_BINS
+        if bins[b] < 0 or value < bins[b]:
+            bins[b] = value
+
+    if tokens:
+        filled = [b for b in range(NUM_BINS) if bins[b] >= 0]
+        densified = list(bins)
+        for b in range(NUM_BINS):
+            if bins[b] >= 0:
+                continue
+            # Next filled bin to the right (circular)
+            hop = next((f - b for f in filled if f > b), filled[0] + NUM_BINS - b)
+            densified[b] = bins[(b + hop) % NUM_BINS] + hop * _DENSIFY_OFFSET
+        bins = densified
+    return tuple(bins)
+
+
+def estimate_jaccard(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity from two signatures."""
+    # Signatures are either fully densified or all-empty
+    if not a or not b or a[0] < 0 or b[0] < 0:
+        return 0.0
+    return sum(map(operator.eq, a, b)) / len(a)
+
+
+@dataclass
+class _IndexedIssue:
+    position: int
+    issue: dict
+    title_words: frozenset[str]  # lower().split(), for overlap mode
+    title_tokens: frozenset[str]
+    signature: tuple[int, ...] = ()
+
+
+class IssueTokenIndex:
+    """
+    Prebuilt token index over a set of issues.
+
+    Example:
+        index = IssueTokenIndex(all_issues)
+        for issue in all_issues:
+            candidates = index.candidates(issue, limit=5)
+    """
+
+    def __init__(self, issues: list[dict], mode: str = MODE_INDEXED):
+        """
+        Build the index.
+
+        Args:
+            issues: Issues with "number", "title" and optional "body"
+            mode: "indexed" or "overlap" (see module docstring)
+        """
+        if mode not in CANDIDATE_MODES:
+            raise ValueError(f"Unknown candidate mode: {mode} (use {CANDIDATE_MODES})")
+        self.mode = mode
+        self.issues = issues
+        self._entries: list[_IndexedIssue] = []
+        self._word_postings: dict[str, list[int]] = {}
+        self._token_postings: dict[str, list[int]] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        self._common_content: frozenset[str] = frozenset()
+
+        total = max(len(issues), 1)
+        self._max_df = max(MIN_MAX_DF, int(total * MAX_DF_FRACTION))
+
+        content: list[set[str]] = []
+        for position, issue in enumerate(issues):
+            entry = self._make_entry(position, issue)
+            self._entries.append(entry)
+            for word in entry.title_words:
+                self._word_postings.setdefault(word, []).append(position)
+            if mode == MODE_INDEXED:
+                for token in entry.title_tokens:
+                    self._token_postings.setdefault(token, []).append(position)
+                content.append(self._content_tokens(issue, entry.title_tokens))
+
+        if mode == MODE_INDEXED:
+            # Tokens in most issues would make every signature agree on the
+            # same bins and collapse the LSH buckets; leave them out
+            content_df = Counter(token for tokens in content for token in tokens)
+            self._common_content = frozenset(
+                token for token, df in content_df.items() if df > self._max_df
+            )
+            for entry, tokens in zip(self._entries, content):
+                entry.signature = minhash_signature(tokens - self._common_content)
+                for key in self._band_keys(entry.signature):
+                    self._buckets.setdefault(key, []).append(entry.position)
+
+        self._idf = {
+            token: math.log(1 + total / len(postings))
+            for token, postings in self._token_postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _make_entry(self, position: int, issue: dict) -> _IndexedIssue:
+        title = issue.get("title") or ""
+        return _IndexedIssue(
+            position=position,
+            issue=issue,
+            title_words=frozenset(title.lower().split()),
+            title_tokens=frozenset(tokenize(title)),
+        )
+
+    @staticmethod
+    def _content_tokens(issue: dict, title_tokens: frozenset[str]) -> set[str]:
+        """Title and body tokens, for the MinHash signature."""
+        return set(tokenize(issue.get("body") or "")) | title_tokens
+
+    @staticmethod
+    def _band_keys(signature: tuple[int, ...]):
+        for band in range(LSH_BANDS):
+            rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+            # Issues without any tokens have all-empty signatures
+            if rows and rows[0] >= 0:
+                yield band, rows
+
+    def candidates(self, issue: dict, limit: int | None = None) -> list[dict]:
+        """
+        Find potential duplicates of an issue.
+
+        Args:
+            issue: The issue being triaged (need not be in the index)
+            limit: Maximum candidates to return (None for all)
+
+        Returns:
+            Candidate issues, best first ("indexed") or in issue order ("overlap")
+        """
+        if self.mode == MODE_OVERLAP:
+            return self._overlap_candidates(issue, limit)
+        found = self._ranked_candidates(issue)
+        return found if limit is None else found[:limit]
+
+    def _overlap_candidates(self, issue: dict, limit: int | None) -> list[dict]:
+        """Title words overlap > OVERLAP_THRESHOLD of the query's words."""
+        words = frozenset((issue.get("title") or "").lower().split())
+        if not words:
+            return []
+
+        # An issue qualifies only if it shares at least `needed` words, so it
+        # must contain one of the (len - needed + 1) rarest query words
+        needed = math.floor(_OVERLAP_FRACTION * len(words)) + 1
+        rarest = sorted(words, key=lambda w: len(self._word_postings.get(w, ())))
+        postings = [
+            self._word_postings.get(w, []) for w in rarest[: len(words) - needed + 1]
+        ]
+
+        # Postings are in issue order; merge them lazily so a limited query
+        # stops at the first `limit` matches
+        number = issue.get("number")
+        matches = []
+        last = -1
+        for position in heapq.merge(*postings):
+            if position == last:
+                continue
+            last = position
+            entry = self._entries[position]
+            if entry.issue.get("number") == number:
+                continue
+            if len(words & entry.title_words) / len(words) > OVERLAP_THRESHOLD:
+                matches.append(entry.issue)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    def _ranked_candidates(self, issue: dict) -> list[dict]:
+        """IDF-weighted title overlap blended with MinHash body similarity."""
+        query = self._make_entry(-1, issue)
+        query.signature = minhash_signature(
+            self._content_tokens(issue, query.title_tokens) - self._common_content
+        )
+        idf_default = math.log(1 + max(len(self._entries), 1))
+        query_weight = sum(self._idf.get(t, idf_default) for t in query.title_tokens)
+
+        shared_weight: Counter[int] = Counter()
+        common: set[str] = set()
+        for token in query.title_tokens:
+            postings = self._token_postings.get(token)
+            if not postings:
+                continue
+            if len(postings) > self._max_df:
+                common.add(token)
+                continue
+            idf = self._idf[token]
+            for position in postings:
+                shared_weight[position] += idf
+
+        lsh_hits: set[int] = set()
+        for key in self._band_keys(query.signature):
+            lsh_hits.update(self._buckets.get(key, ()))
+
+        number = issue.get("number")
+        # Title weight needed to pass MIN_TITLE_SCORE without an LSH hit
+        title_cutoff = MIN_TITLE_SCORE * query_weight - sum(
+            self._idf[t] for t in common
+        )
+        scored = []
+        for position in lsh_hits.union(shared_weight):
+            if shared_weight[position] <= title_cutoff and position not in lsh_hits:
+                continue
+            entry = self._entries[position]
+            if entry.issue.get("number") == number:
+                continue
+            if query_weight:
+                shared = shared_weight[position]
+                if common:
+                    # Common tokens were skipped above; add them back for scoring
+                    shared += sum(self._idf[t] for t in common & entry.title_tokens)
+                title_score = shared / query_weight
+            else:
+                title_score = 0.0
+            # Body similarity is only trusted for LSH hits; others need titles
+            if title_score <= MIN_TITLE_SCORE and position not in lsh_hits:
+                continue
+            body_score = estimate_jaccard(query.signature, entry.signature)
+            if title_score > MIN_TITLE_SCORE or body_score >= MIN_BODY_SCORE:
+                score = TITLE_WEIGHT * title_score + (1 - TITLE_WEIGHT) * body_score
+                scored.append((-score, position, entry.issue))
+
+        scored.sort(key=lambda item: (item[0], item[1]))
+        return [issue for _, _, issue in scored]
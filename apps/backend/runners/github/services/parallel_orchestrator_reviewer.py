@@ -52,6 +52,13 @@ try:
     )
     from .agent_utils import create_working_dir_injector
     from .category_utils import map_category
+    from .diff_shards import (
+        ReviewShard,
+        ShardPlan,
+        build_review_shards,
+        merge_shard_findings,
+        shard_context,
+    )
     from .io_utils import safe_print
     from .pr_worktree_manager import PRWorktreeManager
     from .pydantic_models import (
@@ -61,6 +68,15 @@ try:
         SpecialistResponse,
     )
     from .sdk_utils import process_sdk_stream
+    from .specialist_cache import (
+        SpecialistCache,
+        SpecialistCacheEntry,
+        SpecialistCacheReport,
+        file_patch_hashes,
+        file_set_hash,
+        is_specialist_cache_enabled,
+        specialist_prompt_version,
+    )
 except (ImportError, ValueError, SystemError):
     from context_gatherer import PRContext, _validate_git_ref
     from core.client import create_client
@@ -82,6 +98,13 @@ except (ImportError, ValueError, SystemError):
     )
     from services.agent_utils import create_working_dir_injector
     from services.category_utils import map_category
+    from services.diff_shards import (
+        ReviewShard,
+        ShardPlan,
+        build_review_shards,
+        merge_shard_findings,
+        shard_context,
+    )
     from services.io_utils import safe_print
     from services.pr_worktree_manager import PRWorktreeManager
     from services.pydantic_models import (
@@ -91,6 +114,15 @@ except (ImportError, ValueError, SystemError):
         SpecialistResponse,
     )
     from services.sdk_utils import process_sdk_stream
+    from services.specialist_cache import (
+        SpecialistCache,
+        SpecialistCacheEntry,
+        SpecialistCacheReport,
+        file_patch_hashes,
+        file_set_hash,
+        is_specialist_cache_enabled,
+        specialist_prompt_version,
+    )
 
 
 # =============================================================================
@@ -146,6 +178,9 @@ DEBUG_MODE = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
 # Directory for PR review worktrees (inside github/pr for consistency)
 PR_WORKTREE_DIR = ".auto-claude/github/pr/worktrees"
 
+# Specialist SDK sessions run at once (several per specialist for sharded PRs)
+MAX_CONCURRENT_SPECIALIST_SESSIONS = 8
+
 
 def _is_finding_in_scope(
     finding: PRReviewFinding,
@@ -409,6 +444,8 @@ class ParallelOrchestratorReviewer:
         config: SpecialistConfig,
         context: PRContext,
         project_root: Path,
+        shard: ReviewShard | None = None,
+        shard_count: int = 1,
     ) -> str:
         """Build the full prompt for a specialist agent.
 
@@ -416,6 +453,8 @@ class ParallelOrchestratorReviewer:
             config: Specialist configuration
             context: PR context with files and patches
             project_root: Working directory for the agent
+            shard: Review shard `context` is limited to, for sharded reviews
+            shard_count: Total shards in the review
 
         Returns:
             Full system prompt with context injected
@@ -471,6 +510,12 @@ class ParallelOrchestratorReviewer:
 Analyze this PR for {config.description}.
 Use the Read, Grep, and Glob tools to explore the codebase as needed.
 Report findings with specific file paths, line numbers, and code evidence.
+"""
+        if shard is not None and shard_count > 1:
+            pr_context += f"""
+**Note:** This PR is too large to review at once and is split into {shard_count} shards.
+This is shard {shard.index + 1} of {shard_count}. Only report findings in the files listed
+above; the other shards are reviewed separately.
 """
 
         return prompt_with_cwd + pr_context
@@ -482,7 +527,9 @@ Report findings with specific file paths, line numbers, and code evidence.
         project_root: Path,
         model: str,
         thinking_budget: int | None,
-    ) -> tuple[str, list[PRReviewFinding]]:
+        shard: ReviewShard | None = None,
+        shard_count: int = 1,
+    ) -> tuple[str, list[PRReviewFinding], bool]:
         """Run a single specialist as its own SDK session.
 
         Args:
@@ -491,17 +538,26 @@ Report findings with specific file paths, line numbers, and code evidence.
             project_root: Working directory
             model: Model to use
             thinking_budget: Max thinking tokens
+            shard: Review shard `context` is limited to, for sharded reviews
+            shard_count: Total shards in the review
 
         Returns:
-            Tuple of (specialist_name, findings)
+            Tuple of (specialist_name, findings, completed). `completed` is
+            False when the session failed and `findings` is empty because of it.
         """
+        label = config.name
+        if shard is not None and shard_count > 1:
+            label = f"{config.name}#{shard.index + 1}"
+
         safe_print(
-            f"[Specialist:{config.name}] Starting analysis...",
+            f"[Specialist:{label}] Starting analysis...",
             flush=True,
         )
 
         # Build the specialist prompt with PR context
-        prompt = self._build_specialist_prompt(config, context, project_root)
+        prompt = self._build_specialist_prompt(
+            config, context, project_root, shard=shard, shard_count=shard_count
+        )
 
         try:
             # Create SDK client for this specialist
@@ -533,7 +589,7 @@ Report findings with specific file paths, line numbers, and code evidence.
                 # Process SDK stream
                 stream_result = await process_sdk_stream(
                     client=client,
-                    context_name=f"Specialist:{config.name}",
+                    context_name=f"Specialist:{label}",
                     model=model,
                     system_prompt=prompt,
                     agent_definitions={},  # No subagents for specialists
@@ -541,14 +597,12 @@ Report findings with specific file paths, line numbers, and code evidence.
 
                 error = stream_result.get("error")
                 if error:
-                    logger.error(
-                        f"[Specialist:{config.name}] SDK stream failed: {error}"
-                    )
+                    logger.error(f"[Specialist:{label}] SDK stream failed: {error}")
                     safe_print(
-                        f"[Specialist:{config.name}] Analysis failed: {error}",
+                        f"[Specialist:{label}] Analysis failed: {error}",
                         flush=True,
                     )
-                    return (config.name, [])
+                    return (config.name, [], False)
 
                 # Parse structured output
                 structured_output = stream_result.get("structured_output")
@@ -557,22 +611,22 @@ Report findings with specific file paths, line numbers, and code evidence.
                 )
 
                 safe_print(
-                    f"[Specialist:{config.name}] Complete: {len(findings)} findings",
+                    f"[Specialist:{label}] Complete: {len(findings)} findings",
                     flush=True,
                 )
 
-                return (config.name, findings)
+                return (config.name, findings, True)
 
         except Exception as e:
             logger.error(
-                f"[Specialist:{config.name}] Session failed: {e}",
+                f"[Specialist:{label}] Session failed: {e}",
                 exc_info=True,
             )
             safe_print(
-                f"[Specialist:{config.name}] Error: {e}",
+                f"[Specialist:{label}] Error: {e}",
                 flush=True,
             )
-            return (config.name, [])
+            return (config.name, [], False)
 
     def _parse_specialist_output(
         self,
@@ -707,55 +761,174 @@ Report findings with specific file paths, line numbers, and code evidence.
 
         return findings
 
+    def _specialist_prompt_version(self, config: SpecialistConfig, model: str) -> str:
+        """Cache version of a specialist's prompt, tools, model and thinking level."""
+        return specialist_prompt_version(
+            base_prompt=self._load_prompt(config.prompt_file),
+            description=config.description,
+            tools=config.tools,
+            model=model,
+            thinking_level=self.config.thinking_level or "medium",
+        )
+
     async def _run_parallel_specialists(
         self,
         context: PRContext,
         project_root: Path,
         model: str,
         thinking_budget: int | None,
+        shard_plan: ShardPlan | None = None,
+        cache_report: SpecialistCacheReport | None = None,
     ) -> tuple[list[PRReviewFinding], list[str]]:
         """Run all specialists in parallel and collect findings.
 
+        When the PR is split into review shards, every specialist runs once
+        per shard and the findings one specialist repeated across shards are
+        merged. At most MAX_CONCURRENT_SPECIALIST_SESSIONS sessions run at once.
+
+        Specialists whose cached findings still match the PR (same prompt,
+        head, base and files) are not run again; when only some files
+        changed, a specialist re-runs on those files and keeps its cached
+        findings for the rest.
+
         Args:
             context: PR context
             project_root: Working directory
             model: Model to use
             thinking_budget: Max thinking tokens
+            shard_plan: Review shards for an oversized PR (None = one pass)
+            cache_report: Filled in with which specialists reused findings
 
         Returns:
             Tuple of (all_findings, agents_invoked)
         """
-        safe_print(
-            f"[ParallelOrchestrator] Launching {len(SPECIALIST_CONFIGS)} specialists in parallel...",
-            flush=True,
-        )
+        if shard_plan is None:
+            shard_plan = ShardPlan(shards=[ReviewShard(0, list(context.changed_files))])
+        if cache_report is None:
+            cache_report = SpecialistCacheReport()
+
+        cache = None
+        if is_specialist_cache_enabled() and context.head_sha:
+            cache = SpecialistCache(self.github_dir)
+        patch_hashes = file_patch_hashes(context.changed_files)
+
+        # Work out what each specialist still has to review
+        reused: dict[str, list[PRReviewFinding]] = {}
+        versions: dict[str, str] = {}
+        jobs: list[tuple[SpecialistConfig, PRContext, ReviewShard | None, int]] = []
+        for config in SPECIALIST_CONFIGS:
+            plan = shard_plan
+            if cache is not None:
+                versions[config.name] = self._specialist_prompt_version(config, model)
+                lookup = cache.lookup(
+                    context.pr_number,
+                    config.name,
+                    versions[config.name],
+                    context.head_sha,
+                    context.base_sha,
+                    patch_hashes,
+                )
+                reused[config.name] = lookup.reused_findings
+                if lookup.is_hit:
+                    cache_report.hits.append(config.name)
+                    continue
+                if lookup.reused_files:
+                    cache_report.partial[config.name] = (
+                        lookup.reused_files,
+                        len(patch_hashes),
+                    )
+                    stale = set(lookup.stale_paths)
+                    plan = build_review_shards(
+                        [f for f in context.changed_files if f.path in stale]
+                    )
 
-        # Create tasks for all specialists
-        tasks = [
-            self._run_specialist_session(
-                config=config,
-                context=context,
-                project_root=project_root,
-                model=model,
-                thinking_budget=thinking_budget,
+            if plan is shard_plan and not plan.is_sharded:
+                jobs.append((config, context, None, 1))
+                continue
+            for shard in plan.shards:
+                shard_ctx = shard_context(context, shard)
+                jobs.append((config, shard_ctx, shard, len(plan.shards)))
+
+        if cache_report.hits or cache_report.partial:
+            safe_print(
+                f"[ParallelOrchestrator] Reusing cached findings: "
+                f"{len(cache_report.hits)} specialists unchanged, "
+                f"{len(cache_report.partial)} partially reused",
+                flush=True,
             )
-            for config in SPECIALIST_CONFIGS
-        ]
+        if shard_plan.is_sharded:
+            safe_print(
+                f"[ParallelOrchestrator] PR split into {len(shard_plan.shards)} review shards, "
+                f"launching {len(jobs)} specialist sessions...",
+                flush=True,
+            )
+        else:
+            safe_print(
+                f"[ParallelOrchestrator] Launching {len(jobs)} specialists in parallel...",
+                flush=True,
+            )
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SPECIALIST_SESSIONS)
+
+        async def run_bounded(config, job_context, shard, shard_count):
+            async with semaphore:
+                return await self._run_specialist_session(
+                    config=config,
+                    context=job_context,
+                    project_root=project_root,
+                    model=model,
+                    thinking_budget=thinking_budget,
+                    shard=shard,
+                    shard_count=shard_count,
+                )
 
         # Run all specialists in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(run_bounded(*job) for job in jobs), return_exceptions=True
+        )
 
-        # Collect findings and track which agents ran
-        all_findings: list[PRReviewFinding] = []
+        # Collect findings per specialist and track which agents ran
+        new_findings: dict[str, list[PRReviewFinding]] = defaultdict(list)
+        failed: set[str] = set()
         agents_invoked: list[str] = []
 
-        for result in results:
+        for (config, *_), result in zip(jobs, results):
             if isinstance(result, Exception):
                 logger.error(f"[ParallelOrchestrator] Specialist task failed: {result}")
+                failed.add(config.name)
                 continue
 
-            specialist_name, findings = result
-            agents_invoked.append(specialist_name)
+            specialist_name, findings, completed = result
+            if not completed:
+                failed.add(specialist_name)
+            if specialist_name not in agents_invoked:
+                agents_invoked.append(specialist_name)
+            new_findings[specialist_name].extend(findings)
+
+        all_findings: list[PRReviewFinding] = []
+        for config in SPECIALIST_CONFIGS:
+            name = config.name
+            if name in cache_report.hits:
+                agents_invoked.append(name)
+            findings = reused.get(name, []) + new_findings.get(name, [])
+            if shard_plan.is_sharded or name in cache_report.partial:
+                findings = merge_shard_findings(findings)
+
+            # Cross-validation mutates findings, so store them now
+            if cache is not None and name in versions and name not in failed:
+                if name not in cache_report.hits:
+                    cache.save(
+                        context.pr_number,
+                        SpecialistCacheEntry(
+                            specialist=name,
+                            prompt_version=versions[name],
+                            head_sha=context.head_sha,
+                            base_sha=context.base_sha,
+                            file_set_hash=file_set_hash(patch_hashes),
+                            files=patch_hashes,
+                            findings=[f.to_dict() for f in findings],
+                        ),
+                    )
             all_findings.extend(findings)
 
         safe_print(
@@ -1192,12 +1365,19 @@ The SDK will run invoked agents in parallel automatically.
             # - No dependency on broken CLI features
             # =================================================================
 
+            # Oversized PRs are reviewed in shards that each fit a specialist's
+            # context instead of from a truncated diff
+            shard_plan = build_review_shards(context.changed_files)
+            cache_report = SpecialistCacheReport()
+
             # Run all specialists in parallel
             findings, agents_invoked = await self._run_parallel_specialists(
                 context=context,
                 project_root=project_root,
                 model=model,
                 thinking_budget=thinking_budget,
+                shard_plan=shard_plan,
+                cache_report=cache_report,
             )
 
             # Log results
@@ -1319,6 +1499,8 @@ The SDK will run invoked agents in parallel automatically.
                 blockers=blockers,
                 findings=unique_findings,
                 agents_invoked=agents_invoked,
+                shard_plan=shard_plan,
+                cache_report=cache_report,
             )
 
             # Map verdict to overall_status
@@ -2084,6 +2266,8 @@ For EACH finding above:
         blockers: list[str],
         findings: list[PRReviewFinding],
         agents_invoked: list[str],
+        shard_plan: ShardPlan | None = None,
+        cache_report: SpecialistCacheReport | None = None,
     ) -> str:
         """Generate PR review summary with per-finding evidence details."""
         verdict_emoji = {
@@ -2104,6 +2288,24 @@ For EACH finding above:
             lines.append(f"**Specialist Agents Invoked:** {', '.join(agents_invoked)}")
             lines.append("")
 
+        # Specialists that reused findings from an earlier run
+        cache_line = cache_report.summary_line() if cache_report else None
+        if cache_line:
+            lines.append(cache_line)
+            lines.append("")
+
+        # Large PRs reviewed in shards
+        if shard_plan is not None and shard_plan.is_sharded:
+            lines.append(
+                f"**Review Shards:** {len(shard_plan.shards)} (PR too large to review in one pass)"
+            )
+            if shard_plan.skipped_paths:
+                lines.append(
+                    f"⚠️ {len(shard_plan.skipped_paths)} files exceeded the shard limit "
+                    "and were not reviewed"
+                )
+            lines.append("")
+
         # Blockers
         if blockers:
             lines.append("### 🚨 Blocking Issues")
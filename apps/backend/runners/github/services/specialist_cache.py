@@ -0,0 +1,252 @@
+"""
+Specialist Findings Cache
+=========================
+
+Reuses specialist findings when a PR is reviewed again (retries, label
+changes, crash recovery) instead of re-running every specialist session.
+
+Each specialist's last result for a PR is stored with the key it was
+produced under:
+- specialist name and prompt version (a hash of the prompt, tools, model
+  and thinking level, so prompt or model changes invalidate it)
+- head and base SHA
+- file set hash (the changed files and a hash of each file's patch)
+
+A full key match reuses the specialist's findings outright. When only the
+head moved, findings for files whose patch is unchanged are reused and the
+specialist re-runs on the changed files only.
+
+Layout (under .auto-claude/github/pr/specialist_cache/):
+    <pr_number>/<specialist>.json
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from core.env_flags import env_flag
+
+try:
+    from ..file_lock import atomic_write
+    from ..models import PRReviewFinding
+except (ImportError, ValueError, SystemError):
+    from file_lock import atomic_write
+    from models import PRReviewFinding
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "specialist_cache"
+
+# Bump when the specialist prompt template in ParallelOrchestratorReviewer
+# changes in a way that should invalidate cached findings
+SPECIALIST_PROMPT_TEMPLATE_VERSION = 1
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def specialist_prompt_version(
+    base_prompt: str,
+    description: str,
+    tools: list[str],
+    model: str,
+    thinking_level: str,
+) -> str:
+    """Hash of everything besides the PR that shapes a specialist's findings."""
+    parts = [
+        str(SPECIALIST_PROMPT_TEMPLATE_VERSION),
+        base_prompt,
+        description,
+        ",".join(tools),
+        model,
+        thinking_level,
+    ]
+    return _sha256("\0".join(parts))[:16]
+
+
+def file_patch_hashes(changed_files: list[Any]) -> dict[str, str]:
+    """Hash of each changed file's patch (and status), by path."""
+    return {f.path: _sha256(f"{f.status}\0{f.patch or ''}")[:16] for f in changed_files}
+
+
+def file_set_hash(patch_hashes: dict[str, str]) -> str:
+    """Hash identifying a set of changed files and their patches."""
+    lines = (f"{path}:{patch_hashes[path]}" for path in sorted(patch_hashes))
+    return _sha256("\n".join(lines))[:16]
+
+
+@dataclass
+class SpecialistCacheEntry:
+    """One specialist's findings for a PR and the key they were produced under."""
+
+    specialist: str
+    prompt_version: str
+    head_sha: str
+    base_sha: str
+    file_set_hash: str
+    files: dict[str, str] = field(default_factory=dict)
+    findings: list[dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "specialist": self.specialist,
+            "prompt_version": self.prompt_version,
+            "head_sha": self.head_sha,
+            "base_sha": self.base_sha,
+            "file_set_hash": self.file_set_hash,
+            "files": self.files,
+            "findings": self.findings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpecialistCacheEntry:
+        return cls(
+            specialist=data["specialist"],
+            prompt_version=data["prompt_version"],
+            head_sha=data["head_sha"],
+            base_sha=data["base_sha"],
+            file_set_hash=data["file_set_hash"],
+            files=data.get("files", {}),
+            findings=data.get("findings", []),
+        )
+
+
+@dataclass
+class CacheLookup:
+    """What a specialist can reuse from its cached result."""
+
+    found: bool = False
+    reused_findings: list[PRReviewFinding] = field(default_factory=list)
+    stale_paths: list[str] = field(default_factory=list)
+    reused_files: int = 0
+
+    @property
+    def is_hit(self) -> bool:
+        """True when a cached result covers every changed file."""
+        return self.found and not self.stale_paths
+
+
+@dataclass
+class SpecialistCacheReport:
+    """Cache use across the specialists of one review, for the summary."""
+
+    hits: list[str] = field(default_factory=list)
+    partial: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    def summary_line(self) -> str | None:
+        """One summary line describing reuse, or None if nothing was reused."""
+        if not self.hits and not self.partial:
+            return None
+        parts = []
+        if self.hits:
+            parts.append(f"reused for {', '.join(self.hits)}")
+        for name, (reused, total) in self.partial.items():
+            parts.append(f"{name} reused {reused}/{total} files")
+        return f"**Cached Specialist Results:** {'; '.join(parts)}"
+
+
+class SpecialistCache:
+    """
+    Per-PR store of the last findings of each specialist.
+
+    Usage:
+        cache = SpecialistCache(github_dir)
+        lookup = cache.lookup(pr_number, "security", version, head, base, hashes)
+        ...
+        cache.save(pr_number, entry)
+    """
+
+    def __init__(self, github_dir: Path):
+        self.root = Path(github_dir) / "pr" / CACHE_DIR_NAME
+
+    def _entry_path(self, pr_number: int, specialist: str) -> Path:
+        return self.root / str(pr_number) / f"{specialist}.json"
+
+    def load(self, pr_number: int, specialist: str) -> SpecialistCacheEntry | None:
+        """The specialist's cached entry for a PR, if there is a readable one."""
+        path = self._entry_path(pr_number, specialist)
+        try:
+            return SpecialistCacheEntry.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable specialist cache {path}: {e}")
+            return None
+
+    def lookup(
+        self,
+        pr_number: int,
+        specialist: str,
+        prompt_version: str,
+        head_sha: str,
+        base_sha: str,
+        patch_hashes: dict[str, str],
+    ) -> CacheLookup:
+        """
+        Find the findings a specialist can reuse for the PR as it is now.
+
+        Args:
+            pr_number: PR number
+            specialist: Specialist name
+            prompt_version: From specialist_prompt_version()
+            head_sha: Current PR head SHA
+            base_sha: Current PR base SHA
+            patch_hashes: From file_patch_hashes() for the current changed files
+
+        Returns:
+            CacheLookup; every path is stale when there is no usable entry
+        """
+        miss = CacheLookup(stale_paths=sorted(patch_hashes))
+        entry = self.load(pr_number, specialist)
+        if entry is None or entry.prompt_version != prompt_version:
+            return miss
+
+        try:
+            findings = [PRReviewFinding.from_dict(f) for f in entry.findings]
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Ignoring malformed cached findings for {specialist}: {e}")
+            return miss
+
+        if (
+            entry.head_sha == head_sha
+            and entry.base_sha == base_sha
+            and entry.file_set_hash == file_set_hash(patch_hashes)
+        ):
+            return CacheLookup(
+                found=True, reused_findings=findings, reused_files=len(patch_hashes)
+            )
+
+        # Head moved: reuse findings on files whose patch didn't change.
+        # Findings outside the changed files (impact findings) are dropped, as
+        # they may depend on any of the changes.
+        unchanged = {
+            path
+            for path, digest in patch_hashes.items()
+            if entry.files.get(path) == digest
+        }
+        return CacheLookup(
+            found=True,
+            reused_findings=[f for f in findings if f.file in unchanged],
+            stale_paths=sorted(set(patch_hashes) - unchanged),
+            reused_files=len(unchanged),
+        )
+
+    def save(self, pr_number: int, entry: SpecialistCacheEntry) -> None:
+        """Store a specialist's findings for a PR, replacing the previous entry."""
+        path = self._entry_path(pr_number, entry.specialist)
+        try:
+            with atomic_write(path) as f:
+                json.dump(entry.to_dict(), f)
+        except OSError as e:
+            logger.warning(f"Could not write specialist cache {path}: {e}")
+
+
+def is_specialist_cache_enabled() -> bool:
+    """Whether unchanged specialist findings are reused (PR_REVIEW_SPECIALIST_CACHE)."""
+    return env_flag("PR_REVIEW_SPECIALIST_CACHE", default=True)
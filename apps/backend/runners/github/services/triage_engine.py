@@ -12,11 +12,13 @@ from pathlib import Path
 try:
     from ...phase_config import get_model_betas, resolve_model_id
     from ..models import GitHubRunnerConfig, TriageCategory, TriageResult
+    from .issue_index import IssueTokenIndex
     from .prompt_manager import PromptManager
     from .response_parsers import ResponseParser
 except (ImportError, ValueError, SystemError):
     from models import GitHubRunnerConfig, TriageCategory, TriageResult
     from phase_config import get_model_betas, resolve_model_id
+    from services.issue_index import IssueTokenIndex
     from services.prompt_manager import PromptManager
     from services.response_parsers import ResponseParser
 
@@ -37,6 +39,8 @@ class TriageEngine:
         self.progress_callback = progress_callback
         self.prompt_manager = PromptManager()
         self.parser = ResponseParser()
+        # Candidate-duplicate index, reused while triaging the same issue list
+        self._issue_index: IssueTokenIndex | None = None
 
     def _report_progress(self, phase: str, progress: int, message: str, **kwargs):
         """Report progress if callback is set."""
@@ -113,19 +117,28 @@ class TriageEngine:
                 confidence=0.0,
             )
 
+    def get_issue_index(self, all_issues: list[dict]) -> IssueTokenIndex:
+        """
+        Get the candidate-duplicate index for an issue list.
+
+        The index is built once and reused for every issue triaged against
+        the same list (rebuilt if a different or modified list is passed).
+        """
+        if (
+            self._issue_index is None
+            or self._issue_index.issues is not all_issues
+            or len(self._issue_index) != len(all_issues)
+            or self._issue_index.mode != self.config.triage_candidate_mode
+        ):
+            self._issue_index = IssueTokenIndex(
+                all_issues, mode=self.config.triage_candidate_mode
+            )
+        return self._issue_index
+
     def build_triage_context(self, issue: dict, all_issues: list[dict]) -> str:
         """Build context for triage including potential duplicates."""
-        # Find potential duplicates by title similarity
-        potential_dupes = []
-        for other in all_issues:
-            if other["number"] == issue["number"]:
-                continue
-            # Simple word overlap check
-            title_words = set(issue["title"].lower().split())
-            other_words = set(other["title"].lower().split())
-            overlap = len(title_words & other_words) / max(len(title_words), 1)
-            if overlap > 0.3:
-                potential_dupes.append(other)
+        # Find potential duplicates via the token index
+        potential_dupes = self.get_issue_index(all_issues).candidates(issue, limit=5)
 
         lines = [
             f"## Issue #{issue['number']}",
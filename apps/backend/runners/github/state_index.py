@@ -0,0 +1,457 @@
+"""
+State Index
+===========
+
+SQLite index over the per-item state files in .auto-claude/github:
+
+    pr/review_<n>.json        PR review results     (kind "review")
+    issues/autofix_<n>.json   Auto-fix states       (kind "autofix")
+
+The JSON files stay the source of truth; the frontend reads and writes them
+directly. The index is derived from them and replaces the per-directory
+index.json files, which every save rewrote whole under one lock:
+
+- Saves upsert one row in a short transaction (record()); concurrent saves
+  of different items don't wait on each other
+- Secondary indexes by status and update time back the queue/list queries
+- Incremental sync: each row remembers its file's stat signature, and a
+  query first re-reads only files that changed (or appeared) since and
+  drops rows of deleted files, so files written by other tools are picked up
+- If the database can't be used, queries fall back to reading the files
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "state_index.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS states (
+    kind TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    repo TEXT,
+    status TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_states_status ON states (kind, status);
+CREATE INDEX IF NOT EXISTS idx_states_updated ON states (kind, updated_at);
+CREATE INDEX IF NOT EXISTS idx_states_created ON states (kind, created_at);
+"""
+
+_ORDER_COLUMNS = ("created_at", "updated_at", "number")
+
+
+@dataclass(frozen=True)
+class _Row:
+    """Indexed columns of one state file."""
+
+    repo: str | None
+    status: str | None
+    created_at: str | None
+    updated_at: str | None
+    entry: dict[str, Any]
+
+
+def _review_row(number: int, data: dict[str, Any]) -> _Row:
+    return _Row(
+        repo=data.get("repo"),
+        status=data.get("overall_status"),
+        created_at=data.get("reviewed_at"),
+        updated_at=data.get("reviewed_at"),
+        entry={
+            "pr_number": number,
+            "repo": data.get("repo"),
+            "overall_status": data.get("overall_status"),
+            "findings_count": len(data.get("findings") or []),
+            "reviewed_at": data.get("reviewed_at"),
+            "success": data.get("success", False),
+            "reviewed_commit_sha": data.get("reviewed_commit_sha"),
+        },
+    )
+
+
+def _autofix_row(number: int, data: dict[str, Any]) -> _Row:
+    # Auto-fix states are small: the entry is the whole state
+    return _Row(
+        repo=data.get("repo"),
+        status=data.get("status", "pending"),
+        created_at=data.get("created_at"),
+        updated_at=data.get("updated_at"),
+        entry={"issue_number": number, **data},
+    )
+
+
+@dataclass(frozen=True)
+class _Kind:
+    directory: str
+    prefix: str
+    # (number from the file name, file contents) -> row
+    to_row: Callable[[int, dict[str, Any]], _Row]
+
+
+KINDS: dict[str, _Kind] = {
+    "review": _Kind("pr", "review_", _review_row),
+    "autofix": _Kind("issues", "autofix_", _autofix_row),
+}
+
+
+def _signature(st: os.stat_result) -> tuple[int, int, int]:
+    # atomic_write replaces the file, so the inode changes on every save
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class StateIndex:
+    """
+    SQLite index of the review and auto-fix state files.
+
+    Usage:
+        index = StateIndex(Path(".auto-claude/github"))
+        queue = index.autofix_queue(exclude_statuses=["completed", "failed"])
+        reviews = index.reviews(status="request_changes", limit=20)
+    """
+
+    def __init__(self, github_dir: Path):
+        self.github_dir = Path(github_dir)
+        self.db_path = self.github_dir / INDEX_FILENAME
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.github_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _path(self, kind: str, number: int) -> Path:
+        spec = KINDS[kind]
+        return self.github_dir / spec.directory / f"{spec.prefix}{number}.json"
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def record(self, kind: str, number: int, data: dict[str, Any]) -> None:
+        """
+        Upsert the row for a state file that was just written with `data`.
+
+        Call it while still holding the file's lock, so the stat signature
+        stored with the row is that of the file `data` was written to.
+        """
+        st = self._path(kind, number).stat()
+        with self._transaction() as conn:
+            self._upsert(conn, kind, number, data, st)
+
+    @staticmethod
+    def _upsert(
+        conn: sqlite3.Connection,
+        kind: str,
+        number: int,
+        data: dict[str, Any],
+        st: os.stat_result,
+    ) -> None:
+        row = KINDS[kind].to_row(number, data)
+        conn.execute(
+            "INSERT INTO states (kind, number, repo, status, created_at, "
+            "updated_at, mtime_ns, size, inode, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (kind, number) DO UPDATE SET repo = excluded.repo, "
+            "status = excluded.status, created_at = excluded.created_at, "
+            "updated_at = excluded.updated_at, mtime_ns = excluded.mtime_ns, "
+            "size = excluded.size, inode = excluded.inode, data = excluded.data",
+            (
+                kind,
+                number,
+                row.repo,
+                row.status,
+                row.created_at,
+                row.updated_at,
+                *_signature(st),
+                json.dumps(row.entry),
+            ),
+        )
+
+    # =========================================================================
+    # Sync
+    # =========================================================================
+
+    def _scan(self, kind: str) -> Iterator[tuple[int, Path, os.stat_result]]:
+        """State files of a kind on disk, as (number, path, stat)."""
+        spec = KINDS[kind]
+        try:
+            entries = list(os.scandir(self.github_dir / spec.directory))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(spec.prefix) and name.endswith(".json")):
+                continue
+            try:
+                number = int(name[len(spec.prefix) : -len(".json")])
+                st = entry.stat()
+            except (ValueError, FileNotFoundError):
+                continue
+            yield number, Path(entry.path), st
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.debug(f"Skipping unreadable state file {path}: {e}")
+            return None
+        return data if isinstance(data, dict) else None
+
+    def sync(self) -> int:
+        """
+        Bring the index up to date with the state files.
+
+        Returns:
+            Number of rows added, updated or removed
+        """
+        with self._transaction() as conn:
+            return sum(self._sync_kind(conn, kind) for kind in KINDS)
+
+    def _sync_kind(self, conn: sqlite3.Connection, kind: str) -> int:
+        known = {
+            number: (mtime_ns, size, inode)
+            for number, mtime_ns, size, inode in conn.execute(
+                "SELECT number, mtime_ns, size, inode FROM states WHERE kind = ?",
+                (kind,),
+            )
+        }
+        changed = 0
+        for number, path, st in self._scan(kind):
+            if known.pop(number, None) == _signature(st):
+                continue
+            data = self._read(path)
+            if data is None:
+                continue
+            try:
+                self._upsert(conn, kind, number, data, st)
+            except (KeyError, TypeError) as e:
+                logger.debug(f"Skipping invalid state file {path}: {e}")
+                continue
+            changed += 1
+
+        # What's left in `known` has no file any more
+        conn.executemany(
+            "DELETE FROM states WHERE kind = ? AND number = ?",
+            [(kind, number) for number in known],
+        )
+        return changed + len(known)
+
+    def prune(self, dry_run: bool = False) -> int:
+        """
+        Drop rows whose state file no longer exists (e.g. removed by cleanup).
+
+        Args:
+            dry_run: Only count the rows
+
+        Returns:
+            Number of rows removed (or that would be)
+        """
+        with self._transaction() as conn:
+            stale = [
+                (kind, number)
+                for kind, number in conn.execute("SELECT kind, number FROM states")
+                if kind not in KINDS or not self._path(kind, number).exists()
+            ]
+            if not dry_run:
+                conn.executemany(
+                    "DELETE FROM states WHERE kind = ? AND number = ?", stale
+                )
+        return len(stale)
+
+    def rebuild(self) -> int:
+        """
+        Re-index every state file from scratch.
+
+        Returns:
+            Number of rows indexed
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM states")
+        return self.sync()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def query(
+        self,
+        kind: str,
+        statuses: Iterable[str] | None = None,
+        exclude_statuses: Iterable[str] | None = None,
+        repo: str | None = None,
+        updated_since: str | None = None,
+        order_by: str = "updated_at",
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Index entries of one kind (after syncing), newest first.
+
+        Args:
+            kind: "review" or "autofix"
+            statuses: Only entries with one of these statuses
+            exclude_statuses: Skip entries with these statuses
+            repo: Only entries for this repo
+            updated_since: Only entries updated at or after this ISO timestamp
+            order_by: "created_at", "updated_at" or "number" (descending)
+            limit: Maximum entries to return
+
+        Returns:
+            Entry dicts (the whole state for auto-fix, a summary for reviews)
+        """
+        if order_by not in _ORDER_COLUMNS:
+            raise ValueError(f"Unsupported order: {order_by}")
+        statuses = list(statuses) if statuses is not None else None
+        exclude_statuses = list(exclude_statuses or [])
+
+        try:
+            self.sync()
+            return self._select(
+                kind, statuses, exclude_statuses, repo, updated_since, order_by, limit
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"State index unavailable, reading state files: {e}")
+            return self._query_files(
+                kind, statuses, exclude_statuses, repo, updated_since, order_by, limit
+            )
+
+    def _select(
+        self,
+        kind: str,
+        statuses: list[str] | None,
+        exclude_statuses: list[str],
+        repo: str | None,
+        updated_since: str | None,
+        order_by: str,
+        limit: int | None,
+    ) -> list[dict[str, Any]]:
+        clauses = ["kind = ?"]
+        params: list[Any] = [kind]
+        if statuses is not None:
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if exclude_statuses:
+            clauses.append(f"status NOT IN ({', '.join('?' * len(exclude_statuses))})")
+            params.extend(exclude_statuses)
+        if repo:
+            clauses.append("repo = ?")
+            params.append(repo)
+        if updated_since:
+            clauses.append("updated_at >= ?")
+            params.append(updated_since)
+        sql = (
+            f"SELECT data FROM states WHERE {' AND '.join(clauses)} "
+            f"ORDER BY {order_by} DESC, number DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def _query_files(
+        self,
+        kind: str,
+        statuses: list[str] | None,
+        exclude_statuses: list[str],
+        repo: str | None,
+        updated_since: str | None,
+        order_by: str,
+        limit: int | None,
+    ) -> list[dict[str, Any]]:
+        """query() without the database: read and filter every file."""
+        matches: list[tuple[Any, int, dict[str, Any]]] = []
+        for number, path, _st in self._scan(kind):
+            data = self._read(path)
+            if data is None:
+                continue
+            try:
+                row = KINDS[kind].to_row(number, data)
+            except (KeyError, TypeError):
+                continue
+            if statuses is not None and row.status not in statuses:
+                continue
+            if row.status in exclude_statuses:
+                continue
+            if repo and row.repo != repo:
+                continue
+            if updated_since and (row.updated_at or "") < updated_since:
+                continue
+            key = number if order_by == "number" else getattr(row, order_by) or ""
+            matches.append((key, number, row.entry))
+
+        matches.sort(key=lambda match: (match[0], match[1]), reverse=True)
+        entries = [entry for _key, _number, entry in matches]
+        return entries[:limit] if limit is not None else entries
+
+    def reviews(
+        self,
+        status: str | None = None,
+        repo: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        PR review summaries, most recently reviewed first.
+
+        Each has pr_number, repo, overall_status, findings_count, reviewed_at,
+        success and reviewed_commit_sha.
+        """
+        return self.query(
+            "review",
+            statuses=[status] if status else None,
+            repo=repo,
+            limit=limit,
+        )
+
+    def autofix_queue(
+        self,
+        statuses: Iterable[str] | None = None,
+        exclude_statuses: Iterable[str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Auto-fix states (as saved by AutoFixState), newest first."""
+        return self.query(
+            "autofix",
+            statuses=statuses,
+            exclude_statuses=exclude_statuses,
+            order_by="created_at",
+            limit=limit,
+        )
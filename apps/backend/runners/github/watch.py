@@ -0,0 +1,788 @@
+"""
+GitHub Watch Daemon
+===================
+
+Long-running alternative to the polling commands (check-new,
+check-auto-fix-labels, queue). Those re-list every open issue/PR and reload
+per-issue state files on each invocation; the watch daemon instead:
+
+- Consumes events: GitHub webhook deliveries (WebhookReceiver, a small
+  asyncio HTTP endpoint) and/or incremental polling with the REST `since`
+  cursor (only issues/PRs updated since the last poll are fetched)
+- Keeps an in-memory state index (WatchStateIndex) of issues, PR head SHAs,
+  reviewed commits, triaged issues and auto-fix states, loaded from disk
+  once at startup and updated as events and jobs complete
+- Dispatches review/triage/auto-fix work to a bounded JobQueue: producers
+  wait when it's full (backpressure), review jobs are deduplicated by PR
+  head SHA (a newer push replaces a queued review of an older one), and
+  jobs for the same issue/PR never run concurrently
+- Fetches the PR data for queued reviews in batched GraphQL requests
+
+Which jobs are dispatched follows GitHubRunnerConfig: pr_review_enabled,
+triage_enabled and auto_fix_enabled.
+
+Usage:
+    daemon = WatchDaemon(orchestrator)
+    await daemon.run(webhook_port=8787)  # or poll only: webhook_port=None
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+try:
+    from .file_lock import locked_json_write
+    from .models import AutoFixStatus, PRReviewResult
+    from .state_index import StateIndex
+except (ImportError, ValueError, SystemError):
+    from file_lock import locked_json_write
+    from models import AutoFixStatus, PRReviewResult
+    from state_index import StateIndex
+
+logger = logging.getLogger(__name__)
+
+CURSOR_FILENAME = "watch_cursor.json"
+
+# GitHub caps webhook payloads at 25 MB
+MAX_WEBHOOK_BODY_BYTES = 25 * 1024 * 1024
+
+# Recently seen X-GitHub-Delivery IDs (redeliveries are ignored)
+_DELIVERY_HISTORY = 1000
+
+# Queued reviews whose PR bundles are fetched in one batched GraphQL request
+_PREFETCH_REVIEWS = 10
+
+# Auto-fix states that may be (re)started by a trigger label
+_RESTARTABLE_AUTOFIX = (AutoFixStatus.FAILED,)
+
+# pull_request webhook actions that can need a (new) review
+_REVIEW_PR_ACTIONS = ("opened", "reopened", "synchronize", "ready_for_review")
+
+
+class WatchJobKind(str, Enum):
+    """Work the daemon dispatches."""
+
+    REVIEW = "review"
+    TRIAGE = "triage"
+    AUTO_FIX = "auto_fix"
+
+
+@dataclass
+class WatchJob:
+    """One unit of work for an issue or PR."""
+
+    kind: WatchJobKind
+    number: int
+    head_sha: str | None = None  # Reviews: the commit to review
+    trigger_label: str | None = None  # Auto-fix: label that requested it
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def key(self) -> tuple[WatchJobKind, int]:
+        """Jobs with the same key are deduplicated and never run concurrently."""
+        return (self.kind, self.number)
+
+
+@dataclass
+class JobQueueStats:
+    """Counters for the job queue."""
+
+    submitted: int = 0
+    deduplicated: int = 0  # Same job already queued or running
+    superseded: int = 0  # Queued review replaced by one for a newer head SHA
+    rejected: int = 0  # Queue stayed full past the submit timeout
+    completed: int = 0
+    failed: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "superseded": self.superseded,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+class JobQueue:
+    """
+    Bounded, deduplicating job queue.
+
+    The asyncio.Queue holds job keys; the job itself lives in a pending map,
+    so replacing a queued job doesn't take another slot. A job whose key is
+    already running is held back until that run finishes.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        self._queue: asyncio.Queue[tuple[WatchJobKind, int]] = asyncio.Queue(maxsize)
+        self._pending: dict[tuple[WatchJobKind, int], WatchJob] = {}
+        self._running: dict[tuple[WatchJobKind, int], WatchJob] = {}
+        self._deferred: dict[tuple[WatchJobKind, int], WatchJob] = {}
+        self._requeue_tasks: set[asyncio.Task] = set()
+        self.stats = JobQueueStats()
+
+    @property
+    def maxsize(self) -> int:
+        return self._queue.maxsize
+
+    def qsize(self) -> int:
+        """Jobs waiting to run (including ones held back behind a running job)."""
+        return len(self._pending) + len(self._deferred)
+
+    def running(self) -> list[WatchJob]:
+        return list(self._running.values())
+
+    def pending(self) -> list[WatchJob]:
+        return list(self._pending.values())
+
+    def _merge(self, job: WatchJob) -> bool:
+        """Fold `job` into an equivalent waiting or running job, if any."""
+        for waiting in (self._pending, self._deferred):
+            existing = waiting.get(job.key)
+            if existing is None:
+                continue
+            if existing.head_sha == job.head_sha:
+                self.stats.deduplicated += 1
+            else:
+                waiting[job.key] = job
+                self.stats.superseded += 1
+            return True
+
+        running = self._running.get(job.key)
+        if running is not None and running.head_sha == job.head_sha:
+            self.stats.deduplicated += 1
+            return True
+        return False
+
+    async def submit(self, job: WatchJob, timeout: float | None = None) -> bool:
+        """
+        Queue a job, waiting for space if the queue is full.
+
+        Args:
+            job: Job to queue
+            timeout: Seconds to wait for space (None waits indefinitely)
+
+        Returns:
+            False if the queue stayed full for `timeout` seconds
+        """
+        if self._merge(job):
+            return True
+        try:
+            await asyncio.wait_for(self._queue.put(job.key), timeout)
+        except TimeoutError:
+            self.stats.rejected += 1
+            return False
+        # Another submitter may have queued the same key while we waited;
+        # the newest job wins and the spare key is skipped by get()
+        if self._merge(job):
+            return True
+        self._pending[job.key] = job
+        self.stats.submitted += 1
+        return True
+
+    async def get(self) -> WatchJob:
+        """Take the next runnable job (marking it running)."""
+        while True:
+            key = await self._queue.get()
+            self._queue.task_done()
+            job = self._pending.pop(key, None)
+            if job is None:
+                continue  # Spare key from a merged submit
+            if key in self._running:
+                self._deferred[key] = job
+                continue
+            self._running[key] = job
+            return job
+
+    def done(self, job: WatchJob, failed: bool = False) -> None:
+        """Mark a job finished, releasing any job held back behind it."""
+        self._running.pop(job.key, None)
+        if failed:
+            self.stats.failed += 1
+        else:
+            self.stats.completed += 1
+
+        deferred = self._deferred.pop(job.key, None)
+        if deferred is None:
+            return
+        self._pending[deferred.key] = deferred
+        try:
+            self._queue.put_nowait(deferred.key)
+        except asyncio.QueueFull:
+            # Don't block the worker; the key goes in when there's space.
+            # Keep a reference so the task isn't garbage collected first
+            task = asyncio.get_running_loop().create_task(self._queue.put(deferred.key))
+            self._requeue_tasks.add(task)
+            task.add_done_callback(self._requeue_tasks.discard)
+
+
+@dataclass
+class IssueSnapshot:
+    """What the daemon knows about an issue."""
+
+    number: int
+    state: str
+    labels: list[str]
+    updated_at: str
+
+
+@dataclass
+class PRSnapshot:
+    """What the daemon knows about a pull request."""
+
+    number: int
+    state: str
+    head_sha: str
+    draft: bool
+    updated_at: str
+
+
+class WatchStateIndex:
+    """
+    In-memory view of issue/PR state and the runner's stored results.
+
+    Loaded from .auto-claude/github once; afterwards kept current from
+    events and completed jobs, so dispatch decisions never touch disk.
+    """
+
+    def __init__(self, github_dir: Path):
+        self.github_dir = Path(github_dir)
+        self.issues: dict[int, IssueSnapshot] = {}
+        self.prs: dict[int, PRSnapshot] = {}
+        self.reviewed_sha: dict[int, str] = {}
+        self.triaged: set[int] = set()
+        self.autofix_status: dict[int, AutoFixStatus] = {}
+
+    def load(self) -> None:
+        """Read stored reviews, triage results and auto-fix states."""
+        state_index = StateIndex(self.github_dir)
+        for review in state_index.reviews():
+            if review.get("success") and review.get("reviewed_commit_sha"):
+                self.reviewed_sha[review["pr_number"]] = review["reviewed_commit_sha"]
+
+        for path in (self.github_dir / "issues").glob("triage_*.json"):
+            number = _number_from_stem(path.stem, "triage_")
+            if number is not None:
+                self.triaged.add(number)
+
+        for state in state_index.autofix_queue():
+            try:
+                self.autofix_status[state["issue_number"]] = AutoFixStatus(
+                    state.get("status", "pending")
+                )
+            except (KeyError, ValueError):
+                continue
+
+    def refresh_review(self, pr_number: int) -> None:
+        """Re-read one PR's stored review (after a review job)."""
+        review = PRReviewResult.load(self.github_dir, pr_number)
+        if review and review.success and review.reviewed_commit_sha:
+            self.reviewed_sha[pr_number] = review.reviewed_commit_sha
+
+    def refresh_autofix(self, issue_number: int) -> None:
+        """Re-read one issue's auto-fix state (after an auto-fix job)."""
+        path = self.github_dir / "issues" / f"autofix_{issue_number}.json"
+        data = _read_json(path)
+        if data is None:
+            return
+        try:
+            self.autofix_status[issue_number] = AutoFixStatus(
+                data.get("status", "pending")
+            )
+        except ValueError:
+            pass
+
+
+class WatchDaemon:
+    """
+    Event-driven dispatcher of review, triage and auto-fix work.
+
+    Usage:
+        daemon = WatchDaemon(orchestrator, max_concurrency=2)
+        await daemon.run(webhook_port=8787, webhook_secret="...")
+    """
+
+    def __init__(
+        self,
+        orchestrator: Any,
+        max_concurrency: int | None = None,
+        queue_size: int | None = None,
+        poll_interval: float | None = None,
+        apply_triage_labels: bool = False,
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            orchestrator: GitHubOrchestrator that runs the jobs
+            max_concurrency: Jobs run at once (default: config.watch_max_concurrency)
+            queue_size: Job queue bound (default: config.watch_queue_size)
+            poll_interval: Seconds between incremental polls, 0 to disable
+                (default: config.watch_poll_interval)
+            apply_triage_labels: Apply suggested labels after triage
+        """
+        self.orchestrator = orchestrator
+        config = orchestrator.config
+        self.config = config
+        self.gh_client = orchestrator.gh_client
+        self.max_concurrency = max(1, max_concurrency or config.watch_max_concurrency)
+        self.poll_interval = (
+            config.watch_poll_interval if poll_interval is None else poll_interval
+        )
+        self.apply_triage_labels = apply_triage_labels
+
+        self.index = WatchStateIndex(orchestrator.github_dir)
+        self.index.load()
+        self.queue = JobQueue(queue_size or config.watch_queue_size)
+        self.cursor_file = orchestrator.github_dir / CURSOR_FILENAME
+        self.since = self._load_cursor()
+        # PR bundles prefetched for queued reviews, taken when each review runs
+        self._pr_bundles: dict[int, dict] = {}
+
+    # =========================================================================
+    # Events
+    # =========================================================================
+
+    async def handle_webhook(
+        self, event: str, payload: dict, timeout: float | None = None
+    ) -> bool:
+        """
+        Process one webhook delivery.
+
+        Args:
+            event: X-GitHub-Event header value
+            payload: Decoded JSON body
+            timeout: Seconds to wait for queue space
+
+        Returns:
+            False if the job queue was full (the delivery should be retried)
+        """
+        action = payload.get("action")
+        if event == "issues" and "issue" in payload:
+            return await self.handle_issue(payload["issue"], action, timeout)
+        if event == "pull_request" and "pull_request" in payload:
+            return await self.handle_pull_request(
+                payload["pull_request"], action, timeout
+            )
+        return True  # ping, or events the daemon doesn't act on
+
+    async def handle_issue(
+        self, issue: dict, action: str | None = None, timeout: float | None = None
+    ) -> bool:
+        """
+        Update the index from a REST issue object and queue resulting jobs.
+
+        Args:
+            issue: REST issue (webhook payload or /issues listing)
+            action: Webhook action, or None for a polled update
+            timeout: Seconds to wait for queue space
+
+        Returns:
+            False if the job queue was full; the index isn't updated then,
+            so the same update is acted on when it's seen again
+        """
+        if "pull_request" in issue:
+            return True  # PRs are handled from their pull_request data
+
+        snapshot = IssueSnapshot(
+            number=issue["number"],
+            state=issue.get("state", "open"),
+            labels=[label["name"] for label in issue.get("labels", [])],
+            updated_at=issue.get("updated_at", ""),
+        )
+        known = self.index.issues.get(snapshot.number)
+        if known and known.updated_at == snapshot.updated_at and action is None:
+            return True  # Polled again (the since cursor is inclusive)
+
+        if not await self._submit_all(self._issue_jobs(snapshot, action), timeout):
+            return False
+        self.index.issues[snapshot.number] = snapshot
+        return True
+
+    async def handle_pull_request(
+        self, pr: dict, action: str | None = None, timeout: float | None = None
+    ) -> bool:
+        """
+        Update the index from a REST pull request and queue a review if needed.
+
+        Args:
+            pr: REST pull request (webhook payload or /pulls listing)
+            action: Webhook action, or None for a polled update
+            timeout: Seconds to wait for queue space
+
+        Returns:
+            False if the job queue was full
+        """
+        snapshot = PRSnapshot(
+            number=pr["number"],
+            state=pr.get("state", "open"),
+            head_sha=pr.get("head", {}).get("sha", ""),
+            draft=bool(pr.get("draft")),
+            updated_at=pr.get("updated_at", ""),
+        )
+        known = self.index.prs.get(snapshot.number)
+        if known and known.updated_at == snapshot.updated_at and action is None:
+            return True
+
+        jobs = []
+        if action is None or action in _REVIEW_PR_ACTIONS:
+            jobs = self._pr_jobs(snapshot)
+        if not await self._submit_all(jobs, timeout):
+            return False
+        self.index.prs[snapshot.number] = snapshot
+        return True
+
+    def _issue_jobs(self, issue: IssueSnapshot, action: str | None) -> list[WatchJob]:
+        if issue.state != "open":
+            return []
+
+        jobs = []
+        if (
+            self.config.triage_enabled
+            and issue.number not in self.index.triaged
+            and action in (None, "opened", "reopened")
+        ):
+            jobs.append(WatchJob(WatchJobKind.TRIAGE, issue.number))
+
+        if self.config.auto_fix_enabled:
+            wanted = {label.lower() for label in self.config.auto_fix_labels}
+            trigger = next((lbl for lbl in issue.labels if lbl.lower() in wanted), None)
+            status = self.index.autofix_status.get(issue.number)
+            if trigger and (status is None or status in _RESTARTABLE_AUTOFIX):
+                jobs.append(
+                    WatchJob(WatchJobKind.AUTO_FIX, issue.number, trigger_label=trigger)
+                )
+        return jobs
+
+    def _pr_jobs(self, pr: PRSnapshot) -> list[WatchJob]:
+        if (
+            not self.config.pr_review_enabled
+            or pr.state != "open"
+            or pr.draft
+            or not pr.head_sha
+            or self.index.reviewed_sha.get(pr.number) == pr.head_sha
+        ):
+            return []
+        return [WatchJob(WatchJobKind.REVIEW, pr.number, head_sha=pr.head_sha)]
+
+    async def _submit_all(self, jobs: list[WatchJob], timeout: float | None) -> bool:
+        for job in jobs:
+            if not await self.queue.submit(job, timeout):
+                return False
+        return True
+
+    # =========================================================================
+    # Incremental polling
+    # =========================================================================
+
+    async def poll_once(self) -> int:
+        """
+        Fetch issues and PRs updated since the cursor and process them.
+
+        Returns:
+            Number of updated issues/PRs seen
+        """
+        since = self.since
+        issues = await self.gh_client.issues_updated_since(since)
+        prs = (
+            await self.gh_client.prs_updated_since(since)
+            if self.config.pr_review_enabled
+            else []
+        )
+
+        newest = since or ""
+        for issue in issues:
+            await self.handle_issue(issue)
+            newest = max(newest, issue.get("updated_at", ""))
+        for pr in prs:
+            await self.handle_pull_request(pr)
+            newest = max(newest, pr.get("updated_at", ""))
+
+        if newest and newest != since:
+            self.since = newest
+            await locked_json_write(self.cursor_file, {"since": newest}, timeout=5.0)
+        return len(issues) + len(prs)
+
+    def _load_cursor(self) -> str:
+        data = _read_json(self.cursor_file)
+        if data and data.get("since"):
+            return data["since"]
+        # First run: watch from now on (the one-shot commands cover the backlog)
+        return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    async def _poll_loop(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.warning(f"Watch poll failed: {e}")
+            try:
+                await asyncio.wait_for(stop.wait(), self.poll_interval)
+            except TimeoutError:
+                pass
+
+    # =========================================================================
+    # Workers
+    # =========================================================================
+
+    async def execute(self, job: WatchJob) -> None:
+        """Run one job through the orchestrator and update the index."""
+        orchestrator = self.orchestrator
+        if job.kind == WatchJobKind.REVIEW:
+            if self._is_followup(job):
+                await orchestrator.followup_review_pr(job.number)
+            else:
+                bundle = await self._review_bundle(job)
+                await orchestrator.review_pr(job.number, bundle=bundle)
+            self.index.refresh_review(job.number)
+        elif job.kind == WatchJobKind.TRIAGE:
+            results = await orchestrator.triage_issues(
+                issue_numbers=[job.number],
+                apply_labels=self.apply_triage_labels,
+                max_concurrency=1,
+                use_checkpoint=False,
+            )
+            if not any(r.issue_number == job.number for r in results or []):
+                # Stopped early (e.g. cost budget): leave it for a later poll
+                raise RuntimeError(f"Triage of issue #{job.number} produced no result")
+            self.index.triaged.add(job.number)
+        elif job.kind == WatchJobKind.AUTO_FIX:
+            try:
+                await orchestrator.auto_fix_issue(job.number, job.trigger_label)
+            finally:
+                self.index.refresh_autofix(job.number)
+
+    def _is_followup(self, job: WatchJob) -> bool:
+        """Whether a review job follows up on an earlier review of the PR."""
+        previous = self.index.reviewed_sha.get(job.number)
+        return bool(previous) and previous != job.head_sha
+
+    async def _review_bundle(self, job: WatchJob) -> dict | None:
+        """
+        PR bundle for an initial review job.
+
+        When it isn't prefetched yet, it is fetched together with the bundles
+        of the reviews queued behind it. A bundle for an older head SHA is
+        dropped (the gatherer fetches the PR again).
+        """
+        if job.number not in self._pr_bundles:
+            queued = [
+                other.number
+                for other in self.queue.pending()
+                if other.kind == WatchJobKind.REVIEW
+                and other.number not in self._pr_bundles
+                and not self._is_followup(other)
+            ]
+            numbers = [job.number, *queued][:_PREFETCH_REVIEWS]
+            self._pr_bundles.update(
+                await self.orchestrator.prefetch_pr_bundles(numbers)
+            )
+        bundle = self._pr_bundles.pop(job.number, None)
+        if bundle and job.head_sha and bundle.get("headRefOid") != job.head_sha:
+            return None
+        return bundle
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self.queue.get()
+            failed = False
+            try:
+                await self.execute(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failed = True
+                logger.error(f"Watch job {job.kind.value} #{job.number} failed: {e}")
+            finally:
+                self.queue.done(job, failed=failed)
+
+    async def run(
+        self,
+        webhook_host: str = "127.0.0.1",
+        webhook_port: int | None = None,
+        webhook_secret: str | None = None,
+        stop: asyncio.Event | None = None,
+    ) -> None:
+        """
+        Run until `stop` is set (or the task is cancelled).
+
+        Args:
+            webhook_host: Interface for the webhook receiver
+            webhook_port: Port for the webhook receiver (None: polling only)
+            webhook_secret: Secret for X-Hub-Signature-256 verification
+            stop: Event that ends the run
+        """
+        stop = stop or asyncio.Event()
+        tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)
+        ]
+        receiver = None
+        if webhook_port is not None:
+            receiver = WebhookReceiver(
+                self.handle_webhook, webhook_secret, webhook_host, webhook_port
+            )
+            await receiver.start()
+        if self.poll_interval > 0:
+            tasks.append(asyncio.create_task(self._poll_loop(stop)))
+        try:
+            await stop.wait()
+        finally:
+            if receiver:
+                await receiver.stop()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class WebhookReceiver:
+    """
+    Minimal HTTP endpoint for GitHub webhook deliveries.
+
+    Responds 202 once the delivery's jobs are queued, 503 (Retry-After) when
+    the job queue stays full, 401 on a bad signature and 400 on a malformed
+    request (or when no secret is configured). Redeliveries (same X-GitHub-Delivery) are acknowledged and
+    ignored.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[..., Awaitable[bool]],
+        secret: str | None = None,
+        host: str = "127.0.0.1",
+        port: int = 8787,
+        submit_timeout: float = 10.0,
+    ):
+        """
+        Initialize the receiver.
+
+        Args:
+            handler: async handler(event, payload, timeout) -> accepted
+            secret: Webhook secret (None rejects every delivery)
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            submit_timeout: Seconds to wait for job queue space
+        """
+        self.handler = handler
+        self.secret = secret
+        self.host = host
+        self.port = port
+        self.submit_timeout = submit_timeout
+        self._server: asyncio.AbstractServer | None = None
+        self._deliveries: OrderedDict[str, None] = OrderedDict()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        if not self.secret:
+            logger.warning(
+                "No webhook secret configured; all deliveries will be rejected"
+            )
+        logger.info(f"Webhook receiver listening on {self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def verify_signature(self, body: bytes, signature: str | None) -> bool:
+        """Check an X-Hub-Signature-256 header against the body."""
+        if not self.secret:
+            # Without a secret anyone who can reach the port could queue jobs
+            return False
+        if not signature or not signature.startswith("sha256="):
+            return False
+        expected = hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(signature[len("sha256=") :], expected)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            status = await self._handle_request(reader)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            status = 400
+        except Exception as e:
+            logger.error(f"Webhook handling failed: {e}")
+            status = 500
+        reason = {
+            200: "OK",
+            202: "Accepted",
+            400: "Bad Request",
+            401: "Unauthorized",
+            405: "Method Not Allowed",
+            413: "Payload Too Large",
+            500: "Internal Server Error",
+            503: "Service Unavailable",
+        }[status]
+        headers = "Content-Length: 0\r\nConnection: close\r\n"
+        if status == 503:
+            headers += "Retry-After: 30\r\n"
+        try:
+            writer.write(f"HTTP/1.1 {status} {reason}\r\n{headers}\r\n".encode())
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader) -> int:
+        request_line = (await reader.readline()).decode("latin-1").split()
+        headers: dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if len(request_line) < 2 or request_line[0] != "POST":
+            return 405
+        length = int(headers.get("content-length", "0"))
+        if length > MAX_WEBHOOK_BODY_BYTES:
+            return 413
+        body = await reader.readexactly(length)
+
+        if not self.verify_signature(body, headers.get("x-hub-signature-256")):
+            return 401
+        delivery = headers.get("x-github-delivery")
+        if delivery and delivery in self._deliveries:
+            return 200
+        event = headers.get("x-github-event", "")
+        payload = json.loads(body)
+
+        if not await self.handler(event, payload, self.submit_timeout):
+            return 503
+        if delivery:
+            self._deliveries[delivery] = None
+            while len(self._deliveries) > _DELIVERY_HISTORY:
+                self._deliveries.popitem(last=False)
+        return 202
+
+
+def _number_from_stem(stem: str, prefix: str) -> int | None:
+    try:
+        return int(stem[len(prefix) :])
+    except ValueError:
+        return None  # e.g. triage_checkpoint.json
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
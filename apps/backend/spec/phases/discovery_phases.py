@@ -5,6 +5,7 @@ Discovery and Context Phase Implementations
 Phases for project discovery and context gathering.
 """
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from task_logger import LogEntryType, LogPhase
@@ -79,7 +80,9 @@ class DiscoveryPhaseMixin:
                 f"Running context discovery (attempt {attempt + 1})...", "progress"
             )
 
-            success, output = context.run_context_discovery(
+            # Off the event loop: runs alongside other phases (phase_graph)
+            success, output = await asyncio.to_thread(
+                context.run_context_discovery,
                 self.project_dir,
                 self.spec_dir,
                 task or "unknown task",
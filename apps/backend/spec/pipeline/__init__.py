@@ -10,13 +10,31 @@ Components:
 - orchestrator: Main SpecOrchestrator class
 """
 
+from typing import Any
+
 from init import init_auto_claude_dir
 
 from .models import get_specs_dir
-from .orchestrator import SpecOrchestrator
 
 __all__ = [
     "SpecOrchestrator",
     "get_specs_dir",
     "init_auto_claude_dir",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of SpecOrchestrator.
+
+    The orchestrator pulls in the agent runner and with it the Claude Agent
+    SDK. get_specs_dir() is used by every CLI command, including ones that
+    never create a spec, so importing this package must not load it.
+
+    The imported class is cached in globals() to avoid repeated imports.
+    """
+    if name == "SpecOrchestrator":
+        from .orchestrator import SpecOrchestrator
+
+        globals()["SpecOrchestrator"] = SpecOrchestrator
+        return SpecOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -274,3 +274,16 @@ PHASE_DISPLAY: dict[str, tuple[str, str]] = {
     "planning": ("IMPLEMENTATION PLANNING", Icons.SUBTASK),
     "validation": ("FINAL VALIDATION", Icons.SUCCESS),
 }
+
+# Phases each phase reads the output of. Only dependencies that are part of
+# the current run count; phases with no dependency left may run concurrently.
+PHASE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "historical_context": (),
+    "research": (),
+    "context": (),
+    "quick_spec": ("historical_context", "research", "context"),
+    "spec_writing": ("historical_context", "research", "context"),
+    "self_critique": ("spec_writing", "research"),
+    "planning": ("quick_spec", "spec_writing", "self_critique"),
+    "validation": ("quick_spec", "spec_writing", "self_critique", "planning"),
+}
@@ -46,6 +46,7 @@ from .models import (
     get_specs_dir,
     rename_spec_dir_from_requirements,
 )
+from .phase_graph import run_phase_graph
 
 
 class SpecOrchestrator:
@@ -366,42 +367,49 @@ class SpecOrchestrator:
         print()
 
         phases_executed = ["discovery", "requirements", "complexity_assessment"]
+        known_phases = []
         for phase_name in phases_to_run:
             if phase_name not in all_phases:
                 print_status(f"Unknown phase: {phase_name}, skipping", "warning")
                 continue
+            known_phases.append(phase_name)
 
+        async def run_graph_phase(phase_name: str) -> phases.PhaseResult:
             result = await run_phase(phase_name, all_phases[phase_name])
-            results.append(result)
-            phases_executed.append(phase_name)
-
             # Store summary for subsequent phases (compaction)
             if result.success:
                 await self._store_phase_summary(phase_name)
+            return result
 
-            if not result.success:
-                print()
-                print_status(
-                    f"Phase '{phase_name}' failed after {result.retries} retries",
-                    "error",
-                )
-                print(f"  {muted('Errors:')}")
-                for err in result.errors:
-                    print(f"    {icon(Icons.ARROW_RIGHT)} {err}")
-                print()
-                print_status(
-                    "Spec creation incomplete. Fix errors and retry.", "warning"
-                )
-                task_logger.log(
-                    f"Phase '{phase_name}' failed: {'; '.join(result.errors)}",
-                    LogEntryType.ERROR,
-                )
-                task_logger.end_phase(
-                    LogPhase.PLANNING,
-                    success=False,
-                    message=f"Phase {phase_name} failed",
-                )
-                return False
+        # Phases whose inputs are ready run concurrently (see phase_graph)
+        graph_results = await run_phase_graph(known_phases, run_graph_phase)
+        results.extend(graph_results)
+        phases_executed.extend(result.phase for result in graph_results)
+
+        failed = [result for result in graph_results if not result.success]
+        if failed:
+            result = failed[0]
+            phase_name = result.phase
+            print()
+            print_status(
+                f"Phase '{phase_name}' failed after {result.retries} retries",
+                "error",
+            )
+            print(f"  {muted('Errors:')}")
+            for err in result.errors:
+                print(f"    {icon(Icons.ARROW_RIGHT)} {err}")
+            print()
+            print_status("Spec creation incomplete. Fix errors and retry.", "warning")
+            task_logger.log(
+                f"Phase '{phase_name}' failed: {'; '.join(result.errors)}",
+                LogEntryType.ERROR,
+            )
+            task_logger.end_phase(
+                LogPhase.PLANNING,
+                success=False,
+                message=f"Phase {phase_name} failed",
+            )
+            return False
 
         # Summary
         self._print_completion_summary(results, phases_executed)
@@ -0,0 +1,111 @@
+"""
+Phase Graph Executor
+====================
+
+Runs spec pipeline phases as a dependency graph instead of a fixed sequence.
+
+A phase starts as soon as every phase it depends on (PHASE_DEPENDENCIES,
+restricted to the phases in the run) has succeeded, so independent phases
+such as historical_context, research and context run concurrently. Each phase
+keeps its own retry loop. After a failure no new phase is started; phases
+already running are allowed to finish.
+
+SPEC_PHASE_WORKERS caps how many phases run at once (default 3, 1 runs them
+one after another in the given order).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Awaitable, Callable
+
+from ..phases import PhaseResult
+from .models import PHASE_DEPENDENCIES
+
+
+def get_spec_phase_workers() -> int:
+    """Max spec phases running at once (SPEC_PHASE_WORKERS, default 3)."""
+    try:
+        return max(1, int(os.environ.get("SPEC_PHASE_WORKERS", "3")))
+    except ValueError:
+        return 3
+
+
+def resolve_dependencies(phase_names: list[str]) -> dict[str, list[str]]:
+    """
+    Dependencies of each phase among the phases that run.
+
+    A phase without a declared entry depends on every phase before it, so
+    it keeps its place in the sequence.
+    """
+    dependencies = {}
+    for i, name in enumerate(phase_names):
+        if name in PHASE_DEPENDENCIES:
+            dependencies[name] = [
+                dep for dep in PHASE_DEPENDENCIES[name] if dep in phase_names
+            ]
+        else:
+            dependencies[name] = phase_names[:i]
+    return dependencies
+
+
+async def run_phase_graph(
+    phase_names: list[str],
+    run_phase: Callable[[str], Awaitable[PhaseResult]],
+    max_workers: int | None = None,
+) -> list[PhaseResult]:
+    """
+    Run phases, each once its dependencies have succeeded.
+
+    Args:
+        phase_names: Phases to run, in preferred start order
+        run_phase: Runs one phase by name
+        max_workers: Max phases at once (default: get_spec_phase_workers())
+
+    Returns:
+        Results in completion order; shorter than phase_names if a phase
+        failed and its dependents were never started
+    """
+    if max_workers is None:
+        max_workers = get_spec_phase_workers()
+    dependencies = resolve_dependencies(phase_names)
+    order = {name: i for i, name in enumerate(phase_names)}
+
+    waiting = list(phase_names)
+    succeeded: set[str] = set()
+    running: dict[asyncio.Task, str] = {}
+    results: list[PhaseResult] = []
+    failed = False
+
+    try:
+        while waiting or running:
+            if not failed:
+                for name in list(waiting):
+                    if len(running) >= max_workers:
+                        break
+                    if all(dep in succeeded for dep in dependencies[name]):
+                        waiting.remove(name)
+                        running[asyncio.create_task(run_phase(name))] = name
+            if not running:
+                break
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(finished, key=lambda t: order[running[t]]):
+                name = running.pop(task)
+                result = task.result()
+                results.append(result)
+                if result.success:
+                    succeeded.add(name)
+                else:
+                    failed = True
+    finally:
+        # A phase raised (or we were cancelled): don't leave others running
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    return results
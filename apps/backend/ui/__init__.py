@@ -14,47 +14,78 @@ Terminal UI utilities organized into logical modules:
 - spinner: Spinner for long operations
 """
 
-# Re-export everything from submodules
-from .boxes import box, divider
-from .capabilities import (
-    COLOR,
-    FANCY_UI,
-    INTERACTIVE,
-    UNICODE,
-    configure_safe_encoding,
-    supports_color,
-    supports_interactive,
-    supports_unicode,
-)
-from .colors import (
-    Color,
-    bold,
-    color,
-    error,
-    highlight,
-    info,
-    muted,
-    success,
-    warning,
-)
-from .formatters import (
-    print_header,
-    print_key_value,
-    print_phase_status,
-    print_section,
-    print_status,
-)
-from .icons import Icons, icon
-from .menu import MenuOption, select_menu
-from .progress import progress_bar
-from .spinner import Spinner
-from .status import BuildState, BuildStatus, StatusManager
+from importlib import import_module
+
+# Exports are imported from their submodule on first access, so a caller
+# that needs one module (e.g. statusline.py, which only needs status) doesn't
+# load the rest of the package
+_EXPORTS = {
+    # Capabilities
+    "configure_safe_encoding": "capabilities",
+    "supports_unicode": "capabilities",
+    "supports_color": "capabilities",
+    "supports_interactive": "capabilities",
+    "FANCY_UI": "capabilities",
+    "UNICODE": "capabilities",
+    "COLOR": "capabilities",
+    "INTERACTIVE": "capabilities",
+    # Icons
+    "Icons": "icons",
+    "icon": "icons",
+    # Colors
+    "Color": "colors",
+    "color": "colors",
+    "success": "colors",
+    "error": "colors",
+    "warning": "colors",
+    "info": "colors",
+    "muted": "colors",
+    "highlight": "colors",
+    "bold": "colors",
+    # Boxes
+    "box": "boxes",
+    "divider": "boxes",
+    # Progress
+    "progress_bar": "progress",
+    # Menu
+    "MenuOption": "menu",
+    "select_menu": "menu",
+    # Status
+    "BuildState": "status",
+    "BuildStatus": "status",
+    "StatusManager": "status",
+    # Formatters
+    "print_header": "formatters",
+    "print_section": "formatters",
+    "print_status": "formatters",
+    "print_key_value": "formatters",
+    "print_phase_status": "formatters",
+    # Spinner
+    "Spinner": "spinner",
+}
 
 # For backward compatibility
-_FANCY_UI = FANCY_UI
-_UNICODE = UNICODE
-_COLOR = COLOR
-_INTERACTIVE = INTERACTIVE
+_ALIASES = {
+    "_FANCY_UI": "FANCY_UI",
+    "_UNICODE": "UNICODE",
+    "_COLOR": "COLOR",
+    "_INTERACTIVE": "INTERACTIVE",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name from its submodule on first access.
+
+    Imported objects are cached in globals() to avoid repeated imports.
+    """
+    export = _ALIASES.get(name, name)
+    module_name = _EXPORTS.get(export)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), export)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Capabilities
@@ -37,16 +37,13 @@ import sys
 from pathlib import Path
 
 # Add auto-claude to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-from ui import (
-    BuildState,
-    BuildStatus,
-    Icons,
-    StatusManager,
-    icon,
-    supports_unicode,
-)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# The status bar runs this every few seconds: import the status module (and
+# the icon helpers it shares capability detection with), not the ui package
+from ui.capabilities import supports_unicode
+from ui.icons import Icons, icon
+from ui.status import BuildState, BuildStatus, StatusManager
 
 
 def find_project_root() -> Path:
@@ -0,0 +1,373 @@
+"""
+Tests for Concurrent Subtask Scheduling
+=======================================
+
+Tests agents/scheduler.py and the coder's concurrent waves:
+- Available subtasks: phase dependencies, parallel_safe phases, stuck subtasks
+- Waves never share files
+- Subtask worktrees: created, merged back (git or merge orchestrator), removed;
+  uncommitted work and deletions aren't lost
+- A wave of coder sessions runs concurrently and is merged into the project
+
+Note: Uses temp_git_repo fixture from conftest.py for proper git isolation.
+"""
+
+import asyncio
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from agents.scheduler import (
+    WaveStats,
+    create_subtask_worktree,
+    get_coder_workers,
+    merge_subtask_worktree,
+    remove_subtask_worktree,
+    select_wave,
+)
+from core.plan_store import PlanStore
+from core.progress import get_available_subtasks, get_next_subtask
+
+
+def _subtask(subtask_id: str, files: list[str], status: str = "pending") -> dict:
+    return {
+        "id": subtask_id,
+        "description": f"Subtask {subtask_id}",
+        "status": status,
+        "files_to_create": files,
+    }
+
+
+def _write_plan(spec_dir: Path, phases: list[dict]) -> None:
+    spec_dir.mkdir(parents=True, exist_ok=True)
+    plan = {"feature": "Test", "workflow_type": "feature", "phases": phases}
+    (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _commit_file(repo: Path, name: str, content: str) -> None:
+    (repo / name).write_text(content)
+    _git(repo, "add", name)
+    _git(repo, "commit", "-m", f"Add {name}")
+
+
+@pytest.fixture
+def spec_dir(temp_git_repo: Path) -> Path:
+    path = temp_git_repo / ".auto-claude" / "specs" / "001-test"
+    path.mkdir(parents=True)
+    yield path
+    PlanStore.reset_instances()
+
+
+class TestAvailableSubtasks:
+    def test_parallel_safe_phase_offers_all_pending(self, spec_dir: Path):
+        _write_plan(
+            spec_dir,
+            [
+                {
+                    "id": "p1",
+                    "name": "Setup",
+                    "parallel_safe": True,
+                    "subtasks": [
+                        _subtask("1.1", ["a.py"], status="completed"),
+                        _subtask("1.2", ["b.py"]),
+                        _subtask("1.3", ["c.py"]),
+                    ],
+                }
+            ],
+        )
+
+        assert [s["id"] for s in get_available_subtasks(spec_dir)] == ["1.2", "1.3"]
+        assert get_next_subtask(spec_dir)["id"] == "1.2"
+
+    def test_sequential_phase_offers_next_only(self, spec_dir: Path):
+        _write_plan(
+            spec_dir,
+            [
+                {
+                    "id": "p1",
+                    "name": "Backend",
+                    "subtasks": [_subtask("1.1", ["a.py"]), _subtask("1.2", ["b.py"])],
+                },
+                {
+                    "id": "p2",
+                    "name": "Frontend",
+                    "subtasks": [_subtask("2.1", ["c.py"])],
+                },
+                {
+                    "id": "p3",
+                    "name": "Integration",
+                    "depends_on": ["p1"],
+                    "subtasks": [_subtask("3.1", ["d.py"])],
+                },
+            ],
+        )
+
+        assert [s["id"] for s in get_available_subtasks(spec_dir)] == ["1.1", "2.1"]
+
+    def test_stuck_subtasks_are_skipped(self, spec_dir: Path):
+        _write_plan(
+            spec_dir,
+            [
+                {
+                    "id": "p1",
+                    "name": "Setup",
+                    "parallel_safe": True,
+                    "subtasks": [_subtask("1.1", ["a.py"]), _subtask("1.2", ["b.py"])],
+                }
+            ],
+        )
+        memory_dir = spec_dir / "memory"
+        memory_dir.mkdir()
+        (memory_dir / "attempt_history.json").write_text(
+            json.dumps({"stuck_subtasks": [{"subtask_id": "1.1"}]})
+        )
+
+        assert [s["id"] for s in get_available_subtasks(spec_dir)] == ["1.2"]
+
+    def test_missing_plan(self, spec_dir: Path):
+        assert get_available_subtasks(spec_dir) == []
+
+
+class TestSelectWave:
+    def test_overlapping_files_wait(self):
+        available = [
+            _subtask("1", ["src/a.py", "src/b.py"]),
+            _subtask("2", ["./src/b.py"]),
+            _subtask("3", ["src/c.py"]),
+            _subtask("4", ["src/d.py"]),
+        ]
+
+        assert [s["id"] for s in select_wave(available, 3)] == ["1", "3", "4"]
+        assert [s["id"] for s in select_wave(available, 2)] == ["1", "3"]
+
+    def test_subtask_without_files_runs_alone(self):
+        assert [
+            s["id"] for s in select_wave([_subtask("1", []), _subtask("2", ["a"])], 4)
+        ] == ["1"]
+        assert [
+            s["id"] for s in select_wave([_subtask("1", ["a"]), _subtask("2", [])], 4)
+        ] == ["1"]
+
+    def test_coder_workers_from_environment(self, monkeypatch):
+        monkeypatch.delenv("CODER_WORKERS", raising=False)
+        assert get_coder_workers() == 1
+        monkeypatch.setenv("CODER_WORKERS", "4")
+        assert get_coder_workers() == 4
+        monkeypatch.setenv("CODER_WORKERS", "many")
+        assert get_coder_workers() == 1
+
+
+class TestSubtaskWorktrees:
+    def test_disjoint_subtasks_merge_with_git(
+        self, temp_git_repo: Path, spec_dir: Path
+    ):
+        first = create_subtask_worktree(temp_git_repo, spec_dir, "1.1")
+        second = create_subtask_worktree(temp_git_repo, spec_dir, "1.2")
+        assert (first.path / ".auto-claude" / "specs" / "001-test").resolve() == (
+            spec_dir.resolve()
+        )
+
+        _commit_file(first.path, "a.py", "a = 1\n")
+        _commit_file(second.path, "b.py", "b = 2\n")
+
+        assert merge_subtask_worktree(temp_git_repo, first).method == "git"
+        assert merge_subtask_worktree(temp_git_repo, second).method == "git"
+        for worktree in (first, second):
+            remove_subtask_worktree(temp_git_repo, worktree)
+
+        assert (temp_git_repo / "a.py").read_text() == "a = 1\n"
+        assert (temp_git_repo / "b.py").read_text() == "b = 2\n"
+        assert not first.path.exists()
+        assert _git(temp_git_repo, "branch", "--list", "auto-claude-subtask/*") == ""
+        assert _git(temp_git_repo, "status", "--porcelain") == ""
+
+    def test_no_commits_nothing_to_merge(self, temp_git_repo: Path, spec_dir: Path):
+        worktree = create_subtask_worktree(temp_git_repo, spec_dir, "1.1")
+        head = _git(temp_git_repo, "rev-parse", "HEAD")
+
+        result = merge_subtask_worktree(temp_git_repo, worktree)
+
+        assert (result.success, result.method) == (True, "none")
+        assert _git(temp_git_repo, "rev-parse", "HEAD") == head
+        remove_subtask_worktree(temp_git_repo, worktree)
+
+    def test_conflict_goes_to_merge_orchestrator(
+        self, temp_git_repo: Path, spec_dir: Path, monkeypatch
+    ):
+        import merge
+
+        first = create_subtask_worktree(temp_git_repo, spec_dir, "1.1")
+        second = create_subtask_worktree(temp_git_repo, spec_dir, "1.2")
+        _commit_file(first.path, "README.md", "# First\n")
+        _commit_file(second.path, "README.md", "# Second\n")
+        orchestrator = MagicMock()
+        orchestrator.merge_task.return_value = MagicMock(
+            success=False, error="Conflict needs review"
+        )
+        monkeypatch.setattr(merge, "MergeOrchestrator", lambda *a, **k: orchestrator)
+
+        assert merge_subtask_worktree(temp_git_repo, first).success
+        head = _git(temp_git_repo, "rev-parse", "HEAD")
+        result = merge_subtask_worktree(temp_git_repo, second)
+
+        assert not result.success
+        assert result.error == "Conflict needs review"
+        assert orchestrator.merge_task.call_args.kwargs["worktree_path"] == second.path
+        # The failed git merge was aborted
+        assert _git(temp_git_repo, "rev-parse", "HEAD") == head
+        assert (temp_git_repo / "README.md").read_text() == "# First\n"
+        for worktree in (first, second):
+            remove_subtask_worktree(temp_git_repo, worktree)
+
+    def test_conflict_resolved_by_merge_orchestrator(
+        self, temp_git_repo: Path, spec_dir: Path, monkeypatch
+    ):
+        import merge
+
+        _commit_file(temp_git_repo, "old.py", "x = 1\n")
+        first = create_subtask_worktree(temp_git_repo, spec_dir, "1.1")
+        second = create_subtask_worktree(temp_git_repo, spec_dir, "1.2")
+        _commit_file(first.path, "README.md", "# First\n")
+        (second.path / "README.md").write_text("# Second\n")
+        _git(second.path, "rm", "-q", "old.py")
+        _git(second.path, "commit", "-am", "Rewrite README, drop old.py")
+
+        def apply_to_project(report):
+            (temp_git_repo / "README.md").write_text("# First and second\n")
+            return True
+
+        orchestrator = MagicMock()
+        orchestrator.merge_task.return_value = MagicMock(
+            success=True,
+            error=None,
+            stats=MagicMock(files_need_review=0),
+            file_results={
+                "README.md": MagicMock(merged_content="# First and second\n")
+            },
+        )
+        orchestrator.apply_to_project.side_effect = apply_to_project
+        monkeypatch.setattr(merge, "MergeOrchestrator", lambda *a, **k: orchestrator)
+
+        assert merge_subtask_worktree(temp_git_repo, first).method == "git"
+        result = merge_subtask_worktree(temp_git_repo, second)
+
+        assert (result.success, result.method) == (True, "orchestrator")
+        assert (temp_git_repo / "README.md").read_text() == "# First and second\n"
+        assert not (temp_git_repo / "old.py").exists()
+        assert _git(temp_git_repo, "status", "--porcelain") == ""
+        assert _git(temp_git_repo, "show", "--name-status", "--format=", "HEAD") == (
+            "M\tREADME.md\nD\told.py"
+        )
+        for worktree in (first, second):
+            remove_subtask_worktree(temp_git_repo, worktree)
+
+    def test_uncommitted_changes_are_merged(self, temp_git_repo: Path, spec_dir: Path):
+        worktree = create_subtask_worktree(temp_git_repo, spec_dir, "1.1")
+        (worktree.path / "a.py").write_text("a = 1\n")
+        (spec_dir / "build-progress.txt").write_text("notes\n")
+
+        result = merge_subtask_worktree(temp_git_repo, worktree)
+        remove_subtask_worktree(temp_git_repo, worktree)
+
+        assert (result.success, result.method) == (True, "git")
+        assert (temp_git_repo / "a.py").read_text() == "a = 1\n"
+        tracked = _git(temp_git_repo, "ls-files")
+        assert "a.py" in tracked.splitlines()
+        assert ".auto-claude" not in tracked
+
+
+class TestWaveStats:
+    def test_speedup(self):
+        stats = WaveStats(waves=1, sessions=3, wall_seconds=10.0, session_seconds=25.0)
+        assert stats.speedup == 2.5
+        assert WaveStats().speedup == 1.0
+
+
+class TestConcurrentWave:
+    async def test_wave_runs_sessions_together(
+        self, temp_git_repo: Path, spec_dir: Path, monkeypatch
+    ):
+        from agents import coder
+        from recovery import RecoveryManager
+
+        _write_plan(
+            spec_dir,
+            [
+                {
+                    "id": "p1",
+                    "name": "Setup",
+                    "parallel_safe": True,
+                    "subtasks": [_subtask(f"1.{n}", [f"f{n}.py"]) for n in (1, 2, 3)],
+                }
+            ],
+        )
+
+        class DummyClient:
+            def __init__(self, cwd: Path):
+                self.cwd = cwd
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                return False
+
+        async def fake_run_agent_session(client, prompt, _spec_dir, _verbose, phase):
+            subtask_id = prompt.split("1.", 1)[1][0]
+            await asyncio.sleep(0.3)
+            _commit_file(client.cwd, f"f{subtask_id}.py", f"n = {subtask_id}\n")
+            await PlanStore.for_spec(spec_dir).mutate(
+                lambda plan: {
+                    "op": "update_subtask",
+                    "subtask_id": f"1.{subtask_id}",
+                    "fields": {"status": "completed"},
+                }
+            )
+            return "continue", "", {}
+
+        async def fake_build_subtask_prompt(_spec, _project, subtask, *_a, **_k):
+            return f"Implement {subtask['id']}"
+
+        async def fake_post_session_processing(**_kwargs):
+            return True
+
+        monkeypatch.setattr(
+            coder, "create_client", lambda cwd, *a, **k: DummyClient(cwd)
+        )
+        monkeypatch.setattr(coder, "run_agent_session", fake_run_agent_session)
+        monkeypatch.setattr(coder, "_build_subtask_prompt", fake_build_subtask_prompt)
+        monkeypatch.setattr(
+            coder, "post_session_processing", fake_post_session_processing
+        )
+        status_manager = MagicMock()
+        wave_stats = WaveStats()
+
+        statuses = await coder._run_subtask_wave(
+            get_available_subtasks(spec_dir),
+            project_dir=temp_git_repo,
+            spec_dir=spec_dir,
+            model="sonnet",
+            verbose=False,
+            first_session=1,
+            recovery_manager=RecoveryManager(spec_dir, temp_git_repo),
+            status_manager=status_manager,
+            linear_enabled=False,
+            source_spec_dir=None,
+            wave_stats=wave_stats,
+        )
+
+        assert statuses == {"1.1": "continue", "1.2": "continue", "1.3": "continue"}
+        for n in (1, 2, 3):
+            assert (temp_git_repo / f"f{n}.py").read_text() == f"n = {n}\n"
+        assert get_available_subtasks(spec_dir) == []
+        assert max(c.args[0] for c in status_manager.update_workers.call_args_list) == 3
+        assert wave_stats.sessions == 3
+        assert wave_stats.speedup > 1.5
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Import Helpers for GitHub Runner Tests
+======================================
+
+runners/github/ modules import their siblings as top-level modules
+(models, gh_client, services, ...). Its "services" package has the same
+name as apps/backend/services/, so whichever was imported first wins.
+"""
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent / "apps" / "backend"
+GITHUB_RUNNER_DIR = BACKEND_DIR / "runners" / "github"
+
+_CONFLICTING_PACKAGE = "services"
+
+
+def _package_modules() -> list[str]:
+    return [
+        name
+        for name in sys.modules
+        if name == _CONFLICTING_PACKAGE or name.startswith(_CONFLICTING_PACKAGE + ".")
+    ]
+
+
+@contextmanager
+def github_runner_imports() -> Iterator[None]:
+    """
+    Import runners/github/ modules without the "services" name clash.
+
+    Inside the block, "services" resolves to runners/github/services/. On
+    exit, those modules are dropped from sys.modules again (modules imported
+    in the block keep their references) and any apps/backend/services/
+    modules that were set aside are restored.
+
+    Example:
+        with github_runner_imports():
+            from orchestrator import GitHubOrchestrator
+    """
+    for path in (BACKEND_DIR, GITHUB_RUNNER_DIR):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    sys.path.insert(0, str(GITHUB_RUNNER_DIR))
+    shadowed = {name: sys.modules.pop(name) for name in _package_modules()}
+    try:
+        yield
+    finally:
+        sys.path.remove(str(GITHUB_RUNNER_DIR))
+        for name in _package_modules():
+            del sys.modules[name]
+        sys.modules.update(shadowed)
@@ -340,7 +340,7 @@ class TestRunCliListCommands:
         project_dir = Path("/mock/project")
         mock_utils["get_project_dir"].return_value = project_dir
 
-        with patch("cli.main.print_specs_list") as mock_print_specs:
+        with patch("cli.spec_commands.print_specs_list") as mock_print_specs:
             with patch("sys.argv", ["run.py", "--list"]):
                 _run_cli()
 
@@ -353,7 +353,7 @@ class TestRunCliListCommands:
         project_dir = Path("/mock/project")
         mock_utils["get_project_dir"].return_value = project_dir
 
-        with patch("cli.main.handle_list_worktrees_command") as mock_handle:
+        with patch("cli.workspace_commands.handle_list_worktrees_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--list-worktrees"]):
                 _run_cli()
 
@@ -366,7 +366,7 @@ class TestRunCliListCommands:
         project_dir = Path("/mock/project")
         mock_utils["get_project_dir"].return_value = project_dir
 
-        with patch("cli.main.handle_cleanup_worktrees_command") as mock_handle:
+        with patch("cli.workspace_commands.handle_cleanup_worktrees_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--cleanup-worktrees"]):
                 _run_cli()
 
@@ -383,7 +383,7 @@ class TestRunCliBatchCommands:
         project_dir = Path("/mock/project")
         mock_utils["get_project_dir"].return_value = project_dir
 
-        with patch("cli.main.handle_batch_create_command") as mock_handle:
+        with patch("cli.batch_commands.handle_batch_create_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--batch-create", "tasks.json"]):
                 _run_cli()
 
@@ -396,7 +396,7 @@ class TestRunCliBatchCommands:
         project_dir = Path("/mock/project")
         mock_utils["get_project_dir"].return_value = project_dir
 
-        with patch("cli.main.handle_batch_status_command") as mock_handle:
+        with patch("cli.batch_commands.handle_batch_status_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--batch-status"]):
                 _run_cli()
 
@@ -409,7 +409,7 @@ class TestRunCliBatchCommands:
         project_dir = Path("/mock/project")
         mock_utils["get_project_dir"].return_value = project_dir
 
-        with patch("cli.main.handle_batch_cleanup_command") as mock_handle:
+        with patch("cli.batch_commands.handle_batch_cleanup_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--batch-cleanup"]):
                 _run_cli()
 
@@ -423,7 +423,7 @@ class TestRunCliBatchCommands:
         project_dir = Path("/mock/project")
         mock_utils["get_project_dir"].return_value = project_dir
 
-        with patch("cli.main.handle_batch_cleanup_command") as mock_handle:
+        with patch("cli.batch_commands.handle_batch_cleanup_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--batch-cleanup", "--no-dry-run"]):
                 _run_cli()
 
@@ -457,7 +457,7 @@ class TestRunCliSpecResolution:
         mock_utils["find_spec"].return_value = None
 
         # Mock print_specs_list to avoid directory creation issues
-        with patch("cli.main.print_specs_list"):
+        with patch("cli.spec_commands.print_specs_list"):
             with patch("sys.argv", ["run.py", "--spec", "999"]):
                 with pytest.raises(SystemExit) as exc_info:
                     _run_cli()
@@ -477,7 +477,7 @@ class TestRunCliSpecResolution:
         mock_utils["find_spec"].return_value = spec_dir
 
         with patch("core.sentry.set_context") as mock_set_context, \
-             patch("cli.main.handle_build_command"):
+             patch("cli.build_commands.handle_build_command"):
 
             with patch("sys.argv", ["run.py", "--spec", "001"]):
                 _run_cli()
@@ -502,7 +502,7 @@ class TestRunCliBuildCommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_merge_command", return_value=True) as mock_handle:
+        with patch("cli.workspace_commands.handle_merge_command", return_value=True) as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--merge"]):
                 _run_cli()
 
@@ -523,7 +523,7 @@ class TestRunCliBuildCommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_merge_command", return_value=True) as mock_handle:
+        with patch("cli.workspace_commands.handle_merge_command", return_value=True) as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--merge", "--no-commit"]):
                 _run_cli()
 
@@ -544,7 +544,7 @@ class TestRunCliBuildCommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_merge_command", return_value=True) as mock_handle:
+        with patch("cli.workspace_commands.handle_merge_command", return_value=True) as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--merge", "--base-branch", "develop"]):
                 _run_cli()
 
@@ -565,7 +565,7 @@ class TestRunCliBuildCommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_merge_command", return_value=False):
+        with patch("cli.workspace_commands.handle_merge_command", return_value=False):
             with patch("sys.argv", ["run.py", "--spec", "001", "--merge"]):
                 with pytest.raises(SystemExit) as exc_info:
                     _run_cli()
@@ -606,7 +606,7 @@ class TestRunCliBuildCommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_review_command") as mock_handle:
+        with patch("cli.workspace_commands.handle_review_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--review"]):
                 _run_cli()
 
@@ -622,7 +622,7 @@ class TestRunCliBuildCommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_discard_command") as mock_handle:
+        with patch("cli.workspace_commands.handle_discard_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--discard"]):
                 _run_cli()
 
@@ -644,7 +644,7 @@ class TestRunCliPRCommand:
 
         result = {"success": True, "url": "https://github.com/test/pr/1"}
 
-        with patch("cli.main.handle_create_pr_command", return_value=result) as mock_handle:
+        with patch("cli.workspace_commands.handle_create_pr_command", return_value=result) as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--create-pr"]):
                 _run_cli()
 
@@ -668,7 +668,7 @@ class TestRunCliPRCommand:
 
         result = {"success": True, "url": "https://github.com/test/pr/1"}
 
-        with patch("cli.main.handle_create_pr_command", return_value=result) as mock_handle:
+        with patch("cli.workspace_commands.handle_create_pr_command", return_value=result) as mock_handle:
             with patch("sys.argv", [
                 "run.py", "--spec", "001", "--create-pr",
                 "--pr-target", "develop",
@@ -697,7 +697,7 @@ class TestRunCliPRCommand:
 
         result = {"success": False, "error": "Failed to create PR"}
 
-        with patch("cli.main.handle_create_pr_command", return_value=result):
+        with patch("cli.workspace_commands.handle_create_pr_command", return_value=result):
             with patch("sys.argv", ["run.py", "--spec", "001", "--create-pr"]):
                 with pytest.raises(SystemExit) as exc_info:
                     _run_cli()
@@ -718,7 +718,7 @@ class TestRunCliQACommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_qa_status_command") as mock_handle:
+        with patch("cli.qa_commands.handle_qa_status_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--qa-status"]):
                 _run_cli()
 
@@ -734,7 +734,7 @@ class TestRunCliQACommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_review_status_command") as mock_handle:
+        with patch("cli.qa_commands.handle_review_status_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--review-status"]):
                 _run_cli()
 
@@ -750,7 +750,7 @@ class TestRunCliQACommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_qa_command") as mock_handle:
+        with patch("cli.qa_commands.handle_qa_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--qa"]):
                 _run_cli()
 
@@ -771,7 +771,7 @@ class TestRunCliQACommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_qa_command") as mock_handle:
+        with patch("cli.qa_commands.handle_qa_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--qa", "--model", "opus"]):
                 _run_cli()
 
@@ -792,7 +792,7 @@ class TestRunCliQACommands:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_qa_command") as mock_handle:
+        with patch("cli.qa_commands.handle_qa_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--qa", "--verbose"]):
                 _run_cli()
 
@@ -817,7 +817,7 @@ class TestRunCliFollowupCommand:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_followup_command") as mock_handle:
+        with patch("cli.followup_commands.handle_followup_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--followup"]):
                 _run_cli()
 
@@ -838,7 +838,7 @@ class TestRunCliFollowupCommand:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_followup_command") as mock_handle:
+        with patch("cli.followup_commands.handle_followup_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--followup", "--model", "sonnet", "--verbose"]):
                 _run_cli()
 
@@ -863,7 +863,7 @@ class TestRunCliBuildFlow:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_build_command") as mock_handle:
+        with patch("cli.build_commands.handle_build_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001"]):
                 _run_cli()
 
@@ -891,7 +891,7 @@ class TestRunCliBuildFlow:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_build_command") as mock_handle:
+        with patch("cli.build_commands.handle_build_command") as mock_handle:
             with patch("sys.argv", [
                 "run.py", "--spec", "001",
                 "--model", "opus",
@@ -929,7 +929,7 @@ class TestRunCliBuildFlow:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_build_command") as mock_handle:
+        with patch("cli.build_commands.handle_build_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--direct"]):
                 _run_cli()
 
@@ -951,7 +951,7 @@ class TestModelResolution:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_build_command") as mock_handle:
+        with patch("cli.build_commands.handle_build_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--model", "opus"]):
                 _run_cli()
 
@@ -971,7 +971,7 @@ class TestModelResolution:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_build_command") as mock_handle:
+        with patch("cli.build_commands.handle_build_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001"]):
                 _run_cli()
 
@@ -991,7 +991,7 @@ class TestModelResolution:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_build_command") as mock_handle:
+        with patch("cli.build_commands.handle_build_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001", "--model", "opus"]):
                 _run_cli()
 
@@ -1009,7 +1009,7 @@ class TestModelResolution:
         mock_utils["get_project_dir"].return_value = project_dir
         mock_utils["find_spec"].return_value = spec_dir
 
-        with patch("cli.main.handle_build_command") as mock_handle:
+        with patch("cli.build_commands.handle_build_command") as mock_handle:
             with patch("sys.argv", ["run.py", "--spec", "001"]):
                 _run_cli()
 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for CLI Startup Cost
+==========================
+
+Runs run.py and ui/statusline.py under `python -X importtime` and checks:
+- Commands that don't run an agent (--help, --list, --merge-preview) don't
+  import the agent SDK, the coder or the Linear/Graphiti integrations
+- statusline.py imports only the ui modules it uses
+- Import time per command stays within a budget (slow)
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# The CLI exits at startup without python-dotenv
+pytest.importorskip("dotenv")
+
+BACKEND_DIR = Path(__file__).parent.parent / "apps" / "backend"
+
+# Modules only an agent session (or the command that starts one) needs
+AGENT_MODULES = (
+    "claude_agent_sdk",
+    "agents.coder",
+    "core.client",
+    "linear_updater",
+    "graphiti_config",
+    "integrations.graphiti",
+    "integrations.linear",
+)
+
+STATUSLINE_UI_MODULES = {
+    "ui",
+    "ui.capabilities",
+    "ui.colors",
+    "ui.icons",
+    "ui.status",
+}
+
+# Total import time budgets in milliseconds, about twice what these take
+# on a developer machine
+COMMAND_BUDGETS_MS = {
+    "--help": 250,
+    "--list": 600,
+    "--merge-preview": 600,
+}
+STATUSLINE_BUDGET_MS = 100
+
+
+def _import_profile(script: Path, *args: str, cwd: Path) -> dict[str, int]:
+    """Run a script under -X importtime; returns self import time (us) by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(script), *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        stdin=subprocess.DEVNULL,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        profile[name.strip()] = int(self_us)
+    assert profile, f"no -X importtime output:\n{result.stderr}"
+    return profile
+
+
+def _total_ms(profile: dict[str, int]) -> float:
+    return sum(profile.values()) / 1000
+
+
+@pytest.fixture
+def project_dir(temp_dir: Path) -> Path:
+    """A project with one spec, so --list and --spec don't prompt."""
+    spec_dir = temp_dir / ".auto-claude" / "specs" / "001-startup"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text("# Startup\n")
+    subprocess.run(["git", "init", "-q"], cwd=temp_dir, check=True)
+    return temp_dir
+
+
+COMMANDS = {
+    "--help": ("--help",),
+    "--list": ("--list",),
+    "--merge-preview": ("--spec", "001", "--merge-preview"),
+}
+
+
+def _run_command(name: str, project_dir: Path) -> dict[str, int]:
+    return _import_profile(
+        BACKEND_DIR / "run.py",
+        "--project-dir",
+        str(project_dir),
+        *COMMANDS[name],
+        cwd=project_dir,
+    )
+
+
+class TestCLIStartupImports:
+    """Commands import only what they dispatch to."""
+
+    @pytest.mark.parametrize("command", list(COMMANDS))
+    def test_command_skips_agent_modules(self, command: str, project_dir: Path):
+        profile = _run_command(command, project_dir)
+
+        loaded = [
+            name
+            for name in profile
+            if any(
+                name == module or name.startswith(f"{module}.")
+                for module in AGENT_MODULES
+            )
+        ]
+        assert loaded == []
+
+    def test_statusline_imports_only_status(self, project_dir: Path):
+        profile = _import_profile(
+            BACKEND_DIR / "ui" / "statusline.py", "--format", "json", cwd=project_dir
+        )
+
+        ui_modules = {name for name in profile if name.split(".")[0] == "ui"}
+        assert ui_modules == STATUSLINE_UI_MODULES
+
+
+@pytest.mark.slow
+class TestCLIStartupBudget:
+    """Import time per command, best of three runs."""
+
+    @pytest.mark.parametrize("command", list(COMMAND_BUDGETS_MS))
+    def test_command_import_time(self, command: str, project_dir: Path):
+        best = min(_total_ms(_run_command(command, project_dir)) for _ in range(3))
+
+        assert best < COMMAND_BUDGETS_MS[command], f"{command}: {best:.0f}ms"
+
+    def test_statusline_import_time(self, project_dir: Path):
+        script = BACKEND_DIR / "ui" / "statusline.py"
+        best = min(
+            _total_ms(_import_profile(script, cwd=project_dir)) for _ in range(3)
+        )
+
+        assert best < STATUSLINE_BUDGET_MS, f"statusline: {best:.0f}ms"
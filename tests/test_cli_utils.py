@@ -383,8 +383,8 @@ class TestValidateEnvironment:
     @patch('cli.utils.validate_platform_dependencies')
     @patch('cli.utils.get_auth_token')
     @patch('cli.utils.get_auth_token_source')
-    @patch('cli.utils.is_linear_enabled')
-    @patch('cli.utils.LinearManager')
+    @patch('linear_updater.is_linear_enabled')
+    @patch('linear_integration.LinearManager')
     def test_returns_true_when_all_valid(
         self,
         mock_linear_manager,
@@ -432,7 +432,7 @@ class TestValidateEnvironment:
 
         mock_graphiti_status = {"available": False, "enabled": False, "reason": "test"}
         with patch('graphiti_config.get_graphiti_status', return_value=mock_graphiti_status):
-            with patch('cli.utils.is_linear_enabled', return_value=False):
+            with patch('linear_updater.is_linear_enabled', return_value=False):
                 result = validate_environment(spec_dir)
                 assert result is False
                 captured = capsys.readouterr()
@@ -456,7 +456,7 @@ class TestValidateEnvironment:
 
         mock_graphiti_status = {"available": False, "enabled": False, "reason": "test"}
         with patch('graphiti_config.get_graphiti_status', return_value=mock_graphiti_status):
-            with patch('cli.utils.is_linear_enabled', return_value=False):
+            with patch('linear_updater.is_linear_enabled', return_value=False):
                 result = validate_environment(spec_dir)
                 assert result is False
                 captured = capsys.readouterr()
@@ -476,7 +476,7 @@ class TestValidateEnvironment:
 
         mock_graphiti_status = {"available": False, "enabled": False, "reason": "test"}
         with patch('graphiti_config.get_graphiti_status', return_value=mock_graphiti_status):
-            with patch('cli.utils.is_linear_enabled', return_value=False):
+            with patch('linear_updater.is_linear_enabled', return_value=False):
                 validate_environment(spec_dir)
                 captured = capsys.readouterr()
                 assert "OAuth Profile: test@example.com" in captured.out
@@ -496,15 +496,15 @@ class TestValidateEnvironment:
 
         mock_graphiti_status = {"available": False, "enabled": False, "reason": "test"}
         with patch('graphiti_config.get_graphiti_status', return_value=mock_graphiti_status):
-            with patch('cli.utils.is_linear_enabled', return_value=False):
+            with patch('linear_updater.is_linear_enabled', return_value=False):
                 validate_environment(spec_dir)
                 captured = capsys.readouterr()
                 assert "http://localhost:8080" in captured.out
 
     @patch('cli.utils.validate_platform_dependencies')
     @patch('cli.utils.get_auth_token')
-    @patch('cli.utils.is_linear_enabled')
-    @patch('cli.utils.LinearManager')
+    @patch('linear_updater.is_linear_enabled')
+    @patch('linear_integration.LinearManager')
     def test_shows_linear_integration_enabled_with_project(
         self,
         mock_linear_manager_class,
@@ -543,8 +543,8 @@ class TestValidateEnvironment:
 
     @patch('cli.utils.validate_platform_dependencies')
     @patch('cli.utils.get_auth_token')
-    @patch('cli.utils.is_linear_enabled')
-    @patch('cli.utils.LinearManager')
+    @patch('linear_updater.is_linear_enabled')
+    @patch('linear_integration.LinearManager')
     def test_shows_linear_integration_enabled_not_initialized(
         self,
         mock_linear_manager_class,
@@ -587,7 +587,7 @@ class TestValidateEnvironment:
 
         mock_graphiti_status = {"available": False, "enabled": False, "reason": "test"}
         with patch('graphiti_config.get_graphiti_status', return_value=mock_graphiti_status):
-            with patch('cli.utils.is_linear_enabled', return_value=False):
+            with patch('linear_updater.is_linear_enabled', return_value=False):
                 validate_environment(spec_dir)
                 captured = capsys.readouterr()
                 assert "Linear integration: DISABLED" in captured.out
@@ -610,7 +610,7 @@ class TestValidateEnvironment:
             "db_path": "/path/to/db"
         }
         with patch('graphiti_config.get_graphiti_status', return_value=mock_graphiti_status):
-            with patch('cli.utils.is_linear_enabled', return_value=False):
+            with patch('linear_updater.is_linear_enabled', return_value=False):
                 result = validate_environment(spec_dir)
                 assert result is True
                 captured = capsys.readouterr()
@@ -634,7 +634,7 @@ class TestValidateEnvironment:
             "reason": "connection failed"
         }
         with patch('graphiti_config.get_graphiti_status', return_value=mock_graphiti_status):
-            with patch('cli.utils.is_linear_enabled', return_value=False):
+            with patch('linear_updater.is_linear_enabled', return_value=False):
                 result = validate_environment(spec_dir)
                 assert result is True
                 captured = capsys.readouterr()
@@ -657,7 +657,7 @@ class TestValidateEnvironment:
             "reason": "not configured"
         }
         with patch('graphiti_config.get_graphiti_status', return_value=mock_graphiti_status):
-            with patch('cli.utils.is_linear_enabled', return_value=False):
+            with patch('linear_updater.is_linear_enabled', return_value=False):
                 validate_environment(spec_dir)
                 captured = capsys.readouterr()
                 assert "Graphiti memory: DISABLED" in captured.out
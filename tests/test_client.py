@@ -593,3 +593,119 @@ class TestSimpleClientAPIProfileAuthentication:
 
             # Verify SDK client was created successfully
             assert client is mock_sdk_client
+
+
+def _write_project_index(project_dir, services: int) -> None:
+    """Write a project_index.json with `services` services (monorepo-sized)."""
+    import json
+
+    index = {
+        "project_type": "monorepo",
+        "services": {
+            f"service-{i}": {
+                "framework": "react" if i % 2 else "fastapi",
+                "dependencies": [f"dep-{j}" for j in range(20)],
+                "files": [f"src/service_{i}/file_{j}.py" for j in range(20)],
+            }
+            for i in range(services)
+        },
+    }
+    auto_claude_dir = project_dir / ".auto-claude"
+    auto_claude_dir.mkdir(exist_ok=True)
+    (auto_claude_dir / "project_index.json").write_text(json.dumps(index))
+
+
+class TestProjectDataCache:
+    """Tests for the frozen, mtime-invalidated project index cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from core.client import invalidate_project_cache
+
+        invalidate_project_cache()
+        yield
+        invalidate_project_cache()
+
+    def test_hits_share_frozen_data(self, tmp_path):
+        from core.client import _get_cached_project_data
+
+        _write_project_index(tmp_path, services=3)
+
+        index, capabilities = _get_cached_project_data(tmp_path)
+        index_again, capabilities_again = _get_cached_project_data(tmp_path)
+
+        assert index_again is index
+        assert capabilities_again is capabilities
+        assert capabilities["is_web_frontend"] is True
+        with pytest.raises(TypeError):
+            index["project_type"] = "changed"
+        with pytest.raises(TypeError):
+            capabilities["is_electron"] = True
+        assert isinstance(index["services"]["service-0"]["files"], tuple)
+
+    def test_rewritten_index_invalidates(self, tmp_path):
+        from core.client import _get_cached_project_data
+
+        _write_project_index(tmp_path, services=1)
+        index, _ = _get_cached_project_data(tmp_path)
+
+        _write_project_index(tmp_path, services=2)
+        index_path = tmp_path / ".auto-claude" / "project_index.json"
+        os.utime(index_path, ns=(0, index_path.stat().st_mtime_ns + 1_000_000))
+        reloaded, _ = _get_cached_project_data(tmp_path)
+
+        assert len(index["services"]) == 1
+        assert len(reloaded["services"]) == 2
+
+    def test_missing_then_created_index(self, tmp_path):
+        from core.client import _get_cached_project_data
+
+        index, _ = _get_cached_project_data(tmp_path)
+        assert dict(index) == {}
+        assert _get_cached_project_data(tmp_path)[0] is index
+
+        _write_project_index(tmp_path, services=1)
+
+        assert "service-0" in _get_cached_project_data(tmp_path)[0]["services"]
+
+
+@pytest.mark.slow
+class TestCreateClientLatency:
+    """Benchmark of create_client() setup with a large project index."""
+
+    def test_cached_project_data_is_not_copied(self, tmp_path, monkeypatch, capsys):
+        import time
+
+        from core.client import _get_cached_project_data, invalidate_project_cache
+
+        monkeypatch.setenv("CLAUDE_CODE_OAUTH_TOKEN", "sk-ant-oat01-valid-token")
+        monkeypatch.setattr("core.auth.get_token_from_keychain", lambda _config_dir=None: None)
+        _write_project_index(tmp_path, services=2000)
+        invalidate_project_cache()
+
+        start = time.perf_counter()
+        _get_cached_project_data(tmp_path)
+        load_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(100):
+            _get_cached_project_data(tmp_path)
+        hit_secs = (time.perf_counter() - start) / 100
+
+        with patch("core.client.ClaudeSDKClient"):
+            from core.client import create_client
+
+            timings = []
+            for _ in range(10):
+                start = time.perf_counter()
+                create_client(tmp_path, tmp_path, "claude-sonnet-4", "coder")
+                timings.append(time.perf_counter() - start)
+        invalidate_project_cache()
+
+        with capsys.disabled():
+            print(
+                f"\nproject index load: {load_secs * 1000:.1f}ms, "
+                f"cache hit: {hit_secs * 1e6:.1f}us, "
+                f"create_client (best of 10): {min(timings) * 1000:.1f}ms"
+            )
+        assert hit_secs < load_secs / 100
@@ -0,0 +1,176 @@
+"""
+Tests for Debug Logging
+=======================
+
+Tests core/debug.py:
+- Configuration resolved once, re-read by reload_debug_config()
+- Lazy messages and values, only evaluated when written
+- Buffered DEBUG_LOG_FILE output
+- Cost of a disabled debug call (slow)
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+from core import debug as debug_module
+from core.debug import (
+    debug,
+    debug_detailed,
+    debug_error,
+    debug_verbose,
+    flush_debug_log,
+    get_debug_level,
+    is_debug_enabled,
+    reload_debug_config,
+)
+
+
+@pytest.fixture
+def configure_debug(monkeypatch):
+    """Set debug environment variables and re-resolve the configuration."""
+
+    def configure(**env: str) -> None:
+        for name in ("DEBUG", "DEBUG_LEVEL", "DEBUG_LOG_FILE"):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        reload_debug_config()
+
+    configure()
+    yield configure
+    for name in ("DEBUG", "DEBUG_LEVEL", "DEBUG_LOG_FILE"):
+        monkeypatch.delenv(name, raising=False)
+    reload_debug_config()
+
+
+def _fail():
+    pytest.fail("lazy value evaluated")
+
+
+class TestConfiguration:
+    def test_environment_read_once(self, configure_debug, monkeypatch):
+        configure_debug()
+        monkeypatch.setenv("DEBUG", "true")
+
+        assert not is_debug_enabled()
+
+        reload_debug_config()
+        assert is_debug_enabled()
+
+    def test_level_guard(self, configure_debug):
+        configure_debug(DEBUG="true", DEBUG_LEVEL="2")
+
+        assert get_debug_level() == 2
+        assert is_debug_enabled(level=2)
+        assert not is_debug_enabled(level=3)
+
+    def test_load_dotenv_reloads_config(self, configure_debug, monkeypatch):
+        from cli.utils import import_dotenv
+
+        configure_debug()
+        # As if set by the .env file being loaded
+        monkeypatch.setenv("DEBUG", "true")
+
+        import_dotenv()(Path(".env"))
+
+        assert is_debug_enabled()
+
+
+class TestLazyEvaluation:
+    def test_disabled_skips_callables(self, configure_debug):
+        debug("test", _fail, files=_fail)
+        debug_error("test", _fail, error=_fail)
+
+    def test_level_below_threshold_skips_callables(self, configure_debug):
+        configure_debug(DEBUG="true", DEBUG_LEVEL="2")
+
+        debug_verbose("test", _fail, details=_fail)
+
+    def test_enabled_calls_callables(self, configure_debug, capsys):
+        configure_debug(DEBUG="true", DEBUG_LEVEL="2")
+        files = {"b.py", "a.py"}
+
+        debug_detailed(
+            "test", lambda: f"{len(files)} files", files=lambda: sorted(files)
+        )
+
+        err = capsys.readouterr().err
+        assert "2 files" in err
+        assert '"a.py"' in err
+
+    def test_classes_are_logged_not_called(self, configure_debug, capsys):
+        configure_debug(DEBUG="true")
+
+        debug("test", "Resolver", resolver=Path)
+
+        assert "pathlib" in capsys.readouterr().err
+
+
+class TestLogFile:
+    def test_lines_are_buffered_until_flush(self, configure_debug, tmp_path: Path):
+        log_file = tmp_path / "logs" / "debug.log"
+        configure_debug(DEBUG="true", DEBUG_LOG_FILE=str(log_file))
+        flush_debug_log()
+        written = log_file.read_text()
+
+        debug("test", "first")
+        debug("test", "second")
+        assert log_file.read_text() == written
+
+        flush_debug_log()
+        text = log_file.read_text()
+        assert "[test] first" in text
+        assert "[test] second" in text
+        assert "\033[" not in text
+
+    def test_errors_are_written_immediately(self, configure_debug, tmp_path: Path):
+        log_file = tmp_path / "debug.log"
+        configure_debug(DEBUG="true", DEBUG_LOG_FILE=str(log_file))
+
+        debug("test", "before")
+        debug_error("test", "failed", error="boom")
+
+        text = log_file.read_text()
+        assert "before" in text
+        assert "[ERROR] [test] failed" in text
+
+    def test_buffer_flushes_when_full(self, configure_debug, tmp_path: Path):
+        log_file = tmp_path / "debug.log"
+        configure_debug(DEBUG="true", DEBUG_LOG_FILE=str(log_file))
+        flush_debug_log()
+
+        for i in range(debug_module.LOG_FLUSH_EVERY_LINES):
+            debug("test", f"line {i}")
+
+        assert f"line {debug_module.LOG_FLUSH_EVERY_LINES - 1}" in log_file.read_text()
+
+
+@pytest.mark.slow
+class TestDisabledCost:
+    def test_disabled_call_costs_about_a_noop_call(self, configure_debug):
+        def noop(module, message, level=1, **kwargs):
+            pass
+
+        analyze_only_files = {f"src/file_{i}.py" for i in range(200)}
+
+        def best_of_five(func) -> float:
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(20_000):
+                    func(
+                        "merge",
+                        "refresh_from_git()",
+                        task_id="001",
+                        analyze_only_files=lambda: list(analyze_only_files)[:10],
+                    )
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        noop_secs = best_of_five(noop)
+        debug_secs = best_of_five(debug)
+
+        assert debug_secs < noop_secs * 1.5, (
+            f"debug: {debug_secs:.4f}s, no-op: {noop_secs:.4f}s"
+        )
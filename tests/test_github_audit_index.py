@@ -0,0 +1,230 @@
+"""
+Tests for the Audit Log Index
+=============================
+
+Tests audit_index.py and its use by AuditLogger:
+- query_logs() / get_statistics() parity with the JSONL scan
+- Import of pre-existing JSONL logs and incremental sync
+- Rotation, retention cleanup and partially written lines
+- Benchmark against the JSONL scan
+"""
+
+import json
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from audit import ActorType, AuditAction, AuditLogger
+    from audit_index import AuditIndex, is_audit_index_enabled
+
+_ACTIONS = [
+    AuditAction.PR_REVIEW_STARTED,
+    AuditAction.PR_REVIEW_COMPLETED,
+    AuditAction.TRIAGE_COMPLETED,
+    AuditAction.AI_AGENT_COMPLETED,
+]
+
+
+def _write_log(log_dir: Path, day: str, count: int, start: int = 0) -> None:
+    """Write `count` entries to audit_<day>.jsonl, cycling repos/PRs/actions."""
+    log_dir.mkdir(parents=True, exist_ok=True)
+    base = datetime.fromisoformat(f"{day}T00:00:00+00:00")
+    with open(log_dir / f"audit_{day}.jsonl", "a", encoding="utf-8") as f:
+        for i in range(start, start + count):
+            entry = {
+                "timestamp": (base + timedelta(seconds=i)).isoformat(),
+                "correlation_id": f"gh-{i % 50:012d}",
+                "action": _ACTIONS[i % len(_ACTIONS)].value,
+                "actor_type": "automation",
+                "actor_id": None,
+                "repo": f"owner/repo{i % 3}",
+                "pr_number": i % 20 or None,
+                "issue_number": None,
+                "result": "success" if i % 5 else "failure",
+                "duration_ms": i,
+                "error": None,
+                "details": {"i": i},
+                "token_usage": {"input_tokens": 10, "output_tokens": 2}
+                if i % 4 == 3
+                else None,
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+def _loggers(log_dir: Path) -> tuple[AuditLogger, AuditLogger]:
+    return (
+        AuditLogger(log_dir=log_dir, use_index=True),
+        AuditLogger(log_dir=log_dir, use_index=False),
+    )
+
+
+def _keys(entries) -> list[tuple]:
+    return [(e.correlation_id, e.timestamp, e.action) for e in entries]
+
+
+class TestQueryParity:
+    """The index answers exactly like the JSONL scan."""
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"correlation_id": "gh-000000000007"},
+            {"action": AuditAction.TRIAGE_COMPLETED},
+            {"repo": "owner/repo1", "pr_number": 4},
+            {"since": datetime(2026, 3, 2, 0, 1, tzinfo=UTC)},
+            {"pr_number": 0},  # Falsy filters are ignored
+        ],
+    )
+    def test_query_logs(self, tmp_path: Path, filters):
+        for day in ("2026-03-01", "2026-03-02", "2026-03-03"):
+            _write_log(tmp_path, day, 200)
+        indexed, scanned = _loggers(tmp_path)
+
+        for limit in (5, 1000):
+            assert _keys(indexed.query_logs(limit=limit, **filters)) == _keys(
+                scanned.query_logs(limit=limit, **filters)
+            )
+
+    def test_statistics(self, tmp_path: Path):
+        for day in ("2026-03-01", "2026-03-02"):
+            _write_log(tmp_path, day, 300)
+        indexed, scanned = _loggers(tmp_path)
+
+        assert indexed.get_statistics() == scanned.get_statistics()
+        assert indexed.get_statistics(repo="owner/repo2") == scanned.get_statistics(
+            repo="owner/repo2"
+        )
+
+    def test_logged_entries_are_queryable(self, tmp_path: Path):
+        audit = AuditLogger(log_dir=tmp_path, use_index=True)
+        ctx = audit.start_operation(
+            actor_type=ActorType.USER, repo="owner/repo", pr_number=7
+        )
+        audit.log(ctx, AuditAction.PR_REVIEW_STARTED, result="started")
+        assert len(audit.get_operation_history(ctx.correlation_id)) == 1
+
+        audit.log(ctx, AuditAction.PR_REVIEW_COMPLETED)
+
+        history = audit.get_operation_history(ctx.correlation_id)
+        assert [e.action for e in history] == [
+            AuditAction.PR_REVIEW_STARTED,
+            AuditAction.PR_REVIEW_COMPLETED,
+        ]
+
+
+class TestSync:
+    """Import, incremental sync, rotation and retention."""
+
+    def test_imports_existing_logs_once(self, tmp_path: Path):
+        _write_log(tmp_path, "2026-03-01", 100)
+        index = AuditIndex(tmp_path)
+
+        assert index.sync() == 100
+        assert index.sync() == 0
+        _write_log(tmp_path, "2026-03-01", 10, start=100)
+        assert index.sync() == 10
+        assert index.rebuild() == 110
+
+    def test_partial_line_waits_for_newline(self, tmp_path: Path):
+        _write_log(tmp_path, "2026-03-01", 2)
+        log_file = tmp_path / "audit_2026-03-01.jsonl"
+        line = log_file.read_text().splitlines()[0]
+        with open(log_file, "a") as f:
+            f.write(line[:20])
+        index = AuditIndex(tmp_path)
+
+        assert index.sync() == 2
+        with open(log_file, "a") as f:
+            f.write(line[20:] + "\n")
+        assert index.sync() == 1
+
+    def test_rotated_file_keeps_rows(self, tmp_path: Path):
+        _write_log(tmp_path, "2026-03-01", 50)
+        index = AuditIndex(tmp_path)
+        index.sync()
+
+        (tmp_path / "audit_2026-03-01.jsonl").rename(
+            tmp_path / "audit_2026-03-01.120000.jsonl"
+        )
+        _write_log(tmp_path, "2026-03-01", 5, start=50)
+
+        assert index.sync() == 5  # Only the new file is read
+        assert len(index.query(limit=1000)) == 55
+
+    def test_replaced_file_is_reindexed(self, tmp_path: Path):
+        _write_log(tmp_path, "2026-03-01", 50)
+        index = AuditIndex(tmp_path)
+        index.sync()
+
+        os.unlink(tmp_path / "audit_2026-03-01.jsonl")
+        _write_log(tmp_path, "2026-03-01", 60, start=1000)
+
+        index.sync()
+        rows = index.query(limit=1000)
+        assert len(rows) == 60
+        assert rows[0]["details"] == {"i": 1000}
+
+    def test_retention_cleanup_drops_rows(self, tmp_path: Path):
+        _write_log(tmp_path, "2026-01-01", 20)
+        _write_log(tmp_path, "2026-03-01", 30)
+        audit = AuditLogger(log_dir=tmp_path, retention_days=30, use_index=True)
+        assert len(audit.query_logs(limit=1000)) == 50
+
+        old = tmp_path / "audit_2026-01-01.jsonl"
+        stale = time.time() - 60 * 24 * 60 * 60
+        os.utime(old, (stale, stale))
+        audit._cleanup_old_logs()
+
+        assert not old.exists()
+        assert len(audit.query_logs(limit=1000)) == 30
+
+    def test_invalid_lines_skipped(self, tmp_path: Path):
+        _write_log(tmp_path, "2026-03-01", 3)
+        with open(tmp_path / "audit_2026-03-01.jsonl", "a") as f:
+            f.write("not json\n")
+            f.write(json.dumps({"timestamp": "2026-03-01T00:00:00+00:00"}) + "\n")
+        audit = AuditLogger(log_dir=tmp_path, use_index=True)
+
+        assert len(audit.query_logs()) == 3
+
+    def test_env_toggle(self, monkeypatch, tmp_path: Path):
+        monkeypatch.setenv("AUDIT_INDEX", "false")
+        assert is_audit_index_enabled() is False
+        assert AuditLogger(log_dir=tmp_path).index is None
+        monkeypatch.delenv("AUDIT_INDEX")
+        assert is_audit_index_enabled() is True
+
+
+@pytest.mark.slow
+class TestAuditIndexBenchmark:
+    """Benchmark: dashboard-style queries over 30 days of logs."""
+
+    def test_benchmark_query_logs(self, tmp_path: Path):
+        for day in range(1, 31):
+            _write_log(tmp_path, f"2026-03-{day:02d}", 5000)
+        indexed, scanned = _loggers(tmp_path)
+
+        start = time.perf_counter()
+        indexed.query_logs(limit=1)  # First query imports the JSONL files
+        import_secs = time.perf_counter() - start
+
+        timings = {}
+        for name, audit in (("scan", scanned), ("index", indexed)):
+            start = time.perf_counter()
+            for pr in range(1, 11):
+                audit.query_logs(repo="owner/repo1", pr_number=pr, limit=1000)
+            audit.get_operation_history("gh-000000000007")
+            audit.get_statistics(repo="owner/repo2")
+            timings[name] = time.perf_counter() - start
+
+        print(
+            f"\n150k entries: import={import_secs:.2f}s, "
+            + ", ".join(f"{name}={secs:.3f}s" for name, secs in timings.items())
+        )
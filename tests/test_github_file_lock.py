@@ -0,0 +1,211 @@
+"""
+Tests for GitHub Runner File Locking
+====================================
+
+Tests runners/github/file_lock.py:
+- 50 concurrent writers (coroutines and threads) to one JSON file
+- Waiting on another process's lock without polling
+- Timeouts and cancelled waiters leave the lock usable
+- Contention metrics
+- Writers in several processes
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.github_runner_helpers import GITHUB_RUNNER_DIR, github_runner_imports
+
+# Other processes' locks are simulated with flock()
+fcntl = pytest.importorskip("fcntl")
+
+with github_runner_imports():
+    import file_lock
+    from file_lock import (
+        FileLock,
+        FileLockTimeout,
+        get_lock_stats,
+        locked_json_update,
+        reset_lock_stats,
+    )
+
+
+WRITERS = 50
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats():
+    reset_lock_stats()
+    yield
+
+
+def _stats(target: Path):
+    return get_lock_stats()[str(target.parent / f"{target.name}.lock")]
+
+
+def _hold_os_lock(target: Path) -> int:
+    """Lock the file the way another process would, on a separate fd."""
+    fd = file_lock._open_lock_file(target.parent / f"{target.name}.lock")
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    return fd
+
+
+def _release_os_lock(fd: int) -> None:
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+class TestConcurrentWriters:
+    async def test_coroutines_update_without_lost_writes(self, tmp_path: Path):
+        index = tmp_path / "index.json"
+        index.write_text("[]")
+
+        async def add(n: int):
+            def update(data):
+                return data + [n]
+
+            await locked_json_update(index, update, timeout=30.0)
+
+        await asyncio.gather(*(add(n) for n in range(WRITERS)))
+
+        assert sorted(json.loads(index.read_text())) == list(range(WRITERS))
+        stats = _stats(index)
+        assert stats.acquisitions == WRITERS
+        assert stats.contended > 0
+        assert stats.os_waits == 0
+        assert stats.timeouts == 0
+        assert stats.waiting == 0
+        assert stats.holder is None
+
+    def test_threads_update_without_lost_writes(self, tmp_path: Path):
+        counter = tmp_path / "counter.json"
+        counter.write_text("0")
+
+        def increment():
+            with FileLock(counter, timeout=30.0):
+                value = json.loads(counter.read_text())
+                time.sleep(0.001)
+                counter.write_text(json.dumps(value + 1))
+
+        threads = [threading.Thread(target=increment) for _ in range(WRITERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert json.loads(counter.read_text()) == WRITERS
+        stats = _stats(counter)
+        assert stats.acquisitions == WRITERS
+        assert stats.max_wait_seconds > 0
+        assert stats.total_wait_seconds >= stats.max_wait_seconds
+
+    async def test_holder_is_reported(self, tmp_path: Path):
+        target = tmp_path / "state.json"
+
+        async with FileLock(target):
+            assert _stats(target).holder.startswith("task ")
+
+        assert _stats(target).holder is None
+
+
+class TestWaiting:
+    async def test_waits_for_another_process_without_polling(
+        self, tmp_path: Path, monkeypatch
+    ):
+        target = tmp_path / "state.json"
+        fd = _hold_os_lock(target)
+        attempts = []
+        real_try_lock = file_lock._try_lock
+
+        def counting_try_lock(lock_fd, exclusive):
+            attempts.append(lock_fd)
+            return real_try_lock(lock_fd, exclusive)
+
+        monkeypatch.setattr(file_lock, "_try_lock", counting_try_lock)
+        threading.Timer(0.2, _release_os_lock, args=(fd,)).start()
+
+        async with FileLock(target, timeout=5.0):
+            pass
+
+        assert len(attempts) == 1
+        stats = _stats(target)
+        assert stats.os_waits == 1
+        assert stats.max_wait_seconds >= 0.15
+
+    def test_times_out_on_another_process(self, tmp_path: Path):
+        target = tmp_path / "state.json"
+        fd = _hold_os_lock(target)
+        try:
+            with pytest.raises(FileLockTimeout):
+                with FileLock(target, timeout=0.1):
+                    pass
+        finally:
+            _release_os_lock(fd)
+
+        with FileLock(target, timeout=1.0):
+            pass
+        assert _stats(target).timeouts == 1
+
+    async def test_in_process_timeout_leaves_queue(self, tmp_path: Path):
+        target = tmp_path / "state.json"
+
+        with FileLock(target):
+            with pytest.raises(FileLockTimeout):
+                async with FileLock(target, timeout=0.05):
+                    pass
+            assert _stats(target).waiting == 0
+
+        async with FileLock(target, timeout=0.5):
+            pass
+        assert _stats(target).timeouts == 1
+
+    async def test_cancelled_waiter_does_not_keep_lock(self, tmp_path: Path):
+        target = tmp_path / "state.json"
+        holder = FileLock(target)
+        await holder.__aenter__()
+
+        async def wait():
+            async with FileLock(target, timeout=5.0):
+                pass
+
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await holder.__aexit__(None, None, None)
+
+        async with FileLock(target, timeout=0.5):
+            pass
+
+
+class TestProcesses:
+    def test_writers_in_several_processes(self, tmp_path: Path):
+        counter = tmp_path / "counter.json"
+        counter.write_text("0")
+        script = (
+            "import json, sys\n"
+            f"sys.path.insert(0, {str(GITHUB_RUNNER_DIR)!r})\n"
+            "from file_lock import FileLock\n"
+            "from pathlib import Path\n"
+            "counter = Path(sys.argv[1])\n"
+            "for _ in range(25):\n"
+            "    with FileLock(counter, timeout=30.0):\n"
+            "        value = json.loads(counter.read_text())\n"
+            "        counter.write_text(json.dumps(value + 1))\n"
+        )
+
+        processes = [
+            subprocess.Popen([sys.executable, "-c", script, str(counter)])
+            for _ in range(4)
+        ]
+        assert all(process.wait(timeout=60) == 0 for process in processes)
+
+        assert json.loads(counter.read_text()) == 100
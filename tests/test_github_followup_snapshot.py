@@ -0,0 +1,394 @@
+"""
+Tests for Incremental Follow-up Context
+=======================================
+
+Tests context_snapshot.py and the snapshot path of FollowupContextGatherer:
+- Blob SHAs match git, so snapshots compare with `git ls-tree` directly
+  (also for files whose content couldn't be decoded)
+- Follow-ups diff only files whose blob changed since the reviewed commit
+- Merges from the base branch and rebases are handled like the REST path
+- Comments already seen are skipped; fallback when there is no snapshot
+- Snapshot cache failures don't fail the follow-up
+- Manifest and blob pruning
+"""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from context_gatherer import (
+        ChangedFile,
+        FollowupContextGatherer,
+        PRContext,
+        PRContextGatherer,
+    )
+    from context_snapshot import (
+        MAX_SNAPSHOTS_PER_PR,
+        ContextSnapshot,
+        ContextSnapshotStore,
+        git_blob_sha,
+        is_context_snapshot_enabled,
+    )
+    from models import PRReviewResult
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _commit(repo: Path, message: str, files: dict[str, str | None]) -> str:
+    for path, content in files.items():
+        target = repo / path
+        if content is None:
+            target.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A repo with 50 files on main and a PR branch touching a few of them."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    files = {f"src/mod{i}.py": f"value = {i}\n" for i in range(50)}
+    _commit(tmp_path, "Initial", {".gitignore": ".auto-claude/\n", **files})
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    return tmp_path
+
+
+def _review(sha: str) -> PRReviewResult:
+    return PRReviewResult(
+        pr_number=1,
+        repo="owner/repo",
+        success=True,
+        reviewed_commit_sha=sha,
+        reviewed_at="2026-03-01T00:00:00Z",
+    )
+
+
+def _gatherer(repo: Path, previous_sha: str, head_sha: str, comments=None):
+    gatherer = FollowupContextGatherer(repo, 1, _review(previous_sha), repo="o/r")
+    client = AsyncMock()
+    client.pr_get.return_value = {
+        "headRefOid": head_sha,
+        "baseRefOid": _git(repo, "rev-parse", "main"),
+        "mergeable": "MERGEABLE",
+        "mergeStateStatus": "CLEAN",
+    }
+    client.get_comments_since.return_value = {
+        "review_comments": [],
+        "issue_comments": comments or [],
+    }
+    client.get_reviews_since.return_value = []
+    # The snapshot path never lists the PR's files or commits
+    client.get_pr_files_changed_since.side_effect = AssertionError("REST path used")
+    client.get_pr_head_sha.side_effect = AssertionError("REST path used")
+    gatherer.gh_client = client
+    return gatherer
+
+
+async def _snapshot(repo: Path, sha: str, **fields) -> ContextSnapshot:
+    gatherer = FollowupContextGatherer(repo, 1, _review(sha))
+    snapshot = await gatherer._snapshot_from_git(sha, _git(repo, "rev-parse", "main"))
+    for key, value in fields.items():
+        setattr(snapshot, key, value)
+    gatherer.snapshots.save(snapshot)
+    return snapshot
+
+
+class TestSnapshotStore:
+    """Content-addressed blobs and manifests."""
+
+    def test_blob_sha_matches_git(self, repo: Path):
+        content = (repo / "src/mod3.py").read_bytes()
+
+        assert git_blob_sha(content) == _git(repo, "hash-object", "src/mod3.py")
+
+    async def test_review_snapshot_matches_git(self, repo: Path):
+        head = _commit(repo, "Change", {"src/mod1.py": "value = 'x'\n"})
+        base = _git(repo, "rev-parse", "main")
+        gatherer = PRContextGatherer(repo, 1, repo="owner/repo")
+        context = PRContext(
+            pr_number=1,
+            title="t",
+            description="",
+            author="dev",
+            base_branch="main",
+            head_branch="feature",
+            state="OPEN",
+            changed_files=[
+                ChangedFile("src/mod1.py", "modified", 1, 1, "value = 'x'\n", "", "")
+            ],
+            diff="",
+            repo_structure="",
+            related_files=[],
+            head_sha=head,
+            base_sha=base,
+        )
+        bundle = {
+            "comments": [{"id": 5, "createdAt": "2026-03-01T00:00:00Z"}],
+            "reviewComments": [],
+            "reviews": [{"id": 9, "submittedAt": "2026-03-01T00:00:00Z"}],
+        }
+
+        await gatherer._save_snapshot(context, bundle)
+
+        saved = gatherer.snapshots.load(1, head)
+        from_git = await FollowupContextGatherer(
+            repo, 1, _review(head)
+        )._snapshot_from_git(head, base)
+        assert saved.files == from_git.files
+        assert saved.comments == {"5": "2026-03-01T00:00:00Z"}
+        assert saved.reviews == {"9": "2026-03-01T00:00:00Z"}
+
+    async def test_review_snapshot_ignores_unreadable_content(self, repo: Path):
+        binary = b"\x89PNG\r\n\x1a\n\xff\xfe"
+        (repo / "logo.png").write_bytes(binary)
+        head = _commit(repo, "Add logo", {})
+        gatherer = PRContextGatherer(repo, 1, repo="owner/repo")
+        context = PRContext(
+            pr_number=1,
+            title="t",
+            description="",
+            author="dev",
+            base_branch="main",
+            head_branch="feature",
+            state="OPEN",
+            # _read_file_content() returns "" for content it can't decode
+            changed_files=[ChangedFile("logo.png", "added", 1, 0, "", "", "")],
+            diff="",
+            repo_structure="",
+            related_files=[],
+            head_sha=head,
+            base_sha=_git(repo, "rev-parse", "main"),
+        )
+
+        await gatherer._save_snapshot(context, None)
+
+        saved = gatherer.snapshots.load(1, head)
+        assert saved.files == {"logo.png": git_blob_sha(binary)}
+        assert gatherer.snapshots.get_blob(saved.files["logo.png"]) == binary
+
+    def test_load_rejects_missing_blobs(self, tmp_path: Path):
+        store = ContextSnapshotStore(tmp_path)
+        sha = store.put_blob(b"x = 1\n")
+        store.save(ContextSnapshot(1, "a" * 40, "b" * 40, files={"x.py": sha}))
+        assert store.load(1, "a" * 40).files == {"x.py": sha}
+
+        os.unlink(store._blob_path(sha))
+
+        assert store.load(1, "a" * 40) is None
+
+    def test_prunes_old_manifests_and_blobs(self, tmp_path: Path):
+        store = ContextSnapshotStore(tmp_path)
+        old_blob = store.put_blob(b"old\n")
+        store.save(ContextSnapshot(1, "0" * 40, "", files={"f": old_blob}))
+        stale = time.time() - 2 * 60 * 60
+        os.utime(store._blob_path(old_blob), (stale, stale))
+
+        for i in range(1, MAX_SNAPSHOTS_PER_PR + 1):
+            path = store._manifest_path(1, "0" * 40)
+            os.utime(path, (stale, stale))  # Keep the first one the oldest
+            blob = store.put_blob(f"v{i}\n".encode())
+            store.save(ContextSnapshot(1, str(i) * 40, "", files={"f": blob}))
+
+        assert store.load(1, "0" * 40) is None
+        assert not store.has_blob(old_blob)
+        assert len(list((tmp_path / "context" / "pr" / "1").glob("*.json"))) == (
+            MAX_SNAPSHOTS_PER_PR
+        )
+
+    def test_env_toggle(self, monkeypatch):
+        monkeypatch.setenv("FOLLOWUP_CONTEXT_SNAPSHOTS", "off")
+        assert is_context_snapshot_enabled() is False
+        monkeypatch.delenv("FOLLOWUP_CONTEXT_SNAPSHOTS")
+        assert is_context_snapshot_enabled() is True
+
+
+class TestIncrementalFollowup:
+    """Follow-ups diff against the snapshot of the reviewed commit."""
+
+    async def test_only_changed_files(self, repo: Path):
+        reviewed = _commit(
+            repo, "PR work", {f"src/mod{i}.py": f"value = {i} * 2\n" for i in range(20)}
+        )
+        await _snapshot(repo, reviewed)
+        head = _commit(
+            repo,
+            "Address review",
+            {"src/mod3.py": "value = 3 * 3\n", "src/new.py": "x = 1\n"},
+        )
+
+        context = await _gatherer(repo, reviewed, head).gather()
+
+        assert context.error is None
+        assert context.current_commit_sha == head
+        assert context.files_changed_since_review == ["src/mod3.py", "src/new.py"]
+        assert "-value = 3 * 2\n+value = 3 * 3\n" in context.diff_since_review
+        assert "--- a/src/new.py\n+++ b/src/new.py\n" in context.diff_since_review
+        assert [c["sha"] for c in context.commits_since_review] == [head]
+        assert context.commits_since_review[0]["commit"]["message"] == (
+            "Address review"
+        )
+        # The new head is snapshotted for the next follow-up
+        store = ContextSnapshotStore(repo / ".auto-claude" / "github")
+        assert store.load(1, head).files["src/new.py"] == git_blob_sha(b"x = 1\n")
+
+    async def test_reverted_file_is_reported(self, repo: Path):
+        reviewed = _commit(repo, "PR work", {"src/mod1.py": "value = 'changed'\n"})
+        await _snapshot(repo, reviewed)
+        head = _commit(repo, "Revert", {"src/mod1.py": "value = 1\n"})
+
+        context = await _gatherer(repo, reviewed, head).gather()
+
+        assert context.files_changed_since_review == ["src/mod1.py"]
+        assert "+value = 1\n" in context.diff_since_review
+
+    async def test_merge_from_base_is_excluded(self, repo: Path):
+        reviewed = _commit(repo, "PR work", {"src/mod1.py": "value = 'pr'\n"})
+        await _snapshot(repo, reviewed)
+        _git(repo, "checkout", "-q", "main")
+        _commit(repo, "Unrelated", {"src/mod40.py": "value = 'main'\n"})
+        _git(repo, "checkout", "-q", "feature")
+        _git(repo, "merge", "-q", "--no-edit", "main")
+        head = _git(repo, "rev-parse", "HEAD")
+
+        context = await _gatherer(repo, reviewed, head).gather()
+
+        assert context.files_changed_since_review == []
+        assert [c["sha"] for c in context.commits_since_review] == [head]
+
+    async def test_rebase_uses_blobs(self, repo: Path):
+        reviewed = _commit(
+            repo, "PR work", {"src/mod1.py": "value = 'a'\n", "src/mod2.py": "b\n"}
+        )
+        await _snapshot(repo, reviewed)
+        _git(repo, "reset", "-q", "--hard", "main")
+        head = _commit(
+            repo, "Rewritten", {"src/mod1.py": "value = 'a'\n", "src/mod2.py": "c\n"}
+        )
+
+        context = await _gatherer(repo, reviewed, head).gather()
+
+        assert context.files_changed_since_review == ["src/mod2.py"]
+        assert context.commits_since_review == []
+
+    async def test_seen_comments_are_skipped(self, repo: Path):
+        reviewed = _commit(repo, "PR work", {"src/mod1.py": "value = 'a'\n"})
+        await _snapshot(
+            repo, reviewed, comments={"1": "2026-03-01T01:00:00Z"}, reviews={}
+        )
+        head = _commit(repo, "More", {"src/mod1.py": "value = 'b'\n"})
+        comments = [
+            {"id": 1, "user": {"login": "dev"}, "updated_at": "2026-03-01T01:00:00Z"},
+            {"id": 2, "user": {"login": "dev"}, "updated_at": "2026-03-02T00:00:00Z"},
+            {"id": 3, "user": {"login": "coderabbitai[bot]"}, "created_at": "x"},
+        ]
+
+        context = await _gatherer(repo, reviewed, head, comments).gather()
+
+        assert [c["id"] for c in context.contributor_comments_since_review] == [2]
+        assert [c["id"] for c in context.ai_bot_comments_since_review] == [3]
+
+    async def test_unchanged_head(self, repo: Path):
+        reviewed = _commit(repo, "PR work", {"src/mod1.py": "value = 'a'\n"})
+        await _snapshot(repo, reviewed)
+        gatherer = _gatherer(repo, reviewed, reviewed)
+
+        context = await gatherer.gather()
+
+        assert context.files_changed_since_review == []
+        gatherer.gh_client.get_comments_since.assert_not_called()
+
+    async def test_without_snapshot_uses_rest_and_snapshots(self, repo: Path):
+        reviewed = _commit(repo, "PR work", {"src/mod1.py": "value = 'a'\n"})
+        head = _commit(repo, "More", {"src/mod1.py": "value = 'b'\n"})
+        gatherer = _gatherer(repo, reviewed, head)
+        client = gatherer.gh_client
+        client.get_pr_head_sha.side_effect = None
+        client.get_pr_head_sha.return_value = head
+        client.get_pr_files_changed_since.side_effect = None
+        client.get_pr_files_changed_since.return_value = (
+            [{"filename": "src/mod1.py", "patch": "@@"}],
+            [{"sha": head}],
+        )
+
+        context = await gatherer.gather()
+
+        assert context.files_changed_since_review == ["src/mod1.py"]
+        client.get_pr_files_changed_since.assert_awaited_once()
+        # The next follow-up can diff against this head
+        assert gatherer.snapshots.load(1, head) is not None
+
+    async def test_snapshot_write_failure_is_not_fatal(self, repo: Path, monkeypatch):
+        reviewed = _commit(repo, "PR work", {"src/mod1.py": "value = 'a'\n"})
+        await _snapshot(repo, reviewed)
+        head = _commit(repo, "More", {"src/mod2.py": "value = 'b'\n"})
+        gatherer = _gatherer(repo, reviewed, head)
+
+        def fail(snapshot):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(gatherer.snapshots, "save", fail)
+
+        context = await gatherer.gather()
+
+        assert context.files_changed_since_review == ["src/mod2.py"]
+
+    async def test_malformed_cat_file_output(self, repo: Path, monkeypatch):
+        gatherer = FollowupContextGatherer(repo, 1, _review("a" * 40))
+
+        async def fake_git(*args, **kwargs):
+            return 0, b"truncated"
+
+        monkeypatch.setattr(gatherer, "_git", fake_git)
+
+        assert await gatherer._read_blobs(["a" * 40]) is None
+
+    async def test_disabled(self, repo: Path, monkeypatch):
+        monkeypatch.setenv("FOLLOWUP_CONTEXT_SNAPSHOTS", "false")
+        reviewed = _commit(repo, "PR work", {"src/mod1.py": "value = 'a'\n"})
+        await _snapshot(repo, reviewed)
+        head = _commit(repo, "More", {"src/mod1.py": "value = 'b'\n"})
+        gatherer = _gatherer(repo, reviewed, head)
+
+        with pytest.raises(AssertionError, match="REST path used"):
+            await gatherer.gather()
+
+
+@pytest.mark.slow
+class TestFollowupBenchmark:
+    """Benchmark: follow-up on a 500-file PR with a two-file delta."""
+
+    async def test_benchmark_incremental_followup(self, repo: Path):
+        reviewed = _commit(
+            repo, "PR work", {f"pkg/f{i}.py": f"x = {i}\n" * 50 for i in range(500)}
+        )
+        start = time.perf_counter()
+        await _snapshot(repo, reviewed)
+        snapshot_secs = time.perf_counter() - start
+        head = _commit(repo, "Fix", {"pkg/f1.py": "x = 0\n", "pkg/f2.py": "y\n"})
+
+        start = time.perf_counter()
+        context = await _gatherer(repo, reviewed, head).gather()
+        followup_secs = time.perf_counter() - start
+
+        assert len(context.files_changed_since_review) == 2
+        print(
+            f"\n500-file PR: first snapshot={snapshot_secs:.2f}s, "
+            f"incremental follow-up={followup_secs:.2f}s"
+        )
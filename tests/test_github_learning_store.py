@@ -0,0 +1,309 @@
+"""
+Tests for the Learning Outcome Store
+====================================
+
+Tests OutcomeStore and LearningTracker persistence in learning.py:
+- Per-record upserts, visible across tracker instances
+- Incrementally maintained aggregates match a full rescan
+- Import of legacy <repo>_outcomes.json files
+- Concurrent writers
+- Benchmark of recording and dashboard queries
+"""
+
+import json
+import random
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from learning import (
+        AuthorResponse,
+        LearningTracker,
+        OutcomeType,
+        PredictionType,
+        ReviewOutcome,
+    )
+
+
+def _reference_accuracy(outcomes, repo=None, since=None, prediction_type=None):
+    """The full scan get_accuracy() used to do, as a plain dict."""
+    result = {"total": 0, "correct": 0, "incorrect": 0, "pending": 0, "by_type": {}}
+    merge_times = []
+    for o in outcomes:
+        if repo and o.repo != repo:
+            continue
+        if since and o.created_at < since:
+            continue
+        if prediction_type and o.prediction != prediction_type:
+            continue
+        result["total"] += 1
+        by_type = result["by_type"].setdefault(
+            o.prediction.value, {"total": 0, "correct": 0, "incorrect": 0}
+        )
+        by_type["total"] += 1
+        if o.is_complete:
+            if o.was_correct is True:
+                result["correct"] += 1
+                by_type["correct"] += 1
+            elif o.was_correct is False:
+                result["incorrect"] += 1
+                by_type["incorrect"] += 1
+            if o.actual_outcome == OutcomeType.MERGED and o.time_to_outcome:
+                merge_times.append(o.time_to_outcome.total_seconds())
+        else:
+            result["pending"] += 1
+    result["avg_merge"] = sum(merge_times) / len(merge_times) if merge_times else None
+    return result
+
+
+def _as_dict(stats) -> dict:
+    return {
+        "total": stats.total_predictions,
+        "correct": stats.correct_predictions,
+        "incorrect": stats.incorrect_predictions,
+        "pending": stats.pending_outcomes,
+        "by_type": stats.by_type,
+        "avg_merge": stats.avg_time_to_merge.total_seconds()
+        if stats.avg_time_to_merge
+        else None,
+    }
+
+
+def _populate(tracker: LearningTracker, count: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for i in range(count):
+        repo = f"owner/repo{i % 3}"
+        tracker.record_prediction(
+            repo=repo,
+            review_id=f"review-{i}",
+            prediction=rng.choice(list(PredictionType)),
+            pr_number=i,
+            file_types=rng.sample(["py", "ts", "md", "go"], rng.randint(0, 2)),
+            categories=rng.sample(["security", "bug", "style"], rng.randint(0, 2)),
+            change_size=rng.choice(["small", "medium", "large"]),
+        )
+        if rng.random() < 0.7:
+            tracker.record_outcome(
+                repo=repo,
+                review_id=f"review-{i}",
+                outcome=rng.choice(list(OutcomeType)),
+                time_to_outcome=timedelta(hours=rng.randint(0, 48)),
+                author_response=AuthorResponse.ACCEPTED,
+            )
+
+
+def _all_outcomes(tracker: LearningTracker) -> list[ReviewOutcome]:
+    return tracker.get_recent_outcomes(limit=1_000_000)
+
+
+class TestPersistence:
+    """Outcomes are upserted per record and read back on demand."""
+
+    def test_round_trip_across_instances(self, tmp_path: Path):
+        tracker = LearningTracker(tmp_path)
+        tracker.record_prediction(
+            "owner/repo", "r1", PredictionType.REVIEW_APPROVE, pr_number=5
+        )
+        tracker.record_outcome(
+            "owner/repo", "r1", OutcomeType.MERGED, timedelta(hours=3)
+        )
+
+        reopened = LearningTracker(tmp_path)
+        [outcome] = reopened.get_recent_outcomes()
+
+        assert outcome.pr_number == 5
+        assert outcome.actual_outcome == OutcomeType.MERGED
+        assert outcome.was_correct is True
+        assert reopened.get_accuracy().avg_time_to_merge == timedelta(hours=3)
+
+    def test_unknown_review_outcome(self, tmp_path: Path):
+        tracker = LearningTracker(tmp_path)
+
+        assert tracker.record_outcome("owner/repo", "nope", OutcomeType.MERGED) is None
+
+    def test_pending_outcomes(self, tmp_path: Path):
+        tracker = LearningTracker(tmp_path)
+        for i in range(4):
+            tracker.record_prediction(
+                f"owner/repo{i % 2}", f"r{i}", PredictionType.TRIAGE_SPAM
+            )
+        tracker.record_outcome("owner/repo0", "r0", OutcomeType.CLOSED)
+
+        assert [o.review_id for o in tracker.get_pending_outcomes()] == [
+            "r1",
+            "r2",
+            "r3",
+        ]
+        assert [o.review_id for o in tracker.get_pending_outcomes("owner/repo0")] == [
+            "r2"
+        ]
+        assert tracker.get_dashboard_data("owner/repo1")["pending_count"] == 2
+
+
+class TestAggregates:
+    """Incremental aggregates equal a full rescan of the outcomes."""
+
+    def test_accuracy_matches_rescan(self, tmp_path: Path):
+        tracker = LearningTracker(tmp_path)
+        _populate(tracker, 300)
+        # Outcomes recorded twice replace their earlier contribution
+        _populate(tracker, 100, seed=1)
+        outcomes = _all_outcomes(tracker)
+
+        for filters in (
+            {},
+            {"repo": "owner/repo1"},
+            {"prediction_type": PredictionType.REVIEW_APPROVE},
+            {"since": datetime.now(UTC) - timedelta(days=1)},
+            {"since": datetime.now(UTC) + timedelta(days=1)},
+        ):
+            expected = _reference_accuracy(outcomes, **filters)
+            actual = _as_dict(tracker.get_accuracy(**filters))
+            assert actual.pop("avg_merge") == pytest.approx(expected.pop("avg_merge"))
+            assert actual == expected, filters
+
+    def test_patterns_match_rescan(self, tmp_path: Path):
+        tracker = LearningTracker(tmp_path)
+        _populate(tracker, 300)
+        outcomes = _all_outcomes(tracker)
+
+        expected = {}
+        for o in outcomes:
+            if not o.is_complete or o.was_correct is None:
+                continue
+            keys = [f"file_type_{t}" for t in o.file_types]
+            keys += [f"category_{c}" for c in o.categories]
+            keys.append(f"change_size_{o.change_size}")
+            for key in keys:
+                counts = expected.setdefault(key, [0, 0])
+                counts[0 if o.was_correct else 1] += 1
+
+        patterns = tracker.detect_patterns(min_sample_size=1)
+
+        assert {p.pattern_id: p.sample_size for p in patterns} == {
+            key: sum(counts) for key, counts in expected.items()
+        }
+        for p in patterns:
+            correct, _ = expected[p.pattern_id]
+            assert p.accuracy == pytest.approx(correct / p.sample_size)
+        types = [p.pattern_type for p in patterns]
+        assert types == sorted(
+            types,
+            key=[
+                "file_type_accuracy",
+                "category_accuracy",
+                "change_size_accuracy",
+            ].index,
+        )
+
+
+class TestLegacyImport:
+    """Existing <repo>_outcomes.json files are imported once."""
+
+    def _write_legacy(self, tmp_path: Path, outcomes: list[ReviewOutcome]) -> Path:
+        learning_dir = tmp_path / "learning"
+        learning_dir.mkdir(parents=True, exist_ok=True)
+        path = learning_dir / "owner_repo_outcomes.json"
+        path.write_text(
+            json.dumps(
+                {"repo": "owner/repo", "outcomes": [o.to_dict() for o in outcomes]}
+            )
+        )
+        return path
+
+    def test_import(self, tmp_path: Path):
+        outcome = ReviewOutcome(
+            review_id="old-1",
+            repo="owner/repo",
+            pr_number=1,
+            prediction=PredictionType.REVIEW_REQUEST_CHANGES,
+            findings_count=2,
+            high_severity_count=1,
+            actual_outcome=OutcomeType.MODIFIED,
+        )
+        path = self._write_legacy(tmp_path, [outcome])
+
+        tracker = LearningTracker(tmp_path)
+        assert tracker.get_accuracy().correct_predictions == 1
+
+        # Reopening doesn't import (or count) it again
+        assert LearningTracker(tmp_path).get_accuracy().total_predictions == 1
+
+        # A changed legacy file is re-imported as upserts
+        outcome.actual_outcome = OutcomeType.OVERRIDDEN
+        self._write_legacy(tmp_path, [outcome])
+        stats = LearningTracker(tmp_path).get_accuracy()
+        assert (stats.total_predictions, stats.incorrect_predictions) == (1, 1)
+        assert path.exists()
+
+
+class TestConcurrency:
+    """Separate trackers (like review workers) write concurrently."""
+
+    def test_concurrent_writers(self, tmp_path: Path):
+        LearningTracker(tmp_path)  # Create the store up front
+
+        def worker(n: int) -> None:
+            tracker = LearningTracker(tmp_path)
+            for i in range(25):
+                tracker.record_prediction(
+                    "owner/repo", f"w{n}-{i}", PredictionType.REVIEW_APPROVE
+                )
+                tracker.record_outcome("owner/repo", f"w{n}-{i}", OutcomeType.MERGED)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = LearningTracker(tmp_path).get_accuracy()
+        assert stats.total_predictions == 200
+        assert stats.correct_predictions == 200
+
+
+@pytest.mark.slow
+class TestLearningStoreBenchmark:
+    """Benchmark: recording and dashboard queries at 20k outcomes."""
+
+    def test_benchmark_dashboard(self, tmp_path: Path):
+        tracker = LearningTracker(tmp_path)
+        start = time.perf_counter()
+        _populate(tracker, 20_000)
+        record_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reopened = LearningTracker(tmp_path)
+        open_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(10):
+            reopened.get_accuracy()
+            reopened.get_dashboard_data()
+        dashboard_secs = (time.perf_counter() - start) / 10
+
+        # What every write used to cost: rewriting the repo's whole JSON file
+        repo_outcomes = [
+            o.to_dict() for o in _all_outcomes(reopened) if o.repo == "owner/repo0"
+        ]
+        start = time.perf_counter()
+        (tmp_path / "legacy.json").write_text(
+            json.dumps({"outcomes": repo_outcomes}, indent=2)
+        )
+        legacy_write_secs = time.perf_counter() - start
+
+        # One write per prediction plus one per recorded outcome
+        stats = reopened.get_accuracy()
+        writes = 2 * stats.total_predictions - stats.pending_outcomes
+        print(
+            f"\n20k outcomes: record={record_secs:.2f}s "
+            f"({record_secs / writes * 1000:.2f}ms/write, legacy full "
+            f"rewrite {legacy_write_secs * 1000:.1f}ms/write), "
+            f"open={open_secs * 1000:.1f}ms, dashboard={dashboard_secs * 1000:.1f}ms"
+        )
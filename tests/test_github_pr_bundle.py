@@ -0,0 +1,386 @@
+"""
+Tests for the Bulk PR Fetch
+===========================
+
+Tests the GraphQL PR bundle in gh_client.py and its use by PRContextGatherer:
+- Batched, aliased queries and normalization into the `gh pr view` shape
+- Paging of connections (and review thread comments) longer than 100 entries
+- GraphQL cost accounting in RateLimiter
+- PRContext built from a bundle, with fallback to separate gh calls
+"""
+
+import json
+import re
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from context_gatherer import PRContextGatherer
+    from gh_client import GHClient, GHCommandError, GHCommandResult
+    from rate_limiter import RateLimiter, RateLimitExceeded
+
+
+def _pr_node(number: int, **overrides) -> dict:
+    node = {
+        "number": number,
+        "title": f"PR {number}",
+        "body": "Fixes things",
+        "state": "OPEN",
+        "headRefName": "feature",
+        "baseRefName": "main",
+        "headRefOid": "a" * 40,
+        "baseRefOid": "b" * 40,
+        "author": {"login": "dev"},
+        "additions": 3,
+        "deletions": 1,
+        "changedFiles": 1,
+        "mergeable": "CONFLICTING",
+        "mergeStateStatus": "DIRTY",
+        "labels": {"nodes": [{"name": "bug"}]},
+        "files": {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [
+                {
+                    "path": "src/app.py",
+                    "additions": 3,
+                    "deletions": 1,
+                    "changeType": "ADDED",
+                }
+            ],
+        },
+        "commits": {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [
+                {
+                    "commit": {
+                        "oid": "c" * 40,
+                        "messageHeadline": "Add app",
+                        "messageBody": "",
+                        "committedDate": "2026-03-01T00:00:00Z",
+                        "authors": {
+                            "nodes": [
+                                {
+                                    "name": "Dev",
+                                    "email": "d@x",
+                                    "user": {"login": "dev"},
+                                }
+                            ]
+                        },
+                    }
+                }
+            ],
+        },
+        "reviews": {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [{"databaseId": 5, "author": None, "state": "COMMENTED"}],
+        },
+        "comments": {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [
+                {
+                    "databaseId": 11,
+                    "author": {"login": "coderabbitai[bot]"},
+                    "body": "Summary",
+                    "createdAt": "2026-03-01T01:00:00Z",
+                }
+            ],
+        },
+        "reviewThreads": {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [
+                {
+                    "comments": {
+                        "nodes": [
+                            {
+                                "databaseId": 12,
+                                "author": {"login": "greptile-apps[bot]"},
+                                "body": "Possible bug",
+                                "path": "src/app.py",
+                                "line": None,
+                                "originalLine": 2,
+                                "createdAt": "2026-03-01T02:00:00Z",
+                            }
+                        ]
+                    }
+                }
+            ],
+        },
+    }
+    node.update(overrides)
+    return node
+
+
+def _result(args: list[str], payload: dict) -> GHCommandResult:
+    return GHCommandResult(
+        stdout=json.dumps(payload),
+        stderr="",
+        returncode=0,
+        command=args,
+        attempts=1,
+        total_time=0.0,
+    )
+
+
+def _query(args: list[str]) -> str:
+    return next(a for a in args if a.startswith("query="))
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter():
+    RateLimiter.reset_instance()
+    yield
+    RateLimiter.reset_instance()
+
+
+class TestPRBundle:
+    """Batched GraphQL fetch of PRs and their connections."""
+
+    async def test_batches_and_normalizes(self, tmp_path: Path):
+        client = GHClient(tmp_path, enable_rate_limiting=False, repo="owner/repo")
+        queries = []
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            query = _query(args)
+            queries.append(query)
+            numbers = [
+                int(n) for n in re.findall(r"pullRequest\(number: (\d+)\)", query)
+            ]
+            repository = {f"p{n}": _pr_node(n) if n != 3 else None for n in numbers}
+            return _result(args, {"data": {"repository": repository}})
+
+        client.run = fake_run
+
+        bundles = await client.pr_get_bundle_many([1, 2, 3, 4, 5], batch_size=2)
+
+        assert len(queries) == 3
+        assert "fragment PRBundle on PullRequest" in queries[0]
+        assert sorted(bundles) == [1, 2, 4, 5]
+        bundle = bundles[1]
+        assert bundle["labels"] == [{"name": "bug"}]
+        assert bundle["files"] == [
+            {"path": "src/app.py", "additions": 3, "deletions": 1, "status": "added"}
+        ]
+        assert bundle["commits"][0]["oid"] == "c" * 40
+        assert bundle["commits"][0]["authors"][0]["login"] == "dev"
+        assert bundle["reviews"][0]["author"] == {"login": "ghost"}
+        assert bundle["comments"][0]["id"] == 11
+        assert bundle["reviewComments"] == [
+            {
+                "id": 12,
+                "author": {"login": "greptile-apps[bot]"},
+                "body": "Possible bug",
+                "path": "src/app.py",
+                "line": None,
+                "original_line": 2,
+                "createdAt": "2026-03-01T02:00:00Z",
+                "updatedAt": None,
+                "url": None,
+            }
+        ]
+
+    async def test_pages_long_connections(self, tmp_path: Path):
+        client = GHClient(tmp_path, enable_rate_limiting=False, repo="owner/repo")
+        afters = []
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            if "fragment PRBundle" in _query(args):
+                node = _pr_node(7)
+                node["files"]["pageInfo"] = {"hasNextPage": True, "endCursor": "c1"}
+                return _result(args, {"data": {"repository": {"p7": node}}})
+
+            after = next(a for a in args if a.startswith("after="))
+            afters.append(after)
+            has_next = after == "after=c1"
+            page = {
+                "pageInfo": {"hasNextPage": has_next, "endCursor": "c2"},
+                "nodes": [{"path": f"f{len(afters)}.py", "changeType": "MODIFIED"}],
+            }
+            pr = {"pullRequest": {"files": page}}
+            return _result(args, {"data": {"repository": pr}})
+
+        client.run = fake_run
+
+        bundle = await client.pr_get_bundle(7)
+
+        assert afters == ["after=c1", "after=c2"]
+        assert [f["path"] for f in bundle["files"]] == ["src/app.py", "f1.py", "f2.py"]
+
+    async def test_pages_long_review_threads(self, tmp_path: Path):
+        client = GHClient(tmp_path, enable_rate_limiting=False, repo="owner/repo")
+        requests = []
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            if "fragment PRBundle" in _query(args):
+                node = _pr_node(7)
+                thread = node["reviewThreads"]["nodes"][0]
+                thread["id"] = "T1"
+                thread["comments"]["pageInfo"] = {
+                    "hasNextPage": True,
+                    "endCursor": "c1",
+                }
+                return _result(args, {"data": {"repository": {"p7": node}}})
+
+            requests.append([a for a in args if a.startswith(("thread=", "after="))])
+            comments = {
+                "pageInfo": {"hasNextPage": False, "endCursor": "c2"},
+                "nodes": [{"databaseId": 13, "body": "Second page"}],
+            }
+            return _result(args, {"data": {"node": {"comments": comments}}})
+
+        client.run = fake_run
+
+        bundle = await client.pr_get_bundle(7)
+
+        assert requests == [["thread=T1", "after=c1"]]
+        assert [c["id"] for c in bundle["reviewComments"]] == [12, 13]
+
+    async def test_requires_repo(self, tmp_path: Path):
+        client = GHClient(tmp_path, enable_rate_limiting=False)
+
+        with pytest.raises(GHCommandError, match="owner/repo"):
+            await client.pr_get_bundle(1)
+
+
+class TestGraphQLCost:
+    """GraphQL points are reserved up front and reconciled from rateLimit."""
+
+    async def test_records_reported_cost(self, tmp_path: Path):
+        client = GHClient(tmp_path, repo="owner/repo")
+        reset_at = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            assert "rateLimit { cost remaining resetAt }" in _query(args)
+            data = {
+                "repository": {"p1": _pr_node(1)},
+                "rateLimit": {"cost": 3, "remaining": 4990, "resetAt": reset_at},
+            }
+            return _result(args, {"data": data})
+
+        client.run = fake_run
+
+        await client.pr_get_bundle(1)
+
+        stats = RateLimiter.get_instance().statistics()["graphql"]
+        assert stats["queries"] == 1
+        assert stats["points_used"] == 3
+        assert stats["points_remaining"] == 4990
+
+    async def test_exhausted_budget_is_not_queried(self, tmp_path: Path):
+        limiter = RateLimiter.get_instance(max_retry_delay=0.1)
+        reset_at = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        limiter.record_graphql_cost(cost=1, remaining=1, reset_at=reset_at)
+        client = GHClient(tmp_path, repo="owner/repo")
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            raise AssertionError("query sent without budget")
+
+        client.run = fake_run
+
+        with pytest.raises(RateLimitExceeded, match="GraphQL"):
+            await client.pr_get_bundle_many([1, 2, 3])
+        assert limiter.statistics()["graphql"]["rate_limited"] == 1
+
+    async def test_budget_refreshes_after_reset(self):
+        limiter = RateLimiter.get_instance()
+        past = datetime.fromtimestamp(time.time() - 1, UTC).isoformat()
+        limiter.record_graphql_cost(cost=1, remaining=0, reset_at=past)
+
+        assert limiter.check_graphql_available(50)[0] is True
+        assert await limiter.acquire_graphql(50, timeout=0) is True
+
+
+class TestGatherFromBundle:
+    """PRContextGatherer builds its PRContext from one GraphQL bundle."""
+
+    def _gatherer(self, tmp_path: Path, calls: list, graphql_fails=False):
+        gatherer = PRContextGatherer(tmp_path, 1, repo="owner/repo")
+        gatherer.gh_client.enable_rate_limiting = False
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            calls.append(args[:2])
+            if args[:2] == ["api", "graphql"]:
+                if graphql_fails:
+                    return GHCommandResult("", "boom", 1, args, 1, 0.0)
+                return _result(args, {"data": {"repository": {"p1": _pr_node(1)}}})
+            if args[:2] == ["pr", "diff"]:
+                return GHCommandResult("diff --git", "", 0, args, 1, 0.0)
+            if args[:2] == ["pr", "view"]:
+                return _result(
+                    args,
+                    {
+                        "title": "PR 1",
+                        "author": {"login": "dev"},
+                        "baseRefName": "main",
+                        "headRefName": "feature",
+                        "files": [],
+                        "commits": [],
+                    },
+                )
+            return _result(args, [])
+
+        async def no_refs(head_sha, base_sha):
+            return False
+
+        async def read(*args):
+            return ""
+
+        gatherer.gh_client.run = fake_run
+        gatherer._ensure_pr_refs_available = no_refs
+        gatherer._read_file_content = read
+        gatherer._get_file_patch = read
+        return gatherer
+
+    async def test_single_query_for_review_data(self, tmp_path: Path):
+        calls = []
+        context = await self._gatherer(tmp_path, calls).gather()
+
+        # Without local refs, file patches come from the PR files API
+        assert calls == [["api", "graphql"], ["api", "--method"], ["pr", "diff"]]
+        assert context.title == "PR 1"
+        assert context.labels == ["bug"]
+        assert context.has_merge_conflicts is True
+        assert context.merge_state_status == "DIRTY"
+        assert context.head_sha == "a" * 40
+        assert [f.status for f in context.changed_files] == ["added"]
+        assert context.commits[0]["messageHeadline"] == "Add app"
+        assert [(c.tool_name, c.file, c.line) for c in context.ai_bot_comments] == [
+            ("Greptile", "src/app.py", 2),
+            ("CodeRabbit", None, None),
+        ]
+
+    async def test_prefetched_bundle_skips_query(self, tmp_path: Path):
+        calls = []
+        gatherer = self._gatherer(tmp_path, calls)
+        gatherer.bundle = await gatherer.gh_client.pr_get_bundle(1)
+        calls.clear()
+
+        await gatherer.gather()
+
+        assert calls == [["api", "--method"], ["pr", "diff"]]
+
+    async def test_falls_back_to_separate_calls(self, tmp_path: Path):
+        calls = []
+        context = await self._gatherer(tmp_path, calls, graphql_fails=True).gather()
+
+        assert calls[0] == ["api", "graphql"]
+        assert ["pr", "view"] in calls
+        assert context.title == "PR 1"
+
+    async def test_falls_back_when_graphql_budget_exhausted(self, tmp_path: Path):
+        calls = []
+        gatherer = self._gatherer(tmp_path, calls)
+
+        async def exhausted(pr_number):
+            raise RateLimitExceeded("GitHub GraphQL rate limit exceeded")
+
+        gatherer.gh_client.pr_get_bundle = exhausted
+
+        context = await gatherer.gather()
+
+        assert ["pr", "view"] in calls
+        assert context.title == "PR 1"
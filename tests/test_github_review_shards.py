@@ -0,0 +1,250 @@
+"""
+Tests for Sharded Reviews of Large PRs
+======================================
+
+Tests streaming per-file patches and splitting oversized PRs into review
+shards:
+- GHClient.iter_pr_files() paging without the old 5000-file cutoff
+- API patches for changed files when the PR refs can't be fetched
+- Packing files (and hunks of oversized files) into shards
+- Merging findings a specialist repeated across shards
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from context_gatherer import ChangedFile, PRContext, PRContextGatherer
+    from gh_client import GHClient, GHCommandResult
+    from models import PRReviewFinding, ReviewCategory, ReviewSeverity
+    from rate_limiter import RateLimiter
+    from services.diff_shards import (
+        build_review_shards,
+        merge_shard_findings,
+        shard_context,
+        split_patch,
+    )
+
+
+def _result(args: list[str], payload) -> GHCommandResult:
+    return GHCommandResult(json.dumps(payload), "", 0, args, 1, 0.0)
+
+
+def _hunk(start: int, lines: int) -> str:
+    body = "".join(f"+line {start + i}\n" for i in range(lines))
+    return f"@@ -{start},0 +{start},{lines} @@\n{body}"
+
+
+def _file(path: str, patch: str = "", additions: int = 1) -> ChangedFile:
+    return ChangedFile(
+        path=path,
+        status="modified",
+        additions=additions,
+        deletions=0,
+        content="",
+        base_content="",
+        patch=patch,
+    )
+
+
+def _finding(agent: str, severity: ReviewSeverity, line: int = 10) -> PRReviewFinding:
+    return PRReviewFinding(
+        id=f"{agent}-{severity.value}-{line}",
+        severity=severity,
+        category=ReviewCategory.QUALITY,
+        title="Unchecked return value",
+        description="...",
+        file="src/a.py",
+        line=line,
+        source_agents=[agent],
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter():
+    RateLimiter.reset_instance()
+    yield
+    RateLimiter.reset_instance()
+
+
+class TestIterPRFiles:
+    """Per-file patches streamed from the PR files endpoint."""
+
+    async def test_pages_until_short_page(self, tmp_path: Path):
+        client = GHClient(tmp_path, enable_rate_limiting=False)
+        pages = []
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            page = int(args[-1].split("page=")[1].split("&")[0])
+            pages.append(page)
+            count = 2 if page < 3 else 1
+            files = [{"filename": f"p{page}_{i}.py"} for i in range(count)]
+            return _result(args, files)
+
+        client.run = fake_run
+
+        files = [f async for f in client.iter_pr_files(1, per_page=2)]
+
+        assert pages == [1, 2, 3]
+        assert len(files) == 5
+
+    async def test_stops_at_github_file_limit(self, tmp_path: Path, monkeypatch):
+        # The module GHClient was loaded from (other tests may re-import gh_client)
+        monkeypatch.setitem(
+            GHClient.iter_pr_files.__globals__, "GITHUB_MAX_PR_FILES", 4
+        )
+        client = GHClient(tmp_path, enable_rate_limiting=False)
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            return _result(args, [{"filename": "a.py"}, {"filename": "b.py"}])
+
+        client.run = fake_run
+
+        files = [f async for f in client.iter_pr_files(1, per_page=2)]
+
+        assert len(files) == 4
+
+
+class TestAPIPatchFallback:
+    """Changed files get API patches when the PR refs aren't available."""
+
+    async def test_uses_api_patches_without_refs(self, tmp_path: Path):
+        gatherer = PRContextGatherer(tmp_path, 1)
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            return _result(
+                args,
+                [
+                    {"filename": "a.py", "patch": "@@ -1 +1 @@\n-x\n+y"},
+                    {"filename": "b.bin"},
+                ],
+            )
+
+        async def read(*args):
+            return ""
+
+        async def git_patch(*args):
+            raise AssertionError("git diff without refs")
+
+        gatherer.gh_client.run = fake_run
+        gatherer._read_file_content = read
+        gatherer._get_file_patch = git_patch
+        pr_data = {
+            "headRefName": "feature",
+            "baseRefName": "main",
+            "files": [{"path": "a.py"}, {"path": "b.bin"}],
+        }
+
+        files = await gatherer._fetch_changed_files(pr_data, refs_available=False)
+
+        assert [(f.path, f.patch) for f in files] == [
+            ("a.py", "@@ -1 +1 @@\n-x\n+y"),
+            ("b.bin", ""),
+        ]
+
+
+class TestBuildReviewShards:
+    """Packing changed files into shards within a character budget."""
+
+    def test_small_pr_is_one_shard(self):
+        files = [_file("b.py", _hunk(1, 2)), _file("a.py", _hunk(1, 2))]
+
+        plan = build_review_shards(files, max_chars=10_000)
+
+        assert not plan.is_sharded
+        assert plan.shards[0].files == files
+
+    def test_packs_files_in_path_order(self):
+        files = [_file(f"src/{name}.py", _hunk(1, 40)) for name in "dcba"]
+
+        plan = build_review_shards(files, max_chars=1_000)
+
+        assert plan.is_sharded
+        assert [p for s in plan.shards for p in s.paths] == [
+            "src/a.py",
+            "src/b.py",
+            "src/c.py",
+            "src/d.py",
+        ]
+        assert all(s.chars <= 1_000 for s in plan.shards)
+        assert [s.index for s in plan.shards] == list(range(len(plan.shards)))
+
+    def test_splits_oversized_file_by_hunk(self):
+        header = "--- a/big.py\n+++ b/big.py\n"
+        patch = header + "".join(_hunk(i * 100, 30) for i in range(6))
+        plan = build_review_shards([_file("big.py", patch)], max_chars=1_000)
+
+        parts = [f.patch for s in plan.shards for f in s.files]
+        assert len(parts) > 1
+        assert all(p.startswith(header + "@@ ") for p in parts)
+        assert "".join(p[len(header) :] for p in parts) == patch[len(header) :]
+
+    def test_skips_files_past_shard_limit(self):
+        files = [_file(f"f{i}.py", _hunk(1, 40)) for i in range(10)]
+
+        plan = build_review_shards(files, max_chars=1_000, max_shards=2)
+
+        assert len(plan.shards) == 2
+        reviewed = {p for s in plan.shards for p in s.paths}
+        assert reviewed.isdisjoint(plan.skipped_paths)
+        assert len(reviewed) + len(plan.skipped_paths) == 10
+
+    def test_huge_hunk_is_truncated(self):
+        parts = split_patch(_hunk(1, 500), max_chars=500)
+
+        assert len(parts) == 1
+        assert "(hunk truncated)" in parts[0]
+
+    def test_shard_context_limits_files(self):
+        files = [_file("a.py", additions=3), _file("b.py", additions=4)]
+        plan = build_review_shards(files, max_chars=10_000)
+
+        context = PRContext(
+            pr_number=1,
+            title="t",
+            description="",
+            author="dev",
+            base_branch="main",
+            head_branch="f",
+            state="open",
+            changed_files=files + [_file("c.py")],
+            diff="full diff",
+            repo_structure="",
+            related_files=[],
+        )
+        limited = shard_context(context, plan.shards[0])
+
+        assert [f.path for f in limited.changed_files] == ["a.py", "b.py"]
+        assert limited.diff == ""
+        assert limited.total_additions == 7
+        assert context.diff == "full diff"
+
+
+class TestMergeShardFindings:
+    """One specialist's repeats across shards collapse before cross-validation."""
+
+    def test_keeps_most_severe_repeat(self):
+        findings = [
+            _finding("logic", ReviewSeverity.LOW),
+            _finding("logic", ReviewSeverity.HIGH),
+            _finding("security", ReviewSeverity.MEDIUM),
+        ]
+
+        merged = merge_shard_findings(findings)
+
+        assert [(f.source_agents, f.severity) for f in merged] == [
+            (["logic"], ReviewSeverity.HIGH),
+            (["security"], ReviewSeverity.MEDIUM),
+        ]
+
+    def test_different_lines_are_kept(self):
+        findings = [
+            _finding("logic", ReviewSeverity.LOW, line=1),
+            _finding("logic", ReviewSeverity.LOW, line=2),
+        ]
+
+        assert merge_shard_findings(findings) == findings
@@ -0,0 +1,118 @@
+"""
+Tests for the Specialist Findings Cache
+=======================================
+
+Tests services/specialist_cache.py:
+- Exact reuse for an unchanged (prompt, head, base, file set) key
+- Per-file reuse when only some patches changed
+- Invalidation when the prompt version changes
+"""
+
+from pathlib import Path
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from context_gatherer import ChangedFile
+    from models import PRReviewFinding, ReviewCategory, ReviewSeverity
+    from services.specialist_cache import (
+        SpecialistCache,
+        SpecialistCacheEntry,
+        file_patch_hashes,
+        file_set_hash,
+        specialist_prompt_version,
+    )
+
+HEAD = "a" * 40
+BASE = "b" * 40
+
+
+def _files(**patches: str) -> list[ChangedFile]:
+    return [
+        ChangedFile(f"{name}.py", "modified", 1, 0, "", "", patch)
+        for name, patch in patches.items()
+    ]
+
+
+def _finding(path: str) -> dict:
+    return PRReviewFinding(
+        id=f"F-{path}",
+        severity=ReviewSeverity.HIGH,
+        category=ReviewCategory.SECURITY,
+        title="Injection",
+        description="...",
+        file=path,
+        line=3,
+        source_agents=["security"],
+    ).to_dict()
+
+
+def _store(tmp_path: Path, version: str, files: list[ChangedFile], findings):
+    cache = SpecialistCache(tmp_path)
+    hashes = file_patch_hashes(files)
+    cache.save(
+        7,
+        SpecialistCacheEntry(
+            specialist="security",
+            prompt_version=version,
+            head_sha=HEAD,
+            base_sha=BASE,
+            file_set_hash=file_set_hash(hashes),
+            files=hashes,
+            findings=findings,
+        ),
+    )
+    return cache
+
+
+class TestSpecialistCache:
+    def test_exact_key_reuses_all_findings(self, tmp_path: Path):
+        files = _files(a="+a", b="+b")
+        findings = [_finding("a.py"), _finding("other.py")]
+        cache = _store(tmp_path, "v1", files, findings)
+
+        lookup = cache.lookup(7, "security", "v1", HEAD, BASE, file_patch_hashes(files))
+
+        assert lookup.is_hit
+        assert [f.file for f in lookup.reused_findings] == ["a.py", "other.py"]
+
+    def test_moved_head_reuses_unchanged_files(self, tmp_path: Path):
+        cache = _store(
+            tmp_path,
+            "v1",
+            _files(a="+a", b="+b"),
+            [_finding("a.py"), _finding("b.py"), _finding("other.py")],
+        )
+        now = _files(a="+a", b="+b changed", c="+c")
+
+        lookup = cache.lookup(
+            7, "security", "v1", "c" * 40, BASE, file_patch_hashes(now)
+        )
+
+        assert not lookup.is_hit
+        assert lookup.stale_paths == ["b.py", "c.py"]
+        assert lookup.reused_files == 1
+        assert [f.file for f in lookup.reused_findings] == ["a.py"]
+
+    def test_prompt_change_invalidates(self, tmp_path: Path):
+        files = _files(a="+a")
+        cache = _store(tmp_path, "v1", files, [_finding("a.py")])
+
+        lookup = cache.lookup(7, "security", "v2", HEAD, BASE, file_patch_hashes(files))
+
+        assert not lookup.is_hit
+        assert lookup.reused_findings == []
+        assert lookup.stale_paths == ["a.py"]
+
+    def test_empty_pr_without_entry_is_a_miss(self, tmp_path: Path):
+        lookup = SpecialistCache(tmp_path).lookup(7, "security", "v1", HEAD, BASE, {})
+
+        assert not lookup.is_hit
+
+    def test_prompt_version_covers_model(self):
+        args = ("prompt", "desc", ["Read"], "sonnet", "medium")
+
+        assert specialist_prompt_version(*args) == specialist_prompt_version(*args)
+        assert specialist_prompt_version(*args) != specialist_prompt_version(
+            "prompt", "desc", ["Read"], "opus", "medium"
+        )
@@ -0,0 +1,202 @@
+"""
+Tests for the GitHub State Index
+================================
+
+Tests state_index.py and its use by the review/auto-fix models:
+- Saves upsert index rows; queries filter by status, repo and time
+- Files written by other tools are picked up, deleted files dropped
+- Pruning rows of removed files (used by DataCleaner.run_cleanup())
+- Fallback to reading the files when the database is unusable
+- Concurrent saves leave the index consistent with the files
+- AutoFixProcessor.get_queue() served from the index
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from models import AutoFixState, AutoFixStatus, PRReviewResult
+    from services.autofix_processor import AutoFixProcessor
+    from state_index import INDEX_FILENAME, StateIndex
+
+
+def _autofix(number: int, status: AutoFixStatus, created_at: str) -> AutoFixState:
+    return AutoFixState(
+        issue_number=number,
+        issue_url=f"https://github.com/owner/repo/issues/{number}",
+        repo="owner/repo",
+        status=status,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.fixture
+def github_dir(tmp_path: Path) -> Path:
+    return tmp_path / ".auto-claude" / "github"
+
+
+class TestSaveAndQuery:
+    async def test_autofix_queue_filters_and_orders(self, github_dir: Path):
+        await _autofix(1, AutoFixStatus.PENDING, "2025-01-01T00:00:00").save(github_dir)
+        await _autofix(2, AutoFixStatus.COMPLETED, "2025-01-03T00:00:00").save(
+            github_dir
+        )
+        await _autofix(3, AutoFixStatus.BUILDING, "2025-01-02T00:00:00").save(
+            github_dir
+        )
+        index = StateIndex(github_dir)
+
+        assert [s["issue_number"] for s in index.autofix_queue()] == [2, 3, 1]
+        assert [
+            s["issue_number"]
+            for s in index.autofix_queue(exclude_statuses=["completed", "failed"])
+        ] == [3, 1]
+        assert [
+            s["issue_number"] for s in index.autofix_queue(statuses=["pending"])
+        ] == [1]
+        assert (github_dir / INDEX_FILENAME).exists()
+        assert not (github_dir / "issues" / "index.json").exists()
+
+    async def test_reviews_are_summaries(self, github_dir: Path):
+        for number, status in [(10, "approve"), (11, "request_changes")]:
+            await PRReviewResult(
+                pr_number=number,
+                repo="owner/repo",
+                success=True,
+                overall_status=status,
+                reviewed_at=f"2025-02-0{number - 9}T00:00:00",
+                reviewed_commit_sha=f"sha{number}",
+            ).save(github_dir)
+        index = StateIndex(github_dir)
+
+        reviews = index.reviews()
+        assert [r["pr_number"] for r in reviews] == [11, 10]
+        assert reviews[0]["reviewed_commit_sha"] == "sha11"
+        assert reviews[0]["findings_count"] == 0
+        assert [r["pr_number"] for r in index.reviews(status="approve")] == [10]
+        assert index.reviews(repo="other/repo") == []
+        assert [
+            r["pr_number"]
+            for r in index.query("review", updated_since="2025-02-02T00:00:00")
+        ] == [11]
+
+
+class TestSync:
+    async def test_external_writes_and_deletes(self, github_dir: Path):
+        await _autofix(1, AutoFixStatus.PENDING, "2025-01-01T00:00:00").save(github_dir)
+        index = StateIndex(github_dir)
+        assert len(index.autofix_queue()) == 1
+
+        # As the frontend does: write the JSON file directly
+        path = github_dir / "issues" / "autofix_1.json"
+        data = json.loads(path.read_text())
+        data["status"] = "cancelled"
+        path.write_text(json.dumps(data) + "\n")
+        external = _autofix(2, AutoFixStatus.PENDING, "2025-01-02T00:00:00")
+        (github_dir / "issues" / "autofix_2.json").write_text(
+            json.dumps(external.to_dict())
+        )
+
+        queue = index.autofix_queue()
+        assert [(s["issue_number"], s["status"]) for s in queue] == [
+            (2, "pending"),
+            (1, "cancelled"),
+        ]
+
+        path.unlink()
+        assert [s["issue_number"] for s in index.autofix_queue()] == [2]
+
+    async def test_unchanged_files_are_not_reread(self, github_dir: Path):
+        await _autofix(1, AutoFixStatus.PENDING, "2025-01-01T00:00:00").save(github_dir)
+        index = StateIndex(github_dir)
+
+        assert index.sync() == 0
+        assert index.rebuild() == 1
+
+    def test_invalid_files_are_skipped(self, github_dir: Path):
+        issues_dir = github_dir / "issues"
+        issues_dir.mkdir(parents=True)
+        (issues_dir / "autofix_1.json").write_text("{not json")
+        (issues_dir / "autofix_x.json").write_text("{}")
+
+        assert StateIndex(github_dir).autofix_queue() == []
+
+
+class TestPrune:
+    async def test_prune_drops_rows_of_removed_files(self, github_dir: Path):
+        for number in (1, 2):
+            await _autofix(number, AutoFixStatus.PENDING, "2025-01-01T00:00:00").save(
+                github_dir
+            )
+        index = StateIndex(github_dir)
+        (github_dir / "issues" / "autofix_1.json").unlink()
+
+        assert index.prune(dry_run=True) == 1
+        assert index.prune() == 1
+        assert index.prune() == 0
+
+
+class TestFallback:
+    async def test_unusable_database_reads_files(self, github_dir: Path):
+        await _autofix(1, AutoFixStatus.PENDING, "2025-01-01T00:00:00").save(github_dir)
+        await _autofix(2, AutoFixStatus.FAILED, "2025-01-02T00:00:00").save(github_dir)
+        db = github_dir / INDEX_FILENAME
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db}{suffix}").unlink(missing_ok=True)
+        db.mkdir()
+
+        queue = StateIndex(github_dir).autofix_queue(exclude_statuses=["failed"])
+
+        assert [s["issue_number"] for s in queue] == [1]
+
+    async def test_save_succeeds_without_index(self, github_dir: Path):
+        github_dir.mkdir(parents=True)
+        (github_dir / INDEX_FILENAME).mkdir()
+
+        await _autofix(1, AutoFixStatus.PENDING, "2025-01-01T00:00:00").save(github_dir)
+
+        assert AutoFixState.load(github_dir, 1) is not None
+
+
+class TestConcurrency:
+    async def test_concurrent_saves_match_files(self, github_dir: Path):
+        states = [
+            _autofix(n, AutoFixStatus.PENDING, f"2025-01-01T00:00:{n:02d}")
+            for n in range(50)
+        ]
+        await asyncio.gather(*(state.save(github_dir) for state in states))
+
+        # Save the same items again, concurrently, with a new status
+        for state in states[::2]:
+            state.update_status(AutoFixStatus.ANALYZING)
+        await asyncio.gather(*(state.save(github_dir) for state in states[::2]))
+
+        index = StateIndex(github_dir)
+        queue = index.autofix_queue()
+        assert [s["issue_number"] for s in queue] == list(range(49, -1, -1))
+        assert {s["issue_number"] for s in queue if s["status"] == "analyzing"} == {
+            n for n in range(0, 50, 2)
+        }
+        # Every row already matched its file: nothing to re-read
+        assert index.sync() == 0
+
+
+class TestConsumers:
+    async def test_get_queue_uses_index(self, github_dir: Path):
+        await _autofix(1, AutoFixStatus.PENDING, "2025-01-01T00:00:00").save(github_dir)
+        await _autofix(2, AutoFixStatus.BUILDING, "2025-01-02T00:00:00").save(
+            github_dir
+        )
+        processor = AutoFixProcessor(github_dir, MagicMock(), MagicMock())
+
+        queue = await processor.get_queue()
+
+        assert [state.issue_number for state in queue] == [2, 1]
+        assert queue[0].status == AutoFixStatus.BUILDING
@@ -0,0 +1,226 @@
+"""
+Tests for the Issue Triage Token Index
+======================================
+
+Tests candidate-duplicate lookup used by TriageEngine.build_triage_context():
+- "overlap" mode parity with the original title word overlap scan
+- "indexed" mode ranking (IDF weighting, MinHash/LSH body similarity)
+- Index reuse across a triage run
+- Benchmark at 10k issues
+"""
+
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from models import GitHubRunnerConfig
+    from services.issue_index import (
+        MODE_INDEXED,
+        MODE_OVERLAP,
+        IssueTokenIndex,
+        estimate_jaccard,
+        minhash_signature,
+    )
+    from services.triage_engine import TriageEngine
+
+_WORDS = (
+    "crash login oauth token refresh build fails windows macos linux docs typo "
+    "button dark mode sidebar slow memory leak terminal agent worktree merge "
+    "conflict settings profile update installer python node error on the in with"
+).split()
+
+
+def _issue(number: int, title: str, body: str = "") -> dict:
+    return {
+        "number": number,
+        "title": title,
+        "body": body,
+        "author": {"login": "user"},
+        "createdAt": "2026-01-01T00:00:00Z",
+        "labels": [],
+    }
+
+
+def _random_issues(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    issues = []
+    for number in range(1, count + 1):
+        title = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 8)))
+        if rng.random() < 0.3:
+            title = title.title()
+        body = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 40)))
+        issues.append(_issue(number, title, body))
+    return issues
+
+
+def _zipf_issues(count: int, vocab_size: int = 20_000, seed: int = 0) -> list[dict]:
+    """Issues like real ones: common filler words plus Zipf-distributed terms."""
+    rng = random.Random(seed)
+    filler = "the a in on with when after is not to for of and".split()
+    vocab = [f"term{i}" for i in range(vocab_size)]
+    weights = [1 / (rank + 1) for rank in range(vocab_size)]
+
+    def words(n: int) -> str:
+        terms = rng.choices(vocab, weights=weights, k=n)
+        return " ".join(
+            rng.choice(filler) if rng.random() < 0.3 else term for term in terms
+        )
+
+    return [
+        _issue(number, words(rng.randint(3, 10)), words(rng.randint(10, 80)))
+        for number in range(1, count + 1)
+    ]
+
+
+def _legacy_candidates(issue: dict, all_issues: list[dict]) -> list[dict]:
+    """The full scan build_triage_context() used to do."""
+    potential_dupes = []
+    for other in all_issues:
+        if other["number"] == issue["number"]:
+            continue
+        title_words = set(issue["title"].lower().split())
+        other_words = set(other["title"].lower().split())
+        overlap = len(title_words & other_words) / max(len(title_words), 1)
+        if overlap > 0.3:
+            potential_dupes.append(other)
+    return potential_dupes
+
+
+def _engine(tmp_path: Path, mode: str = MODE_INDEXED) -> TriageEngine:
+    config = GitHubRunnerConfig(token="t", repo="o/r", triage_candidate_mode=mode)
+    return TriageEngine(tmp_path, tmp_path / ".github", config)
+
+
+class TestOverlapMode:
+    """Compatibility mode matches the original scan exactly."""
+
+    def test_parity_with_full_scan(self):
+        issues = _random_issues(400)
+        index = IssueTokenIndex(issues, mode=MODE_OVERLAP)
+
+        for issue in issues:
+            assert index.candidates(issue) == _legacy_candidates(issue, issues)
+
+    def test_issue_outside_index(self):
+        issues = _random_issues(50)
+        query = _issue(999, "Crash on login with oauth token")
+        index = IssueTokenIndex(issues, mode=MODE_OVERLAP)
+
+        assert index.candidates(query) == _legacy_candidates(query, issues)
+
+    def test_context_unchanged_in_overlap_mode(self, tmp_path: Path):
+        issues = _random_issues(100)
+        engine = _engine(tmp_path, MODE_OVERLAP)
+
+        context = engine.build_triage_context(issues[0], issues)
+
+        expected = [
+            f"- #{d['number']}: {d['title']}"
+            for d in _legacy_candidates(issues[0], issues)[:5]
+        ]
+        for line in expected:
+            assert line in context
+
+
+class TestIndexedMode:
+    """IDF-weighted ranking with MinHash body similarity."""
+
+    def test_rare_shared_token_outranks_common_ones(self):
+        issues = [_issue(i, f"error in module {i}") for i in range(1, 40)]
+        issues.append(_issue(100, "segfault error in renderer"))
+        issues.append(_issue(101, "renderer segfault on startup"))
+        index = IssueTokenIndex(issues)
+
+        candidates = index.candidates(issues[-1], limit=3)
+
+        assert candidates[0]["number"] == 100
+
+    def test_similar_body_found_via_lsh(self):
+        body = (
+            "Steps: open settings, toggle dark mode, restart app. Sidebar "
+            "renders white and terminal font resets to default monospace."
+        )
+        issues = _random_issues(200, seed=3)
+        issues.append(_issue(500, "Theme broken after restart", body))
+        query = _issue(501, "Appearance preference lost", body + " Happens daily.")
+        index = IssueTokenIndex(issues)
+
+        assert [c["number"] for c in index.candidates(query, limit=5)][:1] == [500]
+
+    def test_excludes_self_and_respects_limit(self):
+        issues = [_issue(i, "merge conflict in worktree") for i in range(1, 10)]
+        index = IssueTokenIndex(issues)
+
+        candidates = index.candidates(issues[0], limit=5)
+
+        assert len(candidates) == 5
+        assert all(c["number"] != 1 for c in candidates)
+
+    def test_minhash_estimates_jaccard(self):
+        a = {f"tok{i}" for i in range(200)}
+        b = {f"tok{i}" for i in range(100, 300)}  # True Jaccard = 1/3
+
+        estimate = estimate_jaccard(minhash_signature(a), minhash_signature(b))
+
+        assert estimate == pytest.approx(1 / 3, abs=0.15)
+        assert estimate_jaccard(minhash_signature(a), minhash_signature(a)) == 1.0
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            IssueTokenIndex([], mode="nope")
+
+
+class TestTriageEngineIndex:
+    """TriageEngine builds the index once per issue list."""
+
+    def test_index_reused_for_same_list(self, tmp_path: Path):
+        issues = _random_issues(20)
+        engine = _engine(tmp_path)
+
+        first = engine.get_issue_index(issues)
+        engine.build_triage_context(issues[1], issues)
+
+        assert engine.get_issue_index(issues) is first
+        assert engine.get_issue_index(list(issues)) is not first
+
+    def test_config_round_trip(self, tmp_path: Path):
+        config = GitHubRunnerConfig(
+            token="t", repo="o/r", triage_candidate_mode=MODE_OVERLAP
+        )
+        config.save_settings(tmp_path)
+
+        loaded = GitHubRunnerConfig.load_settings(tmp_path, token="t", repo="o/r")
+
+        assert loaded.triage_candidate_mode == MODE_OVERLAP
+
+
+@pytest.mark.slow
+class TestTriageIndexBenchmark:
+    """Benchmark: candidate lookup for every issue in a 10k-issue repo."""
+
+    def test_benchmark_10k_issues(self):
+        issues = _zipf_issues(10_000, seed=7)
+        sample = issues[:200]
+
+        start = time.perf_counter()
+        for issue in sample:
+            _legacy_candidates(issue, issues)
+        legacy_secs = (time.perf_counter() - start) * len(issues) / len(sample)
+
+        timings = {}
+        for mode in (MODE_OVERLAP, MODE_INDEXED):
+            start = time.perf_counter()
+            index = IssueTokenIndex(issues, mode=mode)
+            for issue in issues:
+                index.candidates(issue, limit=5)
+            timings[mode] = time.perf_counter() - start
+
+        print(
+            f"\n10k issues: legacy scan ~{legacy_secs:.1f}s (extrapolated), "
+            + ", ".join(f"{mode}={secs:.2f}s" for mode, secs in timings.items())
+        )
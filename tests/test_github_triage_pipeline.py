@@ -0,0 +1,250 @@
+"""
+Tests for the Concurrent Triage Pipeline
+========================================
+
+Tests GitHubOrchestrator.triage_issues() and the bulk issue fetch it uses:
+- GHClient.issue_get_many() batching and response normalization
+- Bounded concurrency of triage sessions
+- Results saved as they complete and returned in issue order
+- Resume after an interrupted run (TriageCheckpoint)
+- Early stop when the AI cost budget is exhausted
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from gh_client import GHClient, GHCommandResult
+    from models import (
+        GitHubRunnerConfig,
+        TriageCategory,
+        TriageCheckpoint,
+        TriageResult,
+    )
+    from orchestrator import GitHubOrchestrator
+    from rate_limiter import RateLimiter
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def _issue(number: int) -> dict:
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "",
+        "author": {"login": "user"},
+        "createdAt": "2026-01-01T00:00:00Z",
+        "labels": [],
+    }
+
+
+def _result(number: int) -> TriageResult:
+    return TriageResult(
+        issue_number=number,
+        repo="owner/repo",
+        category=TriageCategory.BUG,
+        confidence=0.9,
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter():
+    RateLimiter.reset_instance()
+    yield
+    RateLimiter.reset_instance()
+
+
+@pytest.fixture
+def orchestrator(tmp_path: Path) -> GitHubOrchestrator:
+    config = GitHubRunnerConfig(token="t", repo="owner/repo")
+    orch = GitHubOrchestrator(project_dir=tmp_path, config=config)
+    orch.gh_client.issue_get_many = AsyncMock(
+        side_effect=lambda numbers: [_issue(n) for n in numbers]
+    )
+    return orch
+
+
+class TestIssueGetMany:
+    """Bulk issue fetch via aliased GraphQL queries."""
+
+    async def test_batches_and_normalizes(self, tmp_path: Path):
+        client = GHClient(tmp_path, enable_rate_limiting=False, repo="owner/repo")
+        queries = []
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            query = next(a for a in args if a.startswith("query="))
+            queries.append(query)
+            data = {
+                "repository": {
+                    "i1": {
+                        "number": 1,
+                        "title": "One",
+                        "author": None,
+                        "labels": {"nodes": [{"name": "bug"}]},
+                        "comments": {
+                            "nodes": [{"author": {"login": "a"}, "body": "hi"}]
+                        },
+                    },
+                    "i2": None,
+                    "i3": {"number": 3, "title": "Three", "author": {"login": "b"}},
+                }
+            }
+            return GHCommandResult(
+                stdout=json.dumps({"data": data}),
+                stderr="",
+                returncode=1,
+                command=args,
+                attempts=1,
+                total_time=0.0,
+            )
+
+        client.run = fake_run
+
+        issues = await client.issue_get_many([1, 2, 3], batch_size=2)
+
+        assert len(queries) == 2
+        assert "i1: issue(number: 1)" in queries[0]
+        assert [i["number"] for i in issues] == [1, 3]
+        assert issues[0]["author"] == {"login": "ghost"}
+        assert issues[0]["labels"] == [{"name": "bug"}]
+        assert issues[0]["comments"][0]["body"] == "hi"
+
+    async def test_falls_back_without_repo(self, tmp_path: Path):
+        client = GHClient(tmp_path, enable_rate_limiting=False)
+        client.issue_get = AsyncMock(side_effect=_issue)
+
+        issues = await client.issue_get_many([4, 5])
+
+        assert [i["number"] for i in issues] == [4, 5]
+
+
+class TestTriagePipeline:
+    """Concurrent triage with streaming saves and checkpoints."""
+
+    async def test_concurrency_is_bounded(self, orchestrator: GitHubOrchestrator):
+        running = 0
+        peak = 0
+
+        async def triage(issue, all_issues):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _result(issue["number"])
+
+        orchestrator.triage_engine.triage_single_issue = triage
+
+        results = await orchestrator.triage_issues(
+            issue_numbers=list(range(1, 11)), max_concurrency=3
+        )
+
+        assert peak == 3
+        assert len(results) == 10
+
+    async def test_results_saved_and_ordered(self, orchestrator: GitHubOrchestrator):
+        async def triage(issue, all_issues):
+            # Later issues finish first
+            await asyncio.sleep(0.01 * (5 - issue["number"]))
+            return _result(issue["number"])
+
+        orchestrator.triage_engine.triage_single_issue = triage
+
+        results = await orchestrator.triage_issues(issue_numbers=[1, 2, 3, 4])
+
+        assert [r.issue_number for r in results] == [1, 2, 3, 4]
+        orchestrator.gh_client.issue_get_many.assert_awaited_once_with([1, 2, 3, 4])
+        for number in (1, 2, 3, 4):
+            assert TriageResult.load(orchestrator.github_dir, number) is not None
+        # Finished runs leave no checkpoint behind
+        assert TriageCheckpoint.load(orchestrator.github_dir) is None
+
+    async def test_resume_skips_completed(self, orchestrator: GitHubOrchestrator):
+        calls = []
+
+        async def interrupted(issue, all_issues):
+            if issue["number"] == 3:
+                raise _Interrupted
+            calls.append(issue["number"])
+            return _result(issue["number"])
+
+        orchestrator.triage_engine.triage_single_issue = interrupted
+        with pytest.raises(_Interrupted):
+            await orchestrator.triage_issues(
+                issue_numbers=[1, 2, 3, 4], max_concurrency=1
+            )
+
+        checkpoint = TriageCheckpoint.load(orchestrator.github_dir)
+        assert sorted(checkpoint.completed) == [1, 2]
+        assert checkpoint.pending == [3, 4]
+
+        async def triage(issue, all_issues):
+            calls.append(issue["number"])
+            return _result(issue["number"])
+
+        orchestrator.triage_engine.triage_single_issue = triage
+        results = await orchestrator.triage_issues(resume=True)
+
+        assert calls == [1, 2, 3, 4]
+        assert [r.issue_number for r in results] == [1, 2, 3, 4]
+        assert TriageCheckpoint.load(orchestrator.github_dir) is None
+
+    async def test_without_checkpoint_keeps_interrupted_run(
+        self, orchestrator: GitHubOrchestrator
+    ):
+        async def interrupted(issue, all_issues):
+            if issue["number"] == 2:
+                raise _Interrupted
+            return _result(issue["number"])
+
+        orchestrator.triage_engine.triage_single_issue = interrupted
+        with pytest.raises(_Interrupted):
+            await orchestrator.triage_issues(issue_numbers=[1, 2], max_concurrency=1)
+
+        async def triage(issue, all_issues):
+            return _result(issue["number"])
+
+        # A single-issue triage (the watch daemon) leaves the checkpoint alone
+        orchestrator.triage_engine.triage_single_issue = triage
+        results = await orchestrator.triage_issues(
+            issue_numbers=[5], use_checkpoint=False
+        )
+
+        assert [r.issue_number for r in results] == [5]
+        checkpoint = TriageCheckpoint.load(orchestrator.github_dir)
+        assert checkpoint.issue_numbers == [1, 2]
+        assert checkpoint.pending == [2]
+
+    async def test_stops_when_budget_exhausted(self, orchestrator: GitHubOrchestrator):
+        budget = iter([True, True])
+        orchestrator.rate_limiter = MagicMock()
+        orchestrator.rate_limiter.check_cost_available.side_effect = lambda: (
+            next(budget, False),
+            "Cost budget exceeded",
+        )
+        orchestrator.triage_engine.triage_single_issue = AsyncMock(
+            side_effect=lambda issue, all_issues: _result(issue["number"])
+        )
+
+        results = await orchestrator.triage_issues(
+            issue_numbers=[1, 2, 3, 4], max_concurrency=1
+        )
+
+        assert [r.issue_number for r in results] == [1, 2]
+        assert TriageCheckpoint.load(orchestrator.github_dir).pending == [3, 4]
+
+    def test_config_round_trip(self, tmp_path: Path):
+        config = GitHubRunnerConfig(token="t", repo="o/r", triage_max_concurrency=8)
+        config.save_settings(tmp_path)
+
+        loaded = GitHubRunnerConfig.load_settings(tmp_path, token="t", repo="o/r")
+
+        assert loaded.triage_max_concurrency == 8
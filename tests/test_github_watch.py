@@ -0,0 +1,557 @@
+"""
+Tests for the GitHub Watch Daemon
+=================================
+
+Tests watch.py:
+- JobQueue deduplication by head SHA, backpressure and per-key exclusion
+- Dispatch decisions from webhook payloads and the in-memory state index
+- Incremental polling with the since cursor
+- The local webhook receiver (signatures, redeliveries, full queue)
+- Workers running jobs through the orchestrator, with batched PR prefetch
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tests.github_runner_helpers import github_runner_imports
+
+with github_runner_imports():
+    from gh_client import GHClient, GHCommandResult
+    from models import GitHubRunnerConfig
+    from watch import (
+        JobQueue,
+        WatchDaemon,
+        WatchJob,
+        WatchJobKind,
+        WatchStateIndex,
+        WebhookReceiver,
+    )
+
+
+# Recorded webhook payloads, trimmed to the fields the daemon reads
+PR_OPENED = {
+    "action": "opened",
+    "number": 12,
+    "pull_request": {
+        "number": 12,
+        "state": "open",
+        "draft": False,
+        "updated_at": "2026-03-01T10:00:00Z",
+        "head": {"ref": "feature", "sha": "aaa111"},
+        "base": {"ref": "main", "sha": "000000"},
+    },
+}
+PR_SYNCHRONIZE = {
+    "action": "synchronize",
+    "number": 12,
+    "before": "aaa111",
+    "after": "bbb222",
+    "pull_request": {
+        "number": 12,
+        "state": "open",
+        "draft": False,
+        "updated_at": "2026-03-01T10:05:00Z",
+        "head": {"ref": "feature", "sha": "bbb222"},
+        "base": {"ref": "main", "sha": "000000"},
+    },
+}
+ISSUE_LABELED = {
+    "action": "labeled",
+    "label": {"name": "auto-fix"},
+    "issue": {
+        "number": 7,
+        "state": "open",
+        "title": "Crash on startup",
+        "labels": [{"name": "bug"}, {"name": "auto-fix"}],
+        "updated_at": "2026-03-01T11:00:00Z",
+    },
+}
+ISSUE_OPENED = {
+    "action": "opened",
+    "issue": {
+        "number": 8,
+        "state": "open",
+        "title": "Feature idea",
+        "labels": [],
+        "updated_at": "2026-03-01T12:00:00Z",
+    },
+}
+
+
+def _job(number: int, sha: str | None = None, kind=WatchJobKind.REVIEW) -> WatchJob:
+    return WatchJob(kind, number, head_sha=sha)
+
+
+def _make_daemon(tmp_path: Path, **config) -> WatchDaemon:
+    defaults = {
+        "pr_review_enabled": True,
+        "triage_enabled": True,
+        "auto_fix_enabled": True,
+    }
+    defaults.update(config)
+    orchestrator = SimpleNamespace(
+        config=GitHubRunnerConfig(token="t", repo="owner/repo", **defaults),
+        github_dir=tmp_path,
+        gh_client=SimpleNamespace(
+            issues_updated_since=AsyncMock(return_value=[]),
+            prs_updated_since=AsyncMock(return_value=[]),
+        ),
+        prefetch_pr_bundles=AsyncMock(return_value={}),
+        review_pr=AsyncMock(),
+        followup_review_pr=AsyncMock(),
+        triage_issues=AsyncMock(),
+        auto_fix_issue=AsyncMock(),
+    )
+    return WatchDaemon(orchestrator)
+
+
+def _queued(daemon: WatchDaemon) -> list[tuple]:
+    return sorted(
+        (job.kind.value, job.number, job.head_sha)
+        for job in daemon.queue._pending.values()
+    )
+
+
+class TestJobQueue:
+    """Deduplication, backpressure and per-key exclusion."""
+
+    async def test_dedup_and_supersede(self):
+        queue = JobQueue(maxsize=10)
+        await queue.submit(_job(1, "a"))
+        await queue.submit(_job(1, "a"))
+        await queue.submit(_job(1, "b"))
+        await queue.submit(_job(2, "a"))
+
+        assert queue.qsize() == 2
+        assert queue.stats.deduplicated == 1
+        assert queue.stats.superseded == 1
+        first = await queue.get()
+        assert (first.number, first.head_sha) == (1, "b")
+
+    async def test_running_same_sha_is_deduplicated(self):
+        queue = JobQueue()
+        await queue.submit(_job(1, "a"))
+        running = await queue.get()
+
+        await queue.submit(_job(1, "a"))
+        assert queue.qsize() == 0
+
+        queue.done(running)
+        assert queue.stats.completed == 1
+
+    async def test_same_key_waits_for_running_job(self):
+        queue = JobQueue()
+        await queue.submit(_job(1, "a"))
+        running = await queue.get()
+        await queue.submit(_job(1, "b"))
+        await queue.submit(_job(2, "a"))
+
+        # The newer review of PR 1 is held back; PR 2 runs meanwhile
+        other = await queue.get()
+        assert other.number == 2
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.get(), 0.05)
+
+        queue.done(running)
+        follow_up = await asyncio.wait_for(queue.get(), 1)
+        assert (follow_up.number, follow_up.head_sha) == (1, "b")
+
+    async def test_backpressure(self):
+        queue = JobQueue(maxsize=2)
+        await queue.submit(_job(1))
+        await queue.submit(_job(2))
+
+        assert await queue.submit(_job(3), timeout=0.05) is False
+        assert queue.stats.rejected == 1
+
+        blocked = asyncio.create_task(queue.submit(_job(4)))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        await queue.get()
+        assert await asyncio.wait_for(blocked, 1) is True
+        assert queue.qsize() == 2
+
+
+class TestDispatch:
+    """Jobs derived from events and the in-memory index."""
+
+    async def test_pr_events_dedup_by_head_sha(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+
+        await daemon.handle_webhook("pull_request", PR_OPENED)
+        await daemon.handle_webhook("pull_request", PR_OPENED)
+        assert _queued(daemon) == [("review", 12, "aaa111")]
+
+        await daemon.handle_webhook("pull_request", PR_SYNCHRONIZE)
+        assert _queued(daemon) == [("review", 12, "bbb222")]
+        assert daemon.index.prs[12].head_sha == "bbb222"
+
+    async def test_reviewed_head_is_skipped(self, tmp_path: Path):
+        (tmp_path / "pr").mkdir()
+        (tmp_path / "pr" / "review_12.json").write_text(
+            json.dumps({"success": True, "reviewed_commit_sha": "aaa111"})
+        )
+        daemon = _make_daemon(tmp_path)
+
+        await daemon.handle_webhook("pull_request", PR_OPENED)
+        assert _queued(daemon) == []
+        await daemon.handle_webhook("pull_request", PR_SYNCHRONIZE)
+        assert _queued(daemon) == [("review", 12, "bbb222")]
+
+    async def test_draft_and_disabled_reviews(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path, pr_review_enabled=False)
+        await daemon.handle_webhook("pull_request", PR_OPENED)
+        assert _queued(daemon) == []
+
+        daemon = _make_daemon(tmp_path)
+        draft = json.loads(json.dumps(PR_OPENED))
+        draft["pull_request"]["draft"] = True
+        await daemon.handle_webhook("pull_request", draft)
+        assert _queued(daemon) == []
+
+    async def test_issue_events(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+
+        await daemon.handle_webhook("issues", ISSUE_OPENED)
+        await daemon.handle_webhook("issues", ISSUE_LABELED)
+
+        assert _queued(daemon) == [("auto_fix", 7, None), ("triage", 8, None)]
+        job = daemon.queue._pending[(WatchJobKind.AUTO_FIX, 7)]
+        assert job.trigger_label == "auto-fix"
+
+    async def test_index_skips_triaged_and_active_autofix(self, tmp_path: Path):
+        issues_dir = tmp_path / "issues"
+        issues_dir.mkdir()
+        (issues_dir / "triage_8.json").write_text("{}")
+        (issues_dir / "triage_checkpoint.json").write_text("{}")
+        (issues_dir / "autofix_7.json").write_text(json.dumps({"status": "building"}))
+        daemon = _make_daemon(tmp_path)
+
+        await daemon.handle_webhook("issues", ISSUE_OPENED)
+        await daemon.handle_webhook("issues", ISSUE_LABELED)
+        assert _queued(daemon) == []
+
+        # A failed auto-fix is restarted by the label
+        daemon.index.autofix_status[7] = daemon.index.autofix_status[7].FAILED
+        await daemon.handle_webhook("issues", ISSUE_LABELED)
+        assert _queued(daemon) == [("auto_fix", 7, None)]
+
+    async def test_full_queue_leaves_index_unchanged(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+        daemon.queue = JobQueue(maxsize=1)
+        await daemon.queue.submit(_job(99))
+
+        accepted = await daemon.handle_webhook("pull_request", PR_OPENED, timeout=0.05)
+
+        assert accepted is False
+        assert 12 not in daemon.index.prs
+
+    async def test_ignored_events(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+
+        assert await daemon.handle_webhook("ping", {"zen": "Keep it simple."})
+        closed = json.loads(json.dumps(PR_OPENED))
+        closed["action"] = "closed"
+        closed["pull_request"]["state"] = "closed"
+        assert await daemon.handle_webhook("pull_request", closed)
+        assert _queued(daemon) == []
+
+
+class TestPolling:
+    """Incremental polling with the since cursor."""
+
+    async def test_poll_uses_and_advances_cursor(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+        # First run starts from now; rewind to before the recorded payloads
+        daemon.since = start = "2026-03-01T00:00:00Z"
+        gh = daemon.gh_client
+        pr_as_issue = {**ISSUE_OPENED["issue"], "number": 12, "pull_request": {}}
+        gh.issues_updated_since.return_value = [
+            ISSUE_OPENED["issue"],
+            ISSUE_LABELED["issue"],
+            pr_as_issue,
+        ]
+        gh.prs_updated_since.return_value = [PR_OPENED["pull_request"]]
+
+        assert await daemon.poll_once() == 4
+
+        gh.issues_updated_since.assert_awaited_once_with(start)
+        # Polled updates carry no action: untriaged open issues get triaged
+        assert _queued(daemon) == [
+            ("auto_fix", 7, None),
+            ("review", 12, "aaa111"),
+            ("triage", 7, None),
+            ("triage", 8, None),
+        ]
+        assert daemon.since == "2026-03-01T12:00:00Z"
+        cursor = json.loads((tmp_path / "watch_cursor.json").read_text())
+        assert cursor == {"since": "2026-03-01T12:00:00Z"}
+
+        # The inclusive cursor returns the newest item again: no new jobs
+        daemon.queue = JobQueue()
+        gh.issues_updated_since.return_value = [ISSUE_OPENED["issue"]]
+        gh.prs_updated_since.return_value = []
+        await daemon.poll_once()
+        assert _queued(daemon) == []
+
+        # A restart resumes from the saved cursor
+        assert _make_daemon(tmp_path).since == "2026-03-01T12:00:00Z"
+
+    async def test_gh_client_since_queries(self, tmp_path: Path):
+        client = GHClient(tmp_path, enable_rate_limiting=False, repo="owner/repo")
+        endpoints = []
+
+        async def fake_run(args, timeout=None, raise_on_error=True):
+            endpoint = args[-1]
+            endpoints.append(endpoint)
+            if "/pulls?" in endpoint:
+                # A full page, newest first, reaching past `since`
+                prs = [
+                    {"number": n, "updated_at": f"2026-03-{10 - n // 20:02d}T00:00:00Z"}
+                    for n in range(100)
+                ]
+                stdout = json.dumps(prs)
+            else:
+                stdout = json.dumps([{"number": 1}])
+            return GHCommandResult(
+                stdout=stdout,
+                stderr="",
+                returncode=0,
+                command=args,
+                attempts=1,
+                total_time=0.0,
+            )
+
+        client.run = fake_run
+
+        issues = await client.issues_updated_since("2026-03-07T00:00:00Z")
+        assert issues == [{"number": 1}]
+        assert endpoints[0].startswith("repos/owner/repo/issues?")
+        assert "since=2026-03-07T00:00:00Z" in endpoints[0]
+
+        endpoints.clear()
+        prs = await client.prs_updated_since("2026-03-07T00:00:00Z")
+        # Stops after the first page reaching an older update; oldest first
+        assert len(endpoints) == 1
+        assert [pr["number"] for pr in prs] == list(range(79, -1, -1))
+
+
+class TestWebhookReceiver:
+    """The local HTTP endpoint."""
+
+    async def _post(
+        self,
+        port: int,
+        payload: dict,
+        event: str,
+        secret: str | None = None,
+        delivery: str = "d-1",
+    ) -> int:
+        body = json.dumps(payload).encode()
+        headers = {
+            "Host": "localhost",
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+            "X-GitHub-Event": event,
+            "X-GitHub-Delivery": delivery,
+        }
+        if secret:
+            digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+            headers["X-Hub-Signature-256"] = f"sha256={digest}"
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        request = "POST /webhook HTTP/1.1\r\n" + "".join(
+            f"{k}: {v}\r\n" for k, v in headers.items()
+        )
+        writer.write(request.encode() + b"\r\n" + body)
+        await writer.drain()
+        status_line = await reader.readline()
+        writer.close()
+        return int(status_line.split()[1])
+
+    async def test_deliveries(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+        receiver = WebhookReceiver(daemon.handle_webhook, secret="s3cret", port=0)
+        await receiver.start()
+        try:
+            port = receiver.port
+            assert await self._post(port, PR_OPENED, "pull_request", "s3cret") == 202
+            # Redelivery of the same delivery ID
+            assert await self._post(port, PR_OPENED, "pull_request", "s3cret") == 200
+            assert await self._post(port, PR_OPENED, "pull_request", "wrong") == 401
+            assert await self._post(port, PR_OPENED, "pull_request") == 401
+        finally:
+            await receiver.stop()
+
+        assert _queued(daemon) == [("review", 12, "aaa111")]
+
+    async def test_no_secret_rejects_deliveries(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+        receiver = WebhookReceiver(daemon.handle_webhook, port=0)
+        await receiver.start()
+        try:
+            assert await self._post(receiver.port, PR_OPENED, "pull_request") == 401
+        finally:
+            await receiver.stop()
+
+        assert _queued(daemon) == []
+
+    async def test_full_queue_returns_503(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+        daemon.queue = JobQueue(maxsize=1)
+        await daemon.queue.submit(_job(99))
+        receiver = WebhookReceiver(
+            daemon.handle_webhook, secret="s3cret", port=0, submit_timeout=0.05
+        )
+        await receiver.start()
+        try:
+            status = await self._post(
+                receiver.port, PR_OPENED, "pull_request", "s3cret"
+            )
+            assert status == 503
+            # Not remembered as delivered, so the retry is processed
+            await daemon.queue.get()
+            status = await self._post(
+                receiver.port, PR_OPENED, "pull_request", "s3cret"
+            )
+            assert status == 202
+        finally:
+            await receiver.stop()
+
+
+class TestWorkers:
+    """Jobs run through the orchestrator and update the index."""
+
+    async def test_run_dispatches_jobs(self, tmp_path: Path):
+        (tmp_path / "pr").mkdir()
+        (tmp_path / "pr" / "review_5.json").write_text(
+            json.dumps({"success": True, "reviewed_commit_sha": "old"})
+        )
+        daemon = _make_daemon(tmp_path)
+        daemon.poll_interval = 0
+        orch = daemon.orchestrator
+        orch.triage_issues.return_value = [SimpleNamespace(issue_number=8)]
+
+        await daemon.handle_webhook("pull_request", PR_OPENED)
+        await daemon.queue.submit(_job(5, "new"))
+        await daemon.handle_webhook("issues", ISSUE_OPENED)
+        await daemon.handle_webhook("issues", ISSUE_LABELED)
+
+        stop = asyncio.Event()
+        run = asyncio.create_task(daemon.run(stop=stop))
+        for _ in range(100):
+            if daemon.queue.stats.completed == 4:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await run
+
+        orch.review_pr.assert_awaited_once_with(12, bundle=None)
+        orch.followup_review_pr.assert_awaited_once_with(5)
+        orch.triage_issues.assert_awaited_once_with(
+            issue_numbers=[8],
+            apply_labels=False,
+            max_concurrency=1,
+            use_checkpoint=False,
+        )
+        orch.auto_fix_issue.assert_awaited_once_with(7, "auto-fix")
+        assert 8 in daemon.index.triaged
+
+    async def test_queued_reviews_share_one_bundle_fetch(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+        orch = daemon.orchestrator
+        orch.prefetch_pr_bundles.return_value = {
+            1: {"headRefOid": "a1"},
+            2: {"headRefOid": "old"},
+            3: {"headRefOid": "a3"},
+        }
+        for number in (1, 2, 3):
+            await daemon.queue.submit(_job(number, f"a{number}"))
+
+        for _ in range(3):
+            job = await daemon.queue.get()
+            await daemon.execute(job)
+            daemon.queue.done(job)
+
+        orch.prefetch_pr_bundles.assert_awaited_once_with([1, 2, 3])
+        assert [c.kwargs["bundle"] for c in orch.review_pr.await_args_list] == [
+            {"headRefOid": "a1"},
+            None,  # Pushed since the prefetch
+            {"headRefOid": "a3"},
+        ]
+
+    async def test_failed_job_is_counted(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+        daemon.poll_interval = 0
+        daemon.orchestrator.review_pr.side_effect = RuntimeError("boom")
+        await daemon.handle_webhook("pull_request", PR_OPENED)
+
+        stop = asyncio.Event()
+        run = asyncio.create_task(daemon.run(stop=stop))
+        for _ in range(100):
+            if daemon.queue.stats.failed:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await run
+
+        assert daemon.queue.stats.failed == 1
+        assert daemon.queue.running() == []
+
+    async def test_triage_without_result_is_not_marked_triaged(self, tmp_path: Path):
+        daemon = _make_daemon(tmp_path)
+        daemon.poll_interval = 0
+        daemon.orchestrator.triage_issues.return_value = []
+        await daemon.handle_webhook("issues", ISSUE_OPENED)
+
+        stop = asyncio.Event()
+        run = asyncio.create_task(daemon.run(stop=stop))
+        for _ in range(100):
+            if daemon.queue.stats.failed:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await run
+
+        assert daemon.queue.stats.failed == 1
+        assert 8 not in daemon.index.triaged
+
+
+class TestStateIndex:
+    def test_load(self, tmp_path: Path):
+        (tmp_path / "pr").mkdir()
+        (tmp_path / "issues").mkdir()
+        (tmp_path / "pr" / "review_1.json").write_text(
+            json.dumps({"success": True, "reviewed_commit_sha": "abc"})
+        )
+        (tmp_path / "pr" / "review_2.json").write_text(
+            json.dumps({"success": False, "reviewed_commit_sha": "def"})
+        )
+        (tmp_path / "pr" / "review_3.json").write_text("{not json")
+        (tmp_path / "issues" / "autofix_4.json").write_text(
+            json.dumps({"status": "completed"})
+        )
+
+        index = WatchStateIndex(tmp_path)
+        index.load()
+
+        assert index.reviewed_sha == {1: "abc"}
+        assert index.autofix_status[4].value == "completed"
+
+    def test_config_round_trip(self, tmp_path: Path):
+        config = GitHubRunnerConfig(
+            token="t", repo="o/r", watch_max_concurrency=4, watch_poll_interval=0
+        )
+        config.save_settings(tmp_path)
+
+        loaded = GitHubRunnerConfig.load_settings(tmp_path, token="t", repo="o/r")
+
+        assert loaded.watch_max_concurrency == 4
+        assert loaded.watch_poll_interval == 0
+        assert loaded.watch_queue_size == 100
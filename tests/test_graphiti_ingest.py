@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batched Graphiti episode ingestion.
+
+Tests queries_pkg/ingest.py and its callers:
+- Episodes are bulk added in batches per group_id
+- Without bulk support, bounded concurrent add_episode() calls are used;
+  other bulk failures aren't retried (the batch may be partly saved)
+- Progress is reported and duplicate_facts errors count as saved
+- add_structured_insights() and EmbeddingMigrator.migrate_all() use it
+"""
+
+import asyncio
+import sys
+from enum import Enum
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from integrations.graphiti.queries_pkg.ingest import (
+    Episode,
+    EpisodeIngestor,
+    get_ingest_batch_size,
+    get_ingest_workers,
+)
+
+
+class EpisodeType(Enum):
+    text = "text"
+    message = "message"
+    json = "json"
+
+
+@pytest.fixture(autouse=True)
+def graphiti_core():
+    """Stand in for graphiti_core, which is an optional dependency."""
+    nodes = MagicMock(EpisodeType=EpisodeType)
+    bulk_utils = MagicMock(RawEpisode=lambda **kwargs: SimpleNamespace(**kwargs))
+    with patch.dict(
+        sys.modules,
+        {
+            "graphiti_core": MagicMock(),
+            "graphiti_core.nodes": nodes,
+            "graphiti_core.utils": MagicMock(),
+            "graphiti_core.utils.bulk_utils": bulk_utils,
+        },
+    ):
+        yield
+
+
+def _episodes(count: int, group_id: str = "group") -> list[Episode]:
+    return [
+        Episode(
+            name=f"{group_id}_{i}",
+            body="{}",
+            source_description="test",
+            group_id=group_id,
+        )
+        for i in range(count)
+    ]
+
+
+def _graphiti(bulk: bool = True) -> MagicMock:
+    graphiti = MagicMock(spec=["add_episode", "add_episode_bulk"] if bulk else [])
+    graphiti.add_episode = AsyncMock()
+    if bulk:
+        graphiti.add_episode_bulk = AsyncMock()
+    return graphiti
+
+
+class TestEpisodeIngestor:
+    async def test_bulk_batches_per_group(self):
+        graphiti = _graphiti()
+        progress = []
+
+        result = await EpisodeIngestor(
+            graphiti,
+            batch_size=2,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        ).ingest(_episodes(3, "a") + _episodes(2, "b"))
+
+        batches = [
+            (c.kwargs["group_id"], [e.name for e in c.args[0]])
+            for c in graphiti.add_episode_bulk.call_args_list
+        ]
+        assert batches == [("a", ["a_0", "a_1"]), ("b", ["b_0", "b_1"])]
+        # A batch of one is added on its own
+        assert graphiti.add_episode.call_args.kwargs["name"] == "a_2"
+        assert graphiti.add_episode.call_args.kwargs["source"] is EpisodeType.text
+        assert (result.saved, result.failed, result.bulk_batches) == (5, 0, 2)
+        assert progress == [(2, 5), (3, 5), (5, 5)]
+
+    async def test_bulk_failure_falls_back_to_single_adds(self):
+        graphiti = _graphiti()
+        graphiti.add_episode_bulk.side_effect = NotImplementedError("no bulk")
+
+        result = await EpisodeIngestor(graphiti, batch_size=3).ingest(_episodes(6))
+
+        # Bulk is not retried for the rest of the run
+        assert graphiti.add_episode_bulk.await_count == 1
+        assert graphiti.add_episode.await_count == 6
+        assert (result.saved, result.bulk_batches) == (6, 0)
+
+    async def test_failed_bulk_batch_is_not_added_again(self, caplog):
+        graphiti = _graphiti()
+        graphiti.add_episode_bulk.side_effect = [RuntimeError("connection lost"), None]
+
+        with caplog.at_level("WARNING"):
+            result = await EpisodeIngestor(graphiti, batch_size=2).ingest(
+                _episodes(4)
+            )
+
+        # The failed batch may be partly saved, so it isn't retried one by one
+        graphiti.add_episode.assert_not_called()
+        assert graphiti.add_episode_bulk.await_count == 2
+        assert (result.saved, result.failed, result.bulk_batches) == (2, 2, 1)
+        assert "not retrying" in caplog.text
+
+    async def test_single_adds_are_bounded(self):
+        graphiti = _graphiti(bulk=False)
+        active = 0
+        max_active = 0
+
+        async def add_episode(**kwargs):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if kwargs["name"] == "group_1":
+                raise RuntimeError("invalid duplicate_facts idx")
+            if kwargs["name"] == "group_2":
+                raise RuntimeError("LLM timeout")
+
+        graphiti.add_episode.side_effect = add_episode
+
+        result = await EpisodeIngestor(graphiti, batch_size=10, max_workers=2).ingest(
+            _episodes(8)
+        )
+
+        assert max_active == 2
+        assert (result.total, result.saved, result.failed) == (8, 7, 1)
+
+    def test_settings_from_environment(self, monkeypatch):
+        monkeypatch.delenv("GRAPHITI_INGEST_BATCH_SIZE", raising=False)
+        monkeypatch.delenv("GRAPHITI_INGEST_WORKERS", raising=False)
+        assert (get_ingest_batch_size(), get_ingest_workers()) == (10, 4)
+        monkeypatch.setenv("GRAPHITI_INGEST_BATCH_SIZE", "1")
+        monkeypatch.setenv("GRAPHITI_INGEST_WORKERS", "lots")
+        assert (get_ingest_batch_size(), get_ingest_workers()) == (1, 4)
+        assert not EpisodeIngestor(_graphiti())._use_bulk
+
+
+class TestCallers:
+    async def test_structured_insights_are_bulk_added(self):
+        from integrations.graphiti.queries_pkg.queries import GraphitiQueries
+
+        client = MagicMock(graphiti=_graphiti())
+        queries = GraphitiQueries(client, "project_group", "spec_001")
+
+        saved = await queries.add_structured_insights(
+            {
+                "subtask_id": "1.1",
+                "file_insights": [{"path": "src/app.py", "purpose": "Entry"}],
+                "patterns_discovered": ["Use PlanStore", {"pattern": "Env workers"}],
+                "gotchas_discovered": [{"gotcha": "CRLF files"}],
+                "approach_outcome": {"success": True, "approach_used": "Batching"},
+                "recommendations": ["Add tests"],
+            }
+        )
+
+        assert saved is True
+        (call,) = client.graphiti.add_episode_bulk.call_args_list
+        assert call.kwargs["group_id"] == "project_group"
+        names = [e.name for e in call.args[0]]
+        assert len(names) == 6
+        assert names[0] == "file_insight_src_app.py"
+        assert names[-1] == "recommendations_1.1"
+        client.graphiti.add_episode.assert_not_called()
+
+    async def test_migrate_all_ingests_in_batches(self):
+        from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
+
+        migrator = EmbeddingMigrator(MagicMock(), MagicMock(), dry_run=False)
+        migrator.target_client = MagicMock(graphiti=_graphiti())
+        migrator.get_source_episodes = AsyncMock(
+            return_value=[
+                {
+                    "name": "ep1",
+                    "content": "a",
+                    "source": "message",
+                    "valid_at": "2026-01-01T00:00:00Z",
+                    "group_id": "g",
+                },
+                {"name": "ep2", "content": None, "group_id": "g"},
+                {"name": "bad", "content": "c", "valid_at": "not a date"},
+            ]
+        )
+
+        stats = await migrator.migrate_all()
+
+        assert stats == {"total": 3, "succeeded": 2, "failed": 1, "dry_run": False}
+        (call,) = migrator.target_client.graphiti.add_episode_bulk.call_args_list
+        first, second = call.args[0]
+        assert first.source is EpisodeType.message
+        assert first.reference_time.year == 2026
+        assert second.content == ""
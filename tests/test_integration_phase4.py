@@ -6,6 +6,7 @@ Tests validating key features:
 - Phase 2: Import detection (path aliases, Python), reverse dependencies
 - Phase 3: Multi-agent cross-validation
 - Phase 5+: Scope filtering with is_impact_finding schema field
+- Reuse of cached specialist findings across review re-runs
 
 Note: ConfidenceTier and _validate_finding_evidence were removed in Phase 5
 (Code Simplification). Evidence validation is now handled by schema enforcement
@@ -54,6 +55,24 @@ category_utils_module = importlib.util.module_from_spec(category_utils_spec)
 sys.modules["services.category_utils"] = category_utils_module
 category_utils_spec.loader.exec_module(category_utils_module)
 
+# Load diff_shards
+diff_shards_spec = importlib.util.spec_from_file_location(
+    "services.diff_shards",
+    backend_path / "runners" / "github" / "services" / "diff_shards.py",
+)
+diff_shards_module = importlib.util.module_from_spec(diff_shards_spec)
+sys.modules["services.diff_shards"] = diff_shards_module
+diff_shards_spec.loader.exec_module(diff_shards_module)
+
+# Load specialist_cache
+specialist_cache_spec = importlib.util.spec_from_file_location(
+    "services.specialist_cache",
+    backend_path / "runners" / "github" / "services" / "specialist_cache.py",
+)
+specialist_cache_module = importlib.util.module_from_spec(specialist_cache_spec)
+sys.modules["services.specialist_cache"] = specialist_cache_module
+specialist_cache_spec.loader.exec_module(specialist_cache_module)
+
 # Load io_utils
 io_utils_spec = importlib.util.spec_from_file_location(
     "io_utils", backend_path / "runners" / "github" / "services" / "io_utils.py"
@@ -270,6 +289,13 @@ _cg_spec = importlib.util.spec_from_file_location(
 _cg_module = importlib.util.module_from_spec(_cg_spec)
 # Set up minimal module environment
 sys.modules["context_gatherer_isolated"] = _cg_module
+# Load context_snapshot (context_gatherer depends on it)
+_snapshot_spec = importlib.util.spec_from_file_location(
+    "context_snapshot", github_dir / "context_snapshot.py"
+)
+_snapshot_module = importlib.util.module_from_spec(_snapshot_spec)
+sys.modules["context_snapshot"] = _snapshot_module
+_snapshot_spec.loader.exec_module(_snapshot_module)
 # Mock only the gh_client dependency
 _mock_gh = MagicMock()
 sys.modules["gh_client"] = _mock_gh
@@ -721,3 +747,126 @@ class TestCrossValidation:
         assert len(validated) == 0
         assert len(agreement.agreed_findings) == 0
         assert len(agreement.conflicting_findings) == 0
+
+
+# =============================================================================
+# Specialist Findings Cache
+# =============================================================================
+
+SpecialistCacheReport = specialist_cache_module.SpecialistCacheReport
+ChangedFile = _cg_module.ChangedFile
+PRContext = _cg_module.PRContext
+
+
+class TestSpecialistCacheReuse:
+    """Specialist findings are reused when a PR is reviewed again."""
+
+    @pytest.fixture
+    def reviewer(self, tmp_path):
+        from models import GitHubRunnerConfig
+
+        github_dir = tmp_path / ".auto-claude" / "github"
+        github_dir.mkdir(parents=True)
+        reviewer = ParallelOrchestratorReviewer(
+            project_dir=tmp_path,
+            github_dir=github_dir,
+            config=GitHubRunnerConfig(token="test-token", repo="test/repo"),
+        )
+        reviewer.sessions = []
+        reviewer.failing = set()
+
+        async def fake_session(config, context, **kwargs):
+            paths = [f.path for f in context.changed_files]
+            reviewer.sessions.append((config.name, paths))
+            if config.name in reviewer.failing:
+                return (config.name, [], False)
+            findings = [
+                PRReviewFinding(
+                    id=f"{config.name}-{path}",
+                    severity=ReviewSeverity.MEDIUM,
+                    category=ReviewCategory.QUALITY,
+                    title=f"{config.name} issue",
+                    description="...",
+                    file=path,
+                    line=1,
+                    source_agents=[config.name],
+                )
+                for path in paths
+            ]
+            return (config.name, findings, True)
+
+        reviewer._run_specialist_session = fake_session
+        return reviewer
+
+    def _context(self, head_sha="a" * 40, b_patch="@@ -1 +1 @@\n+b"):
+        files = [
+            ChangedFile("a.py", "modified", 1, 0, "", "", "@@ -1 +1 @@\n+a"),
+            ChangedFile("b.py", "modified", 1, 0, "", "", b_patch),
+        ]
+        return PRContext(
+            pr_number=7,
+            title="t",
+            description="",
+            author="dev",
+            base_branch="main",
+            head_branch="feature",
+            state="open",
+            changed_files=files,
+            diff="",
+            repo_structure="",
+            related_files=[],
+            head_sha=head_sha,
+            base_sha="b" * 40,
+        )
+
+    async def _run(self, reviewer, context):
+        report = SpecialistCacheReport()
+        findings, agents = await reviewer._run_parallel_specialists(
+            context, reviewer.project_dir, "model", None, cache_report=report
+        )
+        return findings, agents, report
+
+    async def test_rerun_at_same_head_reuses_everything(self, reviewer):
+        first, _, _ = await self._run(reviewer, self._context())
+        reviewer.sessions.clear()
+
+        findings, agents, report = await self._run(reviewer, self._context())
+
+        assert reviewer.sessions == []
+        assert len(report.hits) == 4
+        assert sorted(agents) == sorted(report.hits)
+        assert sorted(f.id for f in findings) == sorted(f.id for f in first)
+        assert "Cached Specialist Results" in report.summary_line()
+
+    async def test_only_changed_files_are_reviewed_again(self, reviewer):
+        await self._run(reviewer, self._context())
+        reviewer.sessions.clear()
+
+        context = self._context(head_sha="c" * 40, b_patch="@@ -1 +1 @@\n+b2")
+        findings, _, report = await self._run(reviewer, context)
+
+        assert all(paths == ["b.py"] for _, paths in reviewer.sessions)
+        assert len(reviewer.sessions) == 4
+        assert report.partial["logic"] == (1, 2)
+        assert sorted({f.file for f in findings}) == ["a.py", "b.py"]
+        assert len(findings) == 8
+
+    async def test_failed_session_is_not_cached(self, reviewer):
+        reviewer.failing = {"security"}
+        await self._run(reviewer, self._context())
+        reviewer.failing = set()
+        reviewer.sessions.clear()
+
+        _, _, report = await self._run(reviewer, self._context())
+
+        assert [name for name, _ in reviewer.sessions] == ["security"]
+        assert "security" not in report.hits
+
+    async def test_cache_can_be_disabled(self, reviewer, monkeypatch):
+        monkeypatch.setenv("PR_REVIEW_SPECIALIST_CACHE", "false")
+        await self._run(reviewer, self._context())
+        reviewer.sessions.clear()
+
+        await self._run(reviewer, self._context())
+
+        assert len(reviewer.sessions) == 4
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Tests for the Semantic Analysis Diff Engine
+===========================================
+
+Tests the pluggable line diff backends used by the regex analyzer.
+
+Covers:
+- difflib backend parity with the historical unified_diff parsing
+- git (histogram) backend on simple edits
+- Size guard degrading to lightweight tracking
+- Backend registry
+- Benchmark on a real lockfile diff
+"""
+
+import difflib
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from merge.semantic_analysis import diff_engine
+from merge.semantic_analysis.diff_engine import (
+    LineChanges,
+    available_diff_backends,
+    compute_line_changes,
+    register_diff_backend,
+)
+from merge.semantic_analysis.regex_analyzer import analyze_with_regex
+
+LOCKFILE = Path(__file__).parent.parent / "package-lock.json"
+
+
+def _legacy_line_changes(before: str, after: str):
+    """The unified_diff text re-parsing analyze_with_regex used to do."""
+    diff = difflib.unified_diff(
+        before.splitlines(keepends=True),
+        after.splitlines(keepends=True),
+        lineterm="",
+    )
+    added, removed, current_line = [], [], 0
+    for line in diff:
+        if line.startswith("@@"):
+            match = re.match(r"@@ -\d+(?:,\d+)? \+(\d+)", line)
+            if match:
+                current_line = int(match.group(1))
+        elif line.startswith("+") and not line.startswith("+++"):
+            added.append((current_line, line[1:]))
+            current_line += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed.append((current_line, line[1:]))
+        elif not line.startswith("-"):
+            current_line += 1
+    return added, removed
+
+
+def _lockfile_edit(lines: list[str], fraction: float = 0.1) -> list[str]:
+    """Bump a fraction of the "version" lines, like a dependency update."""
+    rng = random.Random(0)
+    edited = list(lines)
+    version_lines = [i for i, line in enumerate(lines) if '"version":' in line]
+    for i in rng.sample(version_lines, int(len(version_lines) * fraction)):
+        edited[i] = edited[i].replace('"version": "', '"version": "9.')
+    return edited
+
+
+class TestDifflibBackend:
+    """The difflib backend reproduces the legacy output."""
+
+    def test_matches_legacy_parsing_on_random_edits(self):
+        rng = random.Random(42)
+        for _ in range(500):
+            vocab = [f"line {i}\n" for i in range(rng.randint(1, 8))]
+            before = [rng.choice(vocab) for _ in range(rng.randint(0, 30))]
+            after = list(before)
+            for _ in range(rng.randint(0, 5)):
+                roll = rng.random()
+                if roll < 0.4 and after:
+                    del after[rng.randrange(len(after))]
+                elif roll < 0.8:
+                    after.insert(rng.randint(0, len(after)), rng.choice(vocab))
+                elif after:
+                    after[rng.randrange(len(after))] = "changed\n"
+
+            changes = compute_line_changes(before, after, backend="difflib")
+            assert (changes.added, changes.removed) == _legacy_line_changes(
+                "".join(before), "".join(after)
+            )
+
+    def test_file_deleted(self):
+        changes = compute_line_changes(["a\n", "b\n"], [], backend="difflib")
+        assert changes.removed == [(0, "a\n"), (0, "b\n")]
+        assert changes.added == []
+
+
+class TestGitBackend:
+    """The git histogram backend yields structured hunks directly."""
+
+    def test_insert_and_delete(self):
+        before = ["import os\n", "x = 1\n", "y = 2\n", "z = 3\n"]
+        after = ["import os\n", "import sys\n", "x = 1\n", "z = 3\n"]
+
+        changes = compute_line_changes(before, after, backend="git")
+
+        assert changes.backend == "git"
+        assert changes.added == [(2, "import sys\n")]
+        assert [text for _, text in changes.removed] == ["y = 2\n"]
+
+    def test_same_counts_as_difflib_on_lockfile(self):
+        if not LOCKFILE.exists():
+            pytest.skip("package-lock.json not available")
+        lines = LOCKFILE.read_text(encoding="utf-8").splitlines(keepends=True)
+        edited = _lockfile_edit(lines, fraction=0.02)
+
+        git = compute_line_changes(lines, edited, backend="git")
+        legacy_added, legacy_removed = _legacy_line_changes(
+            "".join(lines), "".join(edited)
+        )
+
+        assert sorted(git.added) == sorted(legacy_added)
+        assert len(git.removed) == len(legacy_removed)
+
+
+class TestGuards:
+    """Size guard and backend selection."""
+
+    def test_oversized_region_degrades(self):
+        before = [f"a{i}\n" for i in range(100)]
+        after = [f"b{i}\n" for i in range(100)]
+
+        changes = compute_line_changes(before, after, max_lines=50)
+
+        assert changes.degraded is True
+        assert changes.added == [] and changes.removed == []
+        assert changes.lines_changed == 100
+
+    def test_common_prefix_suffix_not_counted_against_limit(self, monkeypatch):
+        monkeypatch.setattr(diff_engine, "DIFFLIB_WORK_LIMIT", 10)
+        body = [f"same {i}\n" for i in range(1000)]
+
+        changes = compute_line_changes(
+            body + ["old\n"] + body, body + ["new\n"] + body, max_lines=10
+        )
+
+        assert changes.degraded is False
+        assert changes.added == [(1001, "new\n")]
+
+    def test_auto_uses_git_for_large_inputs(self, monkeypatch):
+        monkeypatch.setattr(diff_engine, "DIFFLIB_WORK_LIMIT", 10)
+        changes = compute_line_changes(
+            [f"{i}\n" for i in range(20)], [f"{i}\n" for i in range(0, 20, 2)]
+        )
+        assert changes.backend == "git"
+        assert len(changes.removed) == 10
+
+    def test_failed_backend_degrades(self):
+        register_diff_backend("broken", lambda before, after, offset, empty: None)
+        try:
+            changes = compute_line_changes(["a\n"], ["b\n"], backend="broken")
+        finally:
+            diff_engine._BACKENDS.pop("broken")
+        assert changes.degraded is True
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            compute_line_changes(["a\n"], ["b\n"], backend="nope")
+        assert "auto" in available_diff_backends()
+
+    def test_analyzer_lightweight_on_degraded_diff(self, monkeypatch):
+        monkeypatch.setattr(
+            "merge.semantic_analysis.regex_analyzer.compute_line_changes",
+            lambda *args, **kwargs: LineChanges(
+                degraded=True, estimated_lines_changed=42
+            ),
+        )
+
+        analysis = analyze_with_regex("big.py", "", "import os\n", ".py")
+
+        assert analysis.changes == []
+        assert analysis.total_lines_changed == 42
+
+
+@pytest.mark.slow
+class TestLockfileBenchmark:
+    """Benchmark: real lockfile dependency bump."""
+
+    def test_benchmark_lockfile_diff(self):
+        if not LOCKFILE.exists():
+            pytest.skip("package-lock.json not available")
+        before = LOCKFILE.read_text(encoding="utf-8")
+        lines = before.splitlines(keepends=True)
+        edited = _lockfile_edit(lines)
+        after = "".join(edited)
+
+        start = time.perf_counter()
+        legacy_added, legacy_removed = _legacy_line_changes(before, after)
+        legacy_secs = time.perf_counter() - start
+
+        timings = {}
+        for backend in ("difflib", "git", "auto"):
+            start = time.perf_counter()
+            changes = compute_line_changes(lines, edited, backend=backend)
+            timings[backend] = time.perf_counter() - start
+            assert changes.lines_changed == len(legacy_added) + len(legacy_removed)
+
+        print(
+            f"\nlockfile diff ({len(lines)} lines): legacy={legacy_secs:.3f}s, "
+            + ", ".join(f"{name}={secs:.3f}s" for name, secs in timings.items())
+        )
@@ -14,10 +14,13 @@ Covers:
 - Merge statistics and reports
 - AI enabled/disabled modes
 - Report serialization
+- Parallel per-file pipeline (thread/process pools) and its benchmark
 """
 
 import json
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -27,8 +30,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
 # Add tests directory to path for test_fixtures
 sys.path.insert(0, str(Path(__file__).parent))
 
-from merge import MergeOrchestrator
+from merge import MergeOrchestrator, SemanticAnalyzer
 from merge.orchestrator import TaskMergeRequest
+from merge.types import FileEvolution, TaskSnapshot
 
 from test_fixtures import (
     SAMPLE_PYTHON_MODULE,
@@ -144,6 +148,43 @@ class TestSingleTaskMerge:
         # The pipeline should detect and process the modified file
         assert report.stats.files_processed >= 1
 
+    def test_repeat_merge_reports_analysis_cache_hits(self, temp_project):
+        """Re-merging unchanged task files is served by the analysis cache."""
+        import subprocess
+
+        from merge.semantic_analysis import AnalysisCache
+
+        subprocess.run(["git", "checkout", "-b", "auto-claude/task-001"], cwd=temp_project, capture_output=True)
+        (temp_project / "src" / "utils.py").write_text(SAMPLE_PYTHON_WITH_NEW_FUNCTION)
+        subprocess.run(["git", "add", "."], cwd=temp_project, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add new function"], cwd=temp_project, capture_output=True)
+
+        orchestrator = MergeOrchestrator(temp_project, dry_run=True)
+        orchestrator.analyzer.cache = AnalysisCache()
+
+        def cache_details(events):
+            return [
+                details["analysis_cache"]
+                for _, details in events
+                if details and "analysis_cache" in details
+            ]
+
+        first, second = [], []
+        orchestrator.merge_task(
+            "task-001",
+            worktree_path=temp_project,
+            progress_callback=lambda stage, percent, message, details=None: first.append((stage, details)),
+        )
+        orchestrator.merge_task(
+            "task-001",
+            worktree_path=temp_project,
+            progress_callback=lambda stage, percent, message, details=None: second.append((stage, details)),
+        )
+
+        assert cache_details(first)[0]["misses"] >= 1
+        assert cache_details(second)[0]["hits"] >= 1
+        assert cache_details(second)[0]["misses"] == 0
+
 
 class TestMultiTaskMerge:
     """Integration tests for multi-task merge."""
@@ -248,3 +289,253 @@ class TestErrorHandling:
 
         assert report is not None
         assert len(report.tasks_merged) == 0
+
+
+# =============================================================================
+# Parallel per-file pipeline
+# =============================================================================
+
+
+def _install_synthetic_evolution(
+    orchestrator: MergeOrchestrator, num_files: int, num_tasks: int
+) -> list[TaskMergeRequest]:
+    """Populate the orchestrator's evolution tracker with synthetic task changes.
+
+    Every task adds its own import and function to every file, so each file
+    goes through conflict detection and the AutoMerger strategies.
+    """
+    analyzer = SemanticAnalyzer()
+    baselines: dict[str, str] = {}
+    evolutions: dict[str, FileEvolution] = {}
+    task_ids = [f"task-{t:03d}" for t in range(num_tasks)]
+
+    for i in range(num_files):
+        file_path = f"src/module_{i:04d}.py"
+        baseline = "import os\n\n\n" + "".join(
+            f"def existing_{i}_{n}(value):\n    return value + {n}\n\n\n"
+            for n in range(20)
+        )
+        evolution = FileEvolution(
+            file_path=file_path,
+            baseline_commit="abc123",
+            baseline_captured_at=datetime(2024, 1, 1),
+            baseline_content_hash="",
+            baseline_snapshot_path="",
+        )
+        for t, task_id in enumerate(task_ids):
+            after = (
+                f"import mod_{t}\n"
+                + baseline
+                + f"def task_{t}_helper_{i}():\n    return {t}\n"
+            )
+            analysis = analyzer.analyze_diff(file_path, baseline, after)
+            evolution.add_task_snapshot(
+                TaskSnapshot(
+                    task_id=task_id,
+                    task_intent=f"Synthetic change {t}",
+                    started_at=datetime(2024, 1, 1, 0, t),
+                    semantic_changes=analysis.changes,
+                )
+            )
+        baselines[file_path] = baseline
+        evolutions[file_path] = evolution
+
+    tracker = orchestrator.evolution_tracker
+    tracker.refresh_from_git = lambda *args, **kwargs: None
+    tracker.get_files_modified_by_tasks = lambda ids: {
+        path: list(ids) for path in evolutions
+    }
+    tracker.get_file_evolution = evolutions.get
+    tracker.get_baseline_content = baselines.get
+
+    missing = orchestrator.project_dir / "missing-worktree"
+    return [TaskMergeRequest(task_id=tid, worktree_path=missing) for tid in task_ids]
+
+
+def _report_signature(report) -> dict:
+    """Report content without timing fields, for cross-mode comparison."""
+    data = report.to_dict()
+    data["stats"].pop("duration_seconds")
+    data.pop("started_at")
+    data.pop("completed_at")
+    return data
+
+
+class TestParallelMerge:
+    """Tests for the parallel per-file merge pipeline."""
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_parallel_matches_sequential(self, temp_project, use_processes):
+        """Parallel modes produce the same report, in the same file order."""
+        sequential = MergeOrchestrator(temp_project, dry_run=True, enable_ai=False)
+        requests = _install_synthetic_evolution(sequential, num_files=12, num_tasks=3)
+        expected = sequential.merge_tasks(requests)
+
+        parallel = MergeOrchestrator(
+            temp_project,
+            dry_run=True,
+            enable_ai=False,
+            max_workers=4,
+            use_processes=use_processes,
+        )
+        requests = _install_synthetic_evolution(parallel, num_files=12, num_tasks=3)
+        report = parallel.merge_tasks(requests)
+
+        assert report.success is True
+        assert report.stats.files_processed == 12
+        assert list(report.file_results) == list(expected.file_results)
+        assert _report_signature(report) == _report_signature(expected)
+
+    def test_parallel_progress_reaches_every_file(self, temp_project):
+        """Progress is emitted once per file in parallel mode."""
+        orchestrator = MergeOrchestrator(
+            temp_project, dry_run=True, enable_ai=False, max_workers=4
+        )
+        requests = _install_synthetic_evolution(orchestrator, num_files=8, num_tasks=2)
+
+        events = []
+        orchestrator.merge_tasks(
+            requests,
+            progress_callback=lambda stage, percent, message, details=None: events.append(
+                (stage.value, details)
+            ),
+        )
+
+        merged_files = {
+            details["current_file"]
+            for stage, details in events
+            if stage == "resolving" and details
+        }
+        assert len(merged_files) == 8
+
+    def test_ai_conflicts_rerun_through_full_pipeline(self, temp_project):
+        """Files with AI-resolvable conflicts are re-merged with the AI resolver."""
+        orchestrator = MergeOrchestrator(
+            temp_project, dry_run=True, enable_ai=True, max_workers=2
+        )
+        requests = _install_synthetic_evolution(orchestrator, num_files=4, num_tasks=2)
+
+        calls = []
+        original = orchestrator.merge_pipeline.merge_file
+
+        def tracking_merge_file(**kwargs):
+            calls.append(kwargs["file_path"])
+            return original(**kwargs)
+
+        orchestrator.merge_pipeline.merge_file = tracking_merge_file
+        report = orchestrator.merge_tasks(requests)
+
+        # Compatible changes never need the AI pass
+        assert report.success is True
+        assert calls == []
+
+    @pytest.mark.parametrize("severity", ["MEDIUM", "HIGH"])
+    def test_ai_conflicts_remerged_after_worker_pool(
+        self, temp_project, monkeypatch, severity
+    ):
+        """A deterministic result with AI-resolvable conflicts is re-merged."""
+        import threading
+
+        import merge.orchestrator as orchestrator_module
+        from merge.types import (
+            ChangeType,
+            ConflictRegion,
+            ConflictSeverity,
+            MergeDecision,
+            MergeResult,
+        )
+
+        orchestrator = MergeOrchestrator(
+            temp_project, dry_run=True, enable_ai=True, max_workers=3
+        )
+        requests = _install_synthetic_evolution(orchestrator, num_files=4, num_tasks=2)
+        conflicted = "src/module_0002.py"
+        pool_threads = set()
+
+        # The worker pool's deterministic pipeline leaves one file conflicted
+        build = orchestrator_module.build_deterministic_pipeline
+
+        def conflicting_pipeline(*args, **kwargs):
+            pipeline = build(*args, **kwargs)
+            deterministic_merge = pipeline.merge_file
+
+            def merge_file(file_path, baseline_content, task_snapshots):
+                pool_threads.add(threading.get_ident())
+                result = deterministic_merge(
+                    file_path, baseline_content, task_snapshots
+                )
+                if file_path == conflicted:
+                    result.decision = MergeDecision.NEEDS_HUMAN_REVIEW
+                    result.conflicts_remaining = [
+                        ConflictRegion(
+                            file_path=file_path,
+                            location="function:task_0_helper_2",
+                            tasks_involved=["task-000", "task-001"],
+                            change_types=[ChangeType.MODIFY_FUNCTION] * 2,
+                            severity=ConflictSeverity[severity],
+                            can_auto_merge=False,
+                        )
+                    ]
+                return result
+
+            pipeline.merge_file = merge_file
+            return pipeline
+
+        monkeypatch.setattr(
+            orchestrator_module, "build_deterministic_pipeline", conflicting_pipeline
+        )
+
+        calls = []
+
+        def ai_merge_file(file_path, baseline_content, task_snapshots):
+            calls.append((file_path, len(task_snapshots), threading.get_ident()))
+            return MergeResult(
+                decision=MergeDecision.AI_MERGED,
+                file_path=file_path,
+                merged_content="# resolved\n",
+                ai_calls_made=1,
+            )
+
+        orchestrator.merge_pipeline.merge_file = ai_merge_file
+        report = orchestrator.merge_tasks(requests)
+
+        assert [(path, count) for path, count, _ in calls] == [(conflicted, 2)]
+        # Deterministic stages ran in the pool; the AI pass runs after it
+        assert len(pool_threads) >= 1
+        assert calls[0][2] == threading.get_ident()
+        assert report.file_results[conflicted].decision == MergeDecision.AI_MERGED
+        assert report.file_results[conflicted].merged_content == "# resolved\n"
+        assert report.stats.ai_calls_made == 1
+        others = [r for path, r in report.file_results.items() if path != conflicted]
+        assert len(others) == 3
+        assert all(r.decision != MergeDecision.AI_MERGED for r in others)
+
+    @pytest.mark.slow
+    def test_benchmark_500_files_5_tasks(self, temp_project):
+        """Benchmark: synthetic 500-file, 5-task merge across execution modes."""
+        timings = {}
+        signatures = {}
+        modes = {
+            "sequential": {"max_workers": 1},
+            "threads": {"max_workers": 8},
+            "processes": {"max_workers": 8, "use_processes": True},
+        }
+        for name, options in modes.items():
+            orchestrator = MergeOrchestrator(
+                temp_project, dry_run=True, enable_ai=False, **options
+            )
+            requests = _install_synthetic_evolution(
+                orchestrator, num_files=500, num_tasks=5
+            )
+            start = time.perf_counter()
+            report = orchestrator.merge_tasks(requests)
+            timings[name] = time.perf_counter() - start
+            signatures[name] = _report_signature(report)
+            assert report.stats.files_processed == 500
+
+        print(
+            "\nmerge_tasks 500 files x 5 tasks: "
+            + ", ".join(f"{name}={secs:.2f}s" for name, secs in timings.items())
+        )
+        assert signatures["threads"] == signatures["sequential"]
+        assert signatures["processes"] == signatures["sequential"]
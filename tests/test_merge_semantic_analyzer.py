@@ -11,6 +11,7 @@ Covers:
 - React hook detection
 - File structure analysis
 - Supported file types
+- Content-hash keyed analysis cache (LRU and on-disk layers)
 """
 
 import sys
@@ -23,7 +24,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
 # Add tests directory to path for test_fixtures
 sys.path.insert(0, str(Path(__file__).parent))
 
-from merge import ChangeType
+from merge import ChangeType, SemanticAnalyzer
+from merge.semantic_analysis import AnalysisCache
 from test_fixtures import (
     SAMPLE_PYTHON_MODULE,
     SAMPLE_PYTHON_WITH_NEW_IMPORT,
@@ -233,3 +235,90 @@ class TestEdgeCases:
         # Should complete without issues
         assert analysis is not None
         assert len(analysis.changes) > 0
+
+
+class TestAnalysisCache:
+    """Tests for memoized semantic analysis."""
+
+    def test_repeat_analysis_hits_cache(self):
+        """Analyzing the same versions twice computes once."""
+        cache = AnalysisCache()
+        analyzer = SemanticAnalyzer(cache=cache)
+
+        first = analyzer.analyze_diff(
+            "src/utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+        )
+        second = analyzer.analyze_diff(
+            "src/utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+        )
+
+        stats = cache.stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
+        assert second.to_dict() == first.to_dict()
+        # Hits are independent copies
+        assert second is not first
+        second.changes.clear()
+        assert analyzer.analyze_diff(
+            "src/utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+        ).changes
+
+    def test_same_content_other_path(self):
+        """Hits are stamped with the requested file path."""
+        cache = AnalysisCache()
+        analyzer = SemanticAnalyzer(cache=cache)
+
+        analyzer.analyze_diff("a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION)
+        analysis = analyzer.analyze_diff(
+            "b.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+
+        assert cache.stats().hits == 1
+        assert analysis.file_path == "b.py"
+
+    def test_extension_is_part_of_key(self):
+        """The same contents under another extension are analyzed separately."""
+        cache = AnalysisCache()
+        analyzer = SemanticAnalyzer(cache=cache)
+
+        analyzer.analyze_diff("a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT)
+        analyzer.analyze_diff("a.txt", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT)
+
+        assert cache.stats().misses == 2
+
+    def test_lru_eviction(self):
+        """The in-memory layer is bounded."""
+        cache = AnalysisCache(max_entries=2)
+        analyzer = SemanticAnalyzer(cache=cache)
+
+        for n in range(3):
+            analyzer.analyze_diff("a.py", "", f"import mod_{n}\n")
+
+        assert cache.stats().entries == 2
+        # Oldest entry was evicted
+        analyzer.analyze_diff("a.py", "", "import mod_0\n")
+        assert cache.stats().misses == 4
+
+    def test_disk_layer_survives_new_cache(self, tmp_path):
+        """Entries persisted on disk are served by a fresh cache."""
+        disk_dir = tmp_path / "analysis_cache"
+        SemanticAnalyzer(cache=AnalysisCache(disk_dir=disk_dir)).analyze_diff(
+            "a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+        )
+
+        cache = AnalysisCache(disk_dir=disk_dir)
+        analysis = SemanticAnalyzer(cache=cache).analyze_diff(
+            "a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+        )
+
+        assert cache.stats().disk_hits == 1
+        assert analysis.imports_added
+
+    def test_cache_disabled(self):
+        """use_cache=False always recomputes."""
+        analyzer = SemanticAnalyzer(use_cache=False)
+        assert analyzer.cache is None
+        analysis = analyzer.analyze_diff(
+            "a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+        )
+        assert analysis.imports_added
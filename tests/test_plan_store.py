@@ -0,0 +1,191 @@
+"""
+Tests for the Implementation Plan Store
+=======================================
+
+Tests core/plan_store.py:
+- Reads served from memory until the file changes on disk
+- Mutations coalesced into one debounced write
+- Journal replay after a crash, and discarding stale entries
+- Serialized concurrent mutations
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from core import plan_store
+from core.plan_store import JOURNAL_FILE_NAME, PlanStore, load_plan
+from progress import count_subtasks, get_next_subtask
+
+
+def _plan(*statuses: str) -> dict:
+    return {
+        "feature": "Store",
+        "phases": [
+            {
+                "id": "1",
+                "name": "Phase 1",
+                "subtasks": [
+                    {"id": f"1.{i}", "description": f"Step {i}", "status": status}
+                    for i, status in enumerate(statuses, 1)
+                ],
+            }
+        ],
+    }
+
+
+def _write(spec_dir: Path, plan: dict) -> Path:
+    plan_file = spec_dir / "implementation_plan.json"
+    plan_file.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+    return plan_file
+
+
+def _statuses_on_disk(plan_file: Path) -> list[str]:
+    plan = json.loads(plan_file.read_text(encoding="utf-8"))
+    return [s["status"] for s in plan["phases"][0]["subtasks"]]
+
+
+def _complete(subtask_id: str):
+    return lambda plan: {
+        "op": "update_subtask",
+        "subtask_id": subtask_id,
+        "fields": {"status": "completed"},
+    }
+
+
+@pytest.fixture(autouse=True)
+def fresh_stores():
+    PlanStore.reset_instances()
+    yield
+    PlanStore.reset_instances()
+
+
+class TestReads:
+    def test_reads_are_served_from_memory(self, tmp_path: Path, monkeypatch):
+        _write(tmp_path, _plan("pending"))
+        store = PlanStore.for_spec(tmp_path)
+        store.read()
+        # Past the racy window, an unchanged stat signature skips the file
+        store._loaded_ns += plan_store.RACY_WINDOW_NS * 2
+        monkeypatch.setattr(
+            Path, "read_bytes", lambda self: pytest.fail("plan re-read")
+        )
+
+        assert count_subtasks(tmp_path) == (0, 1)
+        assert get_next_subtask(tmp_path)["id"] == "1.1"
+
+    def test_external_rewrite_is_picked_up(self, tmp_path: Path):
+        _write(tmp_path, _plan("pending"))
+        assert count_subtasks(tmp_path) == (0, 1)
+
+        # Same size, likely the same mtime: caught by the content check
+        _write(tmp_path, _plan("failed "))
+        assert load_plan(tmp_path)["phases"][0]["subtasks"][0]["status"] == "failed "
+
+        _write(tmp_path, _plan("completed", "pending"))
+        assert count_subtasks(tmp_path) == (1, 2)
+
+    def test_next_subtask_is_a_copy(self, tmp_path: Path):
+        _write(tmp_path, _plan("pending"))
+
+        get_next_subtask(tmp_path)["description"] = "changed"
+
+        assert load_plan(tmp_path)["phases"][0]["subtasks"][0]["description"] == (
+            "Step 1"
+        )
+
+
+class TestMutations:
+    async def test_mutations_coalesce_into_one_write(self, tmp_path: Path, monkeypatch):
+        plan_file = _write(tmp_path, _plan("pending", "pending"))
+        store = PlanStore.for_spec(tmp_path)
+        writes = []
+        real_atomic_write = plan_store.atomic_write
+
+        def counting_atomic_write(path, *args, **kwargs):
+            writes.append(path)
+            return real_atomic_write(path, *args, **kwargs)
+
+        monkeypatch.setattr(plan_store, "atomic_write", counting_atomic_write)
+
+        await store.mutate(_complete("1.1"))
+        await store.mutate(_complete("1.2"))
+
+        # Visible to readers before the file is written
+        assert count_subtasks(tmp_path) == (2, 2)
+        assert store.dirty
+
+        await asyncio.sleep(plan_store.FLUSH_DEBOUNCE_SECONDS * 2)
+
+        assert writes == [plan_file]
+        assert not store.dirty
+        assert _statuses_on_disk(plan_file) == ["completed", "completed"]
+        assert "last_updated" in json.loads(plan_file.read_text(encoding="utf-8"))
+
+    async def test_unknown_subtask_is_not_applied(self, tmp_path: Path):
+        _write(tmp_path, _plan("pending"))
+        store = PlanStore.for_spec(tmp_path)
+
+        assert await store.mutate(_complete("9.9")) is None
+        assert await store.mutate(lambda plan: None) is None
+        assert not store.dirty
+
+    async def test_concurrent_mutations_are_serialized(self, tmp_path: Path):
+        _write(tmp_path, {"counter": 0})
+        store = PlanStore.for_spec(tmp_path)
+
+        def increment(plan):
+            return {"op": "set", "values": {"counter": plan["counter"] + 1}}
+
+        await asyncio.gather(*(store.mutate(increment) for _ in range(20)))
+        await store.flush()
+
+        on_disk = json.loads((tmp_path / "implementation_plan.json").read_text())
+        assert on_disk["counter"] == 20
+
+    async def test_flush_keeps_external_changes(self, tmp_path: Path):
+        _write(tmp_path, _plan("pending", "pending"))
+        store = PlanStore.for_spec(tmp_path)
+        await store.mutate(_complete("1.1"))
+
+        external = _plan("pending", "pending")
+        external["feature"] = "Renamed elsewhere"
+        _write(tmp_path, external)
+        await store.flush()
+
+        on_disk = json.loads((tmp_path / "implementation_plan.json").read_text())
+        assert on_disk["feature"] == "Renamed elsewhere"
+        assert on_disk["phases"][0]["subtasks"][0]["status"] == "completed"
+
+
+class TestJournal:
+    async def _crash_after_mutation(self, spec_dir: Path) -> None:
+        store = PlanStore.for_spec(spec_dir)
+        await store.mutate(_complete("1.1"))
+        # Process dies before the debounced flush runs
+        store._flush_task.cancel()
+        store._pending = []
+        PlanStore.reset_instances()
+
+    async def test_unflushed_mutations_are_replayed(self, tmp_path: Path):
+        plan_file = _write(tmp_path, _plan("pending"))
+        await self._crash_after_mutation(tmp_path)
+        assert _statuses_on_disk(plan_file) == ["pending"]
+
+        assert count_subtasks(tmp_path) == (1, 1)
+        assert _statuses_on_disk(plan_file) == ["completed"]
+
+        # Checkpointed: a later store doesn't replay it again
+        PlanStore.reset_instances()
+        _write(tmp_path, _plan("pending"))
+        assert count_subtasks(tmp_path) == (0, 1)
+
+    async def test_entries_for_a_replaced_plan_are_discarded(self, tmp_path: Path):
+        _write(tmp_path, _plan("pending"))
+        await self._crash_after_mutation(tmp_path)
+
+        _write(tmp_path, _plan("pending", "pending"))
+
+        assert count_subtasks(tmp_path) == (0, 2)
+        assert (tmp_path / JOURNAL_FILE_NAME).exists()
@@ -8,10 +8,14 @@ Tests cover:
 - Dependency audit integration
 - Result aggregation
 - Blocking logic
+- Concurrent scanners, audit cache and changed-file SAST
 """
 
 import json
+import os
+import subprocess
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -493,3 +497,208 @@ class TestSASTIntegration:
         # Check parsing worked
         if result.vulnerabilities:
             assert any(v.source == "npm_audit" for v in result.vulnerabilities)
+
+
+# =============================================================================
+# CONCURRENCY, AUDIT CACHE AND CHANGED-FILE SAST TESTS
+# =============================================================================
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_python_project(temp_dir):
+    """A Python project on a feature branch with one changed, one new file."""
+    _git(temp_dir, "init", "-b", "main")
+    _git(temp_dir, "config", "user.email", "test@example.com")
+    _git(temp_dir, "config", "user.name", "Test")
+    (temp_dir / "requirements.txt").write_text("flask==2.0.0\n")
+    (temp_dir / "old.py").write_text("x = 1\n")
+    (temp_dir / "changed.py").write_text("y = 1\n")
+    _git(temp_dir, "add", ".")
+    _git(temp_dir, "commit", "-m", "init")
+    _git(temp_dir, "checkout", "-b", "auto-claude/feature")
+    (temp_dir / "changed.py").write_text("y = 2\n")
+    _git(temp_dir, "commit", "-am", "change")
+    (temp_dir / "new.py").write_text("z = 1\n")
+    (temp_dir / "notes.md").write_text("not python\n")
+    return temp_dir
+
+
+class TestConcurrentScan:
+    """Scanners run concurrently and are timed individually."""
+
+    def test_scanners_run_concurrently(self, scanner, temp_dir):
+        (temp_dir / "requirements.txt").write_text("flask\n")
+        (temp_dir / "package.json").write_text("{}")
+
+        def slow(name, result_arg):
+            def run(*args):
+                time.sleep(0.3)
+                args[result_arg].vulnerabilities.append(
+                    SecurityVulnerability("low", name, name, "")
+                )
+                return True
+
+            return run
+
+        with patch.object(scanner, "_run_secrets_scan", slow("secrets", 2)), \
+                patch.object(scanner, "_run_sast_scans", slow("bandit", 1)), \
+                patch.object(scanner, "_run_npm_audit", slow("npm_audit", 1)), \
+                patch.object(scanner, "_run_pip_audit", slow("pip_audit", 1)), \
+                patch.dict(os.environ, {"SECURITY_AUDIT_CACHE": "false"}):
+            start = time.perf_counter()
+            result = scanner.scan(temp_dir)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.9  # Sequential would take 1.2s
+        # Findings are merged in scanner order, not completion order
+        assert [v.source for v in result.vulnerabilities] == [
+            "secrets",
+            "bandit",
+            "npm_audit",
+            "pip_audit",
+        ]
+        assert set(result.scanner_timings) == {
+            "secrets",
+            "bandit",
+            "npm_audit",
+            "pip_audit",
+        }
+        assert all(t >= 0.3 for t in result.scanner_timings.values())
+        assert scanner.to_dict(result)["scanner_timings"] == result.scanner_timings
+
+    def test_scanner_exception_is_reported(self, scanner, python_project):
+        with patch.object(
+            scanner, "_run_sast_scans", side_effect=RuntimeError("boom")
+        ), patch.object(scanner, "_run_pip_audit", return_value=False):
+            result = scanner.scan(python_project, run_secrets=False)
+
+        assert "bandit error: boom" in result.scan_errors
+
+
+class TestAuditCache:
+    """Dependency audits are cached by lockfile content."""
+
+    @pytest.fixture
+    def counting_audit(self, scanner):
+        calls = []
+
+        def pip_audit(project_dir, result):
+            calls.append(project_dir)
+            result.vulnerabilities.append(
+                SecurityVulnerability("high", "pip_audit", "Vulnerable package: x", "")
+            )
+            return True
+
+        with patch.object(scanner, "_run_pip_audit", side_effect=pip_audit):
+            yield calls
+
+    def _audit(self, scanner, project_dir, **kwargs):
+        return scanner.scan(project_dir, run_secrets=False, run_sast=False, **kwargs)
+
+    def test_unchanged_lockfile_hits_cache(self, scanner, python_project, counting_audit):
+        first = self._audit(scanner, python_project)
+        second = self._audit(scanner, python_project)
+
+        assert len(counting_audit) == 1
+        assert first.cached_scanners == []
+        assert second.cached_scanners == ["pip_audit"]
+        assert second.vulnerabilities == first.vulnerabilities
+        assert second.has_critical_issues
+
+    def test_changed_lockfile_misses_cache(
+        self, scanner, python_project, counting_audit
+    ):
+        self._audit(scanner, python_project)
+        (python_project / "requirements.txt").write_text("flask==3.0.0\n")
+        self._audit(scanner, python_project)
+
+        assert len(counting_audit) == 2
+        # The entry for the old lockfile is replaced
+        cache_dir = python_project / ".auto-claude" / "security-audit-cache"
+        assert len(list(cache_dir.glob("pip_audit-*.json"))) == 1
+
+    def test_full_scan_refreshes(self, scanner, python_project, counting_audit):
+        self._audit(scanner, python_project)
+        self._audit(scanner, python_project, full_scan=True)
+
+        assert len(counting_audit) == 2
+
+    def test_failed_audit_not_cached(self, scanner, python_project):
+        with patch.object(scanner, "_run_pip_audit", return_value=False) as audit:
+            self._audit(scanner, python_project)
+            self._audit(scanner, python_project)
+
+        assert audit.call_count == 2
+
+    def test_cache_can_be_disabled(
+        self, scanner, python_project, counting_audit, monkeypatch
+    ):
+        monkeypatch.setenv("SECURITY_AUDIT_CACHE", "off")
+        self._audit(scanner, python_project)
+        self._audit(scanner, python_project)
+
+        assert len(counting_audit) == 2
+
+
+class TestChangedFileSAST:
+    """Bandit scans only the worktree's changed Python files by default."""
+
+    def _bandit_targets(self, scanner, project_dir, **kwargs):
+        with patch.object(scanner, "_run_bandit") as bandit:
+            scanner.scan(
+                project_dir, run_secrets=False, run_dependency_audit=False, **kwargs
+            )
+        return bandit.call_args.args[2] if bandit.called else "not run"
+
+    def test_worktree_diff(self, scanner, git_python_project):
+        assert sorted(self._bandit_targets(scanner, git_python_project)) == [
+            "changed.py",
+            "new.py",
+        ]
+
+    def test_full_scan(self, scanner, git_python_project):
+        assert self._bandit_targets(scanner, git_python_project, full_scan=True) is None
+
+    def test_explicit_changed_files(self, scanner, git_python_project):
+        targets = self._bandit_targets(
+            scanner, git_python_project, changed_files=["old.py", "notes.md"]
+        )
+        assert targets == ["old.py"]
+
+    def test_no_python_changes_skips_bandit(self, scanner, git_python_project):
+        targets = self._bandit_targets(
+            scanner, git_python_project, changed_files=["notes.md"]
+        )
+        assert targets == "not run"
+
+    def test_without_git_falls_back_to_full_scan(self, scanner, python_project):
+        assert self._bandit_targets(scanner, python_project) is None
+
+    def test_project_in_repo_subdirectory(self, scanner, temp_dir):
+        project = temp_dir / "backend"
+        project.mkdir()
+        (project / "requirements.txt").write_text("flask==2.0.0\n")
+        (project / "app.py").write_text("x = 1\n")
+        (temp_dir / "root.py").write_text("y = 1\n")
+        _git(temp_dir, "init", "-b", "main")
+        _git(temp_dir, "config", "user.email", "test@example.com")
+        _git(temp_dir, "config", "user.name", "Test")
+        _git(temp_dir, "add", ".")
+        _git(temp_dir, "commit", "-m", "init")
+        _git(temp_dir, "checkout", "-b", "auto-claude/feature")
+        (project / "app.py").write_text("x = 2\n")
+        (temp_dir / "root.py").write_text("y = 2\n")
+        _git(temp_dir, "commit", "-am", "change")
+        (project / "new.py").write_text("z = 1\n")
+
+        assert sorted(self._bandit_targets(scanner, project)) == ["app.py", "new.py"]
+
+    def test_empty_diff_falls_back_to_full_scan(self, scanner, git_python_project):
+        _git(git_python_project, "checkout", "-q", "main")
+        (git_python_project / "new.py").unlink()
+        (git_python_project / "notes.md").unlink()
+        assert self._bandit_targets(scanner, git_python_project) is None
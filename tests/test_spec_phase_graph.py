@@ -0,0 +1,133 @@
+"""
+Tests for the Spec Phase Graph
+==============================
+
+Tests spec/pipeline/phase_graph.py:
+- Independent phases (historical_context, research, context) run concurrently
+- Dependents start only after their dependencies succeeded
+- A failure stops new phases; running ones finish
+- SPEC_PHASE_WORKERS=1 keeps the original sequence
+"""
+
+import asyncio
+
+import pytest
+from spec.phases import PhaseResult
+from spec.pipeline.phase_graph import (
+    get_spec_phase_workers,
+    resolve_dependencies,
+    run_phase_graph,
+)
+
+COMPLEX_PHASES = [
+    "historical_context",
+    "research",
+    "context",
+    "spec_writing",
+    "self_critique",
+    "planning",
+    "validation",
+]
+
+
+class PhaseRecorder:
+    """Fake phase runner recording start/end order and concurrency."""
+
+    def __init__(self, fail: set[str] = frozenset(), delay: float = 0.05):
+        self.fail = fail
+        self.delay = delay
+        self.events: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, name: str) -> PhaseResult:
+        self.events.append(f"start:{name}")
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.events.append(f"end:{name}")
+        success = name not in self.fail
+        return PhaseResult(name, success, [], [] if success else ["boom"], 0)
+
+
+class TestDependencies:
+    def test_only_phases_in_the_run_count(self):
+        deps = resolve_dependencies(
+            ["historical_context", "context", "spec_writing", "planning"]
+        )
+
+        assert deps["spec_writing"] == ["historical_context", "context"]
+        assert deps["planning"] == ["spec_writing"]
+
+    def test_undeclared_phase_keeps_its_place(self):
+        deps = resolve_dependencies(["research", "custom", "context"])
+
+        assert deps["custom"] == ["research"]
+        assert deps["context"] == []
+
+    def test_workers_from_environment(self, monkeypatch):
+        monkeypatch.delenv("SPEC_PHASE_WORKERS", raising=False)
+        assert get_spec_phase_workers() == 3
+        monkeypatch.setenv("SPEC_PHASE_WORKERS", "1")
+        assert get_spec_phase_workers() == 1
+        monkeypatch.setenv("SPEC_PHASE_WORKERS", "x")
+        assert get_spec_phase_workers() == 3
+
+
+class TestRunPhaseGraph:
+    async def test_independent_phases_run_concurrently(self):
+        recorder = PhaseRecorder()
+
+        results = await run_phase_graph(COMPLEX_PHASES, recorder, max_workers=3)
+
+        assert [r.phase for r in results] == COMPLEX_PHASES
+        assert recorder.max_active == 3
+        assert recorder.events[:3] == [
+            "start:historical_context",
+            "start:research",
+            "start:context",
+        ]
+        spec_writing = recorder.events.index("start:spec_writing")
+        for name in ("historical_context", "research", "context"):
+            assert recorder.events.index(f"end:{name}") < spec_writing
+
+    async def test_failure_stops_dependents(self):
+        recorder = PhaseRecorder(fail={"research"})
+
+        results = await run_phase_graph(COMPLEX_PHASES, recorder, max_workers=3)
+
+        assert [(r.phase, r.success) for r in results] == [
+            ("historical_context", True),
+            ("research", False),
+            ("context", True),
+        ]
+        assert "start:spec_writing" not in recorder.events
+
+    async def test_one_worker_keeps_sequence(self):
+        recorder = PhaseRecorder(delay=0)
+
+        await run_phase_graph(COMPLEX_PHASES, recorder, max_workers=1)
+
+        assert recorder.max_active == 1
+        assert [e for e in recorder.events if e.startswith("start:")] == [
+            f"start:{name}" for name in COMPLEX_PHASES
+        ]
+
+    async def test_exception_cancels_running_phases(self):
+        cancelled = []
+
+        async def run(name: str) -> PhaseResult:
+            if name == "research":
+                raise RuntimeError("agent crashed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return PhaseResult(name, True, [], [], 0)
+
+        with pytest.raises(RuntimeError, match="agent crashed"):
+            await run_phase_graph(COMPLEX_PHASES, run, max_workers=3)
+
+        assert sorted(cancelled) == ["context", "historical_context"]
@@ -0,0 +1,141 @@
+"""
+Tests for Span Tracing
+======================
+
+Tests core/tracing.py:
+- No-op spans and no output when TRACE_FILE is unset
+- Nesting across calls and asyncio tasks
+- JSONL and Chrome trace output
+- Instrumented git calls
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from core import tracing
+from core.tracing import (
+    NOOP_SPAN,
+    configure_tracing,
+    current_span,
+    flush_traces,
+    span,
+    start_span,
+    traced,
+)
+from core.worktree import WorktreeManager
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path):
+    path = tmp_path / "trace.jsonl"
+    configure_tracing(path)
+    yield path
+    configure_tracing(None)
+
+
+def _spans(path: Path) -> dict[str, dict]:
+    flush_traces()
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    return {record["name"]: record for record in records}
+
+
+class TestDisabled:
+    def test_spans_are_noops(self, tmp_path: Path):
+        configure_tracing(None)
+
+        @traced("work")
+        def work():
+            return current_span()
+
+        with span("outer") as outer:
+            outer.set(ignored=True)
+
+        assert outer is NOOP_SPAN
+        assert start_span("tool") is NOOP_SPAN
+        assert work() is NOOP_SPAN
+        assert not tracing.is_tracing_enabled()
+
+    def test_reload_reads_environment(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("TRACE_FILE", str(tmp_path / "env.jsonl"))
+        tracing.reload_tracing_config()
+        try:
+            assert tracing.is_tracing_enabled()
+        finally:
+            configure_tracing(None)
+
+
+class TestSpans:
+    def test_nested_spans_record_parent(self, trace_file: Path):
+        @traced("inner")
+        def inner():
+            current_span().set(items=3)
+
+        with span("outer", spec="001"):
+            inner()
+
+        spans = _spans(trace_file)
+        assert spans["inner"]["parent_id"] == spans["outer"]["span_id"]
+        assert spans["outer"]["parent_id"] is None
+        assert spans["outer"]["attrs"] == {"spec": "001"}
+        assert spans["inner"]["attrs"] == {"items": 3}
+        assert spans["outer"]["duration_us"] >= spans["inner"]["duration_us"]
+
+    def test_exception_marks_span_failed(self, trace_file: Path):
+        @traced("fails")
+        def fails():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fails()
+
+        assert _spans(trace_file)["fails"]["attrs"]["error"] == "ValueError"
+
+    async def test_async_tasks_nest_under_their_parent(self, trace_file: Path):
+        @traced("child")
+        async def child(n: int):
+            current_span().set(n=n)
+            await asyncio.sleep(0)
+
+        with span("parent"):
+            await asyncio.gather(child(1), child(2))
+            tool = start_span("tool", tool="Read")
+        tool.end(error="tool_error")
+
+        flush_traces()
+        records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+        parent = next(r for r in records if r["name"] == "parent")
+        children = [r for r in records if r["name"] == "child"]
+        assert sorted(r["attrs"]["n"] for r in children) == [1, 2]
+        assert all(r["parent_id"] == parent["span_id"] for r in children)
+        tool = next(r for r in records if r["name"] == "tool")
+        assert tool["parent_id"] == parent["span_id"]
+        assert tool["attrs"] == {"tool": "Read", "error": "tool_error"}
+
+    def test_chrome_trace_format(self, tmp_path: Path):
+        path = tmp_path / "trace.json"
+        configure_tracing(path)
+        try:
+            with span("outer"):
+                with span("inner"):
+                    pass
+            flush_traces()
+            with span("later"):
+                pass
+            flush_traces()
+        finally:
+            configure_tracing(None)
+
+        text = path.read_text()
+        assert text.startswith("[\n")
+        events = json.loads(text.rstrip().rstrip(",") + "]")
+        assert [e["name"] for e in events] == ["inner", "outer", "later"]
+        assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+
+class TestInstrumentation:
+    def test_worktree_git_calls_are_traced(self, temp_git_repo: Path, trace_file):
+        WorktreeManager(temp_git_repo)._run_git(["status", "--short"])
+
+        assert _spans(trace_file)["git"]["attrs"] == {"command": "status"}
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Tests for the Virtualenv Template Cache
+=======================================
+
+Tests venv_cache.py and its use by the RECREATE dependency strategy:
+- Key invalidation on interpreter / requirements / lock file changes
+- Template build, lookup and pruning of stale templates
+- Clone relocation of scripts that embed the venv path
+- setup_worktree_dependencies() cache hits reported in DependencySetupStats
+- Windows venvs are built in place and pip runs through the venv's python
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from core.workspace.models import DependencySetupStats
+from core.workspace.venv_cache import VenvTemplateCache, is_venv_cache_enabled
+
+
+def _fake_venv(path: Path) -> bool:
+    """Create a minimal venv-like tree whose scripts embed its own path."""
+    (path / "bin").mkdir(parents=True)
+    (path / "lib" / "site-packages" / "pkg").mkdir(parents=True)
+    (path / "pyvenv.cfg").write_text(
+        f"home = /usr/bin\ncommand = python -m venv {path}\n"
+    )
+    (path / "bin" / "tool").write_text(f"#!{path}/bin/python\nprint('hi')\n")
+    (path / "bin" / "python").symlink_to(sys.executable)
+    (path / "lib" / "site-packages" / "pkg" / "__init__.py").write_text("X = 1\n")
+    return True
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "requirements.txt").write_text("requests==2.31.0\n")
+    return project
+
+
+class TestComputeKey:
+    """Template keys change whenever the venv inputs change."""
+
+    def test_stable_for_same_inputs(self, project_dir: Path):
+        cache = VenvTemplateCache(project_dir)
+        req = project_dir / "requirements.txt"
+        key = cache.compute_key(sys.executable, ".venv", req)
+        assert key == cache.compute_key(sys.executable, ".venv", req)
+
+    def test_requirements_change_invalidates(self, project_dir: Path):
+        cache = VenvTemplateCache(project_dir)
+        req = project_dir / "requirements.txt"
+        before = cache.compute_key(sys.executable, ".venv", req)
+
+        req.write_text("requests==2.32.0\n")
+
+        assert cache.compute_key(sys.executable, ".venv", req) != before
+
+    def test_lock_file_change_invalidates(self, project_dir: Path):
+        (project_dir / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+        cache = VenvTemplateCache(project_dir)
+        req = project_dir / "pyproject.toml"
+        before = cache.compute_key(sys.executable, ".venv", req)
+
+        (project_dir / "uv.lock").write_text("version = 1\n")
+
+        assert cache.compute_key(sys.executable, ".venv", req) != before
+
+    def test_interpreter_and_path_are_part_of_key(self, project_dir: Path, tmp_path):
+        cache = VenvTemplateCache(project_dir)
+        other_python = tmp_path / "python3"
+        other_python.write_text("")
+        req = project_dir / "requirements.txt"
+
+        key = cache.compute_key(sys.executable, ".venv", req)
+
+        assert key != cache.compute_key(str(other_python), ".venv", req)
+        assert key != cache.compute_key(sys.executable, "venv", req)
+
+    def test_env_toggle(self, monkeypatch):
+        monkeypatch.setenv("VENV_TEMPLATE_CACHE", "false")
+        assert is_venv_cache_enabled() is False
+        monkeypatch.delenv("VENV_TEMPLATE_CACHE")
+        assert is_venv_cache_enabled() is True
+
+
+class TestBuildAndClone:
+    """Building, looking up and cloning templates."""
+
+    def test_build_then_get(self, project_dir: Path):
+        cache = VenvTemplateCache(project_dir)
+        assert cache.get("k1") is None
+
+        template = cache.build("k1", ".venv", _fake_venv)
+
+        assert template == cache.template_path("k1")
+        assert cache.get("k1") == template
+        # Staging directories are cleaned up
+        assert [p.name for p in cache.cache_root.iterdir()] == ["k1"]
+
+    def test_failed_build_leaves_nothing(self, project_dir: Path):
+        cache = VenvTemplateCache(project_dir)
+
+        assert cache.build("k1", ".venv", lambda path: False) is None
+        assert cache.get("k1") is None
+        assert list(cache.cache_root.iterdir()) == []
+
+    def test_new_build_prunes_stale_template_for_same_path(self, project_dir: Path):
+        cache = VenvTemplateCache(project_dir)
+        cache.build("old", ".venv", _fake_venv)
+        cache.build("other", "api/.venv", _fake_venv)
+
+        cache.build("new", ".venv", _fake_venv)
+
+        assert cache.get("old") is None
+        assert cache.get("other") is not None
+        assert cache.get("new") is not None
+
+    def test_clone_relocates_scripts_and_links_libraries(
+        self, project_dir: Path, tmp_path: Path
+    ):
+        cache = VenvTemplateCache(project_dir)
+        template = cache.build("k1", ".venv", _fake_venv)
+        target = tmp_path / "worktree" / ".venv"
+
+        assert cache.clone(template, target) is True
+
+        script = (target / "bin" / "tool").read_text()
+        assert script.startswith(f"#!{target}/bin/python")
+        assert str(target) in (target / "pyvenv.cfg").read_text()
+        assert (target / "bin" / "python").resolve() == Path(sys.executable).resolve()
+        # Library files share storage with the template
+        lib = Path("lib") / "site-packages" / "pkg" / "__init__.py"
+        assert os.path.samefile(template / lib, target / lib)
+        # Template itself is untouched
+        assert "worktree" not in (template / "bin" / "tool").read_text()
+
+
+class TestRecreateStrategyCache:
+    """setup_worktree_dependencies() clones venvs from the template cache."""
+
+    def _index(self) -> dict:
+        return {
+            "dependency_locations": [
+                {
+                    "type": ".venv",
+                    "path": ".venv",
+                    "requirements_file": "requirements.txt",
+                    "package_manager": "pip",
+                },
+            ]
+        }
+
+    def test_second_worktree_is_cache_hit(self, project_dir: Path, tmp_path: Path):
+        from core.workspace import setup as setup_module
+        from core.workspace.setup import setup_worktree_dependencies
+
+        created = []
+
+        def fake_create(project, worktree, config, python_exec, venv_path):
+            created.append(venv_path)
+            return _fake_venv(venv_path)
+
+        stats = DependencySetupStats()
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(setup_module, "_create_venv", fake_create)
+            for name in ("wt1", "wt2"):
+                worktree = tmp_path / name
+                worktree.mkdir()
+                results = setup_worktree_dependencies(
+                    project_dir, worktree, self._index(), stats=stats
+                )
+                assert results["recreate"] == [".venv"]
+
+        assert len(created) == 1
+        assert stats.venv_cache_builds == [".venv"]
+        assert stats.venv_cache_hits == [".venv"]
+        tool = (tmp_path / "wt2" / ".venv" / "bin" / "tool").read_text()
+        assert tool.startswith(f"#!{tmp_path / 'wt2' / '.venv'}/bin/python")
+
+    def test_cache_disabled_creates_in_place(
+        self, project_dir: Path, tmp_path: Path, monkeypatch
+    ):
+        from core.workspace import setup as setup_module
+        from core.workspace.setup import setup_worktree_dependencies
+
+        created = []
+
+        def fake_create(project, worktree, config, python_exec, venv_path):
+            created.append(venv_path)
+            return _fake_venv(venv_path)
+
+        monkeypatch.setenv("VENV_TEMPLATE_CACHE", "false")
+        monkeypatch.setattr(setup_module, "_create_venv", fake_create)
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+
+        setup_worktree_dependencies(project_dir, worktree, self._index())
+
+        assert created == [worktree / ".venv"]
+        assert not (project_dir / ".auto-claude" / "venv-cache").exists()
+
+    def test_failed_install_is_not_retried_uncached(
+        self, project_dir: Path, tmp_path: Path, monkeypatch
+    ):
+        from core.workspace import setup as setup_module
+        from core.workspace.setup import setup_worktree_dependencies
+
+        calls = []
+        monkeypatch.setattr(
+            setup_module, "_create_venv", lambda *args: calls.append(args) or False
+        )
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+
+        results = setup_worktree_dependencies(project_dir, worktree, self._index())
+
+        assert len(calls) == 1
+        assert results["recreate"] == []
+
+    def test_windows_builds_launchers_in_place(
+        self, project_dir: Path, tmp_path: Path, monkeypatch
+    ):
+        from core.workspace import setup as setup_module
+        from core.workspace.setup import setup_worktree_dependencies
+
+        def fake_create(project, worktree, config, python_exec, venv_path):
+            # Launchers are binaries with the venv's interpreter path inside
+            (venv_path / "Scripts").mkdir(parents=True)
+            (venv_path / "pyvenv.cfg").write_text("home = C:\\Python\n")
+            (venv_path / "Scripts" / "pip.exe").write_bytes(
+                b"MZ\0\0#!" + str(venv_path / "Scripts" / "python.exe").encode()
+            )
+            return True
+
+        monkeypatch.setattr(setup_module, "is_windows", lambda: True)
+        monkeypatch.setattr(setup_module, "_create_venv", fake_create)
+        stats = DependencySetupStats()
+        for name in ("wt1", "wt2"):
+            worktree = tmp_path / name
+            worktree.mkdir()
+            setup_worktree_dependencies(
+                project_dir, worktree, self._index(), stats=stats
+            )
+            launcher = (worktree / ".venv" / "Scripts" / "pip.exe").read_bytes()
+            assert str(worktree / ".venv").encode() in launcher
+
+        assert stats.venv_cache_builds == stats.venv_cache_hits == []
+        assert not (project_dir / ".auto-claude" / "venv-cache").exists()
+
+    def test_windows_pip_runs_through_venv_python(
+        self, project_dir: Path, tmp_path: Path, monkeypatch
+    ):
+        from core.workspace import setup as setup_module
+        from core.workspace.models import DependencyShareConfig, DependencyStrategy
+
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(setup_module, "is_windows", lambda: True)
+        monkeypatch.setattr(setup_module.subprocess, "run", fake_run)
+        worktree = tmp_path / "wt"
+        venv = worktree / ".venv"
+        config = DependencyShareConfig(
+            dep_type=".venv",
+            strategy=DependencyStrategy.RECREATE,
+            source_rel_path=".venv",
+            requirements_file="requirements.txt",
+            package_manager="pip",
+        )
+
+        assert setup_module._create_venv(
+            project_dir, worktree, config, sys.executable, venv
+        )
+        assert setup_module._reinstall_project_package(worktree, config, venv)
+
+        python = str(venv / "Scripts" / "python.exe")
+        assert commands[1][:5] == [python, "-m", "pip", "install", "-r"]
+        assert commands[2][:4] == [python, "-m", "pip", "install"]
+        assert not any("pip.exe" in arg for cmd in commands for arg in cmd)
+
+    def test_real_venv_clone_runs_from_new_location(self, tmp_path: Path):
+        """A cloned venv reports its own location as sys.prefix."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        cache = VenvTemplateCache(project_dir)
+
+        def create(path: Path) -> bool:
+            result = subprocess.run(
+                [sys.executable, "-m", "venv", "--without-pip", str(path)],
+                capture_output=True,
+            )
+            return result.returncode == 0
+
+        template = cache.build("real", ".venv", create)
+        if template is None:
+            pytest.skip("venv module unavailable")
+        target = tmp_path / "worktree" / ".venv"
+        assert cache.clone(template, target)
+
+        python = target / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+        prefix = subprocess.run(
+            [str(python), "-c", "import sys; print(sys.prefix)"],
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert Path(prefix).resolve() == target.resolve()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Tests for the Worktree Copy Engine
+==================================
+
+Tests copy_engine.py and parallel dependency setup:
+- copy_tree() parity with shutil.copytree
+- Hardlinks for read-only files only (unless explicitly allowed)
+- Fallback when reflink / copy_file_range are unsupported
+- setup_worktree_dependencies() concurrency, ordering and timing stats
+- Benchmark against shutil.copytree
+"""
+
+import errno
+import os
+import shutil
+import stat
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from core.workspace import copy_engine
+from core.workspace.copy_engine import (
+    METHOD_COPY,
+    METHOD_HARDLINK,
+    CopyStats,
+    copy_file,
+    copy_tree,
+)
+from core.workspace.models import (
+    DependencySetupStats,
+    DependencyShareConfig,
+    DependencyStrategy,
+)
+
+
+def _make_tree(root: Path, files: int = 20) -> None:
+    for i in range(files):
+        path = root / f"pkg{i % 4}" / "sub" / f"file{i}.js"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"module.exports = {i};\n" * (i + 1))
+
+
+def _snapshot(root: Path) -> dict[str, bytes]:
+    return {
+        str(p.relative_to(root)): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+class TestCopyTree:
+    """copy_tree() produces the same tree as shutil.copytree."""
+
+    def test_matches_shutil_copytree(self, tmp_path: Path):
+        src = tmp_path / "src"
+        _make_tree(src)
+        (src / "run.sh").write_text("#!/bin/sh\n")
+        (src / "run.sh").chmod(0o755)
+
+        stats = copy_tree(src, tmp_path / "dst")
+        shutil.copytree(src, tmp_path / "expected")
+
+        assert _snapshot(tmp_path / "dst") == _snapshot(tmp_path / "expected")
+        assert os.access(tmp_path / "dst" / "run.sh", os.X_OK)
+        assert stats.files == 21
+        assert sum(stats.methods.values()) == 21
+
+    def test_follows_symlinks_like_copytree(self, tmp_path: Path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (tmp_path / "real.txt").write_text("data")
+        (src / "link.txt").symlink_to(tmp_path / "real.txt")
+
+        copy_tree(src, tmp_path / "dst")
+
+        copied = tmp_path / "dst" / "link.txt"
+        assert not copied.is_symlink()
+        assert copied.read_text() == "data"
+
+    def test_hardlinks_only_read_only_files(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(copy_engine, "_try_reflink", lambda src, dst: False)
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "writable.txt").write_text("w")
+        (src / "readonly.txt").write_text("r")
+        (src / "readonly.txt").chmod(stat.S_IRUSR | stat.S_IRGRP)
+
+        copy_tree(src, tmp_path / "dst")
+
+        assert os.path.samefile(src / "readonly.txt", tmp_path / "dst" / "readonly.txt")
+        assert not os.path.samefile(
+            src / "writable.txt", tmp_path / "dst" / "writable.txt"
+        )
+
+    def test_allow_hardlink_links_writable_files(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(copy_engine, "_try_reflink", lambda src, dst: False)
+        src = tmp_path / "src"
+        _make_tree(src, files=3)
+
+        stats = copy_tree(src, tmp_path / "dst", allow_hardlink=True)
+
+        assert stats.methods == {METHOD_HARDLINK: 3}
+
+
+class TestFallbacks:
+    """Unsupported methods fall through and are not retried."""
+
+    def test_unsupported_reflink_tried_once_per_tree(self, tmp_path: Path, monkeypatch):
+        calls = []
+
+        def fake_ioctl(fd, request, arg):
+            calls.append(request)
+            raise OSError(errno.EOPNOTSUPP, "not supported")
+
+        monkeypatch.setattr(copy_engine.fcntl, "ioctl", fake_ioctl)
+        src = tmp_path / "src"
+        _make_tree(src, files=10)
+
+        stats = copy_tree(src, tmp_path / "dst")
+
+        assert calls == [copy_engine.FICLONE]
+        assert copy_engine.METHOD_REFLINK in stats.unsupported
+        assert _snapshot(tmp_path / "dst") == _snapshot(src)
+
+    def test_copy_file_range_failure_uses_byte_copy(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(copy_engine, "_try_reflink", lambda src, dst: False)
+
+        def fail(*args):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(os, "copy_file_range", fail, raising=False)
+        (tmp_path / "a.txt").write_text("hello")
+
+        method = copy_file(tmp_path / "a.txt", tmp_path / "b.txt")
+
+        assert method == METHOD_COPY
+        assert (tmp_path / "b.txt").read_text() == "hello"
+
+    def test_stats_merge(self):
+        a = CopyStats()
+        a.record(METHOD_COPY, 10)
+        b = CopyStats()
+        b.record(METHOD_COPY, 5)
+        b.record(METHOD_HARDLINK, 1)
+
+        a.merge(b)
+
+        assert a.to_dict() == {
+            "files": 3,
+            "bytes": 16,
+            "methods": {METHOD_COPY: 2, METHOD_HARDLINK: 1},
+        }
+
+
+class TestParallelDependencySetup:
+    """setup_worktree_dependencies() runs independent configs concurrently."""
+
+    def _configs(self, *paths: str) -> list[DependencyShareConfig]:
+        return [
+            DependencyShareConfig(
+                dep_type="vendor", strategy=DependencyStrategy.COPY, source_rel_path=p
+            )
+            for p in paths
+        ]
+
+    def test_group_nested_configs(self):
+        from core.workspace.setup import _group_nested_configs
+
+        groups = _group_nested_configs(
+            self._configs("a", "b/c", "b", "d", "b/c/e", "a2")
+        )
+
+        assert groups == [[0], [1, 2, 4], [3], [5]]
+
+    def test_independent_configs_overlap(self, tmp_path: Path, monkeypatch):
+        from core.workspace import setup as setup_module
+        from core.workspace.setup import setup_worktree_dependencies
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_copy(project_dir, worktree_path, config, stats=None):
+            barrier.wait()  # Only passes if both configs run at once
+            return True
+
+        monkeypatch.setattr(setup_module, "_apply_copy_strategy", fake_copy)
+        monkeypatch.setattr(
+            setup_module,
+            "get_dependency_configs",
+            lambda index, project_dir=None: self._configs("one", "two"),
+        )
+
+        results = setup_worktree_dependencies(tmp_path, tmp_path / "wt", None)
+
+        assert results == {"copy": ["one", "two"]}
+
+    def test_results_and_timings(self, tmp_path: Path, monkeypatch):
+        from core.workspace import setup as setup_module
+        from core.workspace.setup import setup_worktree_dependencies
+
+        project_dir = tmp_path / "project"
+        for name in ("vendor_a", "vendor_b"):
+            _make_tree(project_dir / name, files=5)
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        monkeypatch.setattr(
+            setup_module,
+            "get_dependency_configs",
+            lambda index, project_dir=None: self._configs("vendor_b", "vendor_a"),
+        )
+
+        stats = DependencySetupStats()
+        results = setup_worktree_dependencies(project_dir, worktree, None, stats=stats)
+
+        assert results == {"copy": ["vendor_b", "vendor_a"]}
+        assert _snapshot(worktree / "vendor_a") == _snapshot(project_dir / "vendor_a")
+        assert set(stats.strategy_seconds) == {"copy"}
+        assert stats.total_seconds > 0
+        assert sum(stats.copy_methods.values()) == 10
+
+    def test_sequential_mode(self, tmp_path: Path, monkeypatch):
+        from core.workspace import setup as setup_module
+        from core.workspace.setup import setup_worktree_dependencies
+
+        threads = set()
+
+        def fake_copy(project_dir, worktree_path, config, stats=None):
+            threads.add(threading.get_ident())
+            return True
+
+        monkeypatch.setattr(setup_module, "_apply_copy_strategy", fake_copy)
+        monkeypatch.setattr(
+            setup_module,
+            "get_dependency_configs",
+            lambda index, project_dir=None: self._configs("one", "two", "three"),
+        )
+
+        setup_worktree_dependencies(tmp_path, tmp_path / "wt", None, max_workers=1)
+
+        assert threads == {threading.get_ident()}
+
+
+@pytest.mark.slow
+class TestCopyBenchmark:
+    """Benchmark: copy engine vs shutil.copytree on a node_modules-like tree."""
+
+    def test_benchmark_copy_tree(self, tmp_path: Path):
+        src = tmp_path / "node_modules"
+        _make_tree(src, files=3000)
+        for path in list(src.rglob("*.js"))[::2]:
+            path.chmod(stat.S_IRUSR | stat.S_IRGRP)
+
+        start = time.perf_counter()
+        shutil.copytree(src, tmp_path / "copytree")
+        copytree_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stats = copy_tree(src, tmp_path / "engine")
+        engine_secs = time.perf_counter() - start
+
+        assert _snapshot(tmp_path / "engine") == _snapshot(tmp_path / "copytree")
+        print(
+            f"\ncopy 3000 files: copytree={copytree_secs:.3f}s, "
+            f"engine={engine_secs:.3f}s, methods={stats.methods}"
+        )